@@ -26,7 +26,8 @@ from .data_client import HacsDataClient
 from .enums import HacsDisabledReason, HacsStage, LovelaceMode
 from .frontend import async_register_frontend
 from .utils.data import HacsData
-from .utils.queue_manager import QueueManager
+from .utils.scheduler import HacsScheduler
+from .utils.store import DATA_STORE_FINGERPRINTS
 from .utils.version import version_left_higher_or_equal_then_right
 from .websocket import async_register_websocket_commands
 
@@ -66,11 +67,16 @@ async def _async_initialize_integration(
     hacs.version = integration.version
     hacs.configuration.dev = integration.version == "0.0.0"
     hacs.hass = hass
-    hacs.queue = QueueManager(hass=hass)
+    hacs.queue = HacsScheduler(
+        hass=hass,
+        rate_limit_fetcher=hacs.async_get_rate_limit,
+        on_drained=hacs.async_queue_drained,
+    )
     hacs.data = HacsData(hacs=hacs)
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
+        hass=hass,
     )
     hacs.system.running = True
     hacs.session = clientsession
@@ -218,6 +224,7 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     hacs.disable_hacs(HacsDisabledReason.REMOVED)
 
     hass.data.pop(DOMAIN, None)
+    hass.data.pop(DATA_STORE_FINGERPRINTS, None)
 
     return unload_ok
 
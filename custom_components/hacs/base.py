@@ -11,6 +11,7 @@ import math
 import os
 import pathlib
 import shutil
+from tempfile import SpooledTemporaryFile
 from typing import TYPE_CHECKING, Any
 
 from aiogithubapi import (
@@ -37,7 +38,14 @@ from homeassistant.helpers.issue_registry import IssueSeverity, async_create_iss
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import DOMAIN, TV, URL_BASE
+from .const import (
+    DEFAULT_CONCURRENT_DOWNLOADS,
+    DOMAIN,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_SPOOL_MAX_SIZE,
+    TV,
+    URL_BASE,
+)
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
@@ -46,12 +54,12 @@ from .enums import (
     HacsDispatchEvent,
     HacsGitHubRepo,
     HacsStage,
+    HacsTaskPriority,
     LovelaceMode,
 )
 from .exceptions import (
     AddonRepositoryException,
     HacsException,
-    HacsExecutionStillInProgress,
     HacsExpectedException,
     HacsNotModifiedException,
     HacsRepositoryArchivedException,
@@ -60,10 +68,10 @@ from .exceptions import (
 )
 from .repositories import REPOSITORY_CLASSES
 from .repositories.base import HACS_MANIFEST_KEYS_TO_EXPORT, REPOSITORY_KEYS_TO_EXPORT
-from .utils.file_system import async_exists
+from .utils.file_system import SpooledBufferWriter, StreamingFileWriter, async_exists
 from .utils.json import json_loads
 from .utils.logger import LOGGER
-from .utils.queue_manager import QueueManager
+from .utils.scheduler import HacsScheduler
 from .utils.store import async_load_from_store, async_save_to_store
 from .utils.workarounds import async_register_static_path
 
@@ -114,6 +122,7 @@ class HacsConfiguration:
     appdaemon_path: str = "appdaemon/apps/"
     appdaemon: bool = False
     config: dict[str, Any] = field(default_factory=dict)
+    concurrent_downloads: int = DEFAULT_CONCURRENT_DOWNLOADS
     config_entry: ConfigEntry | None = None
     country: str = "ALL"
     debug: bool = False
@@ -362,7 +371,7 @@ class HacsBase:
     githubapi: GitHubAPI | None = None
     hass: HomeAssistant | None = None
     integration: Integration | None = None
-    queue: QueueManager | None = None
+    queue: HacsScheduler | None = None
     repository: AIOGitHubAPIRepository | None = None
     session: ClientSession | None = None
     stage: HacsStage | None = None
@@ -380,6 +389,14 @@ class HacsBase:
         self.repositories = HacsRepositories()
         self.status = HacsStatus()
         self.system = HacsSystem()
+        self._download_limiter: asyncio.Semaphore | None = None
+
+    @property
+    def download_limiter(self) -> asyncio.Semaphore:
+        """Return the semaphore limiting the number of concurrent downloads."""
+        if self._download_limiter is None:
+            self._download_limiter = asyncio.Semaphore(self.configuration.concurrent_downloads)
+        return self._download_limiter
 
     @property
     def integration_dir(self) -> pathlib.Path:
@@ -402,6 +419,8 @@ class HacsBase:
             return
 
         self.system.disabled_reason = reason
+        if self.queue is not None:
+            self.queue.pause()
         if reason != HacsDisabledReason.REMOVED:
             self.log.error("HACS is disabled - %s", reason)
 
@@ -447,14 +466,7 @@ class HacsBase:
                         with gzip.open(file_path + ".gz", "wb") as f_out:
                             shutil.copyfileobj(f_in, f_out)
 
-            # LEGACY! Remove with 2.0
-            if "themes" in file_path and file_path.endswith(".yaml"):
-                filename = file_path.split("/")[-1]
-                base = file_path.split("/themes/")[0]
-                combined = f"{base}/themes/{filename}"
-                if os.path.exists(combined):
-                    self.log.info("Removing old theme file %s", combined)
-                    os.remove(combined)
+            self._remove_legacy_theme_file(file_path)
 
         try:
             await self.hass.async_add_executor_job(_write_file)
@@ -467,6 +479,17 @@ class HacsBase:
 
         return await async_exists(self.hass, file_path)
 
+    def _remove_legacy_theme_file(self, file_path: str) -> None:
+        """Remove the file a theme used to be stored in."""
+        # LEGACY! Remove with 2.0
+        if "themes" in file_path and file_path.endswith(".yaml"):
+            filename = file_path.split("/")[-1]
+            base = file_path.split("/themes/")[0]
+            combined = f"{base}/themes/{filename}"
+            if os.path.exists(combined):
+                self.log.info("Removing old theme file %s", combined)
+                os.remove(combined)
+
     async def async_can_update(self) -> int:
         """Helper to calculate the number of repositories we can fetch data for."""
         try:
@@ -499,7 +522,7 @@ class HacsBase:
         _exception = None
 
         try:
-            return await method(*args, **kwargs)
+            result = await method(*args, **kwargs)
         except GitHubAuthenticationException as exception:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
@@ -516,11 +539,24 @@ class HacsBase:
         ) as exception:
             self.log.exception(exception)
             _exception = exception
+        else:
+            if self.queue is not None:
+                self.queue.rate_limit.async_update_from_headers(getattr(result, "headers", None))
+            return result
 
         if raise_exception and _exception is not None:
             raise HacsException(_exception)
         return None
 
+    async def async_get_rate_limit(self) -> tuple[int, int] | None:
+        """Return the remaining GitHub API requests and the timestamp of the reset."""
+        response = await self.async_github_api_method(
+            self.githubapi.rate_limit, raise_exception=False
+        )
+        if response is None or (core := response.data.resources.core) is None:
+            return None
+        return core.remaining or 0, core.reset
+
     async def async_register_repository(
         self,
         repository_full_name: str,
@@ -696,15 +732,16 @@ class HacsBase:
 
         while timeouts < 5:
             try:
-                request = await self.session.get(
-                    url=url,
-                    timeout=ClientTimeout(total=60),
-                    headers=headers,
-                )
+                async with self.download_limiter:
+                    request = await self.session.get(
+                        url=url,
+                        timeout=ClientTimeout(total=60),
+                        headers=headers,
+                    )
 
-                # Make sure that we got a valid result
-                if request.status == 200:
-                    return await request.read()
+                    # Make sure that we got a valid result
+                    if request.status == 200:
+                        return await request.read()
 
                 raise HacsException(
                     f"Got status code {
@@ -734,6 +771,144 @@ class HacsBase:
 
             return None
 
+    async def async_download_file_to_path(
+        self,
+        url: str,
+        file_path: str,
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+    ) -> bool:
+        """Download a file directly to the file system, and return if it succeeded.
+
+        The content is streamed to a temporary file (and the .gz sidecar of .js files)
+        which replaces the file once complete.
+        """
+        if url is None:
+            return False
+
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to download %s to %s", url, file_path)
+        if not await self._async_stream_download(
+            url, StreamingFileWriter(file_path), headers=headers, nolog=nolog
+        ):
+            return False
+        await self.hass.async_add_executor_job(self._remove_legacy_theme_file, file_path)
+        return True
+
+    async def async_download_file_to_buffer(
+        self,
+        url: str,
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+    ) -> SpooledTemporaryFile | None:
+        """Download a file to a buffer, which is spooled to disk if the file is large.
+
+        The caller needs to close the returned buffer.
+        """
+        if url is None:
+            return None
+
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to download %s", url)
+        writer = SpooledBufferWriter(DOWNLOAD_SPOOL_MAX_SIZE)
+        if not await self._async_stream_download(url, writer, headers=headers, nolog=nolog):
+            return None
+        return writer.buffer
+
+    async def _async_stream_download(
+        self,
+        url: str,
+        writer: StreamingFileWriter | SpooledBufferWriter,
+        *,
+        headers: dict | None = None,
+        nolog: bool = False,
+    ) -> bool:
+        """Stream a download to the writer, and return if it succeeded.
+
+        On timeouts the download is retried, resuming from the received content
+        if the server supports ranges. The writer is committed on success and
+        discarded otherwise.
+        """
+        resumable = False
+        timeouts = 0
+
+        try:
+            while timeouts < 5:
+                request_headers = dict(headers or {})
+                if resumable and writer.size:
+                    request_headers["Range"] = f"bytes={writer.size}-"
+                try:
+                    async with (
+                        self.download_limiter,
+                        self.session.get(
+                            url=url,
+                            timeout=ClientTimeout(total=60),
+                            headers=request_headers,
+                        ) as request,
+                    ):
+                        if request.status == 200:
+                            # Full content, restart the writer if this was a retry
+                            await self.hass.async_add_executor_job(writer.open)
+                        elif request.status != 206 or "Range" not in request_headers:
+                            raise HacsException(
+                                f"Got status code {request.status} when trying to download {url}"
+                            )
+                        elif not request.headers.get("Content-Range", "").startswith(
+                            f"bytes {writer.size}-"
+                        ):
+                            # Not the range which was asked for, download all of it again
+                            self.log.debug(
+                                "Got range %s when resuming %s from byte %s, restarting",
+                                request.headers.get("Content-Range"),
+                                url,
+                                writer.size,
+                            )
+                            await self.hass.async_add_executor_job(writer.open)
+                            resumable = False
+                            continue
+                        # Ranges of encoded content don't match the decoded size written
+                        resumable = (
+                            request.headers.get("Accept-Ranges") == "bytes"
+                            and "Content-Encoding" not in request.headers
+                        )
+
+                        async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            if writer.size + len(chunk) <= writer.max_memory_size:
+                                # Kept in memory, no need for the executor
+                                writer.write(chunk)
+                            else:
+                                await self.hass.async_add_executor_job(writer.write, chunk)
+
+                    await self.hass.async_add_executor_job(writer.commit)
+                    return True
+                except TimeoutError:
+                    self.log.warning(
+                        "A timeout of 60! seconds was encountered while downloading %s, "
+                        "retrying from byte %s. Tries left %s",
+                        url,
+                        writer.size if resumable else 0,
+                        (4 - timeouts),
+                    )
+                    timeouts += 1
+                    await asyncio.sleep(1)
+        except (
+            # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            BaseException
+        ) as exception:
+            if not nolog:
+                self.log.exception("Download failed - %s", exception)
+
+        await self.hass.async_add_executor_job(writer.discard)
+        return False
+
     async def async_recreate_entities(self) -> None:
         """Recreate entities."""
         platforms = [Platform.UPDATE]
@@ -840,7 +1015,7 @@ class HacsBase:
         """Update all category repositories."""
         self.log.debug("Fetching updated content for %s", category)
         try:
-            category_data = await self.data_client.get_data(category, validate=True)
+            changes = await self.data_client.get_data_changes(category)
         except HacsNotModifiedException:
             self.log.debug("No updates for %s", category)
             return
@@ -848,6 +1023,22 @@ class HacsBase:
             self.log.error("Could not update %s - %s", category, exception)
             return
 
+        # Repositories which did not change only need to be registered again
+        # if something (like a removal) unregistered them since the last fetch
+        category_data = {
+            repo_id: repo_data
+            for repo_id, repo_data in changes.data.items()
+            if repo_id in changes.changed
+            or not self.repositories.is_registered(repository_id=repo_id)
+        }
+        self.log.debug(
+            "%s of %s %s repositories changed, %s removed",
+            len(category_data),
+            len(changes.data),
+            category,
+            len(changes.removed),
+        )
+
         await self.data.register_unknown_repositories(category_data, category)
 
         for repo_id, repo_data in category_data.items():
@@ -884,6 +1075,16 @@ class HacsBase:
                         "%s Unregister stale custom repository", repository.string
                     )
                     self.repositories.unregister(repository)
+        else:
+            for repo_id in changes.removed:
+                if (
+                    repository := self.repositories.get_by_id(repo_id)
+                ) is not None and not repository.data.installed:
+                    repository.logger.debug(
+                        "%s Unregister repository removed from the default list",
+                        repository.string,
+                    )
+                    self.repositories.unregister(repository)
 
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
         self.coordinators[category].async_update_listeners()
@@ -912,25 +1113,15 @@ class HacsBase:
             self.log.debug("Queue is already running")
             return
 
-        async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
-            can_update = await self.async_can_update()
-            self.log.debug(
-                "Can update %s repositories, items in queue %s",
-                can_update,
-                self.queue.pending_tasks,
-            )
-            if can_update != 0:
-                try:
-                    await self.queue.execute(can_update)
-                except HacsExecutionStillInProgress:
-                    return
-
-                await _handle_queue()
+        # The scheduler keeps the tasks within the rate limit
+        self.log.debug("Processing %s items in the queue", self.queue.pending_tasks)
+        self.queue.async_start()
+        await self.queue.async_wait_idle()
 
-        await _handle_queue()
+    @callback
+    def async_queue_drained(self) -> None:
+        """Save the repository updates once the queue has run all its tasks."""
+        self.data.async_schedule_write()
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -981,7 +1172,7 @@ class HacsBase:
                 repository.remove()
 
         if need_to_save:
-            await self.data.async_write()
+            self.data.async_schedule_write()
 
     async def async_update_downloaded_custom_repositories(self, _=None) -> None:
         """Execute the task."""
@@ -1025,7 +1216,7 @@ class HacsBase:
 
     async def async_handle_critical_repositories(self, _=None) -> None:
         """Handle critical repositories."""
-        critical_queue = QueueManager(hass=self.hass)
+        uninstalls = []
         instored = []
         critical = []
         was_installed = False
@@ -1068,14 +1259,20 @@ class HacsBase:
                     was_installed = True
                     stored["acknowledged"] = False
                     # Remove from HACS
-                    critical_queue.add(repo.uninstall())
+                    uninstalls.append(
+                        self.queue.async_run(
+                            repo.uninstall(), priority=HacsTaskPriority.CRITICAL, cost=0
+                        )
+                    )
                     repo.remove()
 
             stored_critical.append(stored)
             removed_repo.update_data(stored)
 
         # Uninstall
-        await critical_queue.execute()
+        for result in await asyncio.gather(*uninstalls, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.log.error("Could not uninstall critical repository - %s", result)
 
         # Save to FS
         await async_save_to_store(self.hass, "critical", stored_critical)
@@ -17,6 +17,12 @@ PACKAGE_NAME = "custom_components.hacs"
 
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+DEFAULT_CONCURRENT_DOWNLOADS = 6
+DEFAULT_SCHEDULER_WORKERS = 5
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Downloads to a buffer (like archives) are kept in memory up to this size
+DOWNLOAD_SPOOL_MAX_SIZE = 32 * 1024 * 1024
 
 HACS_REPOSITORY_ID = "172733314"
 
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+from collections.abc import Callable
+from typing import Any, NamedTuple
 
 from aiohttp import ClientSession, ClientTimeout
+from homeassistant.core import HomeAssistant
 import voluptuous as vol
 
 from .exceptions import HacsException, HacsNotModifiedException
@@ -21,15 +23,45 @@ CRITICAL_REMOVED_VALIDATORS = {
     "removed": VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
 }
 
+# Number of repositories validated in each executor job
+VALIDATE_CHUNK_SIZE = 500
+
+
+class DataChanges(NamedTuple):
+    """Validated repository data of a section, and what changed since the last fetch."""
+
+    data: dict[str, dict[str, Any]]
+    changed: set[str]
+    removed: set[str]
+
+
+def _validate_repositories(
+    validator: Callable[[Any], Any], repositories: list[tuple[str, dict[str, Any]]]
+) -> dict[str, dict[str, Any] | None]:
+    """Validate repository data, invalid repositories are None."""
+    validated = {}
+    for key, repo_data in repositories:
+        try:
+            validated[key] = validator(repo_data)
+        except vol.Invalid as exception:
+            LOGGER.info("Got invalid data for %s (%s)", repo_data.get("full_name", key), exception)
+            validated[key] = None
+    return validated
+
 
 class HacsDataClient:
     """HACS Data client."""
 
-    def __init__(self, session: ClientSession, client_name: str) -> None:
+    def __init__(
+        self, session: ClientSession, client_name: str, hass: HomeAssistant | None = None
+    ) -> None:
         """Initialize."""
         self._client_name = client_name
         self._etags = {}
+        self._hass = hass
         self._session = session
+        # Per section, the last_fetched and validated data (None if invalid) of each repository
+        self._snapshots: dict[str, dict[str, tuple[float | None, dict[str, Any] | None]]] = {}
 
     async def _do_request(
         self,
@@ -68,17 +100,7 @@ class HacsDataClient:
             return data
 
         if section in VALIDATE_FETCHED_V2_REPO_DATA:
-            validated = {}
-            for key, repo_data in data.items():
-                try:
-                    validated[key] = VALIDATE_FETCHED_V2_REPO_DATA[section](repo_data)
-                except vol.Invalid as exception:
-                    LOGGER.info(
-                        "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
-                    )
-                    continue
-
-            return validated
+            return (await self._async_apply_repositories_data(section, data)).data
 
         if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
             raise ValueError(f"Do not know how to validate {section}")
@@ -93,6 +115,57 @@ class HacsDataClient:
 
         return validated
 
+    async def get_data_changes(self, section: str) -> DataChanges:
+        """Get the validated repository data of a section, with the changes since the last fetch.
+
+        Raises HacsNotModifiedException if the data did not change at all.
+        """
+        if section not in VALIDATE_FETCHED_V2_REPO_DATA:
+            raise ValueError(f"Do not know how to validate {section}")
+        data = await self._do_request(filename="data.json", section=section)
+        return await self._async_apply_repositories_data(section, data)
+
+    async def _async_apply_repositories_data(
+        self, section: str, data: dict[str, dict[str, Any]]
+    ) -> DataChanges:
+        """Validate the repositories which changed and update the snapshot of the section."""
+        snapshot = self._snapshots.get(section, {})
+        to_validate = [
+            (key, repo_data)
+            for key, repo_data in data.items()
+            if (last_fetched := repo_data.get("last_fetched")) is None
+            or (previous := snapshot.get(key)) is None
+            or previous[0] != last_fetched
+        ]
+
+        validated = {}
+        validator = VALIDATE_FETCHED_V2_REPO_DATA[section]
+        for start in range(0, len(to_validate), VALIDATE_CHUNK_SIZE):
+            chunk = to_validate[start : start + VALIDATE_CHUNK_SIZE]
+            if self._hass is None:
+                validated.update(_validate_repositories(validator, chunk))
+            else:
+                validated.update(
+                    await self._hass.async_add_executor_job(
+                        _validate_repositories, validator, chunk
+                    )
+                )
+
+        new_snapshot = {}
+        for key, repo_data in data.items():
+            if key in validated:
+                new_snapshot[key] = (repo_data.get("last_fetched"), validated[key])
+            else:
+                new_snapshot[key] = snapshot[key]
+        self._snapshots[section] = new_snapshot
+
+        LOGGER.debug("Validated %s of %s repositories for %s", len(to_validate), len(data), section)
+        return DataChanges(
+            data={key: entry[1] for key, entry in new_snapshot.items() if entry[1] is not None},
+            changed={key for key, entry in validated.items() if entry is not None},
+            removed=snapshot.keys() - new_snapshot.keys(),
+        )
+
     async def get_repositories(self, section: str) -> list[str]:
         """Get repositories."""
         return await self._do_request(filename="repositories.json", section=section)
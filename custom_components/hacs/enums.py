@@ -1,7 +1,7 @@
 """Helper constants."""
 
 # pylint: disable=missing-class-docstring
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class HacsGitHubRepo(StrEnum):
@@ -38,6 +38,14 @@ class HacsDispatchEvent(StrEnum):
     STATUS = "hacs_dispatch_status"
 
 
+class HacsTaskPriority(IntEnum):
+    """Priority of scheduled tasks, lower values run first."""
+
+    CRITICAL = 0
+    USER = 1
+    BACKGROUND = 2
+
+
 class RepositoryFile(StrEnum):
     """Repository file names."""
 
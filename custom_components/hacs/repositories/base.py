@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from asyncio import sleep
+from asyncio import gather, sleep
 from datetime import UTC, datetime
-import os
 import pathlib
-import shutil
 import tempfile
 from typing import TYPE_CHECKING, Any
 import zipfile
@@ -38,7 +36,6 @@ from ..utils.github_graphql_query import GET_REPOSITORY_RELEASES
 from ..utils.json import json_loads
 from ..utils.logger import LOGGER
 from ..utils.path import is_safe
-from ..utils.queue_manager import QueueManager
 from ..utils.store import async_remove_store
 from ..utils.url import github_archive, github_release_asset
 from ..utils.validate import Validate
@@ -126,6 +123,8 @@ HACS_MANIFEST_KEYS_TO_EXPORT = (
     ("name", None),
 )
 
+_UNSET = object()
+
 
 class FileInformation:
     """FileInformation."""
@@ -174,6 +173,18 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: list[str] = []
 
+    # Not an attrs field, set when any field changes value
+    # and cleared by HacsData once the change is persisted.
+    # The list fields are assigned new lists, never changed in place (the
+    # defaults are shared), so every change goes through __setattr__
+    dirty = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, marking the data as dirty if the value changed."""
+        if name != "dirty" and self.__dict__.get(name, _UNSET) != value:
+            object.__setattr__(self, "dirty", True)
+        object.__setattr__(self, name, value)
+
     @property
     def name(self):
         """Return the name."""
@@ -585,35 +596,18 @@ class HacsRepository:
     ) -> None:
         """Download ZIP archive from repository release."""
         try:
-            filecontent = await self.hacs.async_download_file(content["url"])
+            buffer = await self.hacs.async_download_file_to_buffer(content["url"])
 
-            if filecontent is None:
+            if buffer is None:
                 validate.errors.append(f"Failed to download {content['url']}")
                 return
 
-            temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-            temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-
-            result = await self.hacs.async_save_file(temp_file, filecontent)
-
             def _extract_zip_file():
-                with zipfile.ZipFile(temp_file, "r") as zip_file:
+                with buffer, zipfile.ZipFile(buffer, "r") as zip_file:
                     zip_file.extractall(self.content.path.local)
 
             await self.hacs.hass.async_add_executor_job(_extract_zip_file)
-
-            def cleanup_temp_dir():
-                """Cleanup temp_dir."""
-                if os.path.exists(temp_dir):
-                    self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                    shutil.rmtree(temp_dir)
-
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content["name"])
-                await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
-                return
-
-            validate.errors.append(f"[{content['name']}] was not downloaded")
+            self.logger.info("%s Download of %s completed", self.string, content["name"])
         # lgtm [py/catch-base-exception] pylint: disable=broad-except
         except BaseException:
             validate.errors.append("Download was not completed")
@@ -645,15 +639,18 @@ class HacsRepository:
         if not contents:
             raise HacsException("No content to download")
 
-        download_queue = QueueManager(hass=self.hacs.hass)
-
-        for content in contents:
-            if self.repository_manifest.content_in_root and self.repository_manifest.filename:
-                if content.name != self.repository_manifest.filename:
-                    continue
-            download_queue.add(self.dowload_repository_content(content))
-
-        await download_queue.execute()
+        # The number of concurrent downloads is limited by hacs.download_limiter
+        await gather(
+            *(
+                self.dowload_repository_content(content)
+                for content in contents
+                if not (
+                    self.repository_manifest.content_in_root
+                    and self.repository_manifest.filename
+                    and content.name != self.repository_manifest.filename
+                )
+            )
+        )
 
     async def download_repository_zip(self):
         """Download the zip archive of the repository."""
@@ -662,28 +659,24 @@ class HacsRepository:
         if not ref:
             raise HacsException("Missing required elements.")
 
-        filecontent = await self.hacs.async_download_file(
+        buffer = await self.hacs.async_download_file_to_buffer(
             github_archive(repository=self.data.full_name, version=ref, variant="tags"),
             keep_url=True,
             nolog=True,
         )
 
-        if filecontent is None:
-            filecontent = await self.hacs.async_download_file(
+        if buffer is None:
+            buffer = await self.hacs.async_download_file_to_buffer(
                 github_archive(repository=self.data.full_name, version=ref, variant="heads"),
                 keep_url=True,
             )
-        if filecontent is None:
+        if buffer is None:
             raise HacsException(f"[{self}] Failed to download zipball")
 
-        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-        result = await self.hacs.async_save_file(temp_file, filecontent)
-        if not result:
-            raise HacsException("Could not save ZIP file")
-
         def _extract_zip_file():
-            with zipfile.ZipFile(temp_file, "r") as zip_file:
+            # The archive is read straight from the buffer, only members
+            # in the remote path of the content are written to disk
+            with buffer, zipfile.ZipFile(buffer, "r") as zip_file:
                 extractable = []
                 for path in zip_file.filelist:
                     filename = "/".join(path.filename.split("/")[1:])
@@ -702,14 +695,6 @@ class HacsRepository:
                 zip_file.extractall(self.content.path.local, extractable)
 
         await self.hacs.hass.async_add_executor_job(_extract_zip_file)
-
-        def cleanup_temp_dir():
-            """Cleanup temp_dir."""
-            if os.path.exists(temp_dir):
-                self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                shutil.rmtree(temp_dir)
-
-        await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
         self.logger.info("%s Content was extracted to %s", self.string, self.content.path.local)
 
     async def async_get_hacs_json(self, ref: str = None) -> dict[str, Any] | None:
@@ -1248,18 +1233,11 @@ class HacsRepository:
             for asset in release.data.get("assets", [])
         ]
 
-    @concurrent(concurrenttasks=10)
     async def dowload_repository_content(self, content: FileInformation) -> None:
         """Download content."""
         try:
             self.logger.debug("%s Downloading %s", self.string, content.name)
 
-            filecontent = await self.hacs.async_download_file(content.download_url)
-
-            if filecontent is None:
-                self.validate.errors.append(f"[{content.name}] was not downloaded.")
-                return
-
             # Save the content of the file.
             if self.content.single or content.path is None:
                 local_directory = self.content.path.local
@@ -1279,7 +1257,9 @@ class HacsRepository:
 
             local_file_path = (f"{local_directory}/{content.name}").replace("//", "/")
 
-            result = await self.hacs.async_save_file(local_file_path, filecontent)
+            result = await self.hacs.async_download_file_to_path(
+                content.download_url, local_file_path
+            )
             if result:
                 self.logger.info("%s Download of %s completed", self.string, content.name)
                 return
@@ -13,7 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .base import HacsBase
 from .const import DOMAIN
 from .entity import HacsRepositoryEntity
-from .enums import HacsCategory, HacsDispatchEvent
+from .enums import HacsCategory, HacsDispatchEvent, HacsTaskPriority
 from .exceptions import HacsException
 
 
@@ -85,7 +85,10 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
             raise HomeAssistantError(f"Version {self.installed_version} of {
                                      self.repository.data.full_name} is already downloaded")
         try:
-            await self.repository.async_download_repository(ref=version or self.latest_version)
+            await self.hacs.queue.async_run(
+                self.repository.async_download_repository(ref=version or self.latest_version),
+                priority=HacsTaskPriority.USER,
+            )
         except HacsException as exception:
             raise HomeAssistantError(exception) from exception
 
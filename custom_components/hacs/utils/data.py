@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 from datetime import UTC, datetime
-from typing import Any
+import itertools
+from typing import Any, NamedTuple
 
-from homeassistant.core import callback
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 
 from ..base import HacsBase
 from ..const import HACS_REPOSITORY_ID
@@ -15,7 +17,19 @@ from ..enums import HacsDisabledReason, HacsDispatchEvent
 from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
 from .logger import LOGGER
 from .path import is_safe
-from .store import async_load_from_store, async_save_to_store
+from .store import (
+    async_load_from_store,
+    async_save_to_store,
+    get_data_fingerprint,
+    set_store_fingerprint,
+)
+
+# Seconds a scheduled write waits for other changes to include
+WRITE_DELAY = 10
+
+# Revisions of the exported repository data, unique within the process so a
+# new HacsData (after a reload) never repeats the fingerprint of an old one
+_REVISIONS = itertools.count(1)
 
 EXPORTED_BASE_DATA = (
     ("new", False),
@@ -55,6 +69,15 @@ EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
 )
 
 
+class _ExportedRepository(NamedTuple):
+    """The data of a repository as it was last exported."""
+
+    manifest: dict
+    data: dict
+    experimental: dict
+    revision: int
+
+
 class HacsData:
     """HacsData class."""
 
@@ -63,40 +86,97 @@ class HacsData:
         self.logger = LOGGER
         self.hacs = hacs
         self.content = {}
+        self._exported: dict[HacsRepository, _ExportedRepository] = {}
+        self._fingerprint: int | None = None
+        self._unsub_write: CALLBACK_TYPE | None = None
 
     async def async_force_write(self, _=None):
         """Force write."""
         await self.async_write(force=True)
 
+    @callback
+    def async_schedule_write(self, delay: float = WRITE_DELAY) -> None:
+        """Schedule a write, coalesced with any other write scheduled before it runs."""
+        if self._unsub_write is None:
+            self._unsub_write = async_call_later(self.hacs.hass, delay, self._async_scheduled_write)
+
+    async def _async_scheduled_write(self, _=None) -> None:
+        """Run a scheduled write."""
+        self._unsub_write = None
+        await self.async_write()
+
     async def async_write(self, force: bool = False) -> None:
         """Write content to the store files."""
+        if self._unsub_write is not None:
+            # Anything scheduled is included in this write
+            self._unsub_write()
+            self._unsub_write = None
+
         if not force and self.hacs.system.disabled:
             return
 
         self.logger.debug("<HacsData async_write> Saving data")
 
         # Hacs
-        await async_save_to_store(
-            self.hacs.hass,
-            "hacs",
-            {
-                "archived_repositories": self.hacs.common.archived_repositories,
-                "renamed_repositories": self.hacs.common.renamed_repositories,
-                "ignored_repositories": self.hacs.common.ignored_repositories,
-            },
-        )
+        await async_save_to_store(self.hacs.hass, "hacs", self._async_hacs_content())
+        self._async_export_repositories()
         await self._async_store_experimental_content_and_repos()
         await self._async_store_content_and_repos()
 
+    @callback
+    def _async_hacs_content(self) -> dict:
+        """Return the HACS data to store."""
+        return {
+            "archived_repositories": self.hacs.common.archived_repositories,
+            "renamed_repositories": self.hacs.common.renamed_repositories,
+            "ignored_repositories": self.hacs.common.ignored_repositories,
+        }
+
+    @callback
+    def _async_export_repositories(self) -> None:
+        """Refresh the exported data of the repositories which changed since the last write."""
+        exported = {}
+        for repository in self.hacs.repositories.list_all:
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            manifest = repository.repository_manifest.manifest
+            if (
+                (previous := self._exported.get(repository)) is not None
+                and not repository.data.dirty
+                and previous.manifest is manifest
+            ):
+                exported[repository] = previous
+                continue
+
+            repository.data.dirty = False
+            data = self.async_store_repository_data(repository)
+            experimental = self.async_store_experimental_repository_data(repository)
+            if (
+                previous is not None
+                and previous.data == data
+                and previous.experimental == experimental
+            ):
+                exported[repository] = previous._replace(manifest=manifest)
+                continue
+
+            exported[repository] = _ExportedRepository(
+                manifest, data, experimental, next(_REVISIONS)
+            )
+        self._exported = exported
+        # Both documents are built from the exported data, in the same order,
+        # so the revisions identify the content of either of them
+        self._fingerprint = hash(tuple(entry.revision for entry in exported.values()))
+
     async def _async_store_content_and_repos(self, _=None):  # bb: ignore
         """Store the main repos file and each repo that is out of date."""
         # Repositories
-        self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
-
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
+        self.content = {
+            str(repository.data.id): exported.data
+            for repository, exported in self._exported.items()
+        }
+        await async_save_to_store(
+            self.hacs.hass, "repositories", self.content, fingerprint=self._fingerprint
+        )
         for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
             self.hacs.async_dispatch(event, {})
 
@@ -104,15 +184,16 @@ class HacsData:
         """Store the main repos file and each repo that is out of date."""
         # Repositories
         self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_experimental_repository_data(repository)
+        for repository, exported in self._exported.items():
+            self.content.setdefault(repository.data.category, []).append(exported.experimental)
 
-        await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
+        await async_save_to_store(
+            self.hacs.hass, "data", {"repositories": self.content}, fingerprint=self._fingerprint
+        )
 
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
-        """Store the repository data."""
+        """Return the repository data to store."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
         for key, default in (
@@ -128,13 +209,12 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        return data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
-        """Store the experimental repository data for non downloaded repositories."""
+    def async_store_experimental_repository_data(self, repository: HacsRepository) -> dict:
+        """Return the experimental repository data to store for non downloaded repositories."""
         data = {}
-        self.content.setdefault(repository.data.category, [])
 
         if repository.data.installed:
             data["repository_manifest"] = repository.repository_manifest.manifest
@@ -151,7 +231,7 @@ class HacsData:
                 if (value := getattr(repository.data, key, default)) != default:
                     data[key] = value
 
-        self.content[repository.data.category].append({"id": str(repository.data.id), **data})
+        return {"id": str(repository.data.id), **data}
 
     async def restore(self):
         """Restore saved data."""
@@ -166,7 +246,8 @@ class HacsData:
 
         try:
             repositories = await async_load_from_store(self.hacs.hass, "repositories")
-            if not repositories and (data := await async_load_from_store(self.hacs.hass, "data")):
+            data = await async_load_from_store(self.hacs.hass, "data")
+            if not repositories and data:
                 for category, entries in data.get("repositories", {}).items():
                     for repository in entries:
                         repositories[repository["id"]] = {"category": category, **repository}
@@ -221,6 +302,7 @@ class HacsData:
                     continue
                 self.async_restore_repository(entry, repo_data)
 
+            self._async_seed_fingerprints(hacs, repositories, data)
             self.logger.info("<HacsData restore> Restore done")
         except (
             # lgtm [py/catch-base-exception] pylint: disable=broad-except
@@ -232,6 +314,39 @@ class HacsData:
             return False
         return True
 
+    @callback
+    def _async_seed_fingerprints(self, hacs: dict, repositories: dict, data: dict) -> None:
+        """Record the fingerprints of the stores which the restored data matches.
+
+        The fingerprints are kept in memory only, so without this the first
+        write after a start (or a reload) rewrites every store.
+        """
+        content = self._async_hacs_content()
+        if (
+            hacs.keys() == content.keys()
+            and set(hacs["archived_repositories"]) == content["archived_repositories"]
+            and hacs["renamed_repositories"] == content["renamed_repositories"]
+            and set(hacs["ignored_repositories"]) == content["ignored_repositories"]
+        ):
+            set_store_fingerprint(self.hacs.hass, "hacs", get_data_fingerprint(content))
+
+        self._async_export_repositories()
+        if repositories == {
+            str(repository.data.id): exported.data
+            for repository, exported in self._exported.items()
+        }:
+            set_store_fingerprint(self.hacs.hass, "repositories", self._fingerprint)
+        # The order of the repositories in the lists of a category doesn't matter
+        if data.keys() == {"repositories"} and {
+            str(entry["id"]): (category, entry)
+            for category, entries in data["repositories"].items()
+            for entry in entries
+        } == {
+            str(repository.data.id): (repository.data.category, exported.experimental)
+            for repository, exported in self._exported.items()
+        }:
+            set_store_fingerprint(self.hacs.hass, "data", self._fingerprint)
+
     async def register_unknown_repositories(
         self, repositories: dict[str, dict[str, Any]], category: str | None = None
     ):
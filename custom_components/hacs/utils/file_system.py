@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
 import os
 import shutil
+from tempfile import SpooledTemporaryFile
 from typing import TypeAlias
 
 from homeassistant.core import HomeAssistant
@@ -40,3 +43,97 @@ async def async_remove_directory(
         if missing_ok:
             return
         raise
+
+
+class StreamingFileWriter:
+    """Write a file from chunks to a temporary file next to it.
+
+    The .gz sidecar of .js files is compressed in the same pass, and the
+    files only replace the existing ones once the content is complete.
+    The methods are blocking and need to run in the executor.
+    """
+
+    # Nothing is written to memory
+    max_memory_size = 0
+
+    def __init__(self, file_path: str) -> None:
+        """Initialize."""
+        self.file_path = file_path
+        self.gzip_path = f"{file_path}.gz" if file_path.endswith(".js") else None
+        self.size = 0
+        self._file = None
+        self._gzip_file = None
+        self._gzip = None
+
+    def open(self) -> None:
+        """Open (or truncate) the temporary files."""
+        self.close()
+        self.size = 0
+        self._file = open(f"{self.file_path}.tmp", "wb")
+        if self.gzip_path is not None:
+            self._gzip_file = open(f"{self.gzip_path}.tmp", "wb")
+            # Named after the file, as gzip.open(file_path + ".gz") would
+            self._gzip = gzip.GzipFile(filename=self.file_path, mode="wb", fileobj=self._gzip_file)
+
+    def write(self, chunk: bytes) -> None:
+        """Write a chunk of the content."""
+        self._file.write(chunk)
+        if self._gzip is not None:
+            self._gzip.write(chunk)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        """Close the temporary files."""
+        for handler in (self._file, self._gzip, self._gzip_file):
+            if handler is not None:
+                handler.close()
+        self._file = self._gzip = self._gzip_file = None
+
+    def commit(self) -> None:
+        """Move the complete files into place."""
+        self.close()
+        os.replace(f"{self.file_path}.tmp", self.file_path)
+        if self.gzip_path is not None:
+            os.replace(f"{self.gzip_path}.tmp", self.gzip_path)
+
+    def discard(self) -> None:
+        """Remove the temporary files."""
+        self.close()
+        for path in (self.file_path, self.gzip_path):
+            if path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(f"{path}.tmp")
+
+
+class SpooledBufferWriter:
+    """Write a file from chunks to a buffer, which is moved to disk if it grows large.
+
+    Has the same interface as StreamingFileWriter, the buffer is rewound
+    when committed so it can be read from the start.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize."""
+        self.buffer = SpooledTemporaryFile(max_size=max_size)
+        # Writes up to this size don't touch the disk
+        self.max_memory_size = max_size
+        self.size = 0
+
+    def open(self) -> None:
+        """Truncate the buffer."""
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        """Write a chunk of the content."""
+        self.buffer.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> None:
+        """Rewind the complete buffer."""
+        self.buffer.seek(0)
+
+    def discard(self) -> None:
+        """Close the buffer."""
+        self.buffer.close()
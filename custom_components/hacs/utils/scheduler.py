@@ -0,0 +1,385 @@
+"""The HacsScheduler class."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import heapq
+import itertools
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from ..const import DEFAULT_SCHEDULER_WORKERS
+from ..enums import HacsTaskPriority
+from .logger import LOGGER
+
+_LOGGER = LOGGER
+
+# GitHub API requests left for everything which is not scheduled
+RATE_LIMIT_RESERVE = 1000
+# GitHub API requests a task is expected to use, like updating a repository
+DEFAULT_TASK_COST = 10
+# Seconds to wait before asking for the rate limit again if that failed
+RATE_LIMIT_RETRY = 60
+
+
+class RateLimitBucket:
+    """Token bucket of GitHub API requests, refilled when the rate limit resets.
+
+    Tokens are taken for each task before it runs, the bucket is corrected
+    with the rate limit GitHub reports in the headers of the responses.
+    """
+
+    def __init__(self, reserve: int = RATE_LIMIT_RESERVE) -> None:
+        """Initialize."""
+        self.reserve = reserve
+        self.remaining: int | None = None
+        self.reset: int = 0
+
+    @property
+    def available(self) -> int:
+        """Return the number of tokens which can be taken."""
+        return max(0, (self.remaining or 0) - self.reserve)
+
+    @property
+    def expired(self) -> bool:
+        """Return True if the state of the rate limit is unknown or outdated."""
+        return self.remaining is None or (self.available == 0 and time.time() >= self.reset)
+
+    @callback
+    def async_update(self, remaining: int, reset: int) -> None:
+        """Update the bucket with the rate limit reported by GitHub."""
+        if self.remaining is None or reset != self.reset:
+            self.remaining = remaining
+        else:
+            # Responses can arrive out of order, the lowest count is the latest
+            self.remaining = min(self.remaining, remaining)
+        self.reset = reset
+
+    @callback
+    def async_update_from_headers(self, headers: Any) -> None:
+        """Update the bucket from the headers of a GitHub API response."""
+        if (
+            headers is None
+            or headers.x_ratelimit_remaining is None
+            or headers.x_ratelimit_reset is None
+            or headers.x_ratelimit_resource not in (None, "core")
+        ):
+            return
+        self.async_update(int(headers.x_ratelimit_remaining), int(headers.x_ratelimit_reset))
+
+    @callback
+    def async_take(self, cost: int, *, force: bool = False) -> float:
+        """Take tokens, return 0 if they were taken or else the seconds until the reset."""
+        if force or cost <= self.available:
+            self.remaining = (self.remaining or 0) - cost
+            return 0
+        return max(self.reset - time.time(), 1)
+
+
+class ScheduledTask:
+    """A task in the scheduler."""
+
+    __slots__ = (
+        "coroutine",
+        "cost",
+        "future",
+        "name",
+        "priority",
+        "scheduler",
+        "sequence",
+        "state",
+        "task",
+    )
+
+    def __init__(
+        self,
+        scheduler: HacsScheduler,
+        coroutine: Coroutine,
+        priority: HacsTaskPriority,
+        sequence: int,
+        cost: int,
+        name: str,
+    ) -> None:
+        """Initialize."""
+        self.coroutine = coroutine
+        self.cost = cost
+        self.future: asyncio.Future | None = None
+        self.name = name
+        self.priority = priority
+        self.scheduler = scheduler
+        self.sequence = sequence
+        self.state = "pending"
+        self.task: asyncio.Task | None = None
+
+    def __lt__(self, other: ScheduledTask) -> bool:
+        """Order by priority, then by the order the tasks were added."""
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+    def cancel(self) -> None:
+        """Cancel the task, if it's not done."""
+        self.scheduler.cancel(self)
+
+
+class HacsScheduler:
+    """Run tasks with a bounded pool of workers, by priority and within the rate limit.
+
+    Background tasks only run after async_start and stop being picked up when
+    paused, higher priority tasks (user initiated or critical) always run and
+    are not held back by the rate limit. While the rate limit is reached no
+    worker waits for it, the workers are started again when it resets.
+
+    on_drained is called when the last worker exits and no task is left,
+    tasks held back by the rate limit included.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        rate_limit_fetcher: Callable[[], Awaitable[tuple[int, int] | None]] | None = None,
+        workers: int = DEFAULT_SCHEDULER_WORKERS,
+        on_drained: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.rate_limit = RateLimitBucket()
+        self.max_workers = workers
+        self.started = False
+        self._fetch_rate_limit = rate_limit_fetcher
+        self._on_drained = on_drained
+        self._rate_limit_lock = asyncio.Lock()
+        self._heap: list[ScheduledTask] = []
+        self._sequence = itertools.count()
+        self._workers: set[asyncio.Task] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._pending = 0
+        self._running = 0
+        self._rate_limit_timer: asyncio.TimerHandle | None = None
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+
+    @property
+    def pending_tasks(self) -> int:
+        """Return a count of tasks in the queue which are not done, running included."""
+        return self._pending + self._running
+
+    @property
+    def has_pending_tasks(self) -> bool:
+        """Return True if there are tasks in the queue which are not done."""
+        return self.pending_tasks != 0
+
+    @property
+    def running(self) -> bool:
+        """Return True if any worker is running."""
+        return bool(self._workers)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the progress of the scheduler."""
+        return {
+            "pending": self._pending,
+            "running": self._running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "workers": len(self._workers),
+            "waiting_for_rate_limit": self._rate_limit_timer is not None,
+            "rate_limit_available": self.rate_limit.available,
+            "rate_limit_reset": self.rate_limit.reset,
+        }
+
+    @callback
+    def add(
+        self,
+        coroutine: Coroutine,
+        *,
+        priority: HacsTaskPriority = HacsTaskPriority.BACKGROUND,
+        cost: int = DEFAULT_TASK_COST,
+        name: str | None = None,
+        future: asyncio.Future | None = None,
+    ) -> ScheduledTask:
+        """Add a task to the queue, the future (if any) gets the result of the task."""
+        entry = ScheduledTask(
+            self,
+            coroutine,
+            priority,
+            next(self._sequence),
+            cost,
+            name or getattr(coroutine, "__qualname__", str(coroutine)),
+        )
+        entry.future = future
+        heapq.heappush(self._heap, entry)
+        self._pending += 1
+        self._async_spawn_workers()
+        return entry
+
+    async def async_run(self, coroutine: Coroutine, **kwargs: Any) -> Any:
+        """Add a task to the queue and return its result once it has run."""
+        future = self.hass.loop.create_future()
+        entry = self.add(coroutine, future=future, **kwargs)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            entry.cancel()
+            raise
+
+    @callback
+    def async_start(self) -> None:
+        """Start running the background tasks."""
+        self.started = True
+        self._async_spawn_workers()
+
+    @callback
+    def pause(self) -> None:
+        """Stop running background tasks, tasks which are running are not interrupted."""
+        self.started = False
+
+    @callback
+    def cancel(self, entry: ScheduledTask) -> None:
+        """Cancel a task, if it's not done."""
+        if entry.state == "pending":
+            entry.state = "cancelled"
+            entry.coroutine.close()
+            self._pending -= 1
+            self.cancelled += 1
+            if entry.future is not None and not entry.future.done():
+                entry.future.cancel()
+        elif entry.state == "running" and entry.task is not None:
+            entry.task.cancel()
+
+    @callback
+    def clear(self) -> None:
+        """Cancel all tasks."""
+        self._async_cancel_rate_limit_timer()
+        for entry in self._heap:
+            self.cancel(entry)
+        self._heap = []
+        for worker in self._workers:
+            worker.cancel()
+
+    async def async_wait_idle(self) -> None:
+        """Wait until no worker is running."""
+        await self._idle.wait()
+
+    @callback
+    def _async_spawn_workers(self) -> None:
+        """Start workers for the tasks which can run."""
+        while len(self._workers) < min(self.max_workers, self._pending) and self._can_run_next():
+            worker = self.hass.async_create_background_task(
+                self._async_worker(), "hacs_scheduler_worker"
+            )
+            self._workers.add(worker)
+            worker.add_done_callback(self._async_worker_done)
+            self._idle.clear()
+
+    @callback
+    def _async_worker_done(self, worker: asyncio.Task) -> None:
+        """Handle a worker which exited."""
+        self._workers.discard(worker)
+        if not self._workers:
+            self._idle.set()
+            if (
+                self._on_drained is not None
+                and not worker.cancelled()
+                and not self.has_pending_tasks
+            ):
+                self._on_drained()
+
+    @callback
+    def _async_wait_for_rate_limit(self, wait: float) -> None:
+        """Hold back the background tasks until the rate limit resets."""
+        if self._rate_limit_timer is None:
+            _LOGGER.debug("<HacsScheduler> Rate limit reached, waiting %.0f seconds", wait)
+            self._rate_limit_timer = self.hass.loop.call_later(wait, self._async_rate_limit_reset)
+
+    @callback
+    def _async_rate_limit_reset(self) -> None:
+        """Start workers for the tasks which were held back by the rate limit."""
+        self._rate_limit_timer = None
+        self._async_spawn_workers()
+
+    @callback
+    def _async_cancel_rate_limit_timer(self) -> None:
+        """Cancel waiting for the rate limit to reset."""
+        if self._rate_limit_timer is not None:
+            self._rate_limit_timer.cancel()
+            self._rate_limit_timer = None
+
+    def _can_run_next(self) -> bool:
+        """Return True if the first task in the queue can run."""
+        while self._heap and self._heap[0].state != "pending":
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return False
+        if self._heap[0].priority < HacsTaskPriority.BACKGROUND:
+            return True
+        return self.started and self._rate_limit_timer is None
+
+    async def _async_refresh_rate_limit(self) -> None:
+        """Get the current rate limit from GitHub if it's unknown or outdated."""
+        async with self._rate_limit_lock:
+            if not self.rate_limit.expired:
+                return
+            rate_limit = await self._fetch_rate_limit() if self._fetch_rate_limit else None
+            if rate_limit is None:
+                # Try again later
+                self.rate_limit.async_update(0, int(time.time()) + RATE_LIMIT_RETRY)
+            else:
+                self.rate_limit.async_update(*rate_limit)
+
+    async def _async_worker(self) -> None:
+        """Run tasks until the queue is empty, or only has tasks which can't run."""
+        while self._can_run_next():
+            entry = heapq.heappop(self._heap)
+            force = entry.priority < HacsTaskPriority.BACKGROUND
+            if entry.cost and not force:
+                if self.rate_limit.expired:
+                    await self._async_refresh_rate_limit()
+                if wait := self.rate_limit.async_take(entry.cost):
+                    # Put it back and free the worker, higher priority tasks
+                    # added in the meantime get a worker of their own
+                    heapq.heappush(self._heap, entry)
+                    self._async_wait_for_rate_limit(wait)
+                    continue
+            elif entry.cost:
+                self.rate_limit.async_take(entry.cost, force=True)
+
+            self._pending -= 1
+            self._running += 1
+            entry.state = "running"
+            entry.task = asyncio.create_task(entry.coroutine)
+            start = time.monotonic()
+            try:
+                result = await entry.task
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                if entry.future is not None and not entry.future.done():
+                    entry.future.cancel()
+                if not entry.task.cancelled():
+                    # The worker itself was cancelled
+                    entry.task.cancel()
+                    raise
+            except Exception as exception:  # pylint: disable=broad-except
+                self.failed += 1
+                if entry.future is None:
+                    _LOGGER.error("<HacsScheduler> %s failed: %s", entry.name, exception)
+                elif not entry.future.done():
+                    entry.future.set_exception(exception)
+            else:
+                self.completed += 1
+                if entry.future is not None and not entry.future.done():
+                    entry.future.set_result(result)
+                _LOGGER.debug(
+                    "<HacsScheduler> %s finished in %.2f seconds",
+                    entry.name,
+                    time.monotonic() - start,
+                )
+            finally:
+                entry.state = "done"
+                entry.task = None
+                self._running -= 1
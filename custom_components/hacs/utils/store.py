@@ -1,6 +1,6 @@
 """Storage handers."""
 
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
 
@@ -10,6 +10,9 @@ from .logger import LOGGER
 
 _LOGGER = LOGGER
 
+# hass.data key of the fingerprints of the data last saved for each store key
+DATA_STORE_FINGERPRINTS = "hacs_store_fingerprints"
+
 
 class HACSStore(Store):
     """A subclass of Store that allows multiple loads in the executor."""
@@ -52,28 +55,46 @@ async def async_load_from_store(hass, key):
     return await get_store_for_key(hass, key).async_load() or {}
 
 
-async def async_save_to_store(hass, key, data):
+def get_data_fingerprint(data):
+    """Return a fingerprint of the data, only meaningful within this process."""
+    return hash(json_bytes(data))
+
+
+def set_store_fingerprint(hass, key, fingerprint):
+    """Record the fingerprint of data which is already stored for the key."""
+    hass.data.setdefault(DATA_STORE_FINGERPRINTS, {})[get_store_key(key)] = fingerprint
+
+
+async def async_save_to_store(hass, key, data, fingerprint=None):
     """Generate dynamic data to store and save it to the filesystem.
 
-    The data is only written if the content on the disk has changed
-    by reading the existing content and comparing it.
+    The data is only written if its fingerprint differs from the one of the
+    data last saved for the key, which is kept in memory so no disk read is
+    needed for the comparison.
 
-    If the data has changed this will generate two executor jobs
+    Callers which can tell cheaply if their data changed can pass their own
+    fingerprint, otherwise it's calculated from the serialized data.
 
-    If the data has not changed this will generate one executor job
+    Returns True if the data was written.
     """
-    current = await async_load_from_store(hass, key)
-    if current is None or current != data:
-        await get_store_for_key(hass, key).async_save(data)
-        return
-    _LOGGER.debug(
-        "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
-        get_store_key(key),
-    )
+    if fingerprint is None:
+        fingerprint = get_data_fingerprint(data)
+    fingerprints = hass.data.setdefault(DATA_STORE_FINGERPRINTS, {})
+    store_key = get_store_key(key)
+    if fingerprints.get(store_key) == fingerprint:
+        _LOGGER.debug(
+            "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
+            store_key,
+        )
+        return False
+    await get_store_for_key(hass, key).async_save(data)
+    fingerprints[store_key] = fingerprint
+    return True
 
 
 async def async_remove_store(hass, key):
     """Remove a store element that should no longer be used."""
     if "/" not in key:
         return
+    hass.data.get(DATA_STORE_FINGERPRINTS, {}).pop(get_store_key(key), None)
     await get_store_for_key(hass, key).async_remove()
@@ -114,6 +114,7 @@ async def hacs_info(
                 "dev": hacs.configuration.dev,
                 "disabled_reason": hacs.system.disabled_reason,
                 "has_pending_tasks": hacs.queue.has_pending_tasks,
+                "queue": hacs.queue.stats,
                 "lovelace_mode": hacs.core.lovelace_mode,
                 "stage": hacs.stage,
                 "startup": hacs.status.startup,
@@ -106,7 +106,7 @@ async def hacs_repositories_clear_new(
                 )
                 repo.data.new = False
     hacs.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
-    await hacs.data.async_write()
+    hacs.data.async_schedule_write()
     connection.send_message(websocket_api.result_message(msg["id"]))
 
 
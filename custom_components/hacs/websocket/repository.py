@@ -9,7 +9,7 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
 from ..const import DOMAIN
-from ..enums import HacsDispatchEvent
+from ..enums import HacsDispatchEvent, HacsTaskPriority
 from ..exceptions import HacsException
 from ..utils.version import version_left_higher_then_right
 
@@ -53,7 +53,7 @@ async def hacs_repository_info(
 
     if repository.data.new:
         repository.data.new = False
-        await hacs.data.async_write()
+        hacs.data.async_schedule_write()
 
     connection.send_message(
         websocket_api.result_message(
@@ -231,7 +231,10 @@ async def hacs_repository_download(
 
     try:
         was_installed = repository.data.installed
-        await repository.async_download_repository(ref=msg.get("version"))
+        await hacs.queue.async_run(
+            repository.async_download_repository(ref=msg.get("version")),
+            priority=HacsTaskPriority.USER,
+        )
         if not was_installed:
             hacs.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
             await hacs.async_recreate_entities()
@@ -328,7 +328,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: OrefAlertConfigEntry) ->
 
     entry.runtime_data = OrefAlertRuntimeData(
         coordinator,
-        OrefAlertCoordinatorUpdater(hass, coordinator),
+        OrefAlertCoordinatorUpdater(hass, coordinator, [pushy, tzevaadom]),
         AreasChecker(hass),
         await inject_template_extensions(hass),
         pushy,
@@ -0,0 +1,186 @@
+"""Incremental, time-ordered store of alerts."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import TYPE_CHECKING
+
+from .const import AREA_FIELD, CATEGORY_FIELD, DATE_FIELD, IST, AlertType
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable
+
+AlertKey = tuple[str, int, str]
+SortKey = tuple[float, str]
+
+
+def alert_key(alert: AlertType) -> AlertKey:
+    """Return the identity of the alert (area, category and date)."""
+    return alert[AREA_FIELD], alert[CATEGORY_FIELD], alert[DATE_FIELD]
+
+
+@lru_cache(maxsize=4096)
+def date_to_timestamp(date: str) -> float:
+    """Convert alert's date to a timestamp (alerts of a salvo share the date)."""
+    return datetime.fromisoformat(date).replace(tzinfo=IST).timestamp()
+
+
+class AlertRecord:
+    """Alert and its pre-parsed timestamp."""
+
+    __slots__ = ("alert", "timestamp")
+
+    def __init__(self, alert: AlertType) -> None:
+        """Initialize the record."""
+        self.alert: AlertType = alert
+        self.timestamp: float = date_to_timestamp(alert[DATE_FIELD])
+
+    @property
+    def sort_key(self) -> SortKey:
+        """Sort by descending-order "date" and then ascending-order "name"."""
+        return -self.timestamp, self.alert[AREA_FIELD]
+
+
+class AlertStore:
+    """Keep alerts sorted and merge changes incrementally.
+
+    Alerts are grouped into layers (e.g. history, website, a channel). Syncing a
+    layer inserts only the alerts which are not already stored and removes the
+    ones which are gone, so the cost of a refresh depends on the changes only.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the store."""
+        self._layers: dict[Hashable, dict[AlertKey, AlertRecord]] = {}
+        self._keys: list[SortKey] = []
+        self._records: list[AlertRecord] = []
+        self.version: int = 0
+
+    def sync(self, layer: Hashable, alerts: Iterable[AlertType]) -> list[AlertRecord]:
+        """Set the content of the layer and return the newly added records."""
+        previous = self._layers.get(layer, {})
+        current: dict[AlertKey, AlertRecord] = {}
+        added: list[AlertRecord] = []
+        for alert in alerts:
+            if (key := alert_key(alert)) in current:
+                continue
+            if (exist := previous.pop(key, None)) is not None:
+                current[key] = exist
+            else:
+                current[key] = record = AlertRecord(alert)
+                added.append(record)
+        for record in previous.values():
+            self._remove(record)
+        self._insert(added)
+        self._layers[layer] = current
+        if added or previous:
+            self.version += 1
+        return added
+
+    def prune(self, earliest: float) -> None:
+        """Remove alerts which are older than the timestamp."""
+        index = self._index(earliest)
+        if index == len(self._records):
+            return
+        for record in self._records[index:]:
+            key = alert_key(record.alert)
+            for layer in self._layers.values():
+                if layer.get(key) is record:
+                    del layer[key]
+                    break
+        del self._keys[index:]
+        del self._records[index:]
+        self.version += 1
+
+    def items(self) -> list[AlertRecord]:
+        """Return all records."""
+        return list(self._records)
+
+    def recent(self, earliest: float) -> list[AlertRecord]:
+        """Return the records which are not older than the timestamp."""
+        return self._records[: self._index(earliest)]
+
+    def _index(self, earliest: float) -> int:
+        """Return the index of the first record which is older than the timestamp."""
+        return bisect_right(self._keys, -earliest, key=itemgetter(0))
+
+    def _insert(self, records: list[AlertRecord]) -> None:
+        """Insert records while keeping the order."""
+        if len(records) > len(self._records):
+            # Bulk load (e.g. the first refresh) is cheaper with a single sort.
+            entries = sorted(
+                chain(
+                    zip(self._keys, self._records, strict=True),
+                    ((record.sort_key, record) for record in records),
+                ),
+                key=itemgetter(0),
+            )
+            self._keys = [key for key, _ in entries]
+            self._records = [record for _, record in entries]
+            return
+        for record in records:
+            key = record.sort_key
+            index = bisect_right(self._keys, key)
+            self._keys.insert(index, key)
+            self._records.insert(index, record)
+
+    def _remove(self, record: AlertRecord) -> None:
+        """Remove a record."""
+        index = bisect_left(self._keys, record.sort_key)
+        while self._records[index] is not record:
+            index += 1
+        del self._keys[index]
+        del self._records[index]
+
+
+class DedupIndex:
+    """Timestamps of alerts bucketed by area and category."""
+
+    def __init__(self, window: float) -> None:
+        """Initialize the index."""
+        self._window = window
+        self._buckets: dict[tuple[str, int], list[float]] = {}
+
+    def add(self, alert: AlertType, timestamp: float) -> None:
+        """Add an alert to the index."""
+        insort(
+            self._buckets.setdefault((alert[AREA_FIELD], alert[CATEGORY_FIELD]), []),
+            timestamp,
+        )
+
+    def is_duplicate(self, alert: AlertType, timestamp: float) -> bool:
+        """Check if there is a similar alert within the window."""
+        if (
+            bucket := self._buckets.get((alert[AREA_FIELD], alert[CATEGORY_FIELD]))
+        ) is None:
+            return False
+        index = bisect_right(bucket, timestamp - self._window)
+        return index < len(bucket) and bucket[index] < timestamp + self._window
+
+
+class AreaIndex:
+    """Positions of alerts in a list by area."""
+
+    def __init__(self, alerts: Iterable[AlertType]) -> None:
+        """Initialize the index."""
+        self._positions: dict[str, list[int]] = {}
+        for position, alert in enumerate(alerts):
+            self._positions.setdefault(alert[AREA_FIELD], []).append(position)
+
+    def select[T](self, items: list[T], areas: frozenset[str]) -> list[T]:
+        """Return the items (parallel to the indexed alerts) of the areas."""
+        matches = self._positions.keys() & areas
+        if not matches:
+            return []
+        if len(matches) == 1:
+            return [items[position] for position in self._positions[matches.pop()]]
+        return [
+            items[position]
+            for position in sorted(
+                chain.from_iterable(self._positions[area] for area in matches)
+            )
+        ]
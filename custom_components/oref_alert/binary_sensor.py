@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import homeassistant.util.dt as dt_util
 from homeassistant.components import binary_sensor
@@ -31,8 +31,6 @@ from .const import (
     CONF_ALL_ALERTS_ATTRIBUTES,
     CONF_AREAS,
     CONF_SENSORS,
-    DATE_FIELD,
-    IST,
     OREF_ALERT_UNIQUE_ID,
     AlertType,
 )
@@ -42,11 +40,23 @@ if TYPE_CHECKING:
 
     from homeassistant.core import HomeAssistant
 
+    from .alert_store import AlertRecord
+    from .coordinator import OrefAlertCoordinatorData
+
 PARALLEL_UPDATES = 0
 
 SECONDS_IN_A_MINUTE = 60
 
 
+class SelectedAlerts(NamedTuple):
+    """Alerts of the selected areas."""
+
+    active_alert_records: list[AlertRecord]
+    active_alerts: list[AlertType]
+    alerts: list[AlertType]
+    updates: list[AlertType]
+
+
 async def async_setup_entry(
     _: HomeAssistant,
     config_entry: OrefAlertConfigEntry,
@@ -105,6 +115,9 @@ class AlertAreaSensorBase(AlertSensorBase):
         """Initialize object with defaults."""
         super().__init__(config_entry)
         self._areas = expand_areas_and_groups(areas)
+        self._selected_areas: frozenset[str] = (
+            frozenset(self._areas) | ALL_AREAS_ALIASES
+        )
         self._common_area_sensor_attributes = {
             CONF_AREAS: self._areas,
             **self._common_attributes,
@@ -112,9 +125,7 @@ class AlertAreaSensorBase(AlertSensorBase):
 
     def is_selected_area(self, alert: AlertType) -> bool:
         """Check is the alert is among the selected areas."""
-        return (
-            alert[AREA_FIELD] in self._areas or alert[AREA_FIELD] in ALL_AREAS_ALIASES
-        )
+        return alert[AREA_FIELD] in self._selected_areas
 
 
 class AlertSensor(AlertAreaSensorBase):
@@ -136,6 +147,8 @@ class AlertSensor(AlertAreaSensorBase):
             config_entry.options[CONF_ALERT_ACTIVE_DURATION] * SECONDS_IN_A_MINUTE
         )
         self._is_on_timestamp: float = 0
+        self._selected_data: OrefAlertCoordinatorData | None = None
+        self._selected = SelectedAlerts([], [], [], [])
         self._sensor_key: str = name or ""
         if not name:
             self.use_device_name = True
@@ -158,43 +171,43 @@ class AlertSensor(AlertAreaSensorBase):
             # The state should stay "on" for the active duration.
             return True
 
-        for alert in self.coordinator.data.active_alerts:
-            if self.is_selected_area(alert):
-                if not self.coordinator.is_synthetic_alert(alert):
-                    self._is_on_timestamp = (
-                        dt_util.parse_datetime(alert[DATE_FIELD], raise_on_error=True)
-                        .replace(tzinfo=IST)
-                        .timestamp()
-                    )
-                return True
+        if records := self._get_selected().active_alert_records:
+            if not self.coordinator.is_synthetic_alert(records[0].alert):
+                self._is_on_timestamp = records[0].timestamp
+            return True
         return False
 
+    def _get_selected(self) -> SelectedAlerts:
+        """Return the alerts of the selected areas (once per coordinator update)."""
+        data = self.coordinator.data
+        if self._selected_data is not data:
+            self._selected_data = data
+            active_alert_records = data.select_active_alerts(self._selected_areas)
+            self._selected = SelectedAlerts(
+                active_alert_records,
+                [record.alert for record in active_alert_records],
+                data.select_alerts(self._selected_areas)
+                if self._add_all_alerts_attributes
+                else [],
+                data.select_updates(self._selected_areas),
+            )
+        return self._selected
+
     @property
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return additional attributes."""
+        selected = self._get_selected()
         return {
             **self._common_area_sensor_attributes,
-            ATTR_SELECTED_AREAS_ACTIVE_ALERTS: [
-                alert
-                for alert in self.coordinator.data.active_alerts
-                if self.is_selected_area(alert)
-            ],
+            ATTR_SELECTED_AREAS_ACTIVE_ALERTS: selected.active_alerts,
             **(
                 {
-                    ATTR_SELECTED_AREAS_ALERTS: [
-                        alert
-                        for alert in self.coordinator.data.alerts
-                        if self.is_selected_area(alert)
-                    ],
+                    ATTR_SELECTED_AREAS_ALERTS: selected.alerts,
                 }
                 if self._add_all_alerts_attributes
                 else {}
             ),
-            ATTR_SELECTED_AREAS_UPDATES: [
-                alert
-                for alert in self.coordinator.data.updates
-                if self.is_selected_area(alert)
-            ],
+            ATTR_SELECTED_AREAS_UPDATES: selected.updates,
             ATTR_COUNTRY_ACTIVE_ALERTS: self.coordinator.data.active_alerts,
             **(
                 {
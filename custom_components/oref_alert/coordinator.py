@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import cmp_to_key
+from functools import cached_property
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
@@ -13,8 +16,16 @@ import homeassistant.util.dt as dt_util
 from homeassistant.core import callback
 from homeassistant.helpers import event as event_helper
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .alert_store import (
+    AlertRecord,
+    AlertStore,
+    AreaIndex,
+    DedupIndex,
+    date_to_timestamp,
+)
 from .categories import (
     category_is_alert,
     category_is_update,
@@ -40,12 +51,14 @@ from .const import (
 from .metadata.areas import AREAS
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator, Sequence
 
     from homeassistant.core import HomeAssistant
 
     from . import OrefAlertConfigEntry
+    from .pushy import PushyNotifications
     from .ttl_deque import TTLDeque
+    from .tzevaadom import TzevaAdomNotifications
 
 OREF_ALERTS_URL = "https://www.oref.org.il/warningMessages/alert/Alerts.json"
 OREF_HISTORY_URL = (
@@ -58,7 +71,16 @@ OREF_HEADERS = {
 }
 REQUEST_RETRIES = 3
 REQUEST_THROTTLING = 0.8
+REQUEST_REFRESH_COOLDOWN = 1
 REAL_TIME_ALERT_LOGIC_WINDOW = 2
+UPDATER_TICK = timedelta(seconds=2)
+UPDATER_ACTIVE_WINDOW = timedelta(minutes=20)
+UPDATER_FAST_WINDOW = timedelta(minutes=2)
+UPDATER_IDLE_INTERVAL = timedelta(seconds=20)
+UPDATER_PUSH_IDLE_INTERVAL = timedelta(seconds=60)
+PUSH_HEARTBEAT_GRACE = 15
+JSON_DECODER = json.JSONDecoder()
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 def _is_update(alert: AlertType) -> bool:
@@ -71,38 +93,104 @@ def _is_alert(alert: AlertType) -> bool:
     return category_is_alert(alert["category"]) and not _is_update(alert)
 
 
+def _skip_whitespace(text: str, position: int) -> int:
+    """Return the position of the next non-whitespace character."""
+    return JSON_WHITESPACE.match(text, position).end()  # pyright: ignore[reportOptionalMemberAccess]
+
+
+def _parse_recent_alerts(text: str, earliest: str) -> Any:
+    """Parse the (sorted) alerts list up to the first alert older than earliest."""
+    if not text.startswith("["):
+        return json.loads(text)
+    alerts: list[AlertType] = []
+    position = _skip_whitespace(text, 1)
+    if text.startswith("]", position):
+        return alerts
+    while True:
+        alert, position = JSON_DECODER.raw_decode(text, position)
+        if alert[DATE_FIELD] < earliest:
+            # The list is sorted, so the rest of the alerts are older.
+            return alerts
+        alerts.append(alert)
+        position = _skip_whitespace(text, position)
+        if text.startswith("]", position):
+            return alerts
+        if not text.startswith(",", position):
+            msg = "Expecting ',' delimiter"
+            raise json.JSONDecodeError(msg, text, position)
+        position = _skip_whitespace(text, position + 1)
+
+
+@dataclass
+class OrefAlertFetchStats:
+    """Counters of fetching a URL."""
+
+    requests: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    failures: int = 0
+    bytes: int = 0
+    parse_time: float = 0.0
+
+
 class OrefAlertCoordinatorData:
     """Class for holding coordinator data."""
 
-    def __init__(self, items: list[AlertType], active_duration: int) -> None:
+    def __init__(
+        self,
+        items: list[AlertType],
+        active_records: list[AlertRecord],
+        alerts: list[AlertType] | None = None,
+    ) -> None:
         """Initialize the data."""
         self.items: list[AlertType] = items
-        self.alerts: list[AlertType] = list(
-            filter(lambda alert: _is_alert(alert), items)
-        )
-        self.active_items: list[AlertType] = (
-            OrefAlertDataUpdateCoordinator.recent_alerts(items, active_duration)
-        )
-        self.active_alerts: list[AlertType] = list(
-            filter(lambda alert: _is_alert(alert), self.active_items)
-        )
-        self.updates: list[AlertType] = list(
-            filter(lambda alert: _is_update(alert), self.active_items)
+        self.alerts: list[AlertType] = (
+            alerts if alerts is not None else list(filter(_is_alert, items))
         )
+        self.active_items: list[AlertType] = [record.alert for record in active_records]
+        self.active_alert_records: list[AlertRecord] = [
+            record for record in active_records if _is_alert(record.alert)
+        ]
+        self.active_alerts: list[AlertType] = [
+            record.alert for record in self.active_alert_records
+        ]
+        self.updates: list[AlertType] = list(filter(_is_update, self.active_items))
+        self._active_alerts_index = AreaIndex(self.active_alerts)
+        self._updates_index = AreaIndex(self.updates)
+
+    @cached_property
+    def latest_active_alerts(self) -> dict[str, AlertRecord]:
+        """Return the latest active alert of each area."""
+        latest: dict[str, AlertRecord] = {}
+        for record in self.active_alert_records:
+            latest.setdefault(record.alert[AREA_FIELD], record)
+        return latest
+
+    @cached_property
+    def _active_items_index(self) -> AreaIndex:
+        """Index the active items by area (used by the event entities)."""
+        return AreaIndex(self.active_items)
 
+    @cached_property
+    def _alerts_index(self) -> AreaIndex:
+        """Index all alerts by area (used only when all alerts are exposed)."""
+        return AreaIndex(self.alerts)
 
-def _sort_alerts(item1: AlertType, item2: AlertType) -> int:
-    """Sort by descending-order "date" and then ascending-order "name"."""
-    result = 0
-    if item1[DATE_FIELD] < item2[DATE_FIELD]:
-        result = 1
-    elif item1[DATE_FIELD] > item2[DATE_FIELD]:
-        result = -1
-    elif item1[AREA_FIELD] > item2[AREA_FIELD]:
-        result = 1
-    elif item1[AREA_FIELD] < item2[AREA_FIELD]:
-        result = -1
-    return result
+    def select_active_items(self, areas: frozenset[str]) -> list[AlertType]:
+        """Return the active items of the areas."""
+        return self._active_items_index.select(self.active_items, areas)
+
+    def select_active_alerts(self, areas: frozenset[str]) -> list[AlertRecord]:
+        """Return the active alerts of the areas."""
+        return self._active_alerts_index.select(self.active_alert_records, areas)
+
+    def select_alerts(self, areas: frozenset[str]) -> list[AlertType]:
+        """Return the alerts of the areas."""
+        return self._alerts_index.select(self.alerts, areas)
+
+    def select_updates(self, areas: frozenset[str]) -> list[AlertType]:
+        """Return the updates of the areas."""
+        return self._updates_index.select(self.updates, areas)
 
 
 class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorData]):
@@ -119,6 +207,10 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
             hass,
             LOGGER,
             name=DOMAIN,
+            # Coalesce bursts of refresh requests (e.g. a salvo of push messages).
+            request_refresh_debouncer=Debouncer(
+                hass, LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=True
+            ),
         )
         self._active_duration = config_entry.options.get(
             CONF_ALERT_ACTIVE_DURATION, DEFAULT_ALERT_ACTIVE_DURATION
@@ -128,53 +220,81 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
         )
         self._http_client = async_get_clientsession(hass)
         self._http_cache: dict[str, tuple[Any, str, float]] = {}
+        self.fetch_stats: dict[str, OrefAlertFetchStats] = {
+            url: OrefAlertFetchStats() for url in (OREF_ALERTS_URL, OREF_HISTORY_URL)
+        }
         self._channels: list[TTLDeque] = channels
         self._channels_change: list[datetime | None] = []
         self._synthetic_alerts: list[tuple[float, AlertType]] = []
-        self.data = OrefAlertCoordinatorData([], self._active_duration)
+        self._store = AlertStore()
+        self._store_version: int = self._store.version
+        self.data = OrefAlertCoordinatorData([], [])
 
     async def _async_update_data(self) -> OrefAlertCoordinatorData:
         """Request the data from Oref servers.."""
         channels_change = [alerts.changed() for alerts in self._channels]
         (current, current_modified), (history, history_modified) = await asyncio.gather(
-            *[
-                self._async_fetch_url(url)
-                for url in ((OREF_ALERTS_URL), (OREF_HISTORY_URL))
-            ]
+            self._async_fetch_url(OREF_ALERTS_URL),
+            self._async_fetch_url(
+                OREF_HISTORY_URL,
+                json.loads
+                if self._all_alerts
+                else lambda text: _parse_recent_alerts(
+                    text, self._earliest_history_date()
+                ),
+            ),
         )
         if (
             current_modified
             or history_modified
-            or not self.data
             or (any(channels_change) and channels_change != self._channels_change)
             or self._synthetic_alerts
         ):
-            history = history or []
-            if not self._all_alerts:
-                history = OrefAlertDataUpdateCoordinator.recent_alerts(
-                    history, self._active_duration
+            added: list[AlertRecord] = []
+            if history_modified:
+                added.extend(
+                    self._store.sync(
+                        AlertSource.HISTORY,
+                        self._process_history_alerts(history or []),
+                    )
+                )
+            added.extend(
+                self._store.sync(
+                    AlertSource.WEBSITE,
+                    self._current_to_history_format(current) if current else [],
                 )
-            history = self._process_history_alerts(history)
-            alerts = (
-                self._current_to_history_format(current, history) if current else []
             )
-            alerts.extend(history)
-            alerts.sort(key=cmp_to_key(_sort_alerts))
-            self._add_channels(alerts)
+            added.extend(self._add_channels())
             self._channels_change = channels_change
-            alerts.extend(self._get_synthetic_alerts())
-            alerts.sort(key=cmp_to_key(_sort_alerts))
-            for unrecognized_area in {alert[AREA_FIELD] for alert in alerts}.difference(
-                {alert[AREA_FIELD] for alert in getattr(self.data, "items", [])}
-            ).difference(AREAS):
+            added.extend(
+                self._store.sync(AlertSource.SYNTHETIC, self._get_synthetic_alerts())
+            )
+            for unrecognized_area in {
+                record.alert[AREA_FIELD] for record in added
+            }.difference(AREAS):
                 LOGGER.error("Alert has an unrecognized area: %s", unrecognized_area)
-        else:
-            alerts = self.data.items
-        return OrefAlertCoordinatorData(alerts, self._active_duration)
+        return self._get_data()
+
+    def _get_data(self) -> OrefAlertCoordinatorData:
+        """Build the data from the alerts store."""
+        earliest_alert = dt_util.now().timestamp() - self._active_duration * 60
+        if not self._all_alerts:
+            self._store.prune(earliest_alert)
+        items, alerts = self.data.items, self.data.alerts
+        if self._store.version != self._store_version:
+            self._store_version = self._store.version
+            items = [record.alert for record in self._store.items()]
+            alerts = None
+        return OrefAlertCoordinatorData(
+            items, self._store.recent(earliest_alert), alerts
+        )
 
-    async def _async_fetch_url(self, url: str) -> tuple[Any, bool]:
+    async def _async_fetch_url(
+        self, url: str, parse: Callable[[str], Any] = json.loads
+    ) -> tuple[Any, bool]:
         """Fetch data from Oref servers."""
         exc_info = Exception()
+        stats = self.fetch_stats[url]
         now = dt_util.now().timestamp()
         cached_content, last_modified, last_request = self._http_cache.get(
             url, (None, "", 0)
@@ -186,16 +306,22 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
             if not last_modified
             else {"If-Modified-Since": last_modified, **OREF_HEADERS}
         )
-        for _ in range(REQUEST_RETRIES):
+        for attempt in range(REQUEST_RETRIES):
+            if attempt:
+                stats.retries += 1
+            stats.requests += 1
             try:
                 async with self._http_client.get(url, headers=headers) as response:
                     if response.status == HTTPStatus.NOT_MODIFIED:
+                        stats.not_modified += 1
                         self._http_cache[url] = (cached_content, last_modified, now)
                         return cached_content, False
                     raw = await response.read()
+                    stats.bytes += len(raw)
                     text = raw.decode("utf-8-sig").replace("\x00", "").strip()
+                    parse_start = time.perf_counter()
                     try:
-                        content = None if not text else json.loads(text)
+                        content = None if not text else parse(text)
                     except:
                         LOGGER.debug(
                             "JSON parsing failed for '%s': '%s' hex: '%s'",
@@ -204,6 +330,8 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
                             text.encode("utf-8").hex(),
                         )
                         raise
+                    finally:
+                        stats.parse_time = time.perf_counter() - parse_start
                     self._http_cache[url] = (
                         content,
                         response.headers.get("Last-Modified", ""),
@@ -212,6 +340,7 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
                     return content, not (content is None and cached_content is None)
             except Exception as ex:  # noqa: BLE001
                 exc_info = ex
+        stats.failures += 1
         if url in self._http_cache:
             # Return the cached content if available to prevent entities unavailability.
             LOGGER.info(
@@ -224,107 +353,69 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
         LOGGER.error("Failed to fetch '%s'", url)
         raise exc_info
 
-    def _current_to_history_format(
-        self, current: dict[str, str], history: list[AlertType]
-    ) -> list[AlertType]:
+    def _current_to_history_format(self, current: dict[str, str]) -> list[AlertType]:
         """Convert current alerts payload to history format."""
         if (category := real_time_to_history_category(int(current["cat"]))) is None:
             # Unknown category. Wait for the history to include it.
             return []
-        now = dt_util.now(IST).strftime("%Y-%m-%d %H:%M:%S")
-        history_recent_alerts = self.recent_alerts(
-            history, REAL_TIME_ALERT_LOGIC_WINDOW
-        )
-        previous_recent_alerts = (
-            self.recent_alerts(self.data.items, REAL_TIME_ALERT_LOGIC_WINDOW)
-            if self.data
-            else []
-        )
+        now = dt_util.now(IST)
+        recent_alerts: dict[str, list[AlertType]] = {}
+        for record in self._store.recent(
+            now.timestamp() - REAL_TIME_ALERT_LOGIC_WINDOW * 60
+        ):
+            recent_alerts.setdefault(record.alert[AREA_FIELD], []).append(record.alert)
         alerts = []
         for alert_area in current[AREA_FIELD]:
             area = self._fix_area_spelling(alert_area)
-            for history_recent_alert in history_recent_alerts:
-                if history_recent_alert[AREA_FIELD] == area:
-                    # The alert is already in the history list. No need to add it twice.
-                    break
-            else:
-                for previous_recent_alert in previous_recent_alerts:
-                    if previous_recent_alert[AREA_FIELD] == area:
-                        # The alert was already added, so take the original timestamp.
-                        alerts.append(previous_recent_alert)
-                        break
-                else:
-                    alerts.append(
-                        {
-                            DATE_FIELD: now,
-                            TITLE_FIELD: current[TITLE_FIELD],
-                            AREA_FIELD: area,
-                            CATEGORY_FIELD: category,
-                            CHANNEL_FIELD: AlertSource.WEBSITE,
-                        }
-                    )
+            area_alerts = recent_alerts.get(area, [])
+            if any(
+                alert[CHANNEL_FIELD] != AlertSource.WEBSITE for alert in area_alerts
+            ):
+                # The alert is already in the list. No need to add it twice.
+                continue
+            if area_alerts:
+                # The alert was already added, so take the original timestamp.
+                alerts.append(area_alerts[0])
+                continue
+            alerts.append(
+                {
+                    DATE_FIELD: now.strftime("%Y-%m-%d %H:%M:%S"),
+                    TITLE_FIELD: current[TITLE_FIELD],
+                    AREA_FIELD: area,
+                    CATEGORY_FIELD: category,
+                    CHANNEL_FIELD: AlertSource.WEBSITE,
+                }
+            )
         return alerts
 
-    def _add_channels(self, alerts: list[AlertType]) -> None:
+    def _add_channels(self) -> list[AlertRecord]:
         """Add alerts from the different channels after de-dup."""
-        dedup_window = REAL_TIME_ALERT_LOGIC_WINDOW * 60
-        new_alerts: list[AlertType] = []
+        # We only de-dup alerts with the same area and category.
+        dedup_index = DedupIndex(REAL_TIME_ALERT_LOGIC_WINDOW * 60)
+        # Channel data only exists for active duration, so this is the de-dup window
+        for record in self._store.recent(
+            dt_util.now().timestamp() - self._active_duration * 60
+        ):
+            if record.alert[CHANNEL_FIELD] in (
+                AlertSource.HISTORY,
+                AlertSource.WEBSITE,
+            ):
+                dedup_index.add(record.alert, record.timestamp)
+        added: list[AlertRecord] = []
         for channel in self._channels:
-            if channel.changed() is None:
-                continue
-
-            if new_alerts:  # From the previous iteration of this loop.
-                alerts.sort(key=cmp_to_key(_sort_alerts))
-
-            # Channel data only exists for active duration, so this is the de-dup window
-            exist_alerts = (
-                self.recent_alerts(alerts, self._active_duration)
-                if self._all_alerts
-                else alerts  # It already includes only active alerts.
-            )
-
-            new_alerts = []
-            for alert in channel.items():
-                alert_timestamp = self._alert_timestamp(alert)
-                to_add = True
-                for exist_alert in exist_alerts:
-                    if (
-                        alert[AREA_FIELD] == exist_alert[AREA_FIELD]
-                        and alert[CATEGORY_FIELD] == exist_alert[CATEGORY_FIELD]
-                    ):
-                        # We only de-dup alerts with the same area and category.
-                        exist_timestamp = self._alert_timestamp(exist_alert)
-                        if abs(alert_timestamp - exist_timestamp) < dedup_window:
-                            # There is a similar alert within the window.
-                            to_add = False
-                            break
-                        if alert_timestamp - exist_timestamp > dedup_window:
-                            # exist_timestamp is decreasing so the delta is increasing
-                            break
-                if to_add:
-                    new_alerts.append(alert)
-            if new_alerts:
-                alerts.extend(new_alerts)
-
-    @staticmethod
-    def _alert_timestamp(alert: AlertType) -> float:
-        """Return alert's timestamp."""
-        return (
-            dt_util.parse_datetime(alert[DATE_FIELD], raise_on_error=True)
-            .replace(tzinfo=IST)
-            .timestamp()
-        )
-
-    @classmethod
-    def recent_alerts(cls, alerts: list[Any], active_duration: int) -> list[Any]:
-        """Return the list of recent alerts, assuming the input is sorted."""
-        earliest_alert = dt_util.now().timestamp() - active_duration * 60
-        recent_alerts = []
-        for alert in alerts:
-            if cls._alert_timestamp(alert) < earliest_alert:
-                break
-            recent_alerts.append(alert)
-        return recent_alerts
+            new_alerts = [
+                (date_to_timestamp(alert[DATE_FIELD]), alert)
+                for alert in channel.items()
+            ]
+            new_alerts = [
+                (timestamp, alert)
+                for timestamp, alert in new_alerts
+                if not dedup_index.is_duplicate(alert, timestamp)
+            ]
+            added.extend(self._store.sync(channel, (alert for _, alert in new_alerts)))
+            for timestamp, alert in new_alerts:
+                dedup_index.add(alert, timestamp)
+        return added
 
     def add_synthetic_alert(self, details: dict[str, Any]) -> None:
         """Add a synthetic alert for testing purposes."""
@@ -359,12 +450,24 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
         """Check if the alert is a synthetic alert."""
         return alert.get(CHANNEL_FIELD) == AlertSource.SYNTHETIC
 
-    def _process_history_alerts(self, alerts: list[AlertType]) -> list[AlertType]:
+    def _process_history_alerts(
+        self, alerts: list[AlertType]
+    ) -> Generator[AlertType, None, None]:
         """Add channel field and fix spelling errors in area names."""
+        earliest_alert = self._earliest_history_date() if not self._all_alerts else ""
         for alert in alerts:
+            if alert[DATE_FIELD] < earliest_alert:
+                # The list is sorted, so the rest of the alerts are older.
+                break
             alert[CHANNEL_FIELD] = AlertSource.HISTORY
             alert[AREA_FIELD] = self._fix_area_spelling(alert[AREA_FIELD])
-        return alerts
+            yield alert
+
+    def _earliest_history_date(self) -> str:
+        """Return the date (history format) of the earliest active alert."""
+        return (dt_util.now(IST) - timedelta(minutes=self._active_duration)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
 
     def _fix_area_spelling(self, area: str) -> str:
         """Fix spelling error in area name."""
@@ -374,16 +477,28 @@ class OrefAlertDataUpdateCoordinator(DataUpdateCoordinator[OrefAlertCoordinatorD
 
 
 class OrefAlertCoordinatorUpdater:
-    """Refresh coordinator if there are active alerts / updates."""
+    """Refresh coordinator if there are active alerts / updates.
+
+    While there are no active alerts and all the push channels are healthy
+    (connected and heard from within their heartbeat interval), HTTP polling
+    backs off. Polling is fast again for a while after a push event, or when a
+    channel is disconnected or stops heartbeating.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, coordinator: OrefAlertDataUpdateCoordinator
+        self,
+        hass: HomeAssistant,
+        coordinator: OrefAlertDataUpdateCoordinator,
+        channels: Sequence[PushyNotifications | TzevaAdomNotifications],
     ) -> None:
         """Initialize the updater."""
         self._hass: HomeAssistant = hass
         self._coordinator: OrefAlertDataUpdateCoordinator = coordinator
+        self._channels = channels
         self._active: datetime = dt_util.now() - timedelta(days=1)
+        self._fast_until: datetime = dt_util.now()
         self._update: datetime = dt_util.now()
+        self._push_healthy: bool = False
         self._stop: bool = False
         self._unsub_update: Callable[[], None] | None = None
 
@@ -393,27 +508,53 @@ class OrefAlertCoordinatorUpdater:
             self._unsub_update = event_helper.async_track_point_in_time(
                 self._hass,
                 self._async_update,
-                dt_util.now() + timedelta(seconds=2),
+                dt_util.now() + UPDATER_TICK,
             )
 
+    def _is_push_healthy(self) -> bool:
+        """Check if all push channels are connected and heartbeating."""
+        now = time.monotonic()
+        return all(
+            channel.connected
+            and now - channel.last_message
+            < channel.heartbeat_interval + PUSH_HEARTBEAT_GRACE
+            for channel in self._channels
+        )
+
+    def _poll_interval(self, now: datetime) -> timedelta:
+        """Return the time between HTTP polls."""
+        if now < self._fast_until or now - self._active < UPDATER_ACTIVE_WINDOW:
+            return UPDATER_TICK
+        return (
+            UPDATER_PUSH_IDLE_INTERVAL if self._push_healthy else UPDATER_IDLE_INTERVAL
+        )
+
     @callback
     async def _async_update(self, *_: Any) -> None:
         """Refresh coordinator if needed."""
         self._unsub_update = None
         now = dt_util.now()
-        update = False
         if self._coordinator.data.active_alerts or self._coordinator.data.updates:
             self._active = now
-            update = True
-        elif now - self._active < timedelta(
-            minutes=20
-        ) or now - self._update > timedelta(seconds=20):
-            update = True
-        if update:
+        push_healthy = self._is_push_healthy()
+        if self._push_healthy and not push_healthy:
+            # A channel stopped heartbeating, poll fast like on a disconnection.
+            self._fast_until = now + UPDATER_FAST_WINDOW
+        self._push_healthy = push_healthy
+        if now - self._update >= self._poll_interval(now):
             self._update = now
-            await self._coordinator.async_refresh()
+            await self._coordinator.async_request_refresh()
         self._sub()
 
+    async def async_push_event(self) -> None:
+        """Refresh on a push event (or a channel disconnection) and poll fast."""
+        if self._stop:
+            return
+        now = dt_util.now()
+        self._fast_until = now + UPDATER_FAST_WINDOW
+        self._update = now
+        await self._coordinator.async_request_refresh()
+
     def start(self) -> None:
         """Start the updater."""
         self._sub()
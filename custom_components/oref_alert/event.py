@@ -5,9 +5,10 @@ from __future__ import annotations
 import types
 from contextlib import suppress
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.util.dt as dt_util
+import voluptuous as vol
 from homeassistant.components.event import ATTR_EVENT_TYPE, EventEntity
 from homeassistant.const import Platform
 from homeassistant.core import callback
@@ -15,9 +16,10 @@ from homeassistant.helpers import event
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import slugify
 
+from .categories import CATEGORY_METADATA
 from .const import (
-    AREA_FIELD,
     ATTR_RECORD,
+    CATEGORY_FIELD,
     CHANNEL_FIELD,
     CONF_ALERT_ACTIVE_DURATION,
     CONF_AREAS,
@@ -32,7 +34,7 @@ from .metadata import ALL_AREAS_ALIASES
 from .metadata.areas import AREAS
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -44,7 +46,56 @@ PARALLEL_UPDATES = 0
 GITHUB_ROOT = "https://raw.githubusercontent.com/amitfin/oref_alert/main/custom_components/oref_alert"
 RECORDS_SCHEMA_FILE_NAME = "records_schema"
 RECORDS_SCHEMA_URL = f"{GITHUB_ROOT}/{RECORDS_SCHEMA_FILE_NAME}.py"
-RECORDS_SCHEMA: dict[str, Schema] = {}
+
+
+def _checks_only_category(schema: Schema) -> bool:
+    """Check if the schema validates only the category field."""
+    return (
+        isinstance(schema.schema, dict)
+        and schema.extra == vol.ALLOW_EXTRA
+        and list(schema.schema) == [CATEGORY_FIELD]
+    )
+
+
+class RecordsClassifier:
+    """Record types lookup compiled from the records schema.
+
+    When all schemas validate only the category, the record type of each
+    category is computed once. Otherwise (or when the record has no category)
+    the record is validated against the schemas.
+    """
+
+    def __init__(self, schemas: Mapping[str, Schema]) -> None:
+        """Initialize the classifier."""
+        self._schemas = schemas
+        self.record_types: list[str] = list(schemas.keys())
+        self._by_category: dict[int, str | None] | None = None
+        if all(_checks_only_category(schema) for schema in schemas.values()):
+            self._by_category = {
+                category: self._validate({CATEGORY_FIELD: category})
+                for category in CATEGORY_METADATA
+            }
+
+    def _validate(self, record: Mapping[str, Any]) -> str | None:
+        """Return the type of the 1st schema which accepts the record."""
+        for record_type, schema in self._schemas.items():
+            with suppress(Exception):
+                schema(record)
+                return record_type
+        return None
+
+    def classify(self, record: AlertType) -> str | None:
+        """Return the record type, if any."""
+        if self._by_category is None or not isinstance(
+            category := record.get(CATEGORY_FIELD), int
+        ):
+            return self._validate(record)
+        if category not in self._by_category:
+            self._by_category[category] = self._validate({CATEGORY_FIELD: category})
+        return self._by_category[category]
+
+
+RECORDS_CLASSIFIER = RecordsClassifier({})
 
 
 class RecordsSchemaLoader:
@@ -72,8 +123,9 @@ class RecordsSchemaLoader:
         module = types.ModuleType(RECORDS_SCHEMA_FILE_NAME)
         exec(compile(code, RECORDS_SCHEMA_URL, "exec"), module.__dict__)  # noqa: S102
 
-        global RECORDS_SCHEMA  # noqa: PLW0603
-        RECORDS_SCHEMA = module.RECORDS_SCHEMA
+        # The classifier is built before it's published, so the swap is atomic.
+        global RECORDS_CLASSIFIER  # noqa: PLW0603
+        RECORDS_CLASSIFIER = RecordsClassifier(module.RECORDS_SCHEMA)
 
         self._unsub_next_load = event.async_track_point_in_time(
             self._hass, self.load, dt_util.now() + timedelta(hours=6)
@@ -111,8 +163,9 @@ class AlertEvent(OrefAlertCoordinatorEntity, EventEntity):
     ) -> None:
         """Initialize object with defaults."""
         super().__init__(config_entry)
-        self._attr_event_types = list(RECORDS_SCHEMA.keys())
+        self._attr_event_types = list(RECORDS_CLASSIFIER.record_types)
         self._area = area
+        self._areas: frozenset[str] = frozenset({area}) | ALL_AREAS_ALIASES
         self._active_duration: timedelta = timedelta(
             minutes=config_entry.options[CONF_ALERT_ACTIVE_DURATION]
         )
@@ -155,11 +208,8 @@ class AlertEvent(OrefAlertCoordinatorEntity, EventEntity):
 
     def _get_record(self) -> tuple[str, AlertType] | tuple[None, None]:
         """Get the latest record, if any."""
-        for record in self.coordinator.data.active_items:
-            if (area := record[AREA_FIELD]) == self._area or area in ALL_AREAS_ALIASES:
-                for record_type, schema in RECORDS_SCHEMA.items():
-                    with suppress(Exception):
-                        schema(record)
-                        return record_type, record
+        for record in self.coordinator.data.select_active_items(self._areas):
+            if (record_type := RECORDS_CLASSIFIER.classify(record)) is not None:
+                return record_type, record
 
         return None, None
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-import homeassistant.util.dt as dt_util
 from homeassistant.components.geo_location import ATTR_SOURCE, GeolocationEvent
 from homeassistant.const import (
     ATTR_DATE,
@@ -17,6 +17,7 @@ from homeassistant.const import (
     UnitOfLength,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.location import vincenty
 
 from .categories import (
@@ -41,12 +42,16 @@ from .entity import OrefAlertEntity
 from .metadata.area_info import AREA_INFO
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import OrefAlertConfigEntry
+    from .alert_store import AlertRecord
     from .coordinator import OrefAlertDataUpdateCoordinator
 
 PARALLEL_UPDATES = 0
+CLEANUP_DELAY = 10  # Wait for a stable state before removing entities.
 
 
 async def async_setup_entry(
@@ -109,11 +114,6 @@ class OrefAlertLocationEvent(OrefAlertEntity, GeolocationEvent):
         """Return extra state attributes."""
         return {**self._alert_attributes, ATTR_HOME_DISTANCE: self._attr_distance}
 
-    @callback
-    def async_remove_self(self) -> None:
-        """Remove this entity."""
-        self.hass.async_create_task(self.async_remove(force_remove=True))
-
     def async_update(self, attributes: dict[str, Any]) -> bool:
         """Update the extra attributes when needed."""
         if not attributes or attributes == self._alert_attributes:
@@ -128,7 +128,11 @@ class OrefAlertLocationEvent(OrefAlertEntity, GeolocationEvent):
 
 
 class OrefAlertLocationEventManager:
-    """Add and remove location event entities."""
+    """Add and remove location event entities.
+
+    Each update is diffed against the previous one using the latest active
+    alert record of each area, so only the changed areas are processed.
+    """
 
     def __init__(
         self,
@@ -138,42 +142,57 @@ class OrefAlertLocationEventManager:
     ) -> None:
         """Initialize object with defaults."""
         self._location_events: dict[str, OrefAlertLocationEvent] = {}
+        self._records: dict[str, AlertRecord] = {}
         self._hass = hass
         self._config_entry = config_entry
         self._async_add_entities = async_add_entities
         self._coordinator: OrefAlertDataUpdateCoordinator = (
             config_entry.runtime_data.coordinator
         )
+        self._unsub_cleanup: Callable[[], None] | None = None
+        config_entry.async_on_unload(self._cancel_cleanup)
         self._coordinator.async_add_listener(self._async_update)
         self._async_update()
 
-    def _alert_attributes(self, area: str) -> dict[str, Any]:
+    def _alert_attributes(self, record: AlertRecord) -> dict[str, Any]:
         """Return alert's attributes."""
-        attributes: dict[str, Any] = {}
-        for alert in self._coordinator.data.active_alerts:
-            if alert[AREA_FIELD] == area:
-                attributes = {
-                    key: value
-                    for key, value in alert.items()
-                    if key not in {AREA_FIELD, DATE_FIELD}
-                }
-                attributes[ATTR_DATE] = dt_util.parse_datetime(
-                    alert[DATE_FIELD], raise_on_error=True
-                ).replace(tzinfo=IST)
-                attributes[ATTR_ICON] = category_to_icon(alert[CATEGORY_FIELD])
-                attributes[ATTR_EMOJI] = category_to_emoji(alert[CATEGORY_FIELD])
-                break
+        alert = record.alert
+        attributes = {
+            key: value
+            for key, value in alert.items()
+            if key not in {AREA_FIELD, DATE_FIELD}
+        }
+        attributes[ATTR_DATE] = datetime.fromtimestamp(record.timestamp, IST)
+        attributes[ATTR_ICON] = category_to_icon(alert[CATEGORY_FIELD])
+        attributes[ATTR_EMOJI] = category_to_emoji(alert[CATEGORY_FIELD])
         return attributes
 
     @callback
-    async def _cleanup_entities(self) -> None:
+    def _cancel_cleanup(self) -> None:
+        """Cancel the pending cleanup."""
+        if self._unsub_cleanup is not None:
+            self._unsub_cleanup()
+            self._unsub_cleanup = None
+
+    @callback
+    def _cleanup_entities(self, _: datetime) -> None:
+        """Remove the entities of the areas which are no longer active."""
+        self._unsub_cleanup = None
+        active = self._coordinator.data.latest_active_alerts
+        entities = []
+        for area in [area for area in self._location_events if area not in active]:
+            entities.append(self._location_events.pop(area))
+            self._records.pop(area, None)
+        if entities:
+            self._hass.async_create_task(self._async_remove_entities(entities))
+
+    async def _async_remove_entities(
+        self, entities: list[OrefAlertLocationEvent]
+    ) -> None:
         """Remove entities."""
-        await asyncio.sleep(10)  # Wait for a stable state.
-        active = {alert[AREA_FIELD] for alert in self._coordinator.data.active_alerts}
-        areas_to_delete = set(self._location_events.keys()) - active
-        for area in areas_to_delete:
-            if (entity := self._location_events.pop(area, None)) is not None:
-                entity.async_remove_self()
+        await asyncio.gather(
+            *(entity.async_remove(force_remove=True) for entity in entities)
+        )
 
     def fire_events(self, events: dict[str, OrefAlertLocationEvent]) -> None:
         """Fire events for new locations."""
@@ -197,26 +216,31 @@ class OrefAlertLocationEventManager:
     @callback
     def _async_update(self) -> None:
         """Add and/or remove entities according to the new active alerts list."""
-        active = {alert[AREA_FIELD] for alert in self._coordinator.data.active_alerts}
-        exists = set(self._location_events.keys())
-
-        updated = {
-            area: self._location_events[area]
-            for area in exists.intersection(active)
-            if self._location_events[area].async_update(self._alert_attributes(area))
-        }
-
-        to_add = {
-            area: OrefAlertLocationEvent(
-                self._hass, self._config_entry, area, self._alert_attributes(area)
-            )
-            for area in active - exists
-            if area in AREA_INFO
-        }
-        self._location_events.update(to_add)
-        self._async_add_entities(to_add.values())
+        active = self._coordinator.data.latest_active_alerts
+        updated: dict[str, OrefAlertLocationEvent] = {}
+        to_add: dict[str, OrefAlertLocationEvent] = {}
+        for area, record in active.items():
+            if self._records.get(area) is record:
+                continue
+            if (entity := self._location_events.get(area)) is not None:
+                self._records[area] = record
+                if entity.async_update(self._alert_attributes(record)):
+                    updated[area] = entity
+            elif area in AREA_INFO:
+                self._records[area] = record
+                to_add[area] = OrefAlertLocationEvent(
+                    self._hass, self._config_entry, area, self._alert_attributes(record)
+                )
+        if to_add:
+            self._location_events.update(to_add)
+            self._async_add_entities(to_add.values())
 
         self.fire_events({**updated, **to_add})
 
-        if len(exists - active):
-            self._hass.async_create_task(self._cleanup_entities())
+        if (
+            self._unsub_cleanup is None
+            and not self._location_events.keys() <= active.keys()
+        ):
+            self._unsub_cleanup = async_call_later(
+                self._hass, CLEANUP_DELAY, self._cleanup_entities
+            )
@@ -2,6 +2,8 @@
 
 from typing import TypedDict
 
+from .tables import load_table
+
 
 class AreaInfoType(TypedDict):
     """Type for area info."""
@@ -11,4581 +13,4 @@ class AreaInfoType(TypedDict):
     segment: int
 
 
-AREA_INFO: dict[str, AreaInfoType] = {
-    "אבו גוש": {
-        "lat": 31.80685763957901,
-        "lon": 35.110380104121276,
-        "segment": 5000511,
-    },
-    "אבו סנאן": {
-        "lat": 32.96225265673199,
-        "lon": 35.167813527196365,
-        "segment": 5001470,
-    },
-    "אבו קרינאת": {
-        "lat": 31.12530107318947,
-        "lon": 34.968384251820225,
-        "segment": 5000092,
-    },
-    "אבו תלול": {"lat": 31.19078092444314, "lon": 34.9161188551105, "segment": 5000103},
-    "אבטליון": {
-        "lat": 32.836843752766114,
-        "lon": 35.35084745271316,
-        "segment": 5001363,
-    },
-    "אביאל": {"lat": 32.53142473199893, "lon": 34.99265046677341, "segment": 5001065},
-    "אביבים": {"lat": 33.088103744913646, "lon": 35.47186584307262, "segment": 5001604},
-    "אביגדור": {
-        "lat": 31.709191790041267,
-        "lon": 34.74201611620363,
-        "segment": 5000373,
-    },
-    "אביגיל": {"lat": 31.402630878352564, "lon": 35.14131358886556, "segment": 5002262},
-    "אביחיל": {"lat": 32.35080085971727, "lon": 34.87210380122129, "segment": 5000940},
-    "אביעזר": {
-        "lat": 31.681408433529587,
-        "lon": 35.015151586414866,
-        "segment": 5000359,
-    },
-    "אבירים": {"lat": 33.03959168126126, "lon": 35.28821943440057, "segment": 5001557},
-    "אביתר": {"lat": 32.11975811906201, "lon": 35.27672632650887, "segment": 5002249},
-    "אבן יהודה": {
-        "lat": 32.27210487669174,
-        "lon": 34.8855031904528,
-        "segment": 5000891,
-    },
-    "אבן מנחם": {
-        "lat": 33.07479364097683,
-        "lon": 35.29266079429603,
-        "segment": 5001588,
-    },
-    "אבן ספיר": {
-        "lat": 31.763614529356218,
-        "lon": 35.1339299448979,
-        "segment": 5000443,
-    },
-    "אבן שמואל": {
-        "lat": 31.57495444058843,
-        "lon": 34.765373179360076,
-        "segment": 5000278,
-    },
-    "אבני איתן": {
-        "lat": 32.82268765216033,
-        "lon": 35.76612803680065,
-        "segment": 5001359,
-    },
-    "אבני חפץ": {
-        "lat": 32.287008726071235,
-        "lon": 35.07659605013196,
-        "segment": 5000911,
-    },
-    "אבנת": {"lat": 31.677522336335755, "lon": 35.437181484009045, "segment": 5000372},
-    "אבשלום": {"lat": 31.1931283274009, "lon": 34.33041978938454, "segment": 5000109},
-    "אדורה": {"lat": 31.551034915899002, "lon": 35.015819209970324, "segment": 5000271},
-    "אדורים": {"lat": 31.485811904558496, "lon": 35.0432490899105, "segment": 5001883},
-    "אדמית": {"lat": 33.07943590724911, "lon": 35.208838760173926, "segment": 5001592},
-    "אדרת": {"lat": 31.660340891207362, "lon": 34.99437875586723, "segment": 5000339},
-    "אודים": {"lat": 32.264663036952285, "lon": 34.8446316272934, "segment": 5000889},
-    "אודם": {"lat": 33.19420258301894, "lon": 35.749138314738445, "segment": 5001639},
-    "אום אל פחם": {
-        "lat": 32.52644066847482,
-        "lon": 35.15556406606323,
-        "segment": 5001047,
-    },
-    "אום אל קוטוף": {
-        "lat": 32.46885929943186,
-        "lon": 35.060249472079285,
-        "segment": 5001015,
-    },
-    "אום בטין": {
-        "lat": 31.26940306136843,
-        "lon": 34.87887384661227,
-        "segment": 5000144,
-    },
-    "אופקים": {"lat": 31.30838210527739, "lon": 34.632813702009436, "segment": 5000155},
-    "אור הגנוז": {
-        "lat": 33.00492395885871,
-        "lon": 35.44608342057689,
-        "segment": 5001538,
-    },
-    "אור הנר": {
-        "lat": 31.557814027818907,
-        "lon": 34.59998606020708,
-        "segment": 5000266,
-    },
-    "אור יהודה": {
-        "lat": 32.02919930452588,
-        "lon": 34.84842160144477,
-        "segment": 5000716,
-    },
-    "אור עקיבא": {
-        "lat": 32.502308689901916,
-        "lon": 34.921895869458154,
-        "segment": 5001044,
-    },
-    "אורה": {"lat": 31.753067221359405, "lon": 35.1525563868556, "segment": 5000429},
-    "אורות": {"lat": 31.742188297361913, "lon": 34.73427571300137, "segment": 5000407},
-    "אורטל": {"lat": 33.084808739412416, "lon": 35.76076285885216, "segment": 5001606},
-    "אורים": {"lat": 31.304448832700455, "lon": 34.523364807919634, "segment": 5000158},
-    "אורנים": {"lat": 32.71270357293122, "lon": 35.108316064063104, "segment": 5001216},
-    "אורנית": {"lat": 32.128860897101866, "lon": 34.99039150798264, "segment": 5000804},
-    "אושה": {"lat": 32.79629139603487, "lon": 35.113564637683446, "segment": 5001319},
-    "אזור": {"lat": 32.02303663906089, "lon": 34.80880398451388, "segment": 5000709},
-    "אזור תעשייה אלון התבור": {
-        "lat": 32.63533516968868,
-        "lon": 35.36067307855755,
-        "segment": 5001141,
-    },
-    "אזור תעשייה אפק ולב הארץ": {
-        "lat": 32.108776356264585,
-        "lon": 34.953649576730214,
-        "segment": 5000792,
-    },
-    "אזור תעשייה אריאל": {
-        "lat": 32.094071841722695,
-        "lon": 35.123473973122735,
-        "segment": 5001942,
-    },
-    "אזור תעשייה באר טוביה": {
-        "lat": 31.724133613342115,
-        "lon": 34.75072061988876,
-        "segment": 5000384,
-    },
-    "אזור תעשייה בני יהודה": {
-        "lat": 32.8027371616321,
-        "lon": 35.71711177282049,
-        "segment": 5001343,
-    },
-    "אזור תעשייה בר-לב": {
-        "lat": 32.90566673724098,
-        "lon": 35.19401019147283,
-        "segment": 5001415,
-    },
-    "אזור תעשייה בראון": {
-        "lat": 32.24737992973548,
-        "lon": 35.168616627452394,
-        "segment": 5000883,
-    },
-    "אזור תעשייה ברוש": {
-        "lat": 31.73547296722092,
-        "lon": 34.954968242835136,
-        "segment": 5000399,
-    },
-    "אזור תעשייה ברקן": {
-        "lat": 32.10519889464012,
-        "lon": 35.11999066490826,
-        "segment": 5001933,
-    },
-    "אזור תעשייה גדרה": {
-        "lat": 31.799596252425587,
-        "lon": 34.767747944618236,
-        "segment": 5002195,
-    },
-    "אזור תעשייה דימונה": {
-        "lat": 31.059428899120473,
-        "lon": 35.01285345314403,
-        "segment": 5000087,
-    },
-    "אזור תעשייה הדרומי אשקלון": {
-        "lat": 31.63324328525329,
-        "lon": 34.54133437983676,
-        "segment": 5000305,
-    },
-    "אזור תעשייה הר טוב - צרעה": {
-        "lat": 31.76791949038937,
-        "lon": 34.9913786116108,
-        "segment": 5000441,
-    },
-    "אזור תעשייה חבל מודיעין שוהם": {
-        "lat": 32.01334248318319,
-        "lon": 34.960041124950706,
-        "segment": 5000704,
-    },
-    "אזור תעשייה יקנעם עילית": {
-        "lat": 32.6639304741086,
-        "lon": 35.10499760974777,
-        "segment": 5001150,
-    },
-    "אזור תעשייה כנות": {
-        "lat": 31.80145801326212,
-        "lon": 34.7594673199597,
-        "segment": 5000483,
-    },
-    "אזור תעשייה כפר יונה": {
-        "lat": 32.31918169262085,
-        "lon": 34.91033563153321,
-        "segment": 5002026,
-    },
-    "אזור תעשייה כרמיאל": {
-        "lat": 32.92385854681962,
-        "lon": 35.32470494770334,
-        "segment": 5001435,
-    },
-    "אזור תעשייה מבוא כרמל": {
-        "lat": 32.61648741893312,
-        "lon": 35.0708812753876,
-        "segment": 5001125,
-    },
-    "אזור תעשייה מבואות הגלבוע": {
-        "lat": 32.568081493300106,
-        "lon": 35.266961890867556,
-        "segment": 5001096,
-    },
-    "אזור תעשייה מישור אדומים": {
-        "lat": 31.795024682019967,
-        "lon": 35.33714818242587,
-        "segment": 5000478,
-    },
-    "אזור תעשייה מיתרים": {
-        "lat": 31.369029990594157,
-        "lon": 35.004768735075544,
-        "segment": 5000199,
-    },
-    "אזור תעשייה נ.ע.מ": {
-        "lat": 31.413733323056086,
-        "lon": 34.614612736252006,
-        "segment": 5000207,
-    },
-    "אזור תעשייה ניר עציון": {
-        "lat": 32.70378424100524,
-        "lon": 34.971564372577426,
-        "segment": 5001730,
-    },
-    "אזור תעשייה נשר - רמלה": {
-        "lat": 31.92195081011599,
-        "lon": 34.88962564967637,
-        "segment": 5001799,
-    },
-    "אזור תעשייה עד הלום": {
-        "lat": 31.76243338960652,
-        "lon": 34.66307441272812,
-        "segment": 5000425,
-    },
-    "אזור תעשייה עידן הנגב": {
-        "lat": 31.377448238542737,
-        "lon": 34.78680566718889,
-        "segment": 5000196,
-    },
-    "אזור תעשייה עמק חפר": {
-        "lat": 32.401065927257555,
-        "lon": 34.89614321530953,
-        "segment": 5000972,
-    },
-    "אזור תעשייה צ.ח.ר": {
-        "lat": 32.97111055042925,
-        "lon": 35.567527009572856,
-        "segment": 5001496,
-    },
-    "אזור תעשייה ציפורית": {
-        "lat": 32.75890717644977,
-        "lon": 35.31658388499777,
-        "segment": 5001278,
-    },
-    "אזור תעשייה צפוני אשקלון": {
-        "lat": 31.669185054555278,
-        "lon": 34.600946190452014,
-        "segment": 5000333,
-    },
-    "אזור תעשייה קדמת גליל": {
-        "lat": 32.78484051406167,
-        "lon": 35.4643003720151,
-        "segment": 5001313,
-    },
-    "אזור תעשייה קיסריה": {
-        "lat": 32.482819361284676,
-        "lon": 34.94818940143596,
-        "segment": 5001020,
-    },
-    "אזור תעשייה קריית ביאליק": {
-        "lat": 32.86717746244615,
-        "lon": 35.099198798516234,
-        "segment": 5002023,
-    },
-    "אזור תעשייה קריית גת": {
-        "lat": 31.59441088211664,
-        "lon": 34.78864977651401,
-        "segment": 5000284,
-    },
-    "אזור תעשייה רבדים": {
-        "lat": 31.785585869874943,
-        "lon": 34.82201017430551,
-        "segment": 5002207,
-    },
-    "אזור תעשייה רותם": {
-        "lat": 31.060097378818494,
-        "lon": 35.195021479283255,
-        "segment": 5000089,
-    },
-    "אזור תעשייה רמת דלתון": {
-        "lat": 33.026515312051075,
-        "lon": 35.479686782877465,
-        "segment": 5001550,
-    },
-    "אזור תעשייה שחורת": {
-        "lat": 29.598905038511376,
-        "lon": 34.97192429834075,
-        "segment": 5000010,
-    },
-    "אזור תעשייה שחק": {
-        "lat": 32.47506722666008,
-        "lon": 35.17975652906711,
-        "segment": 5001939,
-    },
-    "אזור תעשייה שער בנימין": {
-        "lat": 31.86621017587834,
-        "lon": 35.26201226313269,
-        "segment": 5000584,
-    },
-    "אזור תעשייה שער נעמן": {
-        "lat": 32.88049906653573,
-        "lon": 35.097607987847326,
-        "segment": 5001389,
-    },
-    "אזור תעשייה תימורים": {
-        "lat": 31.724435387111928,
-        "lon": 34.75932966770891,
-        "segment": 5000386,
-    },
-    "אזור תעשייה תרדיון": {
-        "lat": 32.86738262849822,
-        "lon": 35.273269807739524,
-        "segment": 5001386,
-    },
-    "אחווה": {"lat": 31.743775048578623, "lon": 34.76911789359897, "segment": 5000419},
-    "אחוזם": {"lat": 31.552967427523342, "lon": 34.77078424137736, "segment": 5000264},
-    "אחוזת ברק": {"lat": 32.6432418637716, "lon": 35.3381766543482, "segment": 5001147},
-    "אחיה": {"lat": 32.061557508513204, "lon": 35.3272695831682, "segment": 5000765},
-    "אחיהוד": {"lat": 32.906183096961065, "lon": 35.17578465156839, "segment": 5001414},
-    "אחיטוב": {"lat": 32.38809484749647, "lon": 34.989488770561046, "segment": 5000970},
-    "אחיסמך": {"lat": 31.934874009009274, "lon": 34.90729778185673, "segment": 5001811},
-    "אחיעזר": {"lat": 31.980714341465735, "lon": 34.87164908993782, "segment": 5001849},
-    "איבטין": {"lat": 32.76131475113794, "lon": 35.1136457952403, "segment": 5001272},
-    "איבי הנחל": {
-        "lat": 31.603015739865345,
-        "lon": 35.218459835259395,
-        "segment": 5002230,
-    },
-    "איזור תעשייה מילואות צפון": {
-        "lat": 33.06685696211436,
-        "lon": 35.108656660726034,
-        "segment": 5001562,
-    },
-    "אייל": {"lat": 32.210173596799805, "lon": 34.97964297623483, "segment": 5000864},
-    "איילת השחר": {
-        "lat": 33.023071578879986,
-        "lon": 35.58004942832303,
-        "segment": 5001552,
-    },
-    "איירפורט סיטי": {
-        "lat": 31.988741935771124,
-        "lon": 34.91233333252602,
-        "segment": 5001863,
-    },
-    "אילון": {"lat": 33.06240868429976, "lon": 35.21834419759106, "segment": 5001571},
-    "אילות": {"lat": 29.580682534655367, "lon": 34.96374716734812, "segment": 5000009},
-    "אילניה": {"lat": 32.75618103539593, "lon": 35.40772663561366, "segment": 5001265},
-    "אילת": {"lat": 29.537161929133926, "lon": 34.93682710277249, "segment": 5000004},
-    "אירוס": {"lat": 31.929271986550233, "lon": 34.77660991648226, "segment": 5001807},
-    "איתמר": {"lat": 32.159037755242075, "lon": 35.34944043776865, "segment": 5000852},
-    "איתן": {"lat": 31.57233554723585, "lon": 34.74757375292869, "segment": 5000273},
-    "אכסאל": {"lat": 32.67828021571268, "lon": 35.31977779847586, "segment": 5001178},
-    "אל סייד": {
-        "lat": 31.287860924054986,
-        "lon": 34.90352241129854,
-        "segment": 5001921,
-    },
-    "אל עזי": {"lat": 31.721433575510495, "lon": 34.79799402022892, "segment": 5000387},
-    "אל עמארני, אל מסק": {
-        "lat": 30.79827338651277,
-        "lon": 35.234459851647756,
-        "segment": 5001929,
-    },
-    "אל עריאן": {
-        "lat": 32.498175661839994,
-        "lon": 35.124913680223806,
-        "segment": 5001046,
-    },
-    "אל פורעה": {
-        "lat": 31.221640978509683,
-        "lon": 35.16422745402639,
-        "segment": 5000115,
-    },
-    "אל רום": {"lat": 33.18051976056723, "lon": 35.77073551143868, "segment": 5001635},
-    "אלומה": {"lat": 31.652470228513028, "lon": 34.743192297701356, "segment": 5000323},
-    "אלומות": {"lat": 32.7084920690648, "lon": 35.54533034720877, "segment": 5001222},
-    "אלון": {"lat": 31.830594055298064, "lon": 35.356239168940974, "segment": 5000556},
-    "אלון הגליל": {
-        "lat": 32.759742711603096,
-        "lon": 35.21967339444711,
-        "segment": 5001276,
-    },
-    "אלון מורה": {
-        "lat": 32.23242556853749,
-        "lon": 35.336117662560056,
-        "segment": 5000877,
-    },
-    "אלון שבות": {
-        "lat": 31.654213387652554,
-        "lon": 35.12629377384268,
-        "segment": 5000341,
-    },
-    "אלוני אבא": {
-        "lat": 32.72972065767869,
-        "lon": 35.17070626612839,
-        "segment": 5001231,
-    },
-    "אלוני הבשן": {
-        "lat": 33.04266582778701,
-        "lon": 35.837745360137006,
-        "segment": 5001569,
-    },
-    "אלוני יצחק": {
-        "lat": 32.51027534493917,
-        "lon": 35.00455075054693,
-        "segment": 5001054,
-    },
-    "אלונים": {"lat": 32.71629045448562, "lon": 35.14833966092543, "segment": 5001217},
-    "אלי עד": {"lat": 32.80556217032829, "lon": 35.73500632936523, "segment": 5001344},
-    "אליאב": {"lat": 31.529527960821063, "lon": 34.93119063452325, "segment": 5000257},
-    "אליכין": {"lat": 32.407713939591765, "lon": 34.92187973655388, "segment": 5000980},
-    "אליפז ומכרות תמנע": {
-        "lat": 29.77743951555553,
-        "lon": 34.9938371118505,
-        "segment": 5000015,
-    },
-    "אליפלט": {
-        "lat": 32.947617425168794,
-        "lon": 35.549313961449116,
-        "segment": 5001466,
-    },
-    "אליקים": {"lat": 32.63269191950576, "lon": 35.068464758357244, "segment": 5001131},
-    "אלישיב": {"lat": 32.380801669776965, "lon": 34.90944258886426, "segment": 5000961},
-    "אלישמע": {"lat": 32.15239259597501, "lon": 34.928359641544546, "segment": 5000827},
-    "אלמגור": {"lat": 32.912105605582, "lon": 35.602050639630164, "segment": 5001432},
-    "אלמוג": {"lat": 31.788463133900805, "lon": 35.460992582613315, "segment": 5000499},
-    "אלעד": {"lat": 32.05106699365578, "lon": 34.95639116979344, "segment": 5000735},
-    "אלעזר": {"lat": 31.662696992448325, "lon": 35.139642608998265, "segment": 5000351},
-    "אלפי מנשה": {
-        "lat": 32.171488967508566,
-        "lon": 35.00998126998625,
-        "segment": 5000844,
-    },
-    "אלקוש": {"lat": 33.034432959733344, "lon": 35.324294579251415, "segment": 5001547},
-    "אלקנה": {"lat": 32.11239320292085, "lon": 35.03424631983452, "segment": 5000794},
-    "אמונים": {"lat": 31.743948860494893, "lon": 34.67572471311993, "segment": 5000406},
-    "אמירים": {"lat": 32.93828509479972, "lon": 35.4510839709578, "segment": 5001454},
-    "אמנון": {"lat": 32.90455284973157, "lon": 35.57218020475693, "segment": 5001422},
-    "אמץ": {"lat": 32.36840816933846, "lon": 34.994012481486, "segment": 5000955},
-    "אניעם": {"lat": 32.95786041861325, "lon": 35.74254958428959, "segment": 5001488},
-    "אעבלין": {"lat": 32.82234164830666, "lon": 35.18955571168282, "segment": 5001339},
-    "אעירה השחר": {
-        "lat": 31.950273243060604,
-        "lon": 35.36898691707696,
-        "segment": 5002304,
-    },
-    "אפיק": {"lat": 32.77855701774161, "lon": 35.70194623987097, "segment": 5001314},
-    "אפיקים": {"lat": 32.67990230715485, "lon": 35.57646899669586, "segment": 5001188},
-    "אפק": {"lat": 32.83893124820497, "lon": 35.12595643914429, "segment": 5001352},
-    "אפקה": {"lat": 31.46804704496106, "lon": 35.03779326081101, "segment": 5002271},
-    "אפרת": {"lat": 31.6657946630433, "lon": 35.15914202253074, "segment": 5000329},
-    "ארבל": {"lat": 32.813157463498285, "lon": 35.48264659490305, "segment": 5001342},
-    "ארגמן": {"lat": 32.172250068783235, "lon": 35.52261136764092, "segment": 5000853},
-    "ארז": {"lat": 31.55902641375911, "lon": 34.5660281832233, "segment": 5000263},
-    "אריאל": {"lat": 32.103467035444936, "lon": 35.1879716833812, "segment": 5000795},
-    "ארסוף": {"lat": 32.20901845887546, "lon": 34.81595518642224, "segment": 5000862},
-    "אש קודש": {
-        "lat": 32.066325455818514,
-        "lon": 35.33639478018702,
-        "segment": 5002296,
-    },
-    "אשבול": {"lat": 31.447240278189778, "lon": 34.667646482868356, "segment": 5000225},
-    "אשבל": {"lat": 32.87649053371157, "lon": 35.30466339990685, "segment": 5001392},
-    "אשדוד - א,ב,ד,ה": {
-        "lat": 31.80473285209424,
-        "lon": 34.64694434154939,
-        "segment": 5000468,
-    },
-    "אשדוד - איזור תעשייה צפוני": {
-        "lat": 31.830156552433174,
-        "lon": 34.658508703317686,
-        "segment": 5000530,
-    },
-    "אשדוד - ג,ו,ז": {
-        "lat": 31.796630115394645,
-        "lon": 34.66155224313547,
-        "segment": 5000455,
-    },
-    "אשדוד - ח,ט,י,יג,יד,טז": {
-        "lat": 31.777907436797484,
-        "lon": 34.65337745575527,
-        "segment": 5000433,
-    },
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי": {
-        "lat": 31.783616828070038,
-        "lon": 34.633209071508624,
-        "segment": 5000432,
-    },
-    "אשדות יעקב": {
-        "lat": 32.661075429297114,
-        "lon": 35.57989358259642,
-        "segment": 5001161,
-    },
-    "אשחר": {"lat": 32.88630393849463, "lon": 35.29928823104419, "segment": 5001399},
-    "אשכולות": {"lat": 31.3918852417453, "lon": 34.90076351058225, "segment": 5000203},
-    "אשל הנשיא": {
-        "lat": 31.325856580641208,
-        "lon": 34.69618738120966,
-        "segment": 5000168,
-    },
-    "אשלים": {"lat": 30.971551580272035, "lon": 34.71543730577374, "segment": 5001774},
-    "אשקלון - דרום": {
-        "lat": 31.662622034415094,
-        "lon": 34.56837022761984,
-        "segment": 5001932,
-    },
-    "אשקלון - צפון": {
-        "lat": 31.69206274022601,
-        "lon": 34.58916573351655,
-        "segment": 5000320,
-    },
-    "אשרת": {"lat": 32.97155574751616, "lon": 35.15686284745006, "segment": 5001482},
-    "אשתאול": {
-        "lat": 31.781413554564413,
-        "lon": 35.008490375269524,
-        "segment": 5000462,
-    },
-    "אשתמוע": {"lat": 31.392968542704864, "lon": 35.01515688452604, "segment": 5002270},
-    "אתר דודאים": {
-        "lat": 31.312282915246264,
-        "lon": 34.73399600853803,
-        "segment": 5001752,
-    },
-    "אתר ההנצחה גולני": {
-        "lat": 32.77665171763632,
-        "lon": 35.40970062318435,
-        "segment": 5001715,
-    },
-    "באקה אל גרבייה": {
-        "lat": 32.415805151804996,
-        "lon": 35.03756677460386,
-        "segment": 5000982,
-    },
-    "באר אורה": {
-        "lat": 29.70837270082273,
-        "lon": 34.98564182415043,
-        "segment": 5000012,
-    },
-    "באר גנים": {
-        "lat": 31.699410622846493,
-        "lon": 34.607384548136416,
-        "segment": 5000362,
-    },
-    "באר טוביה": {
-        "lat": 31.73363884736992,
-        "lon": 34.72008665245711,
-        "segment": 5000382,
-    },
-    "באר יעקב": {
-        "lat": 31.944300985260643,
-        "lon": 34.84484159183628,
-        "segment": 5001809,
-    },
-    "באר מילכה": {
-        "lat": 30.93289067654063,
-        "lon": 34.407335418139674,
-        "segment": 5001771,
-    },
-    "באר שבע - דרום": {
-        "lat": 31.241451084757152,
-        "lon": 34.77619063944072,
-        "segment": 5001749,
-    },
-    "באר שבע - מזרח": {
-        "lat": 31.234530086291315,
-        "lon": 34.820154733740345,
-        "segment": 5000124,
-    },
-    "באר שבע - מערב": {
-        "lat": 31.269965469541617,
-        "lon": 34.77403060056157,
-        "segment": 5000141,
-    },
-    "באר שבע - צפון": {
-        "lat": 31.2724557433884,
-        "lon": 34.81384797585934,
-        "segment": 5001748,
-    },
-    "בארות יצחק": {
-        "lat": 32.041754627956195,
-        "lon": 34.91018554349111,
-        "segment": 5000727,
-    },
-    "בארותיים": {
-        "lat": 32.32290131202026,
-        "lon": 34.985658655879305,
-        "segment": 5000923,
-    },
-    "בארי": {"lat": 31.423811318545116, "lon": 34.491396100227774, "segment": 5000212},
-    "בוסתן הגליל": {
-        "lat": 32.95100404315975,
-        "lon": 35.08195055905051,
-        "segment": 5001458,
-    },
-    "בועיינה-נוג'ידאת": {
-        "lat": 32.808081822615286,
-        "lon": 35.3665593998037,
-        "segment": 5001328,
-    },
-    "בוקעתא": {"lat": 33.20487387926963, "lon": 35.78103315331045, "segment": 5001641},
-    "בורגתה": {"lat": 32.324771607385934, "lon": 34.9621871020583, "segment": 5000927},
-    "בחלק מהאזורים בארץ": {
-        "lat": 29.387760464297884,
-        "lon": 34.17631822271019,
-        "segment": 5004000,
-    },
-    "בחן": {"lat": 32.35069016116663, "lon": 35.01880905642629, "segment": 5000944},
-    "בטחה": {"lat": 31.343102978280378, "lon": 34.63208722430491, "segment": 5000173},
-    'בי"ס כרמים בנימינה': {
-        "lat": 32.54632400205567,
-        "lon": 34.95654065846611,
-        "segment": 5001073,
-    },
-    "ביצרון": {"lat": 31.796046075986222, "lon": 34.72858017386407, "segment": 5000470},
-    "ביר אלמכסור": {
-        "lat": 32.785158098387896,
-        "lon": 35.224383636405804,
-        "segment": 5001285,
-    },
-    "ביר הדאג'": {
-        "lat": 31.03023912130094,
-        "lon": 34.71692324804427,
-        "segment": 5000078,
-    },
-    "ביריה": {"lat": 32.981535218259026, "lon": 35.49982257951555, "segment": 5001503},
-    "בית אורן": {
-        "lat": 32.731684862365796,
-        "lon": 35.004984569248975,
-        "segment": 5001240,
-    },
-    "בית אל": {"lat": 31.94053900925388, "lon": 35.22191891067152, "segment": 5001822},
-    "בית אלעזרי": {
-        "lat": 31.844645861187317,
-        "lon": 34.804817816844825,
-        "segment": 5000544,
-    },
-    "בית אלפא וחפציבה": {
-        "lat": 32.51226162159687,
-        "lon": 35.4370439344678,
-        "segment": 5001062,
-    },
-    "בית אריה": {
-        "lat": 32.03708536371123,
-        "lon": 35.05006934784042,
-        "segment": 5000728,
-    },
-    "בית ברל": {"lat": 32.20126923279163, "lon": 34.9241966390213, "segment": 5000858},
-    "בית ג'אן": {
-        "lat": 32.965471657504565,
-        "lon": 35.37137221214056,
-        "segment": 5001474,
-    },
-    "בית גוברין": {
-        "lat": 31.611982235529826,
-        "lon": 34.894417288714095,
-        "segment": 5000301,
-    },
-    "בית גמליאל": {
-        "lat": 31.858100348808517,
-        "lon": 34.761621352442155,
-        "segment": 5000558,
-    },
-    "בית דגן": {"lat": 31.99707305832842, "lon": 34.82762282930521, "segment": 5001860},
-    "בית הברכה": {
-        "lat": 31.631618884687676,
-        "lon": 35.13164586918709,
-        "segment": 5002238,
-    },
-    "בית הגדי": {
-        "lat": 31.429865880075504,
-        "lon": 34.60624194265365,
-        "segment": 5001760,
-    },
-    "בית הלוי": {
-        "lat": 32.35386191337388,
-        "lon": 34.93214367814733,
-        "segment": 5000943,
-    },
-    "בית הלל": {"lat": 33.2074325841489, "lon": 35.60451524814592, "segment": 5001640},
-    "בית העלמין החדש נהריה": {
-        "lat": 33.00508930888904,
-        "lon": 35.14634778468196,
-        "segment": 5002007,
-    },
-    "בית העלמין החדש עכו": {
-        "lat": 32.91468396194066,
-        "lon": 35.13587312638701,
-        "segment": 5002192,
-    },
-    "בית העמק": {
-        "lat": 32.9702346834554,
-        "lon": 35.144705299430456,
-        "segment": 5001481,
-    },
-    "בית הערבה": {
-        "lat": 31.808365070332652,
-        "lon": 35.47770918322507,
-        "segment": 5000529,
-    },
-    "בית השיטה": {
-        "lat": 32.550165979471984,
-        "lon": 35.43839666463546,
-        "segment": 5001087,
-    },
-    "בית זית": {
-        "lat": 31.782090057206297,
-        "lon": 35.161365750855104,
-        "segment": 5000466,
-    },
-    "בית זרע": {
-        "lat": 32.68782677522241,
-        "lon": 35.573900969640995,
-        "segment": 5001196,
-    },
-    'בית חג"י': {
-        "lat": 31.490569411030307,
-        "lon": 35.07879000084332,
-        "segment": 5000247,
-    },
-    "בית חגלה": {
-        "lat": 31.82235248343139,
-        "lon": 35.50415602959602,
-        "segment": 5002223,
-    },
-    "בית חורון": {
-        "lat": 31.87662214130687,
-        "lon": 35.12770157948188,
-        "segment": 5000596,
-    },
-    "בית חלקיה": {
-        "lat": 31.79262285280464,
-        "lon": 34.81203942317946,
-        "segment": 5000471,
-    },
-    "בית חנן": {"lat": 31.936169384623767, "lon": 34.7763611750547, "segment": 5001806},
-    "בית חנניה": {
-        "lat": 32.52907596432906,
-        "lon": 34.92572259030747,
-        "segment": 5001064,
-    },
-    "בית חרות": {
-        "lat": 32.37922603087884,
-        "lon": 34.86713146952014,
-        "segment": 5000958,
-    },
-    "בית חשמונאי": {
-        "lat": 31.888839965127932,
-        "lon": 34.91986010301581,
-        "segment": 5001780,
-    },
-    "בית יהושע": {
-        "lat": 32.26072021725513,
-        "lon": 34.86307373074604,
-        "segment": 5000890,
-    },
-    "בית יוסף": {
-        "lat": 32.55964156185817,
-        "lon": 35.55354191390396,
-        "segment": 5001094,
-    },
-    "בית ינאי": {
-        "lat": 32.382495714499335,
-        "lon": 34.86389107684565,
-        "segment": 5000959,
-    },
-    "בית יצחק - שער חפר": {
-        "lat": 32.33499596637605,
-        "lon": 34.89158094215835,
-        "segment": 5000925,
-    },
-    "בית ירח": {
-        "lat": 32.71433519448109,
-        "lon": 35.574352235112464,
-        "segment": 5001239,
-    },
-    "בית יתיר": {
-        "lat": 31.364400880736753,
-        "lon": 35.11183954962956,
-        "segment": 5000193,
-    },
-    "בית לחם הגלילית": {
-        "lat": 32.7343798311014,
-        "lon": 35.19025639740595,
-        "segment": 5001245,
-    },
-    "בית מאיר": {
-        "lat": 31.79421471291079,
-        "lon": 35.03737272625686,
-        "segment": 5000490,
-    },
-    "בית נחמיה": {
-        "lat": 31.975324445089665,
-        "lon": 34.95489853422562,
-        "segment": 5001852,
-    },
-    "בית ניר": {
-        "lat": 31.648376780588606,
-        "lon": 34.873467265576195,
-        "segment": 5000325,
-    },
-    "בית נקופה": {
-        "lat": 31.803769004381774,
-        "lon": 35.12669908801872,
-        "segment": 5000512,
-    },
-    "בית סוהר צלמון": {
-        "lat": 32.87171250323726,
-        "lon": 35.44759629725465,
-        "segment": 5001931,
-    },
-    "בית סוהר קישון": {
-        "lat": 32.72678633344694,
-        "lon": 35.09173174965065,
-        "segment": 5001928,
-    },
-    "בית ספר שדה מירון": {
-        "lat": 33.00955396603319,
-        "lon": 35.39345905136201,
-        "segment": 5001722,
-    },
-    "בית עובד": {
-        "lat": 31.924290091394234,
-        "lon": 34.76678980702495,
-        "segment": 5001794,
-    },
-    "בית עוזיאל": {
-        "lat": 31.870840992746178,
-        "lon": 34.90536283213462,
-        "segment": 5000578,
-    },
-    "בית עזרא": {
-        "lat": 31.736914839099075,
-        "lon": 34.65478014993354,
-        "segment": 5000394,
-    },
-    "בית עלמין מורשה": {
-        "lat": 32.120687500324046,
-        "lon": 34.854961359001535,
-        "segment": 5002200,
-    },
-    "בית עלמין תל רגב": {
-        "lat": 32.76879138510018,
-        "lon": 35.12515656403699,
-        "segment": 5001871,
-    },
-    "בית עריף": {
-        "lat": 31.99538937354651,
-        "lon": 34.93585817882533,
-        "segment": 5001864,
-    },
-    "בית צבי": {"lat": 32.71815548996545, "lon": 34.9697034310311, "segment": 5001214},
-    "בית קמה": {"lat": 31.4427978744525, "lon": 34.76122374216843, "segment": 5000227},
-    "בית קשת": {"lat": 32.7180150308727, "lon": 35.39550206507172, "segment": 5001234},
-    "בית רימון": {
-        "lat": 32.78127459843438,
-        "lon": 35.32707464411202,
-        "segment": 5001310,
-    },
-    "בית שאן": {"lat": 32.4994446876716, "lon": 35.50056960854995, "segment": 5001042},
-    "בית שמש": {
-        "lat": 31.727521286941798,
-        "lon": 34.990416242017325,
-        "segment": 5000412,
-    },
-    "בית שערים": {
-        "lat": 32.69461039537467,
-        "lon": 35.17708360289098,
-        "segment": 5001185,
-    },
-    "בית שקמה": {
-        "lat": 31.637871733572783,
-        "lon": 34.61124452048191,
-        "segment": 5000311,
-    },
-    "ביתן אהרן": {
-        "lat": 32.36455895866499,
-        "lon": 34.869667674989095,
-        "segment": 5000950,
-    },
-    "ביתר עילית": {
-        "lat": 31.701354285207753,
-        "lon": 35.116223712539735,
-        "segment": 5000371,
-    },
-    "בלפוריה": {"lat": 32.62971533988161, "lon": 35.29693213352987, "segment": 5001139},
-    "בן זכאי": {
-        "lat": 31.85651856194581,
-        "lon": 34.727022412336446,
-        "segment": 5000557,
-    },
-    "בן עמי": {"lat": 33.00629522626831, "lon": 35.124530867966556, "segment": 5001520},
-    "בן שמן": {
-        "lat": 31.951365482262254,
-        "lon": 34.920007791948386,
-        "segment": 5001831,
-    },
-    "בני אדם": {
-        "lat": 31.844365976715228,
-        "lon": 35.305271943819534,
-        "segment": 5002287,
-    },
-    "בני ברק": {"lat": 32.08873610009196, "lon": 34.83418856702101, "segment": 5000754},
-    "בני דקלים": {
-        "lat": 31.518035541828155,
-        "lon": 34.918236685296996,
-        "segment": 5000254,
-    },
-    "בני דרום": {
-        "lat": 31.81977806151884,
-        "lon": 34.69133911441267,
-        "segment": 5000500,
-    },
-    "בני דרור": {
-        "lat": 32.262052531927466,
-        "lon": 34.89910758694943,
-        "segment": 5000892,
-    },
-    "בני יהודה וגבעת יואב": {
-        "lat": 32.798838166260296,
-        "lon": 35.684376602982184,
-        "segment": 5001331,
-    },
-    "בני נצרים": {
-        "lat": 31.145252746776862,
-        "lon": 34.317941391902345,
-        "segment": 5000095,
-    },
-    "בני עטרות": {
-        "lat": 32.02374379999447,
-        "lon": 34.91123809024656,
-        "segment": 5000712,
-    },
-    "בני עי''ש": {
-        "lat": 31.79126761515063,
-        "lon": 34.757542887100655,
-        "segment": 5000456,
-    },
-    "בני ציון": {
-        "lat": 32.21886436257972,
-        "lon": 34.86462357002891,
-        "segment": 5000867,
-    },
-    "בני ראם": {
-        "lat": 31.768612338469975,
-        "lon": 34.79115373890412,
-        "segment": 5000438,
-    },
-    "בניה": {"lat": 31.84360249224315, "lon": 34.7504775389752, "segment": 5000543},
-    "בנימינה": {
-        "lat": 32.521329536131596,
-        "lon": 34.94527817202293,
-        "segment": 5001053,
-    },
-    "בסמת טבעון": {
-        "lat": 32.74535606318308,
-        "lon": 35.14919664680934,
-        "segment": 5001244,
-    },
-    "בענה": {"lat": 32.92791547355048, "lon": 35.27319510049602, "segment": 5001434},
-    "בצרה": {"lat": 32.213264571191786, "lon": 34.879597282314386, "segment": 5000863},
-    "בצת": {"lat": 33.07108704969041, "lon": 35.13026943453792, "segment": 5001581},
-    "בקוע": {"lat": 31.82881017637632, "lon": 34.92444228362647, "segment": 5000536},
-    "בקעות": {"lat": 32.242676317530524, "lon": 35.45554767560611, "segment": 5000887},
-    "בר גיורא": {
-        "lat": 31.730681130757432,
-        "lon": 35.07118916403492,
-        "segment": 5000400,
-    },
-    "בר יוחאי": {
-        "lat": 32.997766268829096,
-        "lon": 35.44827641500951,
-        "segment": 5001526,
-    },
-    "בר כוכבא": {
-        "lat": 31.713417878476733,
-        "lon": 35.15914666749766,
-        "segment": 5002309,
-    },
-    "ברוכין": {"lat": 32.0813362697567, "lon": 35.091786604740385, "segment": 5000782},
-    "ברור חיל": {
-        "lat": 31.55873133759727,
-        "lon": 34.646925326233706,
-        "segment": 5000267,
-    },
-    "ברוש": {"lat": 31.370601519895192, "lon": 34.63133375017302, "segment": 5000189},
-    "ברחבי הארץ": {"lat": 31.7781, "lon": 35.2164, "segment": 0},
-    "ברטעה": {"lat": 32.47214719523749, "lon": 35.09513590536513, "segment": 5001017},
-    "ברכיה": {"lat": 31.670759064548555, "lon": 34.6260900627384, "segment": 5000344},
-    "ברעם": {"lat": 33.056844804607, "lon": 35.43475707905094, "segment": 5001575},
-    "ברקאי": {"lat": 32.47588988450402, "lon": 35.03003465527598, "segment": 5001022},
-    "ברקן": {"lat": 32.11004582938698, "lon": 35.106900106728986, "segment": 5000788},
-    "ברקת": {"lat": 32.01580022279218, "lon": 34.946209879122236, "segment": 5000713},
-    "בת הדר": {"lat": 31.645882955899722, "lon": 34.59546749602666, "segment": 5000317},
-    "בת חן": {"lat": 32.36002073226491, "lon": 34.872669603102786, "segment": 5000949},
-    "בת חפר": {"lat": 32.33543929833317, "lon": 35.01310259487367, "segment": 5000932},
-    "בת ים": {"lat": 32.01465106857374, "lon": 34.749377329238285, "segment": 5001866},
-    "בת עין": {"lat": 31.65913876880783, "lon": 35.096962621618594, "segment": 5000340},
-    "בת שלמה": {
-        "lat": 32.60051668721389,
-        "lon": 35.002006035813956,
-        "segment": 5001110,
-    },
-    "בתי מלון ים המלח": {
-        "lat": 31.168559061785718,
-        "lon": 35.36734155364494,
-        "segment": 5000108,
-    },
-    "בתרונות": {"lat": 32.31963511383252, "lon": 35.54198420253775, "segment": 5002219},
-    "ג'דידה מכר": {
-        "lat": 32.92695051626455,
-        "lon": 35.13744705311964,
-        "segment": 5001424,
-    },
-    "ג'וליס": {"lat": 32.9427051893789, "lon": 35.1837276539774, "segment": 5001448},
-    "ג'לג'וליה": {
-        "lat": 32.15054767093454,
-        "lon": 34.95110552659219,
-        "segment": 5000828,
-    },
-    "ג'סר א-זרקא": {
-        "lat": 32.53903736244178,
-        "lon": 34.91213071301782,
-        "segment": 5001063,
-    },
-    "ג'ש - גוש חלב": {
-        "lat": 33.02399581910761,
-        "lon": 35.44554031738409,
-        "segment": 5001541,
-    },
-    "ג'ת": {"lat": 32.39840018396523, "lon": 35.03558062727278, "segment": 5000977},
-    "גאולי תימן": {
-        "lat": 32.39119131271998,
-        "lon": 34.90144804801578,
-        "segment": 5000973,
-    },
-    "גאולים": {"lat": 32.29898131227249, "lon": 34.95041776768553, "segment": 5000915},
-    "גאליה": {"lat": 31.884353267977467, "lon": 34.765998161459386, "segment": 5000571},
-    "גבולות": {"lat": 31.211735824105872, "lon": 34.46579267284251, "segment": 5000118},
-    "גבים, מכללת ספיר": {
-        "lat": 31.50710644948285,
-        "lon": 34.59732073341287,
-        "segment": 5001759,
-    },
-    "גבע בנימין": {
-        "lat": 31.849085692001083,
-        "lon": 35.28053071216482,
-        "segment": 5000565,
-    },
-    "גבע כרמל": {
-        "lat": 32.66287541330583,
-        "lon": 34.95469830077356,
-        "segment": 5001149,
-    },
-    "גבעון החדשה": {
-        "lat": 31.8481408144304,
-        "lon": 35.15751059162867,
-        "segment": 5001949,
-    },
-    "גבעות": {"lat": 31.67924720832954, "lon": 35.1018054603433, "segment": 5000360},
-    "גבעות בר": {
-        "lat": 31.35620929882504,
-        "lon": 34.75828342624012,
-        "segment": 5000181,
-    },
-    "גבעות עדן": {
-        "lat": 31.662838641755087,
-        "lon": 35.01447304684789,
-        "segment": 5000350,
-    },
-    "גבעת אבני": {
-        "lat": 32.77449210571786,
-        "lon": 35.43795425044025,
-        "segment": 5001297,
-    },
-    "גבעת אלה": {
-        "lat": 32.72098891646386,
-        "lon": 35.245557472098724,
-        "segment": 5001232,
-    },
-    "גבעת אסף": {
-        "lat": 31.90960696705637,
-        "lon": 35.24935051911172,
-        "segment": 5001891,
-    },
-    "גבעת ברנר": {
-        "lat": 31.865428748265387,
-        "lon": 34.80426117989237,
-        "segment": 5000567,
-    },
-    "גבעת הראל": {
-        "lat": 32.05937017526065,
-        "lon": 35.2738744436954,
-        "segment": 5001890,
-    },
-    "גבעת הרואה": {
-        "lat": 32.054067486408016,
-        "lon": 35.26277128150506,
-        "segment": 5002286,
-    },
-    "גבעת השלושה": {
-        "lat": 32.09764603526979,
-        "lon": 34.920242114810364,
-        "segment": 5000787,
-    },
-    "גבעת וולפסון": {
-        "lat": 32.72066424289779,
-        "lon": 35.01600584189215,
-        "segment": 5001228,
-    },
-    "גבעת וושינגטון": {
-        "lat": 31.817383225763596,
-        "lon": 34.72931497007552,
-        "segment": 5000519,
-    },
-    "גבעת זאב": {
-        "lat": 31.850597953399443,
-        "lon": 35.16575690930697,
-        "segment": 5000570,
-    },
-    "גבעת חיים איחוד": {
-        "lat": 32.39954465214124,
-        "lon": 34.933159227674736,
-        "segment": 5000975,
-    },
-    "גבעת חיים מאוחד": {
-        "lat": 32.39064520565822,
-        "lon": 34.93144295930113,
-        "segment": 5000968,
-    },
-    "גבעת חן": {
-        "lat": 32.16323305290449,
-        "lon": 34.872031107304714,
-        "segment": 5000837,
-    },
-    "גבעת יערים": {
-        "lat": 31.787230362513576,
-        "lon": 35.08847152061863,
-        "segment": 5000474,
-    },
-    "גבעת ישעיהו": {
-        "lat": 31.670831350711055,
-        "lon": 34.94669435711167,
-        "segment": 5000349,
-    },
-    "גבעת כ''ח": {
-        "lat": 32.03093709392896,
-        "lon": 34.936639933802645,
-        "segment": 5000719,
-    },
-    "גבעת ניל''י": {
-        "lat": 32.548051315234915,
-        "lon": 35.04188721533737,
-        "segment": 5001074,
-    },
-    "גבעת עדה": {"lat": 32.52110768152239, "lon": 35.0115178426196, "segment": 5001056},
-    "גבעת עוז": {
-        "lat": 32.55543582416329,
-        "lon": 35.198079391888285,
-        "segment": 5001084,
-    },
-    "גבעת פורת יוסף": {
-        "lat": 32.21376688080021,
-        "lon": 35.370051618261236,
-        "segment": 5002247,
-    },
-    "גבעת שמואל": {
-        "lat": 32.07754105618098,
-        "lon": 34.85229948741451,
-        "segment": 5000755,
-    },
-    "גבעת שפירא": {
-        "lat": 32.35754078852347,
-        "lon": 34.87643528431217,
-        "segment": 5000951,
-    },
-    "גבעתי": {"lat": 31.7317414332125, "lon": 34.68037208744016, "segment": 5000395},
-    "גבעתיים": {"lat": 32.07012149509121, "lon": 34.80996178742358, "segment": 5000744},
-    "גברעם": {"lat": 31.59023338758972, "lon": 34.61131256390814, "segment": 5000282},
-    "גבת": {"lat": 32.674127988765534, "lon": 35.21280140688375, "segment": 5001164},
-    "גדות": {"lat": 33.01864971834074, "lon": 35.61878759148494, "segment": 5001543},
-    "גדעונה": {"lat": 32.549322739368115, "lon": 35.35858584830072, "segment": 5001085},
-    "גדרה": {"lat": 31.811093453683675, "lon": 34.77705394113082, "segment": 5000484},
-    "גונן": {"lat": 33.12289999048569, "lon": 35.64606941548483, "segment": 5001618},
-    "גופנה": {"lat": 31.979456456930706, "lon": 35.125911932214464, "segment": 5002294},
-    "גורן": {"lat": 33.05776551483214, "lon": 35.23934185229544, "segment": 5001565},
-    "גורנות הגליל": {
-        "lat": 33.05989701005316,
-        "lon": 35.249323000187296,
-        "segment": 5001572,
-    },
-    "גזית": {"lat": 32.63805574516375, "lon": 35.44694025137154, "segment": 5001148},
-    "גזר": {"lat": 31.87640764559168, "lon": 34.92081240433575, "segment": 5000579},
-    "גיאה": {"lat": 31.62735798674546, "lon": 34.60649645358971, "segment": 5000306},
-    "גיבתון": {
-        "lat": 31.888440058054503,
-        "lon": 34.799896486578085,
-        "segment": 5001779,
-    },
-    "גיזו": {"lat": 31.804565017434317, "lon": 34.93841951270201, "segment": 5000505},
-    "גילת": {"lat": 31.32998354227762, "lon": 34.652597951240764, "segment": 5000164},
-    "גינוסר": {"lat": 32.84719584529923, "lon": 35.52331195495621, "segment": 5001372},
-    "גינתון": {"lat": 31.963738443900098, "lon": 34.91432956008948, "segment": 5001842},
-    "גיתה": {"lat": 32.96742915562377, "lon": 35.247932457753, "segment": 5001483},
-    "גיתית": {"lat": 32.099636579265784, "lon": 35.397844048982186, "segment": 5000798},
-    "גלאון": {"lat": 31.632637308181103, "lon": 34.84765030469155, "segment": 5000315},
-    "גלגל": {"lat": 31.99954533795199, "lon": 35.44736377907772, "segment": 5000707},
-    "גלעד": {"lat": 32.55766458208528, "lon": 35.076364126049306, "segment": 5001083},
-    "גמזו": {"lat": 31.92943509377689, "lon": 34.939780857971854, "segment": 5001812},
-    "גן הדרום": {
-        "lat": 31.80444832674777,
-        "lon": 34.702713193228504,
-        "segment": 5000480,
-    },
-    "גן השומרון": {
-        "lat": 32.461814472774265,
-        "lon": 34.99850713474968,
-        "segment": 5001004,
-    },
-    "גן חיים": {"lat": 32.19471759601995, "lon": 34.90574661289581, "segment": 5000856},
-    "גן יאשיה": {
-        "lat": 32.348328349322315,
-        "lon": 34.99370521172908,
-        "segment": 5000937,
-    },
-    "גן יבנה": {"lat": 31.78614812323355, "lon": 34.70534138764587, "segment": 5000447},
-    "גן נר": {"lat": 32.53106785157177, "lon": 35.333828732738425, "segment": 5001069},
-    "גן שורק": {
-        "lat": 31.944784652958496,
-        "lon": 34.75850765820429,
-        "segment": 5001826,
-    },
-    "גן שלמה": {
-        "lat": 31.878260936873367,
-        "lon": 34.797871800496594,
-        "segment": 5000572,
-    },
-    "גן שמואל": {
-        "lat": 32.44897704828694,
-        "lon": 34.95247449789546,
-        "segment": 5000992,
-    },
-    "גנות": {"lat": 32.017747007894165, "lon": 34.82873301272876, "segment": 5000710},
-    "גנות הדר": {
-        "lat": 32.32067860092501,
-        "lon": 34.900968060613074,
-        "segment": 5000926,
-    },
-    "גני הדר": {"lat": 31.87853708482648, "lon": 34.85404062976697, "segment": 5000589},
-    "גני חוגה": {
-        "lat": 32.517391707066935,
-        "lon": 35.53923743052041,
-        "segment": 5002194,
-    },
-    "גני טל": {"lat": 31.78784975260618, "lon": 34.791592483833924, "segment": 5000457},
-    "גני יוחנן": {
-        "lat": 31.856030531913973,
-        "lon": 34.832708878438126,
-        "segment": 5000559,
-    },
-    "גני עם": {"lat": 32.150920465896675, "lon": 34.90178009640424, "segment": 5000825},
-    "גני תקווה": {
-        "lat": 32.06306887194795,
-        "lon": 34.8752366874169,
-        "segment": 5000746,
-    },
-    "גניגר": {"lat": 32.663797860783134, "lon": 35.25947282810757, "segment": 5001159},
-    "געש": {"lat": 32.22956527212045, "lon": 34.824963668743976, "segment": 5000872},
-    "געתון": {"lat": 33.00614670403676, "lon": 35.21374820022866, "segment": 5001522},
-    "גפן": {"lat": 31.74118994319687, "lon": 34.878534925394455, "segment": 5000411},
-    "גרופית": {"lat": 29.939292337211107, "lon": 35.0660799415974, "segment": 5000022},
-    "גשור": {"lat": 32.817241002846025, "lon": 35.71709540342147, "segment": 5001349},
-    "גשר": {"lat": 32.620002386485915, "lon": 35.55205953548278, "segment": 5001135},
-    "גשר הזיו": {
-        "lat": 33.03964876187636,
-        "lon": 35.11182872284893,
-        "segment": 5001545,
-    },
-    "גת": {"lat": 31.627705144146606, "lon": 34.79417169691214, "segment": 5000314},
-    "גת רימון": {"lat": 32.068149556652, "lon": 34.88326545953122, "segment": 5000758},
-    "דבוריה": {"lat": 32.68756781890128, "lon": 35.37295382629786, "segment": 5001179},
-    "דביר": {"lat": 31.41210214020877, "lon": 34.82457495782771, "segment": 5000210},
-    "דברת": {"lat": 32.64676886353652, "lon": 35.3498245748547, "segment": 5001154},
-    "דגניה א": {"lat": 32.70794154712936, "lon": 35.57460088805669, "segment": 5001224},
-    "דגניה ב": {
-        "lat": 32.699541856750066,
-        "lon": 35.57541242310956,
-        "segment": 5001211,
-    },
-    "דוב''ב": {"lat": 33.054384836174876, "lon": 35.40958119656278, "segment": 5001574},
-    "דולב": {"lat": 31.92645536341438, "lon": 35.13391107496002, "segment": 5001815},
-    "דור, נחשולים": {
-        "lat": 32.61201359870591,
-        "lon": 34.92060962502279,
-        "segment": 5001109,
-    },
-    "דורות": {"lat": 31.50526602359474, "lon": 34.64421607524665, "segment": 5000249},
-    "דורות עילית": {
-        "lat": 32.13700400855994,
-        "lon": 35.062429784127374,
-        "segment": 5002255,
-    },
-    "דחי": {"lat": 32.62109565474588, "lon": 35.34503030003551, "segment": 5001134},
-    "דימונה": {"lat": 31.069203659045055, "lon": 35.03780116482061, "segment": 5000088},
-    "דיר אל-אסד": {
-        "lat": 32.93912340804122,
-        "lon": 35.25978561286213,
-        "segment": 5001442,
-    },
-    "דיר חנא": {"lat": 32.86283329645573, "lon": 35.3660928985545, "segment": 5001381},
-    "דישון": {"lat": 33.08157463857781, "lon": 35.51824235288962, "segment": 5001599},
-    "דליה": {"lat": 32.590117050345704, "lon": 35.07545379529588, "segment": 5001102},
-    "דלית אל כרמל": {
-        "lat": 32.694623294181476,
-        "lon": 35.05013138077511,
-        "segment": 5001172,
-    },
-    "דלתון": {"lat": 33.01652222111726, "lon": 35.49042372592565, "segment": 5001542},
-    "דמיידה": {"lat": 32.814891187954835, "lon": 35.22789524123188, "segment": 5001340},
-    "דפנה": {"lat": 33.22937015936517, "lon": 35.63763951933584, "segment": 5001653},
-    "דקל": {"lat": 31.194879260954103, "lon": 34.34485418078808, "segment": 5000110},
-    "האון": {"lat": 32.72532478592526, "lon": 35.622153853827655, "segment": 5001251},
-    "הבונים": {"lat": 32.63801168925455, "lon": 34.93321075349533, "segment": 5001128},
-    "הגבעה הצהובה": {
-        "lat": 31.658153893760222,
-        "lon": 35.119334359920614,
-        "segment": 5002231,
-    },
-    "הגושרים": {"lat": 33.22157450154208, "lon": 35.62338724227193, "segment": 5001649},
-    "הדר עם": {"lat": 32.34945710017086, "lon": 34.90149576397932, "segment": 5000941},
-    "הוד השרון": {
-        "lat": 32.149456233745056,
-        "lon": 34.88536964240054,
-        "segment": 5000810,
-    },
-    "הודיה": {"lat": 31.671650181281947, "lon": 34.63744070771797, "segment": 5000345},
-    "הודיות": {"lat": 32.788181414943445, "lon": 35.4353666416366, "segment": 5001322},
-    "הושעיה": {"lat": 32.75833034451192, "lon": 35.29205362949482, "segment": 5001277},
-    "הזורעים": {"lat": 32.74506386539639, "lon": 35.5039372474226, "segment": 5001268},
-    "החווה של אורי כהן": {
-        "lat": 32.28898201318537,
-        "lon": 35.5192228750864,
-        "segment": 5002220,
-    },
-    "החווה של זוהר": {
-        "lat": 31.917117916185862,
-        "lon": 35.382774795603616,
-        "segment": 5002211,
-    },
-    "החווה של יאיא": {
-        "lat": 32.14229338162569,
-        "lon": 35.41121675404224,
-        "segment": 5002221,
-    },
-    "החווה של מנחם": {
-        "lat": 32.22326172822863,
-        "lon": 35.54087771248033,
-        "segment": 5002216,
-    },
-    "החווה של עשהאל": {
-        "lat": 32.305880063917144,
-        "lon": 35.491840732345786,
-        "segment": 5002217,
-    },
-    "החותרים": {"lat": 32.75304037448547, "lon": 34.95494746434704, "segment": 5001258},
-    "היוגב": {"lat": 32.610553183547566, "lon": 35.2066182863737, "segment": 5001117},
-    "היישוב היהודי חברון": {
-        "lat": 31.524736874741247,
-        "lon": 35.10736845684271,
-        "segment": 5001736,
-    },
-    "הילה": {"lat": 33.03592154215437, "lon": 35.24427632212905, "segment": 5001556},
-    "המעפיל": {"lat": 32.37778360393938, "lon": 34.98320941983863, "segment": 5000962},
-    "המרכז האקדמי רופין": {
-        "lat": 32.34205556812128,
-        "lon": 34.91218672462992,
-        "segment": 5000935,
-    },
-    "הסוללים": {
-        "lat": 32.750836176703494,
-        "lon": 35.23876889680596,
-        "segment": 5001263,
-    },
-    "העוגן": {"lat": 32.36108474012933, "lon": 34.924364665792254, "segment": 5000954},
-    "הר אדר": {"lat": 31.8265187861247, "lon": 35.12986131044008, "segment": 5000538},
-    "הר ברכה": {"lat": 32.18605028920125, "lon": 35.26451566993667, "segment": 5000861},
-    "הר גילה": {
-        "lat": 31.722562468308794,
-        "lon": 35.16859119779037,
-        "segment": 5000402,
-    },
-    "הר חלוץ": {
-        "lat": 32.94977828749193,
-        "lon": 35.312485484793946,
-        "segment": 5001463,
-    },
-    "הר עמשא": {
-        "lat": 31.342854973739296,
-        "lon": 35.10045420748648,
-        "segment": 5000182,
-    },
-    "הראל": {"lat": 31.810104248122244, "lon": 34.95166497624249, "segment": 5000506},
-    "הרדוף": {"lat": 32.76237957119972, "lon": 35.17450992799123, "segment": 5001275},
-    "הרצליה - מערב": {
-        "lat": 32.17805088445084,
-        "lon": 34.8105950839553,
-        "segment": 5000834,
-    },
-    "הרצליה - מרכז וגליל ים": {
-        "lat": 32.16782505194287,
-        "lon": 34.84216910559462,
-        "segment": 5000824,
-    },
-    "הררית יחד": {
-        "lat": 32.84658141550981,
-        "lon": 35.3688790032855,
-        "segment": 5001370,
-    },
-    "ואדי אל חמאם": {
-        "lat": 32.829662115510715,
-        "lon": 35.48983411519652,
-        "segment": 5001357,
-    },
-    "ואדי אל נעם דרום": {
-        "lat": 31.1349894470303,
-        "lon": 34.824847403637996,
-        "segment": 5000091,
-    },
-    "ורד יריחו": {
-        "lat": 31.825867059657117,
-        "lon": 35.43407317450811,
-        "segment": 5000550,
-    },
-    "ורדון": {"lat": 31.664033052502152, "lon": 34.781534989284395, "segment": 5000348},
-    "זבדיאל": {"lat": 31.65875267358846, "lon": 34.7600107810399, "segment": 5000336},
-    "זוהר": {"lat": 31.595778990815823, "lon": 34.69261447364515, "segment": 5000287},
-    "זיקים": {"lat": 31.60889117295483, "lon": 34.52146160658609, "segment": 5000290},
-    "זיתן": {"lat": 31.97530117316762, "lon": 34.88927763054208, "segment": 5001850},
-    "זכרון יעקב": {
-        "lat": 32.568770821544874,
-        "lon": 34.954796218433586,
-        "segment": 5001081,
-    },
-    "זכריה": {"lat": 31.710202694322792, "lon": 34.94429297663547, "segment": 5000380},
-    "זמר": {"lat": 32.36234078239056, "lon": 35.034290772331666, "segment": 5000956},
-    "זמרת, שובה": {
-        "lat": 31.452823792441148,
-        "lon": 34.54443438176249,
-        "segment": 5000220,
-    },
-    "זנוח": {"lat": 31.73212109774804, "lon": 35.00087808554971, "segment": 5000413},
-    "זרועה": {"lat": 31.45921046106965, "lon": 34.62228983494617, "segment": 5000232},
-    "זרזיר": {"lat": 32.72266570748804, "lon": 35.21924547271775, "segment": 5001205},
-    "זרחיה": {"lat": 31.681950336162494, "lon": 34.74634415881277, "segment": 5000353},
-    "זרעית": {"lat": 33.09898141966526, "lon": 35.284494799996345, "segment": 5001603},
-    "חבצלת השרון וצוקי ים": {
-        "lat": 32.3604568910529,
-        "lon": 34.861473255721485,
-        "segment": 5000947,
-    },
-    "חג'אג'רה": {
-        "lat": 32.74086501684939,
-        "lon": 35.20482536435445,
-        "segment": 5001246,
-    },
-    "חגור": {"lat": 32.13869284091244, "lon": 34.94867809262772, "segment": 5000815},
-    "חגלה": {"lat": 32.38669194235338, "lon": 34.92553301648262, "segment": 5000967},
-    "חד נס": {"lat": 32.932072828802234, "lon": 35.64241828363832, "segment": 5001446},
-    "חדיד": {"lat": 31.968155995847944, "lon": 34.93385020767989, "segment": 5001851},
-    "חדרה - מזרח": {
-        "lat": 32.42514754698003,
-        "lon": 34.9498243249048,
-        "segment": 5000983,
-    },
-    "חדרה - מערב": {
-        "lat": 32.43349577634664,
-        "lon": 34.882238555251575,
-        "segment": 5000984,
-    },
-    "חדרה - מרכז": {
-        "lat": 32.431433578331614,
-        "lon": 34.923692781338445,
-        "segment": 5000985,
-    },
-    "חדרה - נווה חיים": {
-        "lat": 32.44888972027663,
-        "lon": 34.90639866799646,
-        "segment": 5000989,
-    },
-    "חוות אביה": {
-        "lat": 32.45450906015973,
-        "lon": 35.11124439620375,
-        "segment": 5002260,
-    },
-    "חוות אביחי": {
-        "lat": 32.046037260203185,
-        "lon": 35.03638133704425,
-        "segment": 5002242,
-    },
-    "חוות אל נווה": {
-        "lat": 32.43827205015571,
-        "lon": 35.11376979318188,
-        "segment": 5002259,
-    },
-    "חוות אלחי": {
-        "lat": 32.276095381270856,
-        "lon": 35.155923804053536,
-        "segment": 5002252,
-    },
-    "חוות ארץ האיילים": {
-        "lat": 31.664940682191915,
-        "lon": 35.112565803712975,
-        "segment": 5002232,
-    },
-    "חוות אשכולות": {
-        "lat": 31.421642505766815,
-        "lon": 34.915119117325325,
-        "segment": 5002273,
-    },
-    "חוות בניהו": {
-        "lat": 31.857174655740632,
-        "lon": 35.29769127813257,
-        "segment": 5002306,
-    },
-    "חוות גלעד": {
-        "lat": 32.196567785532004,
-        "lon": 35.181525295808825,
-        "segment": 5001884,
-    },
-    "חוות גנות": {
-        "lat": 32.158144141774955,
-        "lon": 35.43967056047696,
-        "segment": 5002215,
-    },
-    "חוות דרומא": {
-        "lat": 31.396881786238655,
-        "lon": 35.145847523234934,
-        "segment": 5002266,
-    },
-    "חוות הרועה העברי": {
-        "lat": 31.812530084273806,
-        "lon": 35.322103991236546,
-        "segment": 5002307,
-    },
-    "חוות הרשאש": {
-        "lat": 32.0421993687519,
-        "lon": 35.40312541192312,
-        "segment": 5002213,
-    },
-    "חוות חנינא": {
-        "lat": 31.895428380100917,
-        "lon": 35.306130836447615,
-        "segment": 5002305,
-    },
-    "חוות טואמין": {
-        "lat": 31.376158798228,
-        "lon": 35.12396299495018,
-        "segment": 5002265,
-    },
-    "חוות טליה": {
-        "lat": 31.367710601326596,
-        "lon": 35.124960422089416,
-        "segment": 5002267,
-    },
-    "חוות יאיר": {
-        "lat": 32.143507816181106,
-        "lon": 35.10655866282715,
-        "segment": 5001723,
-    },
-    "חוות יד השומר": {
-        "lat": 32.33229493728482,
-        "lon": 35.490117950655105,
-        "segment": 5002218,
-    },
-    "חוות יויו": {
-        "lat": 31.386895003794752,
-        "lon": 35.153826339987695,
-        "segment": 5002275,
-    },
-    "חוות ינון": {
-        "lat": 31.85655005929107,
-        "lon": 35.31486841765128,
-        "segment": 5002303,
-    },
-    "חוות מגדלים": {
-        "lat": 32.094421073569286,
-        "lon": 35.35246933002303,
-        "segment": 5002248,
-    },
-    "חוות מגנזי": {
-        "lat": 31.961232148331714,
-        "lon": 35.034961079944786,
-        "segment": 5002293,
-    },
-    "חוות מדבר חבר": {
-        "lat": 31.471107390462297,
-        "lon": 35.178025534016,
-        "segment": 5002261,
-    },
-    "חוות מור ואברהם": {
-        "lat": 31.369538605905067,
-        "lon": 34.968234754438974,
-        "segment": 5002272,
-    },
-    "חוות מלאכי אברהם": {
-        "lat": 31.482378574824512,
-        "lon": 35.17625665464146,
-        "segment": 5002276,
-    },
-    "חוות מלכיאל": {
-        "lat": 31.908511427366328,
-        "lon": 35.371445412073314,
-        "segment": 5002299,
-    },
-    "חוות מנחם": {
-        "lat": 31.36427447497134,
-        "lon": 35.16874990589291,
-        "segment": 5002274,
-    },
-    "חוות מעלה אהוביה": {
-        "lat": 31.949475783290975,
-        "lon": 35.33629607500727,
-        "segment": 5002300,
-    },
-    "חוות מקנה יהודה": {
-        "lat": 31.36257189521187,
-        "lon": 35.03707540692364,
-        "segment": 5002269,
-    },
-    "חוות מרום שמואל": {
-        "lat": 32.20541412335315,
-        "lon": 35.392780782369485,
-        "segment": 5002291,
-    },
-    "חוות נווה צוף": {
-        "lat": 32.0070213897777,
-        "lon": 35.14586532561789,
-        "segment": 5002308,
-    },
-    'חוות נוף אב"י': {
-        "lat": 32.090984219218775,
-        "lon": 35.15037927491666,
-        "segment": 5002256,
-    },
-    "חוות נחל שילה": {
-        "lat": 32.04811564937636,
-        "lon": 35.28195557138612,
-        "segment": 5002297,
-    },
-    "חוות נחלת אבות": {
-        "lat": 31.577166578489436,
-        "lon": 35.19697498120877,
-        "segment": 5002235,
-    },
-    "חוות נחלת צבי": {
-        "lat": 31.87105249078404,
-        "lon": 35.29870203514737,
-        "segment": 5002301,
-    },
-    "חוות עדן": {
-        "lat": 31.700007239491075,
-        "lon": 35.140997995218804,
-        "segment": 5002237,
-    },
-    "חוות עולם חסד": {
-        "lat": 32.00419447335169,
-        "lon": 35.03319044684693,
-        "segment": 5002243,
-    },
-    "חוות עמיאל": {
-        "lat": 32.391253033538604,
-        "lon": 35.4646848542073,
-        "segment": 5002222,
-    },
-    "חוות פריאל": {
-        "lat": 32.07906812306237,
-        "lon": 35.41626289961313,
-        "segment": 5002282,
-    },
-    "חוות צאן קדר": {
-        "lat": 31.736248379679743,
-        "lon": 35.32003735379833,
-        "segment": 5002240,
-    },
-    "חוות צרידה": {
-        "lat": 32.055914834435654,
-        "lon": 35.06091100033654,
-        "segment": 5002257,
-    },
-    "חוות קשואלה": {
-        "lat": 31.6756008284106,
-        "lon": 35.10223646069265,
-        "segment": 5002233,
-    },
-    "חוות ראש תאנה": {
-        "lat": 32.00444434488992,
-        "lon": 35.371258054313564,
-        "segment": 5002298,
-    },
-    "חוות שדה": {
-        "lat": 32.18857235886136,
-        "lon": 35.31043481350479,
-        "segment": 5002250,
-    },
-    "חוות שוביאל": {
-        "lat": 32.07885771906845,
-        "lon": 35.135825769109964,
-        "segment": 5002253,
-    },
-    "חוות שחרית": {
-        "lat": 32.089156566031036,
-        "lon": 35.07509842656411,
-        "segment": 5002254,
-    },
-    "חוות תלם צפון": {
-        "lat": 31.57065275406054,
-        "lon": 35.037185937666905,
-        "segment": 5002281,
-    },
-    "חולדה": {"lat": 31.83097560051248, "lon": 34.883197255975055, "segment": 5000535},
-    "חולון": {"lat": 32.01472274164716, "lon": 34.786476022784655, "segment": 5000701},
-    "חולית": {"lat": 31.23015323820678, "lon": 34.326224657192434, "segment": 5000128},
-    "חולתה": {"lat": 33.051136574047696, "lon": 35.60965140003556, "segment": 5001578},
-    "חומש": {"lat": 32.310074675719044, "lon": 35.19310430218792, "segment": 5002251},
-    "חוסן": {"lat": 32.99930489607293, "lon": 35.295609183477545, "segment": 5001514},
-    "חוסנייה": {
-        "lat": 32.900868553495755,
-        "lon": 35.319103779173304,
-        "segment": 5001418,
-    },
-    "חוף אכזיב": {
-        "lat": 33.05264159000795,
-        "lon": 35.1033351295994,
-        "segment": 5002245,
-    },
-    "חוף בצת": {"lat": 33.08017649692231, "lon": 35.10662134988104, "segment": 5002209},
-    "חוף זיקים": {
-        "lat": 31.616402561093892,
-        "lon": 34.50803406648558,
-        "segment": 5002019,
-    },
-    "חוף קליה": {
-        "lat": 31.760860232326838,
-        "lon": 35.49962377169416,
-        "segment": 5002014,
-    },
-    "חופית": {"lat": 32.38576639714159, "lon": 34.878241031268715, "segment": 5000964},
-    "חוקוק": {"lat": 32.88063027124185, "lon": 35.495292324062454, "segment": 5001403},
-    "חורה": {"lat": 31.296609077411915, "lon": 34.93344339843457, "segment": 5000156},
-    "חורפיש": {"lat": 33.02180909112941, "lon": 35.34454527664794, "segment": 5001536},
-    "חורשים": {"lat": 32.13805648896154, "lon": 34.97050551250157, "segment": 5000816},
-    "חזון": {"lat": 32.90534866219422, "lon": 35.396137702392686, "segment": 5001419},
-    "חיבת ציון": {
-        "lat": 32.39754447547098,
-        "lon": 34.91352365707453,
-        "segment": 5000974,
-    },
-    "חיננית": {"lat": 32.48020876587455, "lon": 35.17193334198326, "segment": 5001035},
-    "חיפה - בת גלים ק.אליעזר": {
-        "lat": 32.82775166707076,
-        "lon": 34.98012365943304,
-        "segment": 5002330,
-    },
-    "חיפה - כרמל, הדר ועיר תחתית": {
-        "lat": 32.8068239429968,
-        "lon": 34.988130988154694,
-        "segment": 5001302,
-    },
-    "חיפה - מערב": {
-        "lat": 32.802075302888156,
-        "lon": 34.962639889756524,
-        "segment": 5001292,
-    },
-    "חיפה - מפרץ": {
-        "lat": 32.80495512021589,
-        "lon": 35.05210658723248,
-        "segment": 5001336,
-    },
-    "חיפה - נווה שאנן ורמות כרמל": {
-        "lat": 32.78076129377333,
-        "lon": 35.002116089158605,
-        "segment": 5001270,
-    },
-    "חיפה - קריית חיים ושמואל": {
-        "lat": 32.82838587529852,
-        "lon": 35.064815765420306,
-        "segment": 5001878,
-    },
-    "חירן": {"lat": 31.347036848318275, "lon": 35.06025912432227, "segment": 5002268},
-    "חלץ": {"lat": 31.577461715813328, "lon": 34.657086476755715, "segment": 5000276},
-    "חמד": {"lat": 32.01829583044595, "lon": 34.84304513175201, "segment": 5000711},
-    "חמדיה": {"lat": 32.52060602867147, "lon": 35.520700276931215, "segment": 5001071},
-    "חמדת": {"lat": 32.25179230935501, "lon": 35.52686249243718, "segment": 5000897},
-    "חמדת ימים": {
-        "lat": 32.94875034306822,
-        "lon": 35.42492014245824,
-        "segment": 5002228,
-    },
-    "חמרה": {"lat": 32.20367267161285, "lon": 35.42631288910095, "segment": 5000865},
-    "חמת גדר": {
-        "lat": 32.684435025575816,
-        "lon": 35.666294592037296,
-        "segment": 5001198,
-    },
-    "חניאל": {"lat": 32.33328532972, "lon": 34.94951097906518, "segment": 5000930},
-    "חניון רעים אנדרטת הנובה": {
-        "lat": 31.39790758830467,
-        "lon": 34.468769371087845,
-        "segment": 5002284,
-    },
-    "חניתה": {"lat": 33.087436763886465, "lon": 35.174325384842966, "segment": 5001591},
-    "חנתון": {"lat": 32.783895277810956, "lon": 35.244535506205075, "segment": 5001308},
-    "חספין": {"lat": 32.8455729365377, "lon": 35.79284226824308, "segment": 5001374},
-    "חפץ חיים": {
-        "lat": 31.78902511270593,
-        "lon": 34.80137874338249,
-        "segment": 5000458,
-    },
-    "חצב": {"lat": 31.777624895917878, "lon": 34.77018089392998, "segment": 5000437},
-    "חצבה": {"lat": 30.76993722319733, "lon": 35.27693148461707, "segment": 5000046},
-    "חצור": {"lat": 31.774637647500512, "lon": 34.71867121139723, "segment": 5000435},
-    "חצור הגלילית": {
-        "lat": 32.98418387372934,
-        "lon": 35.54792462374585,
-        "segment": 5001506,
-    },
-    "חצרים": {"lat": 31.239379719722393, "lon": 34.7138331587301, "segment": 5000139},
-    "חרב לאת": {
-        "lat": 32.40103502088939,
-        "lon": 34.919770318371214,
-        "segment": 5000979,
-    },
-    "חרוצים": {"lat": 32.227806510000065, "lon": 34.8645338561232, "segment": 5000873},
-    "חרות": {"lat": 32.23922022509822, "lon": 34.916245963810546, "segment": 5000876},
-    "חריש": {"lat": 32.45967685987781, "lon": 35.04923987554248, "segment": 5001008},
-    "חרמש": {"lat": 32.42333627076506, "lon": 35.11866402499925, "segment": 5000987},
-    "חרמש דרום": {
-        "lat": 32.41624068868958,
-        "lon": 35.12166243767283,
-        "segment": 5002258,
-    },
-    "חרשה": {"lat": 31.944252736377113, "lon": 35.13754097623868, "segment": 5001833},
-    "חרשים": {"lat": 32.95677659682337, "lon": 35.32782142281069, "segment": 5001473},
-    "חשמונאים": {
-        "lat": 31.93056390714442,
-        "lon": 35.01827369040211,
-        "segment": 5001813,
-    },
-    "טבריה": {"lat": 32.78416350906845, "lon": 35.52044155002187, "segment": 5001298},
-    "טובא זנגריה": {
-        "lat": 32.96532973829391,
-        "lon": 35.59214429939297,
-        "segment": 5001487,
-    },
-    "טורעאן": {"lat": 32.77662147046275, "lon": 35.37657778612759, "segment": 5001296},
-    "טייבה": {"lat": 32.26351531294739, "lon": 35.00605612664427, "segment": 5000886},
-    "טייבה בגלבוע": {
-        "lat": 32.603086338066966,
-        "lon": 35.44405573836295,
-        "segment": 5001122,
-    },
-    "טירה": {"lat": 32.2343274278489, "lon": 34.95798239768061, "segment": 5000869},
-    "טירת יהודה": {
-        "lat": 32.0131158343888,
-        "lon": 34.933295809286896,
-        "segment": 5000703,
-    },
-    "טירת כרמל": {
-        "lat": 32.761127169911795,
-        "lon": 34.97161442353749,
-        "segment": 5001259,
-    },
-    "טירת צבי": {
-        "lat": 32.42209978511581,
-        "lon": 35.527383040139675,
-        "segment": 5000991,
-    },
-    "טל - אל": {"lat": 32.92622320701856, "lon": 35.17859437188503, "segment": 5001433},
-    "טל מנשה": {
-        "lat": 32.483304309018436,
-        "lon": 35.16108111887789,
-        "segment": 5001034,
-    },
-    "טל שחר": {"lat": 31.804872542018092, "lon": 34.90104949162369, "segment": 5000486},
-    "טללים": {"lat": 30.990493194258352, "lon": 34.77148268102784, "segment": 5000075},
-    "טלמון": {"lat": 31.93838249612274, "lon": 35.138504287441336, "segment": 5001832},
-    "טמרה": {"lat": 32.84704241849496, "lon": 35.20468855124347, "segment": 5001360},
-    "טמרה בגלבוע": {
-        "lat": 32.631336084592014,
-        "lon": 35.40187586281854,
-        "segment": 5001142,
-    },
-    "טנא עומרים": {
-        "lat": 31.37492865626151,
-        "lon": 34.956721248025154,
-        "segment": 5000198,
-    },
-    "טפחות": {"lat": 32.86752696439797, "lon": 35.423675401922644, "segment": 5001387},
-    "יבוא דודי": {
-        "lat": 31.96747811502925,
-        "lon": 35.146216917993975,
-        "segment": 5002295,
-    },
-    "יבול": {"lat": 31.188251253303548, "lon": 34.31829923164924, "segment": 5000105},
-    "יבנאל": {"lat": 32.70881402819777, "lon": 35.501133514555605, "segment": 5001210},
-    "יבנה": {"lat": 31.87813399501096, "lon": 34.73752570113535, "segment": 5000566},
-    "יגור": {"lat": 32.74314508394178, "lon": 35.07706680239746, "segment": 5001242},
-    "יגל": {"lat": 31.988241511996673, "lon": 34.879904979528995, "segment": 5001853},
-    "יד בנימין": {
-        "lat": 31.796205085816876,
-        "lon": 34.82183689157808,
-        "segment": 5000472,
-    },
-    "יד השמונה": {
-        "lat": 31.807704780720286,
-        "lon": 35.08990663321843,
-        "segment": 5000509,
-    },
-    "יד חנה": {"lat": 32.325922839560334, "lon": 35.00580171033907, "segment": 5000928},
-    "יד מרדכי": {
-        "lat": 31.588677623583806,
-        "lon": 34.55909945747169,
-        "segment": 5000281,
-    },
-    "יד נתן": {"lat": 31.653792703175412, "lon": 34.7054218696936, "segment": 5000322},
-    "יד רמב''ם": {
-        "lat": 31.900254820580077,
-        "lon": 34.902116873426465,
-        "segment": 5001784,
-    },
-    "יהוד מונוסון": {
-        "lat": 32.03223238338741,
-        "lon": 34.88785562935948,
-        "segment": 5000717,
-    },
-    "יהל": {"lat": 30.081275193958966, "lon": 35.1279535514438, "segment": 5000028},
-    "יובלים": {"lat": 32.877729878601436, "lon": 35.26991177723732, "segment": 5001391},
-    "יודפת": {"lat": 32.83663188918958, "lon": 35.272743991429536, "segment": 5001355},
-    "יונתן": {"lat": 32.936732065816614, "lon": 35.79430471015475, "segment": 5001467},
-    "יושיביה": {
-        "lat": 31.44305050380377,
-        "lon": 34.608686423553536,
-        "segment": 5000223,
-    },
-    "יזרעאל": {"lat": 32.56302319776226, "lon": 35.32102420767835, "segment": 5001091},
-    "יחיעם": {"lat": 32.99729075634386, "lon": 35.220409017802325, "segment": 5001512},
-    "יטבתה": {"lat": 29.895815933291484, "lon": 35.06217063630354, "segment": 5000018},
-    "ייט''ב": {
-        "lat": 31.949305355077374,
-        "lon": 35.421822729122994,
-        "segment": 5001837,
-    },
-    "יכיני": {"lat": 31.48277689063753, "lon": 34.6010358686186, "segment": 5000240},
-    "ינוב": {"lat": 32.30721925426444, "lon": 34.94849385354216, "segment": 5000917},
-    "ינוח ג'ת": {
-        "lat": 32.98051460519927,
-        "lon": 35.25525317972469,
-        "segment": 5001493,
-    },
-    "ינון": {"lat": 31.74287698857089, "lon": 34.78132853336715, "segment": 5000409},
-    "יסוד המעלה": {
-        "lat": 33.05738109567832,
-        "lon": 35.60552444007362,
-        "segment": 5001577,
-    },
-    "יסודות": {"lat": 31.81566675313495, "lon": 34.86380111648054, "segment": 5000522},
-    "יסעור": {"lat": 32.899624942565396, "lon": 35.165297739436575, "segment": 5001405},
-    "יעבץ, יעף": {
-        "lat": 32.27305085931823,
-        "lon": 34.96594265289997,
-        "segment": 5000902,
-    },
-    "יעד": {"lat": 32.8789029406869, "lon": 35.24228214010229, "segment": 5001390},
-    "יערה": {"lat": 33.067684226359084, "lon": 35.184770489110406, "segment": 5001583},
-    "יפיע": {"lat": 32.68403719748739, "lon": 35.272954272019525, "segment": 5001176},
-    "יפית": {"lat": 32.06015177585059, "lon": 35.47155089807745, "segment": 5000766},
-    "יפעת": {"lat": 32.67763528495858, "lon": 35.22320006521984, "segment": 5001165},
-    "יפתח": {"lat": 33.12608743385069, "lon": 35.55032588619666, "segment": 5001617},
-    "יצהר": {"lat": 32.16483667929793, "lon": 35.24481609280669, "segment": 5000851},
-    "יציץ": {"lat": 31.86330022286429, "lon": 34.8614867238459, "segment": 5000568},
-    "יקום": {"lat": 32.24843889062203, "lon": 34.8409640067601, "segment": 5000878},
-    "יקיר": {"lat": 32.14901958928079, "lon": 35.11368539358598, "segment": 5000831},
-    "יקנעם המושבה והזורע": {
-        "lat": 32.65276824732047,
-        "lon": 35.11623890812353,
-        "segment": 5001138,
-    },
-    "יקנעם עילית": {
-        "lat": 32.64946837833158,
-        "lon": 35.09625796054399,
-        "segment": 5001137,
-    },
-    "יראון": {"lat": 33.07745434384217, "lon": 35.45399599906121, "segment": 5001598},
-    "ירדנה": {"lat": 32.566132223387235, "lon": 35.56395621655785, "segment": 5001098},
-    "ירוחם": {"lat": 30.99538567085322, "lon": 34.92384283835852, "segment": 5000073},
-    "ירושלים - אזור תעשייה עטרות": {
-        "lat": 31.860677355886928,
-        "lon": 35.21654609735883,
-        "segment": 5000564,
-    },
-    "ירושלים - דרום": {
-        "lat": 31.73777395747067,
-        "lon": 35.18795669551971,
-        "segment": 5000415,
-    },
-    "ירושלים - כפר עקב": {
-        "lat": 31.874514260479682,
-        "lon": 35.21762599463317,
-        "segment": 5001926,
-    },
-    "ירושלים - מזרח": {
-        "lat": 31.76273817993166,
-        "lon": 35.24046099218474,
-        "segment": 5000496,
-    },
-    "ירושלים - מערב": {
-        "lat": 31.774380876387198,
-        "lon": 35.172816098283036,
-        "segment": 5001922,
-    },
-    "ירושלים - מרכז": {
-        "lat": 31.778142829212364,
-        "lon": 35.216612326828546,
-        "segment": 5000391,
-    },
-    "ירושלים - צפון": {
-        "lat": 31.82131201370977,
-        "lon": 35.238942341137445,
-        "segment": 5000527,
-    },
-    "ירחיב": {"lat": 32.153605166843036, "lon": 34.9683779939307, "segment": 5000829},
-    "ירכא": {"lat": 32.954327637448536, "lon": 35.20565659463998, "segment": 5001462},
-    "ירקונה": {"lat": 32.14511652181756, "lon": 34.8984980120905, "segment": 5000822},
-    "ישובי אומן": {
-        "lat": 32.565514216976304,
-        "lon": 35.24374034886024,
-        "segment": 5001090,
-    },
-    "ישובי יעל": {
-        "lat": 32.54986685766721,
-        "lon": 35.3074579388323,
-        "segment": 5001077,
-    },
-    "ישעי": {"lat": 31.751072502849155, "lon": 34.96471469604598, "segment": 5000427},
-    "ישרש": {"lat": 31.914569466689176, "lon": 34.84712001410273, "segment": 5001790},
-    "יתד": {"lat": 31.206546355931334, "lon": 34.32535321085974, "segment": 5000112},
-    "כאבול": {"lat": 32.875486148937796, "lon": 35.202917191135356, "segment": 5001384},
-    "כאוכב אבו אלהיג'א": {
-        "lat": 32.830881035764875,
-        "lon": 35.24869497681923,
-        "segment": 5001354,
-    },
-    "כברי": {"lat": 33.01757581202287, "lon": 35.14681791002035, "segment": 5001531},
-    "כדורי": {"lat": 32.703274577562176, "lon": 35.40818027676557, "segment": 5001209},
-    "כוכב השחר": {
-        "lat": 31.95682712445123,
-        "lon": 35.34591971881664,
-        "segment": 5001847,
-    },
-    "כוכב יאיר - צור יגאל": {
-        "lat": 32.220918890782194,
-        "lon": 34.994202235518486,
-        "segment": 5000870,
-    },
-    "כוכב יעקב": {
-        "lat": 31.880385522238935,
-        "lon": 35.245926832377,
-        "segment": 5000598,
-    },
-    "כוכב מיכאל": {
-        "lat": 31.62915773235843,
-        "lon": 34.67031563105078,
-        "segment": 5000307,
-    },
-    "כורזים ורד הגליל": {
-        "lat": 32.9088875374408,
-        "lon": 35.55191100386822,
-        "segment": 5001431,
-    },
-    "כחל": {"lat": 32.8916852165847, "lon": 35.50964421960382, "segment": 5001410},
-    "כינרת מושבה": {
-        "lat": 32.722799618613514,
-        "lon": 35.563842359912606,
-        "segment": 5001238,
-    },
-    "כינרת קבוצה": {
-        "lat": 32.712805440050644,
-        "lon": 35.56173152101543,
-        "segment": 5001223,
-    },
-    "כיסופים": {"lat": 31.374112003364854, "lon": 34.3975709035132, "segment": 5000188},
-    "כישור": {"lat": 32.94614784832888, "lon": 35.249592321472804, "segment": 5001449},
-    "כל הארץ": {"lat": 31.7781, "lon": 35.2164, "segment": 0},
-    "כליל": {"lat": 32.98364912072198, "lon": 35.19215924321235, "segment": 5001492},
-    "כלנית": {"lat": 32.87436156200075, "lon": 35.457680335679804, "segment": 5001394},
-    "כמהין": {"lat": 30.910255554702566, "lon": 34.43164934103578, "segment": 5001768},
-    "כמון - כמאנה מזרחית": {
-        "lat": 32.912481475049255,
-        "lon": 35.354256355203916,
-        "segment": 5001427,
-    },
-    "כנות": {"lat": 31.802477362474665, "lon": 34.751738026373644, "segment": 5000482},
-    "כנף": {"lat": 32.870563813535966, "lon": 35.69999620878968, "segment": 5001395},
-    "כסייפה": {"lat": 31.234772387223696, "lon": 35.0682392595391, "segment": 5000126},
-    "כסלון": {"lat": 31.77402331001428, "lon": 35.04876868920006, "segment": 5000448},
-    "כסרא סמיע": {
-        "lat": 32.9714071716981,
-        "lon": 35.31169738068722,
-        "segment": 5001472,
-    },
-    "כעביה טבאש": {
-        "lat": 32.75438215454957,
-        "lon": 35.187449321207026,
-        "segment": 5001262,
-    },
-    "כפר אביב": {
-        "lat": 31.83183665175439,
-        "lon": 34.720030807746035,
-        "segment": 5000531,
-    },
-    "כפר אדומים": {
-        "lat": 31.82221235714465,
-        "lon": 35.34087372750441,
-        "segment": 5000540,
-    },
-    "כפר אוריה": {
-        "lat": 31.79285965434217,
-        "lon": 34.94699232331765,
-        "segment": 5000473,
-    },
-    "כפר אחים": {
-        "lat": 31.74501746083071,
-        "lon": 34.75603580168722,
-        "segment": 5000408,
-    },
-    "כפר אלדד": {
-        "lat": 31.649331605134822,
-        "lon": 35.25349386367206,
-        "segment": 5000342,
-    },
-    "כפר ביאליק": {
-        "lat": 32.82000323097197,
-        "lon": 35.08989774929018,
-        "segment": 5001338,
-    },
-    "כפר ביל''ו": {
-        "lat": 31.87368577270275,
-        "lon": 34.82555682930998,
-        "segment": 5000575,
-    },
-    "כפר בלום": {
-        "lat": 33.17300002432875,
-        "lon": 35.61069048923086,
-        "segment": 5001631,
-    },
-    "כפר בן נון": {
-        "lat": 31.860960236966637,
-        "lon": 34.94724804795882,
-        "segment": 5000562,
-    },
-    "כפר ברא": {"lat": 32.13271602997541, "lon": 34.9722912055736, "segment": 5000817},
-    "כפר ברוך": {"lat": 32.6457638960868, "lon": 35.19046489815144, "segment": 5001145},
-    "כפר גדעון": {
-        "lat": 32.643410792109485,
-        "lon": 35.29166316802071,
-        "segment": 5001146,
-    },
-    "כפר גלים": {
-        "lat": 32.76678109993937,
-        "lon": 34.95700375893559,
-        "segment": 5001269,
-    },
-    "כפר גליקסון": {
-        "lat": 32.506024938657795,
-        "lon": 35.00474979358477,
-        "segment": 5001045,
-    },
-    "כפר גלעדי": {
-        "lat": 33.24300130715764,
-        "lon": 35.57660701596004,
-        "segment": 5001657,
-    },
-    "כפר גמילה מלכישוע": {
-        "lat": 32.43753926652345,
-        "lon": 35.41584593110848,
-        "segment": 5001000,
-    },
-    "כפר דניאל": {
-        "lat": 31.93324335163294,
-        "lon": 34.93232143921657,
-        "segment": 5001819,
-    },
-    "כפר האורנים": {
-        "lat": 31.91909011905609,
-        "lon": 35.03889266617396,
-        "segment": 5001803,
-    },
-    "כפר החורש": {
-        "lat": 32.70166469037695,
-        "lon": 35.27032993352182,
-        "segment": 5001207,
-    },
-    "כפר המכבי": {
-        "lat": 32.790209259287984,
-        "lon": 35.11424495615995,
-        "segment": 5001305,
-    },
-    "כפר הנגיד": {
-        "lat": 31.887607106781708,
-        "lon": 34.74810926757926,
-        "segment": 5000585,
-    },
-    "כפר הנוער קריית יערים": {
-        "lat": 31.81273321954225,
-        "lon": 35.10498081991419,
-        "segment": 5001963,
-    },
-    "כפר הנוקדים": {
-        "lat": 31.30488089856303,
-        "lon": 35.269623021876434,
-        "segment": 5002204,
-    },
-    "כפר הנשיא": {
-        "lat": 32.9756089382086,
-        "lon": 35.60185771587197,
-        "segment": 5001509,
-    },
-    "כפר הס": {"lat": 32.24672570270939, "lon": 34.935643345236386, "segment": 5000879},
-    "כפר הרא''ה": {
-        "lat": 32.389674921640875,
-        "lon": 34.910887780453386,
-        "segment": 5000966,
-    },
-    "כפר הרי''ף וצומת ראם": {
-        "lat": 31.751093628239452,
-        "lon": 34.784618220347525,
-        "segment": 5000410,
-    },
-    "כפר ויתקין": {
-        "lat": 32.38344983265555,
-        "lon": 34.88256072972723,
-        "segment": 5000960,
-    },
-    "כפר ורבורג": {
-        "lat": 31.72011769984254,
-        "lon": 34.72495505618803,
-        "segment": 5000377,
-    },
-    "כפר ורדים": {
-        "lat": 32.99868031228313,
-        "lon": 35.268382049771084,
-        "segment": 5001513,
-    },
-    "כפר זוהרים": {
-        "lat": 31.62148679342718,
-        "lon": 34.92466846854225,
-        "segment": 5000310,
-    },
-    "כפר זיתים": {
-        "lat": 32.812462109518464,
-        "lon": 35.46262816684169,
-        "segment": 5001341,
-    },
-    "כפר ח'וואלד": {
-        "lat": 32.77009282362132,
-        "lon": 35.1363361404153,
-        "segment": 5001282,
-    },
-    "כפר חב''ד": {
-        "lat": 31.990408298875405,
-        "lon": 34.849640453456935,
-        "segment": 5001861,
-    },
-    "כפר חיטים": {
-        "lat": 32.80039983324157,
-        "lon": 35.50334949904216,
-        "segment": 5001330,
-    },
-    "כפר חיים": {
-        "lat": 32.35432423487584,
-        "lon": 34.89914727028119,
-        "segment": 5000942,
-    },
-    "כפר חנניה": {
-        "lat": 32.91454659634863,
-        "lon": 35.425270270155266,
-        "segment": 5001437,
-    },
-    "כפר חסידים": {
-        "lat": 32.74783671084536,
-        "lon": 35.089037097994165,
-        "segment": 5001243,
-    },
-    "כפר חרוב": {
-        "lat": 32.76215859870324,
-        "lon": 35.66285030313503,
-        "segment": 5001289,
-    },
-    "כפר טרומן": {
-        "lat": 31.97960993010719,
-        "lon": 34.92360353185257,
-        "segment": 5001854,
-    },
-    "כפר יאסיף": {
-        "lat": 32.953137978886815,
-        "lon": 35.16119176714547,
-        "segment": 5001461,
-    },
-    "כפר ידידיה": {
-        "lat": 32.34513301037398,
-        "lon": 34.89993888491275,
-        "segment": 5000934,
-    },
-    "כפר יהושע": {
-        "lat": 32.68195030330225,
-        "lon": 35.15332080325189,
-        "segment": 5001163,
-    },
-    "כפר יובל": {
-        "lat": 33.24641764043398,
-        "lon": 35.59623987162367,
-        "segment": 5001662,
-    },
-    "כפר יונה": {
-        "lat": 32.314737588524984,
-        "lon": 34.937389551477025,
-        "segment": 5000922,
-    },
-    "כפר יחזקאל": {
-        "lat": 32.56793622218904,
-        "lon": 35.35867069029486,
-        "segment": 5001092,
-    },
-    "כפר כמא": {
-        "lat": 32.719986555024114,
-        "lon": 35.44193221088896,
-        "segment": 5001235,
-    },
-    "כפר כנא": {"lat": 32.74798846585171, "lon": 35.34272618367805, "segment": 5001255},
-    "כפר מונש": {
-        "lat": 32.34752039690843,
-        "lon": 34.91782153518034,
-        "segment": 5000936,
-    },
-    "כפר מימון ותושיה": {
-        "lat": 31.43240140278596,
-        "lon": 34.53862775337013,
-        "segment": 5000213,
-    },
-    "כפר מל''ל": {
-        "lat": 32.167646748486355,
-        "lon": 34.894370171833174,
-        "segment": 5000842,
-    },
-    "כפר מנדא": {
-        "lat": 32.807591301489644,
-        "lon": 35.26509874401224,
-        "segment": 5001320,
-    },
-    "כפר מנחם": {
-        "lat": 31.733059893223743,
-        "lon": 34.8356167644499,
-        "segment": 5000397,
-    },
-    "כפר מסריק": {"lat": 32.891419170628, "lon": 35.09856047987391, "segment": 5001396},
-    "כפר מצר": {"lat": 32.64536837947409, "lon": 35.42234718236059, "segment": 5001156},
-    "כפר מרדכי": {
-        "lat": 31.83167051801477,
-        "lon": 34.75429260200936,
-        "segment": 5000533,
-    },
-    "כפר נהר הירדן": {
-        "lat": 32.76650767763801,
-        "lon": 35.43494404244105,
-        "segment": 5001287,
-    },
-    "כפר נוער בן שמן": {
-        "lat": 31.959943961499505,
-        "lon": 34.92733359871573,
-        "segment": 5001843,
-    },
-    "כפר נטר": {
-        "lat": 32.276152691826624,
-        "lon": 34.87228059950541,
-        "segment": 5000899,
-    },
-    "כפר סאלד": {
-        "lat": 33.19392667289132,
-        "lon": 35.65685905028884,
-        "segment": 5001638,
-    },
-    "כפר סבא": {"lat": 32.17993973499383, "lon": 34.92268823308181, "segment": 5000840},
-    "כפר סילבר": {
-        "lat": 31.673281328855666,
-        "lon": 34.61191324884771,
-        "segment": 5000352,
-    },
-    "כפר סירקין": {
-        "lat": 32.076456945450666,
-        "lon": 34.92498430356903,
-        "segment": 5000761,
-    },
-    "כפר עבודה": {
-        "lat": 32.25755412815783,
-        "lon": 34.94122740109253,
-        "segment": 5000894,
-    },
-    "כפר עזה": {
-        "lat": 31.48177133704883,
-        "lon": 34.533160057151704,
-        "segment": 5000239,
-    },
-    "כפר עציון": {
-        "lat": 31.648782900481564,
-        "lon": 35.11521822827265,
-        "segment": 5000326,
-    },
-    "כפר פינס": {
-        "lat": 32.484780170552014,
-        "lon": 35.002715968354735,
-        "segment": 5001031,
-    },
-    "כפר קאסם": {
-        "lat": 32.11789529205788,
-        "lon": 34.966994490674246,
-        "segment": 5000793,
-    },
-    "כפר קיש": {
-        "lat": 32.66506366956728,
-        "lon": 35.449159682782074,
-        "segment": 5001166,
-    },
-    "כפר קרע": {"lat": 32.50326632045693, "lon": 35.0474530840167, "segment": 5001039},
-    "כפר רופין": {
-        "lat": 32.45801766434735,
-        "lon": 35.556646886000735,
-        "segment": 5001019,
-    },
-    "כפר רות": {
-        "lat": 31.907322492694597,
-        "lon": 35.03297200439221,
-        "segment": 5001792,
-    },
-    "כפר שמאי": {
-        "lat": 32.95695187338929,
-        "lon": 35.45837352396073,
-        "segment": 5001475,
-    },
-    "כפר שמואל": {
-        "lat": 31.88870057265975,
-        "lon": 34.932244230539254,
-        "segment": 5000593,
-    },
-    "כפר שמריהו": {
-        "lat": 32.185969892952166,
-        "lon": 34.82038572103429,
-        "segment": 5000848,
-    },
-    "כפר תבור": {
-        "lat": 32.68879118652337,
-        "lon": 35.423289224055765,
-        "segment": 5001181,
-    },
-    "כפר תפוח": {
-        "lat": 32.118444190454774,
-        "lon": 35.23874706906802,
-        "segment": 5000807,
-    },
-    "כפר תקווה": {
-        "lat": 32.70134869678191,
-        "lon": 35.115990570562964,
-        "segment": 5001202,
-    },
-    "כרכום": {"lat": 32.9295315335096, "lon": 35.60793124482831, "segment": 5001457},
-    "כרם ביבנה": {
-        "lat": 31.819114298723292,
-        "lon": 34.72339073297781,
-        "segment": 5000518,
-    },
-    "כרם בן זמרה": {
-        "lat": 33.037586877753036,
-        "lon": 35.46696260062931,
-        "segment": 5001560,
-    },
-    "כרם מהר''ל": {
-        "lat": 32.64540223748117,
-        "lon": 34.99059496733071,
-        "segment": 5001136,
-    },
-    "כרם רעים": {
-        "lat": 31.958765551334878,
-        "lon": 35.13883469495559,
-        "segment": 5001955,
-    },
-    "כרם שלום": {
-        "lat": 31.227449943309374,
-        "lon": 34.28581348794025,
-        "segment": 5000127,
-    },
-    "כרמי יוסף": {
-        "lat": 31.847538684312344,
-        "lon": 34.92009550248915,
-        "segment": 5000553,
-    },
-    "כרמי צור": {
-        "lat": 31.608523137461138,
-        "lon": 35.09990816949324,
-        "segment": 5000302,
-    },
-    "כרמי קטיף ואמציה": {
-        "lat": 31.534901338924705,
-        "lon": 34.91282096971649,
-        "segment": 5000261,
-    },
-    "כרמיאל": {"lat": 32.91052184618355, "lon": 35.28501699751741, "segment": 5001417},
-    "כרמיה": {"lat": 31.60611566637716, "lon": 34.541372329981314, "segment": 5000291},
-    "כרמים": {"lat": 31.33190162614183, "lon": 34.91737506590382, "segment": 5000176},
-    "כרמית": {"lat": 31.33122405250232, "lon": 34.89609170928868, "segment": 5000175},
-    "כרמל": {"lat": 31.426897724502073, "lon": 35.184399049383416, "segment": 5000217},
-    "לב החולה": {
-        "lat": 33.110326967790506,
-        "lon": 35.58197385544656,
-        "segment": 5002021,
-    },
-    "לבון": {"lat": 32.943793973226676, "lon": 35.285993108624645, "segment": 5001450},
-    "לביא": {"lat": 32.79039373376624, "lon": 35.44181986097007, "segment": 5001312},
-    "לבנים": {"lat": 32.863609176137416, "lon": 35.4933646141688, "segment": 5001388},
-    "להב": {"lat": 31.377213466676697, "lon": 34.86807937023593, "segment": 5000197},
-    "להבות הבשן": {
-        "lat": 33.14112593739605,
-        "lon": 35.647662631405744,
-        "segment": 5001625,
-    },
-    "להבות חביבה": {
-        "lat": 32.39439195697995,
-        "lon": 35.009496783511096,
-        "segment": 5000976,
-    },
-    "להבים": {"lat": 31.367708781728396, "lon": 34.81165433252667, "segment": 5000185},
-    "לוד": {"lat": 31.952503439053448, "lon": 34.890884472304414, "segment": 5001830},
-    "לוזית": {"lat": 31.686833772981842, "lon": 34.886721514731335, "segment": 5000358},
-    "לוחמי הגטאות": {
-        "lat": 32.96213035808914,
-        "lon": 35.09864225970385,
-        "segment": 5001469,
-    },
-    "לוטם וחמדון": {
-        "lat": 32.88234655878094,
-        "lon": 35.35818394925875,
-        "segment": 5001400,
-    },
-    "לוטן": {"lat": 29.986771254279706, "lon": 35.087955625122035, "segment": 5000024},
-    "לטרון": {"lat": 31.838185935314662, "lon": 34.97991572029142, "segment": 5000545},
-    "לימן": {"lat": 33.05948937607571, "lon": 35.11281845576022, "segment": 5001563},
-    "לכיש": {"lat": 31.565011401183703, "lon": 34.841521677637814, "segment": 5000270},
-    "לפיד": {"lat": 31.917165609741755, "lon": 35.03171799032382, "segment": 5001802},
-    "לפידות": {
-        "lat": 32.959025361907656,
-        "lon": 35.261100483070145,
-        "segment": 5001471,
-    },
-    "לקיה": {"lat": 31.318242077220287, "lon": 34.84016899811771, "segment": 5000153},
-    "מאור": {"lat": 32.424209248849465, "lon": 35.00552202690379, "segment": 5000986},
-    "מאיר שפיה": {
-        "lat": 32.590806992775406,
-        "lon": 34.97085496296989,
-        "segment": 5001100,
-    },
-    "מבוא ביתר": {
-        "lat": 31.722924391308602,
-        "lon": 35.10640443654193,
-        "segment": 5000401,
-    },
-    "מבוא דותן": {
-        "lat": 32.42254377674277,
-        "lon": 35.17289658621978,
-        "segment": 5000988,
-    },
-    "מבוא חורון": {
-        "lat": 31.848271815478594,
-        "lon": 35.03724098964389,
-        "segment": 5000554,
-    },
-    "מבוא חמה": {
-        "lat": 32.73744387752989,
-        "lon": 35.65571177990361,
-        "segment": 5001257,
-    },
-    "מבוא מודיעים": {
-        "lat": 31.934459281906882,
-        "lon": 34.98688195035051,
-        "segment": 5001820,
-    },
-    "מבואות יריחו": {
-        "lat": 31.907948392614873,
-        "lon": 35.418332899737855,
-        "segment": 5001804,
-    },
-    "מבועים": {"lat": 31.45032981659013, "lon": 34.65284396486723, "segment": 5000224},
-    "מבטחים, עמיעוז, ישע": {
-        "lat": 31.24262068799729,
-        "lon": 34.406506789497165,
-        "segment": 5000135,
-    },
-    "מבקיעים": {
-        "lat": 31.623267153032653,
-        "lon": 34.57708370642113,
-        "segment": 5000304,
-    },
-    "מבשרת ציון": {
-        "lat": 31.797352249190844,
-        "lon": 35.14041671055469,
-        "segment": 5000494,
-    },
-    "מג'דל כרום": {
-        "lat": 32.920153996387846,
-        "lon": 35.25302457942254,
-        "segment": 5001425,
-    },
-    "מג'דל שמס": {
-        "lat": 33.26161963203415,
-        "lon": 35.76867943789821,
-        "segment": 5001665,
-    },
-    "מגדים": {"lat": 32.72905247946271, "lon": 34.96175748569128, "segment": 5001213},
-    "מגדל": {"lat": 32.83513179818486, "lon": 35.498595441696985, "segment": 5001358},
-    "מגדל העמק": {
-        "lat": 32.67324593003991,
-        "lon": 35.24395532934693,
-        "segment": 5001158,
-    },
-    "מגדל עוז": {
-        "lat": 31.642481855369134,
-        "lon": 35.14556792918478,
-        "segment": 5000328,
-    },
-    "מגדל תפן": {
-        "lat": 32.97553422961311,
-        "lon": 35.274980203863144,
-        "segment": 5001494,
-    },
-    "מגדלים": {"lat": 32.09064501294402, "lon": 35.34276115070784, "segment": 5000789},
-    "מגל": {"lat": 32.385450926545346, "lon": 35.03116664240777, "segment": 5000971},
-    "מגן": {"lat": 31.29969121169846, "lon": 34.427820492948655, "segment": 5000154},
-    "מגן שאול": {
-        "lat": 32.52019652730031,
-        "lon": 35.30667310082312,
-        "segment": 5001061,
-    },
-    "מגרון": {"lat": 31.87473078505488, "lon": 35.25891958320694, "segment": 5000599},
-    "מגשימים": {"lat": 32.04691771548739, "lon": 34.89818303689335, "segment": 5000732},
-    "מדרך עוז": {
-        "lat": 32.59684567658632,
-        "lon": 35.15837650009541,
-        "segment": 5001104,
-    },
-    "מדרשת בן גוריון": {
-        "lat": 30.853943688728123,
-        "lon": 34.78121081484084,
-        "segment": 5000053,
-    },
-    "מודיעין - ישפרו סנטר": {
-        "lat": 31.887754421557933,
-        "lon": 34.96477969088553,
-        "segment": 5000594,
-    },
-    "מודיעין - ליגד סנטר": {
-        "lat": 31.91920967530186,
-        "lon": 34.9734344374194,
-        "segment": 5001791,
-    },
-    "מודיעין מכבים רעות": {
-        "lat": 31.901050588270614,
-        "lon": 35.00152704948291,
-        "segment": 5001785,
-    },
-    "מודיעין עילית": {
-        "lat": 31.930759143652153,
-        "lon": 35.04495425390012,
-        "segment": 5001814,
-    },
-    "מולדת": {"lat": 32.58586515815601, "lon": 35.44150023455928, "segment": 5001107},
-    "מועאוויה": {
-        "lat": 32.531237935392674,
-        "lon": 35.10437014896225,
-        "segment": 5001066,
-    },
-    "מוצא עילית": {
-        "lat": 31.79378239909127,
-        "lon": 35.156920517834614,
-        "segment": 5000495,
-    },
-    "מוקיבלה": {"lat": 32.515148087105764, "lon": 35.2948440407426, "segment": 5001060},
-    "מורן": {"lat": 32.92065662834033, "lon": 35.39310294406635, "segment": 5001436},
-    "מורשת": {"lat": 32.82666404303354, "lon": 35.2321449084087, "segment": 5001348},
-    "מזור": {"lat": 32.05249767700301, "lon": 34.92577798594005, "segment": 5000739},
-    "מזכרת בתיה": {
-        "lat": 31.843906605805152,
-        "lon": 34.84544003553903,
-        "segment": 5000534,
-    },
-    "מזרע": {"lat": 32.65205238281512, "lon": 35.2874845296519, "segment": 5001152},
-    "מזרעה": {"lat": 32.98347405270126, "lon": 35.102481526467315, "segment": 5001490},
-    "מחולה": {"lat": 32.364179088016925, "lon": 35.514728439112794, "segment": 5000963},
-    "מחניים": {"lat": 32.98892239254092, "lon": 35.571924729568295, "segment": 5001517},
-    "מחסיה": {"lat": 31.74634147718211, "lon": 35.00817388255428, "segment": 5000422},
-    "מטווח ניר עם": {
-        "lat": 31.513639292821022,
-        "lon": 34.554787907271844,
-        "segment": 5000251,
-    },
-    "מטולה": {"lat": 33.27789954844356, "lon": 35.57953608946286, "segment": 5001669},
-    "מטע": {"lat": 31.717472237534842, "lon": 35.060431902128954, "segment": 5000389},
-    "מי עמי": {"lat": 32.50266229607511, "lon": 35.14388092976956, "segment": 5001048},
-    "מייסר": {"lat": 32.44467617578396, "lon": 35.04251267972407, "segment": 5000999},
-    "מיני ישראל - נחשון": {
-        "lat": 31.842530179101953,
-        "lon": 34.968584100910114,
-        "segment": 5001956,
-    },
-    "מיצד": {"lat": 31.585025921050526, "lon": 35.186845923002544, "segment": 5000288},
-    "מיצר": {"lat": 32.76689163687038, "lon": 35.73608372769473, "segment": 5001290},
-    "מירב": {"lat": 32.452590767463526, "lon": 35.421686890158526, "segment": 5001009},
-    "מירון": {"lat": 32.98750969438403, "lon": 35.44159855497312, "segment": 5001502},
-    "מישר": {"lat": 31.818627330205437, "lon": 34.75334327977343, "segment": 5000503},
-    "מיתר": {"lat": 31.328080094866205, "lon": 34.93868454202855, "segment": 5000169},
-    "מכון וינגייט": {
-        "lat": 32.260118755328406,
-        "lon": 34.83321904922201,
-        "segment": 5000888,
-    },
-    "מכורה": {"lat": 32.161949834778106, "lon": 35.42277533615383, "segment": 5000847},
-    "מכינת אלישע": {
-        "lat": 32.011098709905134,
-        "lon": 35.13844438785145,
-        "segment": 5002285,
-    },
-    "מכמורת": {"lat": 32.405937639964314, "lon": 34.87320678690291, "segment": 5000978},
-    "מכמנים - כמאנה מערבית": {
-        "lat": 32.90752308426414,
-        "lon": 35.32944907077538,
-        "segment": 5001426,
-    },
-    "מלאכי השלום": {
-        "lat": 32.02680824351295,
-        "lon": 35.362691277105135,
-        "segment": 5002327,
-    },
-    "מלונות ים המלח מרכז": {
-        "lat": 31.180609598724914,
-        "lon": 35.365074827573345,
-        "segment": 5001874,
-    },
-    "מלכיה": {"lat": 33.098239300190315, "lon": 35.51020074337952, "segment": 5001608},
-    "מנוחה": {"lat": 31.65628027789846, "lon": 34.77613390986627, "segment": 5000324},
-    "מנוף": {"lat": 32.85279101473319, "lon": 35.23793197012515, "segment": 5001366},
-    "מנות": {"lat": 33.03839486805868, "lon": 35.1951457384462, "segment": 5001555},
-    "מנחמיה": {"lat": 32.66798956983958, "lon": 35.556001301905596, "segment": 5001167},
-    "מנחת מחניים": {
-        "lat": 32.98144767606759,
-        "lon": 35.572389512114796,
-        "segment": 5001508,
-    },
-    "מנרה": {"lat": 33.19743114446591, "lon": 35.54408806788543, "segment": 5001636},
-    "מנשית זבדה": {
-        "lat": 32.70908167179856,
-        "lon": 35.19454448299277,
-        "segment": 5001204,
-    },
-    "מסד": {"lat": 32.84350732634056, "lon": 35.42434675184086, "segment": 5001371},
-    "מסדה": {"lat": 32.683174961975794, "lon": 35.59859835754368, "segment": 5001189},
-    "מסוף אורנית": {
-        "lat": 32.11810924678845,
-        "lon": 34.9910933643024,
-        "segment": 5002226,
-    },
-    "מסילות": {"lat": 32.49482615570422, "lon": 35.47447572764066, "segment": 5001049},
-    "מסילת ציון": {
-        "lat": 31.80267327363306,
-        "lon": 35.011456029454685,
-        "segment": 5000489,
-    },
-    "מסלול": {"lat": 31.323505253068763, "lon": 34.588419411707825, "segment": 5000162},
-    "מסעדה": {"lat": 33.232226140325956, "lon": 35.76458256867355, "segment": 5001655},
-    "מע'אר": {"lat": 32.88574365270414, "lon": 35.41290789186407, "segment": 5001393},
-    "מעברות": {"lat": 32.36336369371849, "lon": 34.904802131052385, "segment": 5000953},
-    "מעגלים, גבעולים, מלילות": {
-        "lat": 31.392189923163016,
-        "lon": 34.59434175460055,
-        "segment": 5000200,
-    },
-    "מעגן": {"lat": 32.70644662742498, "lon": 35.59974801108711, "segment": 5001226},
-    "מעגן מיכאל": {
-        "lat": 32.55739765998372,
-        "lon": 34.91666116619987,
-        "segment": 5001072,
-    },
-    "מעוז חיים": {
-        "lat": 32.49258090293366,
-        "lon": 35.551317067493024,
-        "segment": 5001052,
-    },
-    "מעון": {"lat": 31.407715905397488, "lon": 35.16217435623715, "segment": 5000211},
-    "מעון צופיה": {
-        "lat": 31.8560627210845,
-        "lon": 34.738401803750754,
-        "segment": 5001761,
-    },
-    "מעונה": {"lat": 33.017051917141, "lon": 35.26157964865257, "segment": 5001534},
-    "מעיין ברוך": {
-        "lat": 33.2402067284756,
-        "lon": 35.60726044443248,
-        "segment": 5001658,
-    },
-    "מעיין צבי": {
-        "lat": 32.56718755574699,
-        "lon": 34.9400919613043,
-        "segment": 5001088,
-    },
-    "מעיליא": {"lat": 33.02719153275403, "lon": 35.2566479431511, "segment": 5001540},
-    "מעלה אדומים": {
-        "lat": 31.78636554794522,
-        "lon": 35.3123101349307,
-        "segment": 5000454,
-    },
-    "מעלה אפרים": {
-        "lat": 32.07053794861144,
-        "lon": 35.40516548578258,
-        "segment": 5000775,
-    },
-    "מעלה גלבוע": {
-        "lat": 32.47448741418924,
-        "lon": 35.42226674808914,
-        "segment": 5001024,
-    },
-    "מעלה גמלא": {
-        "lat": 32.88797369405512,
-        "lon": 35.68324738320746,
-        "segment": 5001411,
-    },
-    "מעלה החמישה": {
-        "lat": 31.817940069004095,
-        "lon": 35.11009109338543,
-        "segment": 5000526,
-    },
-    "מעלה חבר": {
-        "lat": 31.48511994501483,
-        "lon": 35.16628256946103,
-        "segment": 5000243,
-    },
-    "מעלה לבונה": {
-        "lat": 32.05486504317076,
-        "lon": 35.240481302072865,
-        "segment": 5000750,
-    },
-    "מעלה מכמש": {
-        "lat": 31.879676499475014,
-        "lon": 35.30538734169465,
-        "segment": 5001776,
-    },
-    "מעלה עירון": {
-        "lat": 32.54811158229863,
-        "lon": 35.187841082739844,
-        "segment": 5001075,
-    },
-    "מעלה עמוס": {
-        "lat": 31.59820292572787,
-        "lon": 35.228376930277236,
-        "segment": 5000294,
-    },
-    "מעלה צביה": {
-        "lat": 32.88966785499477,
-        "lon": 35.33135476335493,
-        "segment": 5001409,
-    },
-    "מעלה רחבעם": {
-        "lat": 31.650088758754237,
-        "lon": 35.25912999843808,
-        "segment": 5001923,
-    },
-    "מעלות תרשיחא": {
-        "lat": 33.01428377962904,
-        "lon": 35.27976682402203,
-        "segment": 5001523,
-    },
-    "מענית, גבעת חביבה": {
-        "lat": 32.45860800092951,
-        "lon": 35.02594948383451,
-        "segment": 5001006,
-    },
-    "מעש": {"lat": 32.06391795669804, "lon": 34.888266466742934, "segment": 5000747},
-    "מפלסים": {"lat": 31.500301437491284, "lon": 34.5646822760361, "segment": 5000244},
-    "מצדה": {"lat": 31.311755812309382, "lon": 35.36357011508615, "segment": 5000170},
-    "מצובה": {"lat": 33.06391833652102, "lon": 35.1568642356467, "segment": 5001570},
-    "מצוקי דרגות": {
-        "lat": 31.591013077430556,
-        "lon": 35.39221616002183,
-        "segment": 5000295,
-    },
-    "מצליח": {"lat": 31.905992581273633, "lon": 34.87187791123914, "segment": 5001783},
-    "מצפה": {"lat": 32.79049226042784, "lon": 35.509270206768306, "segment": 5001323},
-    "מצפה אבי''ב": {
-        "lat": 32.835046740075974,
-        "lon": 35.2043584471121,
-        "segment": 5001353,
-    },
-    "מצפה אילן": {
-        "lat": 32.46165081593235,
-        "lon": 35.06865223265493,
-        "segment": 5001016,
-    },
-    "מצפה דני": {
-        "lat": 31.88014917725387,
-        "lon": 35.31468939012041,
-        "segment": 5002290,
-    },
-    'מצפה זי"ו': {
-        "lat": 31.48390505682318,
-        "lon": 35.14486482086071,
-        "segment": 5002278,
-    },
-    "מצפה חגית": {
-        "lat": 31.851473737716656,
-        "lon": 35.33746287390646,
-        "segment": 5002288,
-    },
-    "מצפה יאיר": {
-        "lat": 31.382948394525616,
-        "lon": 35.13556080959369,
-        "segment": 5002263,
-    },
-    "מצפה יריחו": {
-        "lat": 31.818611567791613,
-        "lon": 35.39418535950014,
-        "segment": 5000541,
-    },
-    "מצפה מדרג": {
-        "lat": 31.44280633613345,
-        "lon": 35.24754071021244,
-        "segment": 5002277,
-    },
-    "מצפה נטופה": {
-        "lat": 32.80242079307416,
-        "lon": 35.38683565569559,
-        "segment": 5001329,
-    },
-    "מצפה רמון": {
-        "lat": 30.61539241274669,
-        "lon": 34.79769806021767,
-        "segment": 5000038,
-    },
-    "מצפה שלם": {
-        "lat": 31.56686716731552,
-        "lon": 35.40182290316945,
-        "segment": 5000280,
-    },
-    "מצפור פצאל": {
-        "lat": 32.05593198320681,
-        "lon": 35.41970981745947,
-        "segment": 5002212,
-    },
-    "מצר": {"lat": 32.439918126644315, "lon": 35.050886912353995, "segment": 5000994},
-    "מקווה ישראל": {
-        "lat": 32.029923002905825,
-        "lon": 34.78373351901169,
-        "segment": 5000715,
-    },
-    "מרגליות": {
-        "lat": 33.213581313231046,
-        "lon": 35.545863072412416,
-        "segment": 5001642,
-    },
-    "מרום גולן": {
-        "lat": 33.13454980175313,
-        "lon": 35.77679885540037,
-        "segment": 5001622,
-    },
-    "מרחב עם": {"lat": 30.88895715437673, "lon": 34.82806567553722, "segment": 5000058},
-    "מרחביה מושב": {
-        "lat": 32.60485313647578,
-        "lon": 35.315406015739484,
-        "segment": 5001118,
-    },
-    "מרחביה קיבוץ": {
-        "lat": 32.605042904583,
-        "lon": 35.307196571765694,
-        "segment": 5001119,
-    },
-    "מרחצאות עין גדי": {
-        "lat": 31.417047017780913,
-        "lon": 35.37909166791406,
-        "segment": 5000218,
-    },
-    "מרכז אזורי דרום השרון": {
-        "lat": 32.13362371487635,
-        "lon": 34.91207251300782,
-        "segment": 5000814,
-    },
-    "מרכז אזורי מבואות חרמון": {
-        "lat": 33.12093011896035,
-        "lon": 35.56999976438758,
-        "segment": 5001613,
-    },
-    "מרכז אזורי מגילות": {
-        "lat": 31.773854010433933,
-        "lon": 35.503845620473626,
-        "segment": 5001716,
-    },
-    "מרכז אזורי מרום גליל": {
-        "lat": 32.99799800235925,
-        "lon": 35.44101295040433,
-        "segment": 5001525,
-    },
-    "מרכז אזורי משגב": {
-        "lat": 32.85892512998547,
-        "lon": 35.25947730877511,
-        "segment": 5001378,
-    },
-    "מרכז אזורי רמת כורזים": {
-        "lat": 32.939839118682215,
-        "lon": 35.550597736502354,
-        "segment": 5002227,
-    },
-    "מרכז חבר": {
-        "lat": 32.54737482268718,
-        "lon": 35.266806239615775,
-        "segment": 5001076,
-    },
-    "מרכז מיר''ב": {
-        "lat": 32.64674587481867,
-        "lon": 34.964890544403204,
-        "segment": 5001144,
-    },
-    "מרכז שפירא": {
-        "lat": 31.695675186053897,
-        "lon": 34.70614276652034,
-        "segment": 5000366,
-    },
-    "מרעית": {"lat": 31.28127436220065, "lon": 35.053442625611964, "segment": 5000150},
-    "משאבי שדה": {
-        "lat": 31.0088257317292,
-        "lon": 34.777574071926274,
-        "segment": 5000077,
-    },
-    "משגב דב": {"lat": 31.81940808157683, "lon": 34.74045856965515, "segment": 5000502},
-    "משגב עם": {"lat": 33.2467350419635, "lon": 35.54928260702074, "segment": 5001661},
-    "משהד": {"lat": 32.74021345118554, "lon": 35.321208018269765, "segment": 5001248},
-    "משואה": {"lat": 32.11659722275514, "lon": 35.48940330824686, "segment": 5000799},
-    "משואות יצחק": {
-        "lat": 31.70285730840298,
-        "lon": 34.69078931123831,
-        "segment": 5000365,
-    },
-    "משכיות": {"lat": 32.31912733837997, "lon": 35.50484439714426, "segment": 5000933},
-    "משמר איילון": {
-        "lat": 31.872450389713688,
-        "lon": 34.944769920721505,
-        "segment": 5000580,
-    },
-    "משמר דוד": {
-        "lat": 31.821429803480292,
-        "lon": 34.90024506055475,
-        "segment": 5000524,
-    },
-    "משמר הירדן": {
-        "lat": 33.004597589843975,
-        "lon": 35.59999938216145,
-        "segment": 5001539,
-    },
-    "משמר הנגב": {
-        "lat": 31.36410510891804,
-        "lon": 34.71760434254449,
-        "segment": 5000184,
-    },
-    "משמר העמק": {
-        "lat": 32.60947649131941,
-        "lon": 35.141804789011836,
-        "segment": 5001116,
-    },
-    "משמר השבעה": {
-        "lat": 32.00977172545158,
-        "lon": 34.824018574259185,
-        "segment": 5000702,
-    },
-    "משמר השרון": {
-        "lat": 32.35670596160707,
-        "lon": 34.904159198997434,
-        "segment": 5000952,
-    },
-    "משמרות": {"lat": 32.48846576490203, "lon": 34.98384643626706, "segment": 5001030},
-    "משמרת": {"lat": 32.227176912429826, "lon": 34.921843772016956, "segment": 5000874},
-    "משען": {"lat": 31.657358529428024, "lon": 34.624198648769365, "segment": 5000321},
-    "מתחם בני דרום": {
-        "lat": 31.821662171823803,
-        "lon": 34.70220579664146,
-        "segment": 5001714,
-    },
-    "מתחם גלילות": {
-        "lat": 32.15053041799633,
-        "lon": 34.808689452189924,
-        "segment": 5000818,
-    },
-    "מתחם סקי גלבוע": {
-        "lat": 32.55288556117845,
-        "lon": 35.33522177547606,
-        "segment": 5002191,
-    },
-    "מתחם פי גלילות": {
-        "lat": 32.13646930595436,
-        "lon": 34.80371133606915,
-        "segment": 5001751,
-    },
-    "מתחם שביל התפוזים": {
-        "lat": 32.45978226011145,
-        "lon": 34.940775059551726,
-        "segment": 5002203,
-    },
-    "מתן": {"lat": 32.15719188036433, "lon": 34.97512914515832, "segment": 5000830},
-    "מתת": {"lat": 33.04044357744309, "lon": 35.35770012487988, "segment": 5001558},
-    "מתתיהו": {"lat": 31.93001666913153, "lon": 35.03131593138841, "segment": 5001821},
-    "נאות גולן": {
-        "lat": 32.78647524669525,
-        "lon": 35.69257256469633,
-        "segment": 5001324,
-    },
-    "נאות הכיכר": {
-        "lat": 30.934711314620188,
-        "lon": 35.38204659545755,
-        "segment": 5001772,
-    },
-    "נאות מרדכי": {
-        "lat": 33.16009006864287,
-        "lon": 35.59814032328965,
-        "segment": 5001626,
-    },
-    "נאות סמדר": {
-        "lat": 30.049954006327393,
-        "lon": 35.026586998264555,
-        "segment": 5000027,
-    },
-    "נאות קדומים": {
-        "lat": 31.947993313007956,
-        "lon": 34.97285301113398,
-        "segment": 5002017,
-    },
-    "נאעורה": {"lat": 32.60794706419618, "lon": 35.390287952667315, "segment": 5001121},
-    "נבטים": {"lat": 31.224212407630354, "lon": 34.88012982816137, "segment": 5000125},
-    "נבי שועייב": {
-        "lat": 32.8058011690196,
-        "lon": 35.45146954778955,
-        "segment": 5002201,
-    },
-    "נגבה": {"lat": 31.660468990727473, "lon": 34.68246818909894, "segment": 5000334},
-    "נגוהות": {"lat": 31.496157535476783, "lon": 34.97225477289198, "segment": 5000246},
-    "נהורה": {"lat": 31.623006520043422, "lon": 34.70479003526067, "segment": 5000309},
-    "נהלל": {"lat": 32.68905065560677, "lon": 35.19372841328403, "segment": 5001174},
-    "נהריה": {"lat": 33.01524852166275, "lon": 35.10255500709587, "segment": 5001499},
-    "נוב": {"lat": 32.83249812022716, "lon": 35.78323107575866, "segment": 5001364},
-    "נוגה": {"lat": 31.622662033428785, "lon": 34.69540598615426, "segment": 5000308},
-    "נוה איתן": {
-        "lat": 32.49123515113506,
-        "lon": 35.532338027757675,
-        "segment": 5001051,
-    },
-    "נווה": {"lat": 31.162036337238415, "lon": 34.33028821984245, "segment": 5000099},
-    "נווה אור": {
-        "lat": 32.588214548474866,
-        "lon": 35.55358997405038,
-        "segment": 5001108,
-    },
-    "נווה אטי''ב": {
-        "lat": 33.261968215798056,
-        "lon": 35.741602635174665,
-        "segment": 5001668,
-    },
-    "נווה אילן": {
-        "lat": 31.808559666642832,
-        "lon": 35.07897861350897,
-        "segment": 5000507,
-    },
-    "נווה ארז": {
-        "lat": 31.86493662935988,
-        "lon": 35.311239946036096,
-        "segment": 5002289,
-    },
-    "נווה דניאל": {
-        "lat": 31.67840534373572,
-        "lon": 35.14290946664582,
-        "segment": 5000361,
-    },
-    "נווה זוהר": {
-        "lat": 31.154136536633924,
-        "lon": 35.3651537792057,
-        "segment": 5000104,
-    },
-    "נווה זיו": {
-        "lat": 33.027903816648234,
-        "lon": 35.17924313471957,
-        "segment": 5001546,
-    },
-    "נווה חריף": {
-        "lat": 30.03787755840799,
-        "lon": 35.036264097030845,
-        "segment": 5000026,
-    },
-    "נווה ים": {
-        "lat": 32.678878297598175,
-        "lon": 34.931089048247344,
-        "segment": 5001169,
-    },
-    "נווה ימין": {
-        "lat": 32.17024785398423,
-        "lon": 34.93827786466108,
-        "segment": 5000843,
-    },
-    "נווה ירק": {
-        "lat": 32.13391232568151,
-        "lon": 34.92493239565652,
-        "segment": 5000813,
-    },
-    "נווה מבטח": {
-        "lat": 31.806703144763286,
-        "lon": 34.74195447224367,
-        "segment": 5000481,
-    },
-    "נווה מיכאל - רוגלית": {
-        "lat": 31.673306715380875,
-        "lon": 35.00683658031554,
-        "segment": 5000355,
-    },
-    "נווה צוף": {"lat": 32.00755814534099, "lon": 35.1265582533794, "segment": 5000705},
-    "נווה שלום": {
-        "lat": 31.81842105805334,
-        "lon": 34.978251690197915,
-        "segment": 5000525,
-    },
-    "נועם": {"lat": 31.566837762666335, "lon": 34.78850376777165, "segment": 5000274},
-    "נוף איילון, שעלבים": {
-        "lat": 31.87019589688624,
-        "lon": 34.98568448237727,
-        "segment": 5000582,
-    },
-    "נוף הגליל": {
-        "lat": 32.71009526311976,
-        "lon": 35.32281787905606,
-        "segment": 5001186,
-    },
-    "נופי נחמיה": {
-        "lat": 32.09792561372944,
-        "lon": 35.23905126748545,
-        "segment": 5000796,
-    },
-    "נופי פרת": {
-        "lat": 31.82244494912052,
-        "lon": 35.31954055925399,
-        "segment": 5000539,
-    },
-    "נופים": {"lat": 32.15406459727448, "lon": 35.10183655861174, "segment": 5000832},
-    "נופית": {"lat": 32.759736777576144, "lon": 35.14669549276147, "segment": 5001273},
-    "נופך": {"lat": 32.04297463956539, "lon": 34.920450299178675, "segment": 5000733},
-    "נוקדים": {"lat": 31.64593112923764, "lon": 35.246854633247786, "segment": 5000331},
-    "נורדיה": {"lat": 32.31443213144872, "lon": 34.896979717609895, "segment": 5000921},
-    "נורית": {"lat": 32.53931643555258, "lon": 35.35739892443317, "segment": 5001078},
-    "נחושה": {"lat": 31.6293087421502, "lon": 34.9533533359555, "segment": 5000316},
-    "נחל עוז": {"lat": 31.472169943762964, "lon": 34.4983670455394, "segment": 5000234},
-    "נחלה": {"lat": 31.65838451162998, "lon": 34.79501957112019, "segment": 5000337},
-    "נחליאל": {"lat": 31.97381029391288, "lon": 35.14029833768542, "segment": 5001856},
-    "נחלים": {"lat": 32.05759231736578, "lon": 34.912589530537325, "segment": 5000738},
-    "נחם": {"lat": 31.767229838607545, "lon": 35.00378047833367, "segment": 5000442},
-    "נחף": {"lat": 32.93523346164985, "lon": 35.319208518165446, "segment": 5001443},
-    "נחשון": {"lat": 31.831409271349496, "lon": 34.95635629500801, "segment": 5000537},
-    "נחשונים": {"lat": 32.061360878708356, "lon": 34.9491091555238, "segment": 5000748},
-    "נטועה": {"lat": 33.06487460000614, "lon": 35.324965476498846, "segment": 5001585},
-    "נטור": {"lat": 32.85373469948043, "lon": 35.74983551599556, "segment": 5001383},
-    "נטע": {"lat": 31.476390167589457, "lon": 34.92664178450298, "segment": 5000242},
-    "נטעים": {"lat": 31.942544676983108, "lon": 34.77429591822468, "segment": 5001818},
-    "נטף": {"lat": 31.833057518723667, "lon": 35.06786592086248, "segment": 5000546},
-    "נילי": {"lat": 31.962311815877946, "lon": 35.04581759627556, "segment": 5001845},
-    "נין": {"lat": 32.63310984502092, "lon": 35.35057151728957, "segment": 5001140},
-    "ניצן": {"lat": 31.738388069769712, "lon": 34.63430292158963, "segment": 5000404},
-    "ניצנה": {"lat": 30.885202561665583, "lon": 34.422168847582455, "segment": 5000055},
-    "ניצני עוז": {
-        "lat": 32.30516678546212,
-        "lon": 35.00417301596719,
-        "segment": 5000919,
-    },
-    "ניצנים": {"lat": 31.7164764769938, "lon": 34.63448914192513, "segment": 5000376},
-    "ניר אליהו": {
-        "lat": 32.19706283876628,
-        "lon": 34.94865107957293,
-        "segment": 5000859,
-    },
-    "ניר בנים": {
-        "lat": 31.672013448538433,
-        "lon": 34.753471339160306,
-        "segment": 5000346,
-    },
-    "ניר גלים": {
-        "lat": 31.824466321146478,
-        "lon": 34.68286942463804,
-        "segment": 5000517,
-    },
-    "ניר דוד": {
-        "lat": 32.504457033849505,
-        "lon": 35.455950588490275,
-        "segment": 5001055,
-    },
-    "ניר ח''ן": {
-        "lat": 31.610235199971402,
-        "lon": 34.71421256204509,
-        "segment": 5000292,
-    },
-    "ניר יצחק": {
-        "lat": 31.236984756068075,
-        "lon": 34.358128701479856,
-        "segment": 5000134,
-    },
-    "ניר ישראל": {
-        "lat": 31.688150241847243,
-        "lon": 34.637563550238134,
-        "segment": 5000357,
-    },
-    "ניר משה": {
-        "lat": 31.476630835806166,
-        "lon": 34.630577959735184,
-        "segment": 5000241,
-    },
-    "ניר עוז": {
-        "lat": 31.312925367590726,
-        "lon": 34.40219485535039,
-        "segment": 5000159,
-    },
-    "ניר עם": {"lat": 31.518264952972647, "lon": 34.57743277248873, "segment": 5000252},
-    "ניר עציון, ימין אורד": {
-        "lat": 32.70022466439267,
-        "lon": 34.99141596681276,
-        "segment": 5001191,
-    },
-    "ניר עקיבא": {
-        "lat": 31.47190278590826,
-        "lon": 34.65540942936902,
-        "segment": 5000236,
-    },
-    "ניר צבי": {
-        "lat": 31.951074020084754,
-        "lon": 34.86372614265986,
-        "segment": 5001829,
-    },
-    "נירים": {"lat": 31.337371709403662, "lon": 34.39541261844079, "segment": 5000171},
-    "נירית": {"lat": 32.14663508796265, "lon": 34.98386630410848, "segment": 5000823},
-    "נמל קיסריה": {
-        "lat": 32.50149591317826,
-        "lon": 34.89257594347341,
-        "segment": 5001043,
-    },
-    "נמרוד": {"lat": 33.24572338427445, "lon": 35.751583941552276, "segment": 5001664},
-    "נס הרים": {
-        "lat": 31.743836737714417,
-        "lon": 35.056735964688556,
-        "segment": 5000423,
-    },
-    "נס עמים": {
-        "lat": 32.965948816322104,
-        "lon": 35.12085773435231,
-        "segment": 5001480,
-    },
-    "נס ציונה": {
-        "lat": 31.924062750864525,
-        "lon": 34.79690438972649,
-        "segment": 5001795,
-    },
-    "נעורים": {"lat": 32.37127851131718, "lon": 34.86157803859557, "segment": 5000957},
-    "נעלה": {"lat": 31.96303550052001, "lon": 35.06451669363302, "segment": 5001846},
-    "נעמה": {"lat": 31.910007166646118, "lon": 35.471418811435676, "segment": 5001805},
-    "נען": {"lat": 31.885277545008922, "lon": 34.85576149676634, "segment": 5000590},
-    "נערן": {"lat": 31.968365409010154, "lon": 35.456642192120356, "segment": 5001858},
-    "נצר חזני": {
-        "lat": 31.82052054432597,
-        "lon": 34.86217523588572,
-        "segment": 5000523,
-    },
-    "נצר סרני": {
-        "lat": 31.924272431091946,
-        "lon": 34.8245471292588,
-        "segment": 5001796,
-    },
-    "נצרת": {"lat": 32.69925360183232, "lon": 35.29564520662064, "segment": 5001177},
-    "נריה": {"lat": 31.953281811371287, "lon": 35.127410247804434, "segment": 5001835},
-    "נשר": {"lat": 32.76790358966932, "lon": 35.0421437953042, "segment": 5001271},
-    "נתיב הגדוד": {
-        "lat": 31.98851282391839,
-        "lon": 35.445381662235214,
-        "segment": 5000700,
-    },
-    "נתיב הל''ה": {
-        "lat": 31.688863108937433,
-        "lon": 34.981231496419255,
-        "segment": 5000370,
-    },
-    "נתיב העשרה": {
-        "lat": 31.576787822762885,
-        "lon": 34.53119220289208,
-        "segment": 5000272,
-    },
-    "נתיב השיירה": {
-        "lat": 32.99444028607441,
-        "lon": 35.135668690968906,
-        "segment": 5001501,
-    },
-    "נתיבות": {"lat": 31.427112542110784, "lon": 34.58398344798194, "segment": 5000206},
-    "נתניה - מזרח": {
-        "lat": 32.30036219437079,
-        "lon": 34.87279763948554,
-        "segment": 5000913,
-    },
-    "נתניה - מערב": {
-        "lat": 32.31087798774615,
-        "lon": 34.85430644782669,
-        "segment": 5000920,
-    },
-    "סאג'ור": {
-        "lat": 32.938500284218236,
-        "lon": 35.344221130842755,
-        "segment": 5001451,
-    },
-    "סאסא": {"lat": 33.02748165599935, "lon": 35.39609295599652, "segment": 5001548},
-    "סביון": {"lat": 32.04693059885222, "lon": 34.87940593065448, "segment": 5000726},
-    "סגולה": {"lat": 31.671818510272942, "lon": 34.78006679520396, "segment": 5000347},
-    "סואעד חמירה": {
-        "lat": 32.767251422217655,
-        "lon": 35.16765035850633,
-        "segment": 5001284,
-    },
-    "סולם": {"lat": 32.60661109106098, "lon": 35.33603498191711, "segment": 5001120},
-    "סוסיא": {"lat": 31.391280406518405, "lon": 35.113197330514716, "segment": 5000205},
-    "סוסיא הקדומה": {
-        "lat": 31.40596525670834,
-        "lon": 35.10312868921976,
-        "segment": 5002264,
-    },
-    "סופה": {"lat": 31.236855433362088, "lon": 34.34165545221294, "segment": 5000133},
-    "סכנין": {"lat": 32.86541728647378, "lon": 35.3005915975029, "segment": 5001380},
-    "סלמה": {"lat": 32.89199706995152, "lon": 35.36922408997713, "segment": 5001401},
-    "סלעית": {"lat": 32.24440682894911, "lon": 35.04756490173971, "segment": 5000882},
-    "סמר": {"lat": 29.83264819947935, "lon": 35.022872093617984, "segment": 5000016},
-    "סנדלה": {"lat": 32.52143019436687, "lon": 35.32305124399673, "segment": 5001068},
-    "סנסנה": {"lat": 31.364097362266946, "lon": 34.901227857336806, "segment": 5000192},
-    "סעד": {"lat": 31.469372734678537, "lon": 34.534672760504534, "segment": 5000235},
-    "סעווה": {"lat": 31.251028146312077, "lon": 34.95283730812284, "segment": 5000137},
-    "סער": {"lat": 33.030652559315655, "lon": 35.10938066096604, "segment": 5001544},
-    "ספיר": {"lat": 30.607142720310982, "lon": 35.18636347242608, "segment": 5000039},
-    "ספסופה - כפר חושן": {
-        "lat": 33.010959139002885,
-        "lon": 35.43833701700508,
-        "segment": 5001537,
-    },
-    "סתריה": {"lat": 31.889929846507403, "lon": 34.84384124503238, "segment": 5000591},
-    "ע'ג'ר": {"lat": 33.27220598830647, "lon": 35.62443026522478, "segment": 5001667},
-    "עבדון": {"lat": 33.04856163534674, "lon": 35.17973851859295, "segment": 5001564},
-    "עברון": {"lat": 32.9914380526345, "lon": 35.10154088304459, "segment": 5001500},
-    "עגור": {"lat": 31.696985041889075, "lon": 34.912212216416634, "segment": 5000369},
-    "עדי": {"lat": 32.78273810340428, "lon": 35.17238055637853, "segment": 5001295},
-    "עדי עד": {
-        "lat": 32.040607268401615,
-        "lon": 35.336289627031626,
-        "segment": 5001724,
-    },
-    "עדנים": {"lat": 32.13983501817534, "lon": 34.90661880721784, "segment": 5000812},
-    "עוז וגאון": {
-        "lat": 31.64281093772951,
-        "lon": 35.13394867936215,
-        "segment": 5002234,
-    },
-    "עוזה": {"lat": 31.592260436747218, "lon": 34.76311166329001, "segment": 5000283},
-    "עוזייר, רומאנה": {
-        "lat": 32.789202550935435,
-        "lon": 35.31765168254542,
-        "segment": 5001309,
-    },
-    "עולש": {"lat": 32.33321867434203, "lon": 34.98495476797206, "segment": 5000931},
-    "עומר": {"lat": 31.268494646088488, "lon": 34.84690326707985, "segment": 5000147},
-    "עופר": {"lat": 32.62276760211005, "lon": 34.981926846252506, "segment": 5001123},
-    "עופרים": {"lat": 32.01889044786406, "lon": 35.043945112648046, "segment": 5000714},
-    "עוצם": {"lat": 31.638216070936128, "lon": 34.70524678834755, "segment": 5000312},
-    "עזוז": {"lat": 30.796132972522905, "lon": 34.46638415284296, "segment": 5000047},
-    "עזר": {"lat": 31.7371151205582, "lon": 34.670602483207084, "segment": 5000405},
-    "עזריאל": {"lat": 32.26170020296093, "lon": 34.97036610110963, "segment": 5000895},
-    "עזריה": {"lat": 31.89003842052738, "lon": 34.903087225577934, "segment": 5000592},
-    "עזריקם": {"lat": 31.750420111819555, "lon": 34.69581808562696, "segment": 5000417},
-    "עטרת": {"lat": 32.00049012406996, "lon": 35.17598881394517, "segment": 5000706},
-    "עידן": {"lat": 30.80378039081436, "lon": 35.29993681736458, "segment": 5000050},
-    "עיינות": {"lat": 31.91736011501418, "lon": 34.76804672718156, "segment": 5001793},
-    "עילבון": {"lat": 32.83659247919754, "lon": 35.40118148678067, "segment": 5001356},
-    "עילוט": {"lat": 32.7190248849791, "lon": 35.26149013413843, "segment": 5001218},
-    "עין איילה": {
-        "lat": 32.628746532746405,
-        "lon": 34.94618121519895,
-        "segment": 5001129,
-    },
-    "עין אל אסד": {
-        "lat": 32.93917987851437,
-        "lon": 35.400276905758936,
-        "segment": 5001453,
-    },
-    "עין אל סהלה": {
-        "lat": 32.49030901521981,
-        "lon": 35.11650336724648,
-        "segment": 5001041,
-    },
-    "עין בוקק": {"lat": 31.19914177397828, "lon": 35.363604733233, "segment": 5000119},
-    "עין גב": {"lat": 32.776706351349674, "lon": 35.63990952010692, "segment": 5001299},
-    "עין גדי": {
-        "lat": 31.459074530309383,
-        "lon": 35.39479194626461,
-        "segment": 5000233,
-    },
-    "עין דור": {
-        "lat": 32.656987749532405,
-        "lon": 35.417998231955096,
-        "segment": 5001160,
-    },
-    "עין הבשור": {
-        "lat": 31.27818602807948,
-        "lon": 34.45017488455439,
-        "segment": 5000151,
-    },
-    "עין הוד": {"lat": 32.69974064547935, "lon": 34.98261846401036, "segment": 5001190},
-    "עין החורש": {
-        "lat": 32.38565548138387,
-        "lon": 34.938998962156916,
-        "segment": 5000969,
-    },
-    "עין המפרץ": {"lat": 32.9036778111, "lon": 35.096451615237534, "segment": 5001404},
-    "עין הנצי''ב": {
-        "lat": 32.47006922041845,
-        "lon": 35.50149077371446,
-        "segment": 5001027,
-    },
-    "עין העמק": {
-        "lat": 32.62925973154922,
-        "lon": 35.08496864600109,
-        "segment": 5001132,
-    },
-    "עין השופט": {
-        "lat": 32.59605856002268,
-        "lon": 35.09908281087588,
-        "segment": 5001103,
-    },
-    "עין השלושה": {
-        "lat": 31.34986515994114,
-        "lon": 34.40235524001244,
-        "segment": 5000178,
-    },
-    "עין ורד": {"lat": 32.26360290794597, "lon": 34.93097808599016, "segment": 5000893},
-    "עין זיוון": {
-        "lat": 33.09665087928538,
-        "lon": 35.79653513717385,
-        "segment": 5001610,
-    },
-    "עין חוד": {
-        "lat": 32.691456185860595,
-        "lon": 34.999568572248876,
-        "segment": 5001182,
-    },
-    "עין חצבה": {
-        "lat": 30.798201221916514,
-        "lon": 35.24574916692504,
-        "segment": 5000049,
-    },
-    "עין חרוד, תל יוסף": {
-        "lat": 32.55857368708975,
-        "lon": 35.39418556069531,
-        "segment": 5001086,
-    },
-    "עין יהב": {
-        "lat": 30.654321162842887,
-        "lon": 35.23357717435532,
-        "segment": 5000044,
-    },
-    "עין יעקב": {
-        "lat": 33.01120467246208,
-        "lon": 35.23274801338701,
-        "segment": 5001533,
-    },
-    "עין כרמל": {
-        "lat": 32.676731429004185,
-        "lon": 34.95463605286297,
-        "segment": 5001162,
-    },
-    "עין מאהל": {
-        "lat": 32.721908159900224,
-        "lon": 35.35251100832601,
-        "segment": 5001221,
-    },
-    "עין נקובא": {
-        "lat": 31.794869496682402,
-        "lon": 35.12043410021735,
-        "segment": 5000493,
-    },
-    "עין עירון": {
-        "lat": 32.48274278859509,
-        "lon": 35.00903380526682,
-        "segment": 5001032,
-    },
-    "עין צורים": {
-        "lat": 31.695414612513087,
-        "lon": 34.72039670688877,
-        "segment": 5000367,
-    },
-    "עין קנייא": {
-        "lat": 33.23664098745114,
-        "lon": 35.72809587853729,
-        "segment": 5001654,
-    },
-    "עין ראפה": {"lat": 31.79037739098917, "lon": 35.1147166013582, "segment": 5000475},
-    "עין שמר": {"lat": 32.46320750497755, "lon": 35.00785033254951, "segment": 5001005},
-    "עין שריד": {
-        "lat": 32.27368955053249,
-        "lon": 34.93451752993835,
-        "segment": 5000906,
-    },
-    "עין תמר": {
-        "lat": 30.943895563832314,
-        "lon": 35.36782917966381,
-        "segment": 5001775,
-    },
-    "עינות קדם": {
-        "lat": 31.93030015508793,
-        "lon": 35.428981556867804,
-        "segment": 5002210,
-    },
-    "עינת": {"lat": 32.08422885182182, "lon": 34.939185039110775, "segment": 5000772},
-    "עכו": {"lat": 32.93073340611182, "lon": 35.08348517498391, "segment": 5001423},
-    "עכו - אזור תעשייה": {
-        "lat": 32.898862686832906,
-        "lon": 35.08907864568338,
-        "segment": 5001397,
-    },
-    "עכו - רמות ים": {
-        "lat": 32.92757140005421,
-        "lon": 35.10440977925329,
-        "segment": 5002229,
-    },
-    "עלומים": {"lat": 31.453015438067585, "lon": 34.51464929652567, "segment": 5000219},
-    "עלי": {"lat": 32.07521751788047, "lon": 35.2754290490856, "segment": 5000764},
-    "עלי זהב - לשם": {
-        "lat": 32.07014848411872,
-        "lon": 35.053276276798556,
-        "segment": 5000763,
-    },
-    "עלמה": {"lat": 33.05147933312149, "lon": 35.50042054843737, "segment": 5001576},
-    "עלמון": {"lat": 31.82808772473693, "lon": 35.293853669047756, "segment": 5000549},
-    "עמוקה": {"lat": 32.99822706301649, "lon": 35.524745748369426, "segment": 5001528},
-    "עמיחי": {"lat": 32.044541062379565, "lon": 35.3268862590824, "segment": 5001894},
-    "עמינדב": {"lat": 31.7521279784154, "lon": 35.14141655782879, "segment": 5000428},
-    "עמיעד": {"lat": 32.92819468067475, "lon": 35.54083759648868, "segment": 5001445},
-    "עמיקם": {"lat": 32.56430392518046, "lon": 35.024400238686326, "segment": 5001089},
-    "עמיר": {"lat": 33.17798712460239, "lon": 35.62090496717832, "segment": 5001633},
-    "עמנואל": {
-        "lat": 32.166162682850334,
-        "lon": 35.149680808862065,
-        "segment": 5000841,
-    },
-    "עמקה": {"lat": 32.97963336637018, "lon": 35.161456226221375, "segment": 5001491},
-    "ענב": {"lat": 32.28674309180864, "lon": 35.12826513735047, "segment": 5000912},
-    "עספיא": {"lat": 32.71331048079336, "lon": 35.066885682537105, "segment": 5001200},
-    "עפולה": {"lat": 32.61542152591898, "lon": 35.29701791750411, "segment": 5001112},
-    "עפרה": {"lat": 31.9532019985195, "lon": 35.26210445844214, "segment": 5001836},
-    "עץ אפרים": {
-        "lat": 32.11768214911567,
-        "lon": 35.045131290952895,
-        "segment": 5000800,
-    },
-    "עצמון - שגב": {
-        "lat": 32.86556532820404,
-        "lon": 35.251448646347534,
-        "segment": 5001385,
-    },
-    "עראבה": {"lat": 32.853419798088815, "lon": 35.33702930078702, "segment": 5001362},
-    "ערב אל נעים": {
-        "lat": 32.887520349704275,
-        "lon": 35.29098625366327,
-        "segment": 5001408,
-    },
-    "ערב אל עראמשה": {
-        "lat": 33.090948012002535,
-        "lon": 35.226199798275715,
-        "segment": 5001593,
-    },
-    "ערד": {"lat": 31.256897054624805, "lon": 35.21260158341068, "segment": 5000143},
-    "ערוגות": {"lat": 31.73519292402782, "lon": 34.77506949863688, "segment": 5000396},
-    "ערערה": {"lat": 32.500533981127326, "lon": 35.09318472271883, "segment": 5001040},
-    "ערערה בנגב": {
-        "lat": 31.151949079712747,
-        "lon": 35.01947609125465,
-        "segment": 5000098,
-    },
-    "עשהאל": {"lat": 31.373539665876507, "lon": 35.04374599320068, "segment": 5001880},
-    "עשרת": {"lat": 31.824163710479418, "lon": 34.74716977918141, "segment": 5000520},
-    "עתלית": {"lat": 32.69775028662086, "lon": 34.94636458052099, "segment": 5001171},
-    "עתניאל": {"lat": 31.440221772233432, "lon": 35.02984463737629, "segment": 5000229},
-    "פארן": {"lat": 30.369312646290513, "lon": 35.151667549077075, "segment": 5000033},
-    "פארק אריאל שרון": {
-        "lat": 32.0315833368582,
-        "lon": 34.81606793340289,
-        "segment": 5001961,
-    },
-    "פארק תעשיות מגדל עוז": {
-        "lat": 31.641062072899576,
-        "lon": 35.15154482404172,
-        "segment": 5002025,
-    },
-    "פארק תעשיות פלמחים": {
-        "lat": 31.953221018736265,
-        "lon": 34.76821260053625,
-        "segment": 5001834,
-    },
-    "פארק תעשייה ראם": {
-        "lat": 31.772034583510933,
-        "lon": 34.75375163041736,
-        "segment": 5000436,
-    },
-    "פדואל": {"lat": 32.06183691559163, "lon": 35.05187184838702, "segment": 5000749},
-    "פדויים": {"lat": 31.327704955286944, "lon": 34.6136788736418, "segment": 5000166},
-    "פדיה": {"lat": 31.857522588812998, "lon": 34.87903771256813, "segment": 5000561},
-    "פוריה כפר עבודה": {
-        "lat": 32.72028576553375,
-        "lon": 35.548602326324556,
-        "segment": 5001237,
-    },
-    "פוריה נווה עובד": {
-        "lat": 32.745376082037005,
-        "lon": 35.53661267390145,
-        "segment": 5001256,
-    },
-    "פוריה עילית": {
-        "lat": 32.72982837550277,
-        "lon": 35.547069703184356,
-        "segment": 5001250,
-    },
-    "פוריידיס": {
-        "lat": 32.59673386098461,
-        "lon": 34.95599515902549,
-        "segment": 5001099,
-    },
-    "פורת": {"lat": 32.277040432676465, "lon": 34.94941285407447, "segment": 5000901},
-    "פטיש": {"lat": 31.32754317775792, "lon": 34.5581292165411, "segment": 5000161},
-    "פלך": {"lat": 32.93286340061664, "lon": 35.23205839805145, "segment": 5001440},
-    "פלמחים": {"lat": 31.934506565568135, "lon": 34.71157196182384, "segment": 5001817},
-    "פני קדם": {
-        "lat": 31.586181803363157,
-        "lon": 35.19782041961162,
-        "segment": 5000289,
-    },
-    "פנימיית עין כרם": {
-        "lat": 31.778146510537894,
-        "lon": 35.153021774044355,
-        "segment": 5000465,
-    },
-    "פסגות": {"lat": 31.898405966128895, "lon": 35.22606311704346, "segment": 5001786},
-    "פסוטה": {"lat": 33.04856136771821, "lon": 35.309526271811436, "segment": 5001566},
-    "פעמי תש''ז": {
-        "lat": 31.43817180255698,
-        "lon": 34.691925190187035,
-        "segment": 5000215,
-    },
-    "פצאל": {"lat": 32.04415693638641, "lon": 35.44376487728318, "segment": 5000741},
-    "פקיעין": {"lat": 32.97466610594709, "lon": 35.33343411711484, "segment": 5001484},
-    "פקיעין החדשה": {
-        "lat": 32.98826747986109,
-        "lon": 35.31583613178447,
-        "segment": 5001945,
-    },
-    "פרדס חנה כרכור": {
-        "lat": 32.47630391866119,
-        "lon": 34.977344233700094,
-        "segment": 5001003,
-    },
-    "פרדסיה": {"lat": 32.30793124908323, "lon": 34.90920111634625, "segment": 5000916},
-    "פרוד": {"lat": 32.93266007571097, "lon": 35.43316185637517, "segment": 5001455},
-    "פרי גן": {"lat": 31.222826255186547, "lon": 34.35688676265056, "segment": 5000120},
-    "פתח תקווה": {
-        "lat": 32.09429109811987,
-        "lon": 34.8780320360819,
-        "segment": 5000785,
-    },
-    "פתחיה": {"lat": 31.8655663213756, "lon": 34.88608877609978, "segment": 5000569},
-    "צאלים": {"lat": 31.203329528437468, "lon": 34.5339628033338, "segment": 5000114},
-    "צבעון": {"lat": 33.025081407328635, "lon": 35.41683017758076, "segment": 5001549},
-    "צובה": {"lat": 31.7833613015182, "lon": 35.11997168292863, "segment": 5000464},
-    "צוחר, אוהד": {
-        "lat": 31.238975190362936,
-        "lon": 34.42773850550585,
-        "segment": 5000136,
-    },
-    "צומת אלמוג": {
-        "lat": 31.80120883000764,
-        "lon": 35.45183697905129,
-        "segment": 5002225,
-    },
-    "צומת הגוש": {
-        "lat": 31.64638586787215,
-        "lon": 35.13060344586356,
-        "segment": 5001943,
-    },
-    "צופים": {"lat": 32.19861582351399, "lon": 35.01005026271212, "segment": 5000860},
-    "צופית": {"lat": 32.192694808358986, "lon": 34.92173356545058, "segment": 5000854},
-    "צופר": {"lat": 30.56041768832532, "lon": 35.178363688941666, "segment": 5000036},
-    "צוקים": {"lat": 30.48836294681956, "lon": 35.168085726808776, "segment": 5000035},
-    "צור הדסה": {
-        "lat": 31.71606108866978,
-        "lon": 35.09750236276422,
-        "segment": 5000390,
-    },
-    "צור יצחק": {
-        "lat": 32.24074203125948,
-        "lon": 34.99788964451766,
-        "segment": 5000880,
-    },
-    "צור משה": {
-        "lat": 32.296644967366255,
-        "lon": 34.914410019836254,
-        "segment": 5000914,
-    },
-    "צור נתן": {"lat": 32.24130209914792, "lon": 35.01116427234329, "segment": 5000881},
-    "צוריאל": {
-        "lat": 33.006235215137764,
-        "lon": 35.314600886325195,
-        "segment": 5001535,
-    },
-    "צורית גילון": {
-        "lat": 32.903808851884506,
-        "lon": 35.24881943064354,
-        "segment": 5001416,
-    },
-    "ציפורי": {"lat": 32.74720299740179, "lon": 35.27885784356909, "segment": 5001254},
-    "צלפון": {"lat": 31.805019847586074, "lon": 34.93228330213475, "segment": 5000487},
-    "צמח": {"lat": 32.70273169263747, "lon": 35.58609524830453, "segment": 5001212},
-    "צפריה": {"lat": 32.00293121485375, "lon": 34.8572903031236, "segment": 5001869},
-    "צפרירים": {
-        "lat": 31.659747325026842,
-        "lon": 34.94369541742405,
-        "segment": 5000338,
-    },
-    "צפת - נוף כנרת": {
-        "lat": 32.95265276225553,
-        "lon": 35.52984929434942,
-        "segment": 5002006,
-    },
-    "צפת - עיר": {
-        "lat": 32.9691397969163,
-        "lon": 35.50060626361891,
-        "segment": 5001477,
-    },
-    "צפת - עכברה": {
-        "lat": 32.94158180544306,
-        "lon": 35.497559833576176,
-        "segment": 5002005,
-    },
-    "צרופה": {"lat": 32.64864527863, "lon": 34.94771786330144, "segment": 5001143},
-    "צרעה": {"lat": 31.760967090007295, "lon": 34.9705962807367, "segment": 5000440},
-    "קבוצת גבע": {
-        "lat": 32.56576325129808,
-        "lon": 35.37283730343748,
-        "segment": 5001097,
-    },
-    "קבוצת יבנה": {
-        "lat": 31.816620040135838,
-        "lon": 34.71937851305848,
-        "segment": 5000501,
-    },
-    "קדומים": {"lat": 32.22098705653795, "lon": 35.16270418210595, "segment": 5000871},
-    "קדימה צורן": {
-        "lat": 32.28318287863425,
-        "lon": 34.91201935159926,
-        "segment": 5000900,
-    },
-    "קדיתא": {"lat": 33.005173298246476, "lon": 35.465321279684034, "segment": 5001527},
-    "קדם ערבה": {
-        "lat": 31.805288969036948,
-        "lon": 35.49959253852109,
-        "segment": 5002224,
-    },
-    "קדמה": {"lat": 31.70084813225069, "lon": 34.77467763891139, "segment": 5000374},
-    "קדמת צבי": {
-        "lat": 33.02707770849454,
-        "lon": 35.69722132745106,
-        "segment": 5001553,
-    },
-    "קדר": {"lat": 31.754125038931857, "lon": 35.30981239071104, "segment": 5000431},
-    "קדר דרום": {
-        "lat": 31.74618125758381,
-        "lon": 35.301642677567365,
-        "segment": 5002239,
-    },
-    "קדרון": {"lat": 31.81598383239597, "lon": 34.798776108534696, "segment": 5000504},
-    "קדרים": {"lat": 32.8985210266147, "lon": 35.474304494026484, "segment": 5001421},
-    "קדש ברנע": {
-        "lat": 30.903484402670266,
-        "lon": 34.3987985897314,
-        "segment": 5000059,
-    },
-    "קוממיות": {"lat": 31.66330306925659, "lon": 34.72946448252118, "segment": 5000335},
-    "קורנית": {"lat": 32.84315756499607, "lon": 35.25301606062762, "segment": 5001361},
-    "קטורה": {"lat": 29.96980094876565, "lon": 35.06091471975459, "segment": 5000023},
-    "קיבוץ דן": {
-        "lat": 33.24011482145289,
-        "lon": 35.652636712114955,
-        "segment": 5001659,
-    },
-    "קיבוץ מגידו": {
-        "lat": 32.57856117328293,
-        "lon": 35.18072199343068,
-        "segment": 5001095,
-    },
-    "קידה": {"lat": 32.04972821482487, "lon": 35.33975089718052, "segment": 5001725},
-    "קיסריה": {"lat": 32.50588309419283, "lon": 34.90601826908905, "segment": 5001029},
-    "קלחים": {"lat": 31.446978251272153, "lon": 34.67912417502821, "segment": 5000226},
-    "קליה": {"lat": 31.7480516215435, "lon": 35.46776612510038, "segment": 5000444},
-    "קלנסווה": {"lat": 32.29100654147556, "lon": 34.97423011342478, "segment": 5000907},
-    "קלע אלון": {
-        "lat": 33.13077411460984,
-        "lon": 35.68186242796469,
-        "segment": 5001621,
-    },
-    "קסר א-סר": {
-        "lat": 31.086465227100994,
-        "lon": 34.9979208751258,
-        "segment": 5000090,
-    },
-    "קציר": {"lat": 32.4843866527773, "lon": 35.115652408274144, "segment": 5001033},
-    "קצרין": {"lat": 32.99140957347042, "lon": 35.689337703002586, "segment": 5001518},
-    "קצרין - אזור תעשייה": {
-        "lat": 32.99047949796869,
-        "lon": 35.71098348633197,
-        "segment": 5001875,
-    },
-    "קריית אונו": {
-        "lat": 32.05199783509393,
-        "lon": 34.860650814544165,
-        "segment": 5000737,
-    },
-    "קריית אתא": {
-        "lat": 32.80499655856933,
-        "lon": 35.09134751551459,
-        "segment": 5001304,
-    },
-    "קריית ביאליק": {
-        "lat": 32.835657356768394,
-        "lon": 35.09536641126655,
-        "segment": 5001337,
-    },
-    "קריית גת, כרמי גת": {
-        "lat": 31.619747889632873,
-        "lon": 34.7659276353846,
-        "segment": 5000293,
-    },
-    "קריית חינוך מרחבים": {
-        "lat": 31.311860151391453,
-        "lon": 34.594957126692194,
-        "segment": 5000163,
-    },
-    "קריית טבעון - בית זייד": {
-        "lat": 32.71323661719378,
-        "lon": 35.122627463207444,
-        "segment": 5001183,
-    },
-    "קריית ים": {
-        "lat": 32.84770178486491,
-        "lon": 35.07044278636627,
-        "segment": 5001351,
-    },
-    "קריית יערים": {
-        "lat": 31.80407426758879,
-        "lon": 35.103219983185966,
-        "segment": 5000510,
-    },
-    "קריית מוצקין": {
-        "lat": 32.841684496348876,
-        "lon": 35.08219718018289,
-        "segment": 5001347,
-    },
-    "קריית מלאכי": {
-        "lat": 31.73197536643254,
-        "lon": 34.74569104264478,
-        "segment": 5000385,
-    },
-    "קריית נטפים": {
-        "lat": 32.11666857893809,
-        "lon": 35.11294412174872,
-        "segment": 5000801,
-    },
-    "קריית ענבים": {
-        "lat": 31.80927274707548,
-        "lon": 35.11900491855324,
-        "segment": 5000513,
-    },
-    "קריית עקרון": {
-        "lat": 31.86166874758062,
-        "lon": 34.819585961525746,
-        "segment": 5000560,
-    },
-    "קריית שמונה": {
-        "lat": 33.209337631332886,
-        "lon": 35.57250802421206,
-        "segment": 5001637,
-    },
-    "קרית ארבע": {
-        "lat": 31.534132520235087,
-        "lon": 35.12364528633219,
-        "segment": 5000258,
-    },
-    "קרני שומרון": {
-        "lat": 32.16675244599479,
-        "lon": 35.0839437842364,
-        "segment": 5000846,
-    },
-    "קשת": {"lat": 32.97893245533591, "lon": 35.80893703116772, "segment": 5001510},
-    "ראמה": {"lat": 32.93890554293654, "lon": 35.36406380065614, "segment": 5001452},
-    "ראס אל-עין": {
-        "lat": 32.91441879737509,
-        "lon": 35.371506465277236,
-        "segment": 5001428,
-    },
-    "ראס עלי": {
-        "lat": 32.77134545517055,
-        "lon": 35.154562940640844,
-        "segment": 5001283,
-    },
-    "ראש הנקרה": {
-        "lat": 33.08607430198727,
-        "lon": 35.11582364956327,
-        "segment": 5001590,
-    },
-    "ראש העין": {
-        "lat": 32.09380498036208,
-        "lon": 34.962043338047536,
-        "segment": 5000781,
-    },
-    "ראש פינה": {
-        "lat": 32.96544752660657,
-        "lon": 35.54187885161763,
-        "segment": 5001486,
-    },
-    "ראש צורים": {
-        "lat": 31.668616566021754,
-        "lon": 35.12648906583756,
-        "segment": 5000356,
-    },
-    "ראשון לציון - מזרח": {
-        "lat": 31.97269648512617,
-        "lon": 34.80619392948898,
-        "segment": 5001827,
-    },
-    "ראשון לציון - מערב": {
-        "lat": 31.980947735605316,
-        "lon": 34.76793584461642,
-        "segment": 5001838,
-    },
-    "רבבה": {"lat": 32.11954500475444, "lon": 35.127910950710245, "segment": 5000806},
-    "רבדים": {"lat": 31.771784667690465, "lon": 34.816536946342225, "segment": 5000439},
-    "רביבים": {"lat": 31.042505605728774, "lon": 34.71985583640898, "segment": 5000083},
-    "רביד": {"lat": 32.85028709822773, "lon": 35.463223696398124, "segment": 5001382},
-    "רגבה": {"lat": 32.97335035841595, "lon": 35.097467241712536, "segment": 5001479},
-    "רגבים": {"lat": 32.52292438950553, "lon": 35.03659606965979, "segment": 5001057},
-    "רהט": {"lat": 31.402736264452265, "lon": 34.75793169387692, "segment": 5000191},
-    "רווחה": {"lat": 31.648956824818537, "lon": 34.735842752117364, "segment": 5000319},
-    "רוויה": {"lat": 32.44749227533889, "lon": 35.471258884317045, "segment": 5001010},
-    "רוחמה": {"lat": 31.496870513874395, "lon": 34.70770603647712, "segment": 5000245},
-    "רומת אל הייב": {
-        "lat": 32.77891175080372,
-        "lon": 35.30414737455565,
-        "segment": 5001286,
-    },
-    "רועי": {"lat": 32.24851340196987, "lon": 35.48488738260207, "segment": 5000896},
-    "רותם": {"lat": 32.3366062576712, "lon": 35.518591841223646, "segment": 5000945},
-    "רחוב": {"lat": 32.45010622729795, "lon": 35.48917606829809, "segment": 5001011},
-    "רחובות": {"lat": 31.89207074944567, "lon": 34.801685827384716, "segment": 5000587},
-    "רחלים": {"lat": 32.10196961293435, "lon": 35.25618644494396, "segment": 5000797},
-    "רטורנו - גבעת שמש": {
-        "lat": 31.7758969533431,
-        "lon": 34.94793152378426,
-        "segment": 5000460,
-    },
-    "ריחאנייה": {"lat": 33.0476900155802, "lon": 35.48907092773396, "segment": 5001567},
-    "ריחן": {"lat": 32.4682800823007, "lon": 35.137028292125834, "segment": 5001018},
-    "ריינה": {"lat": 32.723313196647894, "lon": 35.30575701068762, "segment": 5001219},
-    "רימונים": {"lat": 31.92232912323027, "lon": 35.3349814282716, "segment": 5001823},
-    "רינתיה": {"lat": 32.04507605175813, "lon": 34.92790786810887, "segment": 5000734},
-    "רכסים": {"lat": 32.751223188858205, "lon": 35.107464440600914, "segment": 5001253},
-    "רם און": {"lat": 32.52679473486857, "lon": 35.25939688720492, "segment": 5001067},
-    "רמות": {"lat": 32.849123660739444, "lon": 35.666244888278996, "segment": 5001373},
-    "רמות השבים": {
-        "lat": 32.167761400695426,
-        "lon": 34.886675928450146,
-        "segment": 5000838,
-    },
-    "רמות מאיר": {
-        "lat": 31.872859358063486,
-        "lon": 34.858450665506815,
-        "segment": 5000577,
-    },
-    "רמות מנשה": {
-        "lat": 32.59645628105447,
-        "lon": 35.05725114087222,
-        "segment": 5001101,
-    },
-    "רמות נפתלי": {
-        "lat": 33.09728563821409,
-        "lon": 35.551502680624296,
-        "segment": 5001605,
-    },
-    "רמלה": {"lat": 31.926651343056335, "lon": 34.86461914524346, "segment": 5001797},
-    "רמת גן - מזרח": {
-        "lat": 32.04928998474401,
-        "lon": 34.842520406036236,
-        "segment": 5000730,
-    },
-    "רמת גן - מערב": {
-        "lat": 32.07143980016151,
-        "lon": 34.8263818282187,
-        "segment": 5000745,
-    },
-    "רמת דוד": {"lat": 32.67840726939466, "lon": 35.20266273545325, "segment": 5001175},
-    "רמת הכובש": {
-        "lat": 32.21831497489022,
-        "lon": 34.93830697885668,
-        "segment": 5000868,
-    },
-    "רמת השופט": {
-        "lat": 32.611796118058905,
-        "lon": 35.093012284295924,
-        "segment": 5001115,
-    },
-    "רמת השרון": {
-        "lat": 32.13951883501204,
-        "lon": 34.833658348972406,
-        "segment": 5000802,
-    },
-    "רמת טראמפ": {
-        "lat": 33.1328852319818,
-        "lon": 35.689749504047214,
-        "segment": 5001938,
-    },
-    "רמת יוחנן": {
-        "lat": 32.79302771890175,
-        "lon": 35.12272204519053,
-        "segment": 5001306,
-    },
-    "רמת ישי": {"lat": 32.70304479655566, "lon": 35.16504830108114, "segment": 5001193},
-    "רמת מגרון": {
-        "lat": 31.88638381312616,
-        "lon": 35.2702822637937,
-        "segment": 5002302,
-    },
-    "רמת מגשימים": {
-        "lat": 32.84708605497448,
-        "lon": 35.80831155488,
-        "segment": 5001375,
-    },
-    "רמת צבי": {
-        "lat": 32.59072749758057,
-        "lon": 35.414559833967274,
-        "segment": 5001106,
-    },
-    "רמת רזיאל": {
-        "lat": 31.77407320223186,
-        "lon": 35.07297472898681,
-        "segment": 5000449,
-    },
-    "רנן": {"lat": 31.337940435212683, "lon": 34.60128137409976, "segment": 5000172},
-    "רעים": {"lat": 31.384927264500813, "lon": 34.459176868762505, "segment": 5000194},
-    "רעננה": {"lat": 32.190511846137014, "lon": 34.86303778664936, "segment": 5000849},
-    "רקפת": {"lat": 32.85641575577281, "lon": 35.26431534682674, "segment": 5001368},
-    "רשפון": {"lat": 32.201058729135816, "lon": 34.82349421040678, "segment": 5000855},
-    "רשפים, שלוחות, שלפים": {
-        "lat": 32.47723082796922,
-        "lon": 35.476363439806455,
-        "segment": 5001025,
-    },
-    "רתמים": {"lat": 31.05350347862614, "lon": 34.68954772375209, "segment": 5000085},
-    "שאנטי במדבר": {
-        "lat": 30.82983167220191,
-        "lon": 34.7505235666681,
-        "segment": 5000052,
-    },
-    "שאר ישוב": {
-        "lat": 33.22451235586783,
-        "lon": 35.64879210139786,
-        "segment": 5001650,
-    },
-    "שבות רחל": {
-        "lat": 32.05475201417946,
-        "lon": 35.31282140760974,
-        "segment": 5001729,
-    },
-    "שבי דרום": {
-        "lat": 31.465568405409993,
-        "lon": 34.63555022665966,
-        "segment": 5000237,
-    },
-    "שבי ציון": {"lat": 32.97992676536005, "lon": 35.0836961438997, "segment": 5001489},
-    "שבי שומרון": {
-        "lat": 32.26413512040059,
-        "lon": 35.18421517754177,
-        "segment": 5000904,
-    },
-    "שגב שלום": {
-        "lat": 31.20073547705281,
-        "lon": 34.82545546762658,
-        "segment": 5000106,
-    },
-    "שדה אילן": {
-        "lat": 32.74865985770421,
-        "lon": 35.42608952196388,
-        "segment": 5001267,
-    },
-    "שדה אליהו": {
-        "lat": 32.44081748337007,
-        "lon": 35.51430400540992,
-        "segment": 5001002,
-    },
-    "שדה אליעזר": {
-        "lat": 33.046756711650694,
-        "lon": 35.56564115163569,
-        "segment": 5001568,
-    },
-    "שדה אפרים": {
-        "lat": 31.9401846998341,
-        "lon": 35.09239677717725,
-        "segment": 5002292,
-    },
-    "שדה בועז": {
-        "lat": 31.69158094482382,
-        "lon": 35.14451677636548,
-        "segment": 5002236,
-    },
-    "שדה בוקר": {
-        "lat": 30.87027025052728,
-        "lon": 34.79148559412283,
-        "segment": 5000054,
-    },
-    "שדה בר": {"lat": 31.659495542390644, "lon": 35.24402415261997, "segment": 5001713},
-    "שדה דוד": {"lat": 31.57500914150889, "lon": 34.68303434868116, "segment": 5000277},
-    "שדה ורבורג": {
-        "lat": 32.20624129895324,
-        "lon": 34.907340590390035,
-        "segment": 5000857,
-    },
-    "שדה יואב": {
-        "lat": 31.644872669151574,
-        "lon": 34.678013677940235,
-        "segment": 5000318,
-    },
-    "שדה יעקב": {
-        "lat": 32.69687033126048,
-        "lon": 35.14224872224815,
-        "segment": 5001184,
-    },
-    "שדה יצחק": {
-        "lat": 32.40398720146779,
-        "lon": 34.994410305523964,
-        "segment": 5000981,
-    },
-    "שדה משה": {
-        "lat": 31.61100683863398,
-        "lon": 34.800819306149066,
-        "segment": 5000300,
-    },
-    "שדה נחום": {
-        "lat": 32.526372649509184,
-        "lon": 35.48174415432542,
-        "segment": 5001070,
-    },
-    "שדה נחמיה": {
-        "lat": 33.18657548089074,
-        "lon": 35.62310641188181,
-        "segment": 5001634,
-    },
-    "שדה ניצן": {
-        "lat": 31.228627892184708,
-        "lon": 34.419298559236246,
-        "segment": 5000121,
-    },
-    "שדה עוזיהו": {
-        "lat": 31.759095358165858,
-        "lon": 34.67799465703326,
-        "segment": 5000416,
-    },
-    "שדה צבי": {
-        "lat": 31.449824678228968,
-        "lon": 34.711154037306414,
-        "segment": 5000231,
-    },
-    "שדות ים": {"lat": 32.48943737561991, "lon": 34.89351810045433, "segment": 5001028},
-    "שדות מיכה": {
-        "lat": 31.72133802227033,
-        "lon": 34.92112665790401,
-        "segment": 5000388,
-    },
-    "שדי אברהם": {
-        "lat": 31.211492819708162,
-        "lon": 34.3368384758341,
-        "segment": 5000117,
-    },
-    "שדי חמד": {
-        "lat": 32.159523585905596,
-        "lon": 34.94357083221071,
-        "segment": 5000839,
-    },
-    "שדי תרומות": {
-        "lat": 32.43896486364709,
-        "lon": 35.485644762045474,
-        "segment": 5000995,
-    },
-    "שדמה": {"lat": 31.83273662088306, "lon": 34.74229728443213, "segment": 5000532},
-    "שדמות דבורה": {
-        "lat": 32.696641580185336,
-        "lon": 35.437017022772736,
-        "segment": 5001195,
-    },
-    "שדמות מחולה": {
-        "lat": 32.346906716981806,
-        "lon": 35.53419119576972,
-        "segment": 5000946,
-    },
-    "שדרות, איבים": {
-        "lat": 31.5313301707356,
-        "lon": 34.59847615064889,
-        "segment": 5000248,
-    },
-    "שואבה": {"lat": 31.7984899415274, "lon": 35.077747141052726, "segment": 5000492},
-    "שובל": {"lat": 31.412398577072253, "lon": 34.738648485395856, "segment": 5000208},
-    "שוהם": {"lat": 31.997147060939543, "lon": 34.946923910399015, "segment": 5001865},
-    "שומרה": {"lat": 33.08463077057533, "lon": 35.28564678603911, "segment": 5001595},
-    "שומריה": {"lat": 31.43132359114556, "lon": 34.88347827665477, "segment": 5000216},
-    "שוקדה": {"lat": 31.42218576030495, "lon": 34.52627768652034, "segment": 5000209},
-    "שורש": {"lat": 31.796568795985866, "lon": 35.06552207860288, "segment": 5000491},
-    "שורשים": {"lat": 32.89373157197603, "lon": 35.26026248827562, "segment": 5001407},
-    "שושנת העמקים": {
-        "lat": 32.35418731110158,
-        "lon": 34.85703720204691,
-        "segment": 5000938,
-    },
-    "שזור": {"lat": 32.932156485901125, "lon": 35.35230683603552, "segment": 5001444},
-    "שחר": {"lat": 31.624443788182965, "lon": 34.72656780686787, "segment": 5000298},
-    "שחרות": {"lat": 29.904855280374097, "lon": 35.000676433817375, "segment": 5000019},
-    "שיבולים": {
-        "lat": 31.395285391115966,
-        "lon": 34.60692000256391,
-        "segment": 5000201,
-    },
-    "שיבלי אום אלג'נם": {
-        "lat": 32.68607759025939,
-        "lon": 35.399952389400674,
-        "segment": 5001180,
-    },
-    "שיטים": {"lat": 30.177059841818963, "lon": 35.01597915833006, "segment": 5000030},
-    "שייח' דנון": {
-        "lat": 32.9931884730326,
-        "lon": 35.148528068758985,
-        "segment": 5001511,
-    },
-    "שילה": {"lat": 32.05048948232607, "lon": 35.298246476048206, "segment": 5000740},
-    "שילת": {"lat": 31.918117326804357, "lon": 35.01910112208166, "segment": 5001801},
-    "שכניה": {"lat": 32.8488430919668, "lon": 35.24692387024132, "segment": 5001367},
-    "שלווה": {"lat": 31.56469242200209, "lon": 34.76833665032169, "segment": 5000269},
-    "שלומי": {"lat": 33.07464564607269, "lon": 35.15006471745603, "segment": 5001582},
-    "שלומית": {"lat": 31.16852908685378, "lon": 34.303925387812434, "segment": 5000102},
-    "שלומציון": {
-        "lat": 32.098223839005065,
-        "lon": 35.4928423422206,
-        "segment": 5002214,
-    },
-    "שמיר": {"lat": 33.16520413184825, "lon": 35.66091212018969, "segment": 5001627},
-    "שמעה": {"lat": 31.3879870916516, "lon": 35.01209708389196, "segment": 5000204},
-    "שמרת": {"lat": 32.95173548657556, "lon": 35.09584589326596, "segment": 5001459},
-    "שמשית": {"lat": 32.732781152690585, "lon": 35.24594778158214, "segment": 5001247},
-    "שני ליבנה": {
-        "lat": 31.35555506532235,
-        "lon": 35.06939564950077,
-        "segment": 5000186,
-    },
-    "שניר": {"lat": 33.24003370343007, "lon": 35.67782906712838, "segment": 5001660},
-    "שעב": {"lat": 32.88888716370854, "lon": 35.23556580541931, "segment": 5001398},
-    "שעל": {"lat": 33.11476971476615, "lon": 35.71881391136436, "segment": 5001614},
-    "שער אפרים": {
-        "lat": 32.28920607318477,
-        "lon": 34.99846718797931,
-        "segment": 5000910,
-    },
-    "שער הגולן": {
-        "lat": 32.68715439729683,
-        "lon": 35.604142910388894,
-        "segment": 5001197,
-    },
-    "שער העמקים": {
-        "lat": 32.72287583523793,
-        "lon": 35.11311371356272,
-        "segment": 5001230,
-    },
-    "שער מנשה": {"lat": 32.447321418832, "lon": 35.0157242953813, "segment": 5000998},
-    "שערי תקווה": {
-        "lat": 32.12308690986221,
-        "lon": 35.028856583990056,
-        "segment": 5000805,
-    },
-    "שפיים": {"lat": 32.217779348752764, "lon": 34.82466892983779, "segment": 5000866},
-    "שפיר": {"lat": 31.69641700684756, "lon": 34.7310387336349, "segment": 5000368},
-    "שפר": {"lat": 32.94321031848368, "lon": 35.43587309929592, "segment": 5001464},
-    "שפרעם": {"lat": 32.80802728981533, "lon": 35.170439083717625, "segment": 5001307},
-    "שקד": {"lat": 32.47432240978377, "lon": 35.16831078647439, "segment": 5001023},
-    "שקף": {"lat": 31.51122349842128, "lon": 34.93677375324182, "segment": 5000255},
-    "שרונה": {"lat": 32.72497798362925, "lon": 35.46857975041681, "segment": 5001236},
-    "שריגים - לי-און": {
-        "lat": 31.676649970984524,
-        "lon": 34.935327453726835,
-        "segment": 5000354,
-    },
-    "שריד": {"lat": 32.66233347004695, "lon": 35.226613429646605, "segment": 5001157},
-    "שרשרת": {"lat": 31.404679594218994, "lon": 34.60321402411149, "segment": 5000202},
-    "שתולה": {"lat": 33.08526388360367, "lon": 35.31524147566447, "segment": 5001596},
-    "שתולים": {"lat": 31.77723352571018, "lon": 34.68175789558654, "segment": 5000434},
-    "תארבין": {"lat": 31.35745807578184, "lon": 34.738496020816854, "segment": 5000179},
-    "תאשור": {"lat": 31.371512235305307, "lon": 34.64238635042767, "segment": 5000190},
-    "תדהר": {"lat": 31.379443516192122, "lon": 34.62666981740982, "segment": 5000195},
-    "תובל": {"lat": 32.92940163754889, "lon": 35.245297425770325, "segment": 5001441},
-    "תומר": {"lat": 32.01591207913891, "lon": 35.4414933250764, "segment": 5000720},
-    "תחנת רכבת כפר ברוך": {
-        "lat": 32.64769623919011,
-        "lon": 35.208672810745234,
-        "segment": 5002202,
-    },
-    "תחנת רכבת כפר יהושוע": {
-        "lat": 32.681491682087234,
-        "lon": 35.125001215527924,
-        "segment": 5001173,
-    },
-    "תחנת רכבת קריית מלאכי - יואב": {
-        "lat": 31.74722351326908,
-        "lon": 34.822177910500365,
-        "segment": 5001937,
-    },
-    "תחנת רכבת ראש העין": {
-        "lat": 32.12040014109624,
-        "lon": 34.935061404100374,
-        "segment": 5001721,
-    },
-    "תימורים": {
-        "lat": 31.715664218606474,
-        "lon": 34.75910109010229,
-        "segment": 5000378,
-    },
-    "תירוש": {"lat": 31.750701828240402, "lon": 34.88478199333457, "segment": 5000421},
-    "תל אביב - דרום העיר ויפו": {
-        "lat": 32.04627600848105,
-        "lon": 34.765623892441305,
-        "segment": 5000722,
-    },
-    "תל אביב - מזרח": {
-        "lat": 32.057385860578705,
-        "lon": 34.79860677190302,
-        "segment": 5000724,
-    },
-    "תל אביב - מרכז העיר": {
-        "lat": 32.079882706693276,
-        "lon": 34.781624113487126,
-        "segment": 5000742,
-    },
-    "תל אביב - עבר הירקון": {
-        "lat": 32.121425058553044,
-        "lon": 34.81696231593351,
-        "segment": 5000783,
-    },
-    "תל חי": {"lat": 33.233470131631904, "lon": 35.581771700882975, "segment": 5001652},
-    "תל יצחק": {"lat": 32.25137025991913, "lon": 34.87377932264783, "segment": 5000884},
-    "תל מונד": {
-        "lat": 32.253591014635795,
-        "lon": 34.917786971159295,
-        "segment": 5000885,
-    },
-    "תל עדשים": {
-        "lat": 32.653622709731486,
-        "lon": 35.299634880900136,
-        "segment": 5001153,
-    },
-    "תל ערד": {
-        "lat": 31.283695587292325,
-        "lon": 35.103799635295694,
-        "segment": 5001925,
-    },
-    "תל ציון": {
-        "lat": 31.880565864120637,
-        "lon": 35.236967267468955,
-        "segment": 5000597,
-    },
-    "תל קציר": {"lat": 32.70578321806435, "lon": 35.61795191379197, "segment": 5001227},
-    "תל שבע": {"lat": 31.241192086865293, "lon": 34.86391444138751, "segment": 5000131},
-    "תל תאומים": {
-        "lat": 32.441830339731254,
-        "lon": 35.49621700856826,
-        "segment": 5001001,
-    },
-    "תלם": {"lat": 31.565133426965485, "lon": 35.029506120120956, "segment": 5000275},
-    "תלמי אליהו": {
-        "lat": 31.22827835685208,
-        "lon": 34.42910713613371,
-        "segment": 5000129,
-    },
-    "תלמי אלעזר": {
-        "lat": 32.44514285265673,
-        "lon": 34.97888269783346,
-        "segment": 5000993,
-    },
-    "תלמי ביל''ו": {
-        "lat": 31.43825868408051,
-        "lon": 34.646233759584696,
-        "segment": 5000214,
-    },
-    "תלמי יוסף": {
-        "lat": 31.199641894455613,
-        "lon": 34.361692916552,
-        "segment": 5000113,
-    },
-    "תלמי יחיאל": {
-        "lat": 31.75410876816779,
-        "lon": 34.76029424759499,
-        "segment": 5000420,
-    },
-    "תלמי יפה": {
-        "lat": 31.615647816525655,
-        "lon": 34.612750010350865,
-        "segment": 5000297,
-    },
-    "תלמים": {"lat": 31.565559842635416, "lon": 34.67197577776344, "segment": 5000268},
-    "תמרת": {"lat": 32.70367382437655, "lon": 35.23021997265126, "segment": 5001206},
-    "תנובות": {"lat": 32.30716831494372, "lon": 34.96340115091996, "segment": 5000918},
-    "תעוז": {"lat": 31.800559960741275, "lon": 34.97364978749871, "segment": 5000488},
-    "תעשיון צריפין": {
-        "lat": 31.963233375065457,
-        "lon": 34.85284595836128,
-        "segment": 5001840,
-    },
-    "תפרח": {"lat": 31.325957325858592, "lon": 34.684528784294905, "segment": 5000167},
-    "תקומה": {"lat": 31.449618646560452, "lon": 34.57646126443642, "segment": 5000222},
-    "תקוע": {"lat": 31.649298966155445, "lon": 35.22895663638095, "segment": 5000330},
-    "תקוע ד' וה'": {
-        "lat": 31.63355761960141,
-        "lon": 35.24518981039739,
-        "segment": 5002241,
-    },
-    "תרום": {"lat": 31.782982706994996, "lon": 34.98222350317808, "segment": 5000461},
-}
+AREA_INFO: dict[str, AreaInfoType] = load_table("area_info")
@@ -1,1454 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-AREA_TO_DISTRICT: dict[str, str] = {
-    "אבו גוש": "בית שמש",
-    "אבו סנאן": "גליל עליון",
-    "אבו קרינאת": "דרום הנגב",
-    "אבו תלול": "דרום הנגב",
-    "אבטליון": "גליל תחתון",
-    "אביאל": "מנשה",
-    "אביבים": "קו העימות",
-    "אביגדור": "לכיש",
-    "אביגיל": "יהודה",
-    "אביחיל": "חפר",
-    "אביעזר": "בית שמש",
-    "אבירים": "קו העימות",
-    "אביתר": "שומרון",
-    "אבן יהודה": "שרון",
-    "אבן מנחם": "קו העימות",
-    "אבן ספיר": "בית שמש",
-    "אבן שמואל": "לכיש",
-    "אבני איתן": "גולן",
-    "אבני חפץ": "שומרון",
-    "אבנת": "ים המלח",
-    "אבשלום": "עוטף עזה",
-    "אדורה": "יהודה",
-    "אדורים": "יהודה",
-    "אדמית": "קו העימות",
-    "אדרת": "בית שמש",
-    "אודים": "שרון",
-    "אודם": "גולן",
-    "אום אל פחם": "ואדי ערה",
-    "אום אל קוטוף": "ואדי ערה",
-    "אום בטין": "דרום הנגב",
-    "אופקים": "מערב הנגב",
-    "אור הגנוז": "גליל עליון",
-    "אור הנר": "עוטף עזה",
-    "אור יהודה": "דן",
-    "אור עקיבא": "מנשה",
-    "אורה": "בית שמש",
-    "אורות": "לכיש",
-    "אורטל": "גולן",
-    "אורים": "מערב הנגב",
-    "אורנים": "קריות",
-    "אורנית": "שומרון",
-    "אושה": "קריות",
-    "אזור": "דן",
-    "אזור תעשייה אלון התבור": "תבור",
-    "אזור תעשייה אפק ולב הארץ": "ירקון",
-    "אזור תעשייה אריאל": "שומרון",
-    "אזור תעשייה באר טוביה": "לכיש",
-    "אזור תעשייה בני יהודה": "גולן",
-    "אזור תעשייה בר-לב": "גליל תחתון",
-    "אזור תעשייה בראון": "שומרון",
-    "אזור תעשייה ברוש": "בית שמש",
-    "אזור תעשייה ברקן": "שומרון",
-    "אזור תעשייה גדרה": "דרום השפלה",
-    "אזור תעשייה דימונה": "דרום הנגב",
-    "אזור תעשייה הדרומי אשקלון": "מערב לכיש",
-    "אזור תעשייה הר טוב - צרעה": "בית שמש",
-    "אזור תעשייה חבל מודיעין שוהם": "ירקון",
-    "אזור תעשייה יקנעם עילית": "מנשה",
-    "אזור תעשייה כנות": "לכיש",
-    "אזור תעשייה כפר יונה": "חפר",
-    "אזור תעשייה כרמיאל": "גליל עליון",
-    "אזור תעשייה מבוא כרמל": "מנשה",
-    "אזור תעשייה מבואות הגלבוע": "תבור",
-    "אזור תעשייה מישור אדומים": "יהודה",
-    "אזור תעשייה מיתרים": "יהודה",
-    "אזור תעשייה נ.ע.מ": "מערב הנגב",
-    "אזור תעשייה ניר עציון": "חוף הכרמל",
-    "אזור תעשייה נשר - רמלה": "השפלה",
-    "אזור תעשייה עד הלום": "לכיש",
-    "אזור תעשייה עידן הנגב": "מרכז הנגב",
-    "אזור תעשייה עמק חפר": "חפר",
-    "אזור תעשייה צ.ח.ר": "גליל עליון",
-    "אזור תעשייה ציפורית": "תבור",
-    "אזור תעשייה צפוני אשקלון": "מערב לכיש",
-    "אזור תעשייה קדמת גליל": "גליל תחתון",
-    "אזור תעשייה קיסריה": "מנשה",
-    "אזור תעשייה קריית ביאליק": "קריות",
-    "אזור תעשייה קריית גת": "לכיש",
-    "אזור תעשייה רבדים": "לכיש",
-    "אזור תעשייה רותם": "דרום הנגב",
-    "אזור תעשייה רמת דלתון": "קו העימות",
-    "אזור תעשייה שחורת": "אילת",
-    "אזור תעשייה שחק": "שומרון",
-    "אזור תעשייה שער בנימין": "שומרון",
-    "אזור תעשייה שער נעמן": "גליל עליון",
-    "אזור תעשייה תימורים": "לכיש",
-    "אזור תעשייה תרדיון": "גליל תחתון",
-    "אחווה": "לכיש",
-    "אחוזם": "לכיש",
-    "אחוזת ברק": "תבור",
-    "אחיה": "שומרון",
-    "אחיהוד": "גליל תחתון",
-    "אחיטוב": "חפר",
-    "אחיסמך": "השפלה",
-    "אחיעזר": "השפלה",
-    "איבטין": "קריות",
-    "איבי הנחל": "יהודה",
-    "איזור תעשייה מילואות צפון": "קו העימות",
-    "אייל": "חפר",
-    "איילת השחר": "גליל עליון",
-    "איירפורט סיטי": "ירקון",
-    "אילון": "קו העימות",
-    "אילות": "אילת",
-    "אילניה": "גליל תחתון",
-    "אילת": "אילת",
-    "אירוס": "השפלה",
-    "איתמר": "שומרון",
-    "איתן": "לכיש",
-    "אכסאל": "תבור",
-    "אל סייד": "דרום הנגב",
-    "אל עזי": "לכיש",
-    "אל עמארני, אל מסק": "ערבה",
-    "אל עריאן": "ואדי ערה",
-    "אל פורעה": "דרום הנגב",
-    "אל רום": "גולן",
-    "אלומה": "לכיש",
-    "אלומות": "גליל תחתון",
-    "אלון": "יהודה",
-    "אלון הגליל": "תבור",
-    "אלון מורה": "שומרון",
-    "אלון שבות": "יהודה",
-    "אלוני אבא": "תבור",
-    "אלוני הבשן": "גולן",
-    "אלוני יצחק": "מנשה",
-    "אלונים": "תבור",
-    "אלי עד": "גולן",
-    "אליאב": "יהודה",
-    "אליכין": "חפר",
-    "אליפז ומכרות תמנע": "ערבה",
-    "אליפלט": "גליל עליון",
-    "אליקים": "מנשה",
-    "אלישיב": "חפר",
-    "אלישמע": "שרון",
-    "אלמגור": "קצרין",
-    "אלמוג": "בקעה",
-    "אלעד": "ירקון",
-    "אלעזר": "יהודה",
-    "אלפי מנשה": "שומרון",
-    "אלקוש": "קו העימות",
-    "אלקנה": "שומרון",
-    "אמונים": "לכיש",
-    "אמירים": "גליל עליון",
-    "אמנון": "גליל עליון",
-    "אמץ": "חפר",
-    "אניעם": "קצרין",
-    "אעבלין": "גליל תחתון",
-    "אעירה השחר": "שומרון",
-    "אפיק": "גולן",
-    "אפיקים": "גליל תחתון",
-    "אפק": "גליל תחתון",
-    "אפקה": "יהודה",
-    "אפרת": "יהודה",
-    "ארבל": "גליל תחתון",
-    "ארגמן": "בקעה",
-    "ארז": "עוטף עזה",
-    "אריאל": "שומרון",
-    "ארסוף": "שרון",
-    "אש קודש": "בקעה",
-    "אשבול": "מערב הנגב",
-    "אשבל": "גליל תחתון",
-    "אשדוד - א,ב,ד,ה": "לכיש",
-    "אשדוד - איזור תעשייה צפוני": "לכיש",
-    "אשדוד - ג,ו,ז": "לכיש",
-    "אשדוד - ח,ט,י,יג,יד,טז": "לכיש",
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי": "לכיש",
-    "אשדות יעקב": "גליל תחתון",
-    "אשחר": "גליל תחתון",
-    "אשכולות": "יהודה",
-    "אשל הנשיא": "מערב הנגב",
-    "אשלים": "דרום הנגב",
-    "אשקלון - דרום": "מערב לכיש",
-    "אשקלון - צפון": "מערב לכיש",
-    "אשרת": "גליל עליון",
-    "אשתאול": "בית שמש",
-    "אשתמוע": "יהודה",
-    "אתר דודאים": "מרכז הנגב",
-    "אתר ההנצחה גולני": "גליל תחתון",
-    "באקה אל גרבייה": "ואדי ערה",
-    "באר אורה": "ערבה",
-    "באר גנים": "מערב לכיש",
-    "באר טוביה": "לכיש",
-    "באר יעקב": "השפלה",
-    "באר מילכה": "דרום הנגב",
-    "באר שבע - דרום": "מרכז הנגב",
-    "באר שבע - מזרח": "מרכז הנגב",
-    "באר שבע - מערב": "מרכז הנגב",
-    "באר שבע - צפון": "מרכז הנגב",
-    "בארות יצחק": "ירקון",
-    "בארותיים": "חפר",
-    "בארי": "עוטף עזה",
-    "בוסתן הגליל": "גליל עליון",
-    "בועיינה-נוג'ידאת": "גליל תחתון",
-    "בוקעתא": "גולן",
-    "בורגתה": "חפר",
-    "בחלק מהאזורים בארץ": "דן",
-    "בחן": "חפר",
-    "בטחה": "מערב הנגב",
-    'בי"ס כרמים בנימינה': "מנשה",
-    "ביצרון": "לכיש",
-    "ביר אלמכסור": "גליל תחתון",
-    "ביר הדאג'": "דרום הנגב",
-    "ביריה": "גליל עליון",
-    "בית אורן": "יערות הכרמל",
-    "בית אל": "שומרון",
-    "בית אלעזרי": "דרום השפלה",
-    "בית אלפא וחפציבה": "בקעת בית שאן",
-    "בית אריה": "שומרון",
-    "בית ברל": "שרון",
-    "בית ג'אן": "גליל עליון",
-    "בית גוברין": "לכיש",
-    "בית גמליאל": "דרום השפלה",
-    "בית דגן": "השפלה",
-    "בית הברכה": "יהודה",
-    "בית הגדי": "מערב הנגב",
-    "בית הלוי": "חפר",
-    "בית הלל": "קו העימות",
-    "בית העלמין החדש נהריה": "קו העימות",
-    "בית העלמין החדש עכו": "גליל עליון",
-    "בית העמק": "גליל עליון",
-    "בית הערבה": "בקעה",
-    "בית השיטה": "בקעת בית שאן",
-    "בית זית": "בית שמש",
-    "בית זרע": "גליל תחתון",
-    'בית חג"י': "יהודה",
-    "בית חגלה": "בקעה",
-    "בית חורון": "שומרון",
-    "בית חלקיה": "דרום השפלה",
-    "בית חנן": "השפלה",
-    "בית חנניה": "מנשה",
-    "בית חרות": "חפר",
-    "בית חשמונאי": "השפלה",
-    "בית יהושע": "שרון",
-    "בית יוסף": "בקעת בית שאן",
-    "בית ינאי": "חפר",
-    "בית יצחק - שער חפר": "חפר",
-    "בית ירח": "גליל תחתון",
-    "בית יתיר": "יהודה",
-    "בית לחם הגלילית": "תבור",
-    "בית מאיר": "בית שמש",
-    "בית נחמיה": "ירקון",
-    "בית ניר": "לכיש",
-    "בית נקופה": "בית שמש",
-    "בית סוהר צלמון": "גליל תחתון",
-    "בית סוהר קישון": "קריות",
-    "בית ספר שדה מירון": "קו העימות",
-    "בית עובד": "השפלה",
-    "בית עוזיאל": "השפלה",
-    "בית עזרא": "לכיש",
-    "בית עלמין מורשה": "שרון",
-    "בית עלמין תל רגב": "קריות",
-    "בית עריף": "ירקון",
-    "בית צבי": "חוף הכרמל",
-    "בית קמה": "מרכז הנגב",
-    "בית קשת": "גליל תחתון",
-    "בית רימון": "גליל תחתון",
-    "בית שאן": "בקעת בית שאן",
-    "בית שמש": "בית שמש",
-    "בית שערים": "תבור",
-    "בית שקמה": "מערב לכיש",
-    "ביתן אהרן": "חפר",
-    "ביתר עילית": "יהודה",
-    "בלפוריה": "תבור",
-    "בן זכאי": "דרום השפלה",
-    "בן עמי": "קו העימות",
-    "בן שמן": "השפלה",
-    "בני אדם": "יהודה",
-    "בני ברק": "דן",
-    "בני דקלים": "יהודה",
-    "בני דרום": "דרום השפלה",
-    "בני דרור": "חפר",
-    "בני יהודה וגבעת יואב": "גולן",
-    "בני נצרים": "עוטף עזה",
-    "בני עטרות": "ירקון",
-    "בני עי''ש": "לכיש",
-    "בני ציון": "שרון",
-    "בני ראם": "דרום השפלה",
-    "בניה": "דרום השפלה",
-    "בנימינה": "מנשה",
-    "בסמת טבעון": "קריות",
-    "בענה": "גליל עליון",
-    "בצרה": "שרון",
-    "בצת": "קו העימות",
-    "בקוע": "בית שמש",
-    "בקעות": "בקעה",
-    "בר גיורא": "בית שמש",
-    "בר יוחאי": "גליל עליון",
-    "בר כוכבא": "יהודה",
-    "ברוכין": "שומרון",
-    "ברור חיל": "מערב הנגב",
-    "ברוש": "מערב הנגב",
-    "ברטעה": "ואדי ערה",
-    "ברכיה": "מערב לכיש",
-    "ברעם": "קו העימות",
-    "ברקאי": "ואדי ערה",
-    "ברקן": "שומרון",
-    "ברקת": "ירקון",
-    "בת הדר": "מערב לכיש",
-    "בת חן": "חפר",
-    "בת חפר": "חפר",
-    "בת ים": "דן",
-    "בת עין": "יהודה",
-    "בת שלמה": "חוף הכרמל",
-    "בתי מלון ים המלח": "ים המלח",
-    "בתרונות": "בקעה",
-    "ג'דידה מכר": "גליל עליון",
-    "ג'וליס": "גליל עליון",
-    "ג'לג'וליה": "שרון",
-    "ג'סר א-זרקא": "מנשה",
-    "ג'ש - גוש חלב": "קו העימות",
-    "ג'ת": "ואדי ערה",
-    "גאולי תימן": "חפר",
-    "גאולים": "חפר",
-    "גאליה": "השפלה",
-    "גבולות": "מערב הנגב",
-    "גבים, מכללת ספיר": "עוטף עזה",
-    "גבע בנימין": "שומרון",
-    "גבע כרמל": "חוף הכרמל",
-    "גבעון החדשה": "שומרון",
-    "גבעות": "יהודה",
-    "גבעות בר": "מרכז הנגב",
-    "גבעות עדן": "בית שמש",
-    "גבעת אבני": "גליל תחתון",
-    "גבעת אלה": "תבור",
-    "גבעת אסף": "שומרון",
-    "גבעת ברנר": "דרום השפלה",
-    "גבעת הראל": "שומרון",
-    "גבעת הרואה": "שומרון",
-    "גבעת השלושה": "ירקון",
-    "גבעת וולפסון": "יערות הכרמל",
-    "גבעת וושינגטון": "דרום השפלה",
-    "גבעת זאב": "ירושלים",
-    "גבעת חיים איחוד": "חפר",
-    "גבעת חיים מאוחד": "חפר",
-    "גבעת חן": "שרון",
-    "גבעת יערים": "בית שמש",
-    "גבעת ישעיהו": "בית שמש",
-    "גבעת כ''ח": "ירקון",
-    "גבעת ניל''י": "מנשה",
-    "גבעת עדה": "מנשה",
-    "גבעת עוז": "מנשה",
-    "גבעת פורת יוסף": "שומרון",
-    "גבעת שמואל": "דן",
-    "גבעת שפירא": "חפר",
-    "גבעתי": "לכיש",
-    "גבעתיים": "דן",
-    "גברעם": "עוטף עזה",
-    "גבת": "תבור",
-    "גדות": "גליל עליון",
-    "גדעונה": "תבור",
-    "גדרה": "דרום השפלה",
-    "גונן": "קו העימות",
-    "גופנה": "שומרון",
-    "גורן": "קו העימות",
-    "גורנות הגליל": "קו העימות",
-    "גזית": "תבור",
-    "גזר": "השפלה",
-    "גיאה": "מערב לכיש",
-    "גיבתון": "דרום השפלה",
-    "גיזו": "בית שמש",
-    "גילת": "מערב הנגב",
-    "גינוסר": "גליל תחתון",
-    "גינתון": "השפלה",
-    "גיתה": "גליל עליון",
-    "גיתית": "בקעה",
-    "גלאון": "לכיש",
-    "גלגל": "בקעה",
-    "גלעד": "מנשה",
-    "גמזו": "השפלה",
-    "גן הדרום": "דרום השפלה",
-    "גן השומרון": "מנשה",
-    "גן חיים": "שרון",
-    "גן יאשיה": "חפר",
-    "גן יבנה": "לכיש",
-    "גן נר": "תבור",
-    "גן שורק": "השפלה",
-    "גן שלמה": "דרום השפלה",
-    "גן שמואל": "מנשה",
-    "גנות": "השפלה",
-    "גנות הדר": "חפר",
-    "גני הדר": "השפלה",
-    "גני חוגה": "בקעת בית שאן",
-    "גני טל": "דרום השפלה",
-    "גני יוחנן": "השפלה",
-    "גני עם": "שרון",
-    "גני תקווה": "דן",
-    "גניגר": "תבור",
-    "געש": "שרון",
-    "געתון": "קו העימות",
-    "גפן": "בית שמש",
-    "גרופית": "ערבה",
-    "גשור": "גולן",
-    "גשר": "בקעת בית שאן",
-    "גשר הזיו": "קו העימות",
-    "גת": "לכיש",
-    "גת רימון": "ירקון",
-    "דבוריה": "תבור",
-    "דביר": "מרכז הנגב",
-    "דברת": "תבור",
-    "דגניה א": "גליל תחתון",
-    "דגניה ב": "גליל תחתון",
-    "דוב''ב": "קו העימות",
-    "דולב": "שומרון",
-    "דור, נחשולים": "חוף הכרמל",
-    "דורות": "מערב הנגב",
-    "דורות עילית": "שומרון",
-    "דחי": "תבור",
-    "דימונה": "דרום הנגב",
-    "דיר אל-אסד": "גליל עליון",
-    "דיר חנא": "גליל תחתון",
-    "דישון": "קו העימות",
-    "דליה": "מנשה",
-    "דלית אל כרמל": "יערות הכרמל",
-    "דלתון": "קו העימות",
-    "דמיידה": "גליל תחתון",
-    "דפנה": "קו העימות",
-    "דקל": "עוטף עזה",
-    "האון": "קצרין",
-    "הבונים": "חוף הכרמל",
-    "הגבעה הצהובה": "יהודה",
-    "הגושרים": "קו העימות",
-    "הדר עם": "חפר",
-    "הוד השרון": "שרון",
-    "הודיה": "מערב לכיש",
-    "הודיות": "גליל תחתון",
-    "הושעיה": "תבור",
-    "הזורעים": "גליל תחתון",
-    "החווה של אורי כהן": "בקעה",
-    "החווה של זוהר": "שומרון",
-    "החווה של יאיא": "בקעה",
-    "החווה של מנחם": "בקעה",
-    "החווה של עשהאל": "בקעה",
-    "החותרים": "חיפה",
-    "היוגב": "תבור",
-    "היישוב היהודי חברון": "יהודה",
-    "הילה": "קו העימות",
-    "המעפיל": "חפר",
-    "המרכז האקדמי רופין": "חפר",
-    "הסוללים": "תבור",
-    "העוגן": "חפר",
-    "הר אדר": "בית שמש",
-    "הר ברכה": "שומרון",
-    "הר גילה": "יהודה",
-    "הר חלוץ": "גליל עליון",
-    "הר עמשא": "יהודה",
-    "הראל": "בית שמש",
-    "הרדוף": "תבור",
-    "הרצליה - מערב": "שרון",
-    "הרצליה - מרכז וגליל ים": "שרון",
-    "הררית יחד": "גליל תחתון",
-    "ואדי אל חמאם": "גליל תחתון",
-    "ואדי אל נעם דרום": "מרכז הנגב",
-    "ורד יריחו": "בקעה",
-    "ורדון": "לכיש",
-    "זבדיאל": "לכיש",
-    "זוהר": "לכיש",
-    "זיקים": "עוטף עזה",
-    "זיתן": "השפלה",
-    "זכרון יעקב": "מנשה",
-    "זכריה": "בית שמש",
-    "זמר": "חפר",
-    "זמרת, שובה": "עוטף עזה",
-    "זנוח": "בית שמש",
-    "זרועה": "מערב הנגב",
-    "זרזיר": "תבור",
-    "זרחיה": "לכיש",
-    "זרעית": "קו העימות",
-    "חבצלת השרון וצוקי ים": "חפר",
-    "חג'אג'רה": "תבור",
-    "חגור": "שרון",
-    "חגלה": "חפר",
-    "חד נס": "קצרין",
-    "חדיד": "ירקון",
-    "חדרה - מזרח": "מנשה",
-    "חדרה - מערב": "מנשה",
-    "חדרה - מרכז": "מנשה",
-    "חדרה - נווה חיים": "מנשה",
-    "חוות אביה": "שומרון",
-    "חוות אביחי": "שומרון",
-    "חוות אל נווה": "שומרון",
-    "חוות אלחי": "שומרון",
-    "חוות ארץ האיילים": "יהודה",
-    "חוות אשכולות": "יהודה",
-    "חוות בניהו": "שומרון",
-    "חוות גלעד": "שומרון",
-    "חוות גנות": "בקעה",
-    "חוות דרומא": "יהודה",
-    "חוות הרועה העברי": "יהודה",
-    "חוות הרשאש": "בקעה",
-    "חוות חנינא": "שומרון",
-    "חוות טואמין": "יהודה",
-    "חוות טליה": "יהודה",
-    "חוות יאיר": "שומרון",
-    "חוות יד השומר": "בקעה",
-    "חוות יויו": "יהודה",
-    "חוות ינון": "שומרון",
-    "חוות מגדלים": "שומרון",
-    "חוות מגנזי": "שומרון",
-    "חוות מדבר חבר": "יהודה",
-    "חוות מור ואברהם": "יהודה",
-    "חוות מלאכי אברהם": "יהודה",
-    "חוות מלכיאל": "שומרון",
-    "חוות מנחם": "ים המלח",
-    "חוות מעלה אהוביה": "שומרון",
-    "חוות מקנה יהודה": "יהודה",
-    "חוות מרום שמואל": "שומרון",
-    "חוות נווה צוף": "שומרון",
-    'חוות נוף אב"י': "שומרון",
-    "חוות נחל שילה": "שומרון",
-    "חוות נחלת אבות": "יהודה",
-    "חוות נחלת צבי": "שומרון",
-    "חוות עדן": "יהודה",
-    "חוות עולם חסד": "שומרון",
-    "חוות עמיאל": "בקעה",
-    "חוות פריאל": "בקעה",
-    "חוות צאן קדר": "יהודה",
-    "חוות צרידה": "שומרון",
-    "חוות קשואלה": "יהודה",
-    "חוות ראש תאנה": "שומרון",
-    "חוות שדה": "שומרון",
-    "חוות שוביאל": "שומרון",
-    "חוות שחרית": "שומרון",
-    "חוות תלם צפון": "יהודה",
-    "חולדה": "השפלה",
-    "חולון": "דן",
-    "חולית": "עוטף עזה",
-    "חולתה": "גליל עליון",
-    "חומש": "שומרון",
-    "חוסן": "קו העימות",
-    "חוסנייה": "גליל תחתון",
-    "חוף אכזיב": "קו העימות",
-    "חוף בצת": "קו העימות",
-    "חוף זיקים": "עוטף עזה",
-    "חוף קליה": "בקעה",
-    "חופית": "חפר",
-    "חוקוק": "גליל תחתון",
-    "חורה": "דרום הנגב",
-    "חורפיש": "קו העימות",
-    "חורשים": "שרון",
-    "חזון": "גליל תחתון",
-    "חיבת ציון": "חפר",
-    "חיננית": "שומרון",
-    "חיפה - בת גלים ק.אליעזר": "חיפה",
-    "חיפה - כרמל, הדר ועיר תחתית": "חיפה",
-    "חיפה - מערב": "חיפה",
-    "חיפה - מפרץ": "חיפה",
-    "חיפה - נווה שאנן ורמות כרמל": "חיפה",
-    "חיפה - קריית חיים ושמואל": "חיפה",
-    "חירן": "יהודה",
-    "חלץ": "מערב לכיש",
-    "חמד": "השפלה",
-    "חמדיה": "בקעת בית שאן",
-    "חמדת": "בקעה",
-    "חמדת ימים": "גליל עליון",
-    "חמרה": "בקעה",
-    "חמת גדר": "קצרין",
-    "חניאל": "חפר",
-    "חניון רעים אנדרטת הנובה": "עוטף עזה",
-    "חניתה": "קו העימות",
-    "חנתון": "תבור",
-    "חספין": "גולן",
-    "חפץ חיים": "דרום השפלה",
-    "חצב": "לכיש",
-    "חצבה": "ערבה",
-    "חצור": "לכיש",
-    "חצור הגלילית": "גליל עליון",
-    "חצרים": "מרכז הנגב",
-    "חרב לאת": "חפר",
-    "חרוצים": "שרון",
-    "חרות": "חפר",
-    "חריש": "ואדי ערה",
-    "חרמש": "שומרון",
-    "חרמש דרום": "שומרון",
-    "חרשה": "שומרון",
-    "חרשים": "גליל עליון",
-    "חשמונאים": "השפלה",
-    "טבריה": "גליל תחתון",
-    "טובא זנגריה": "גליל עליון",
-    "טורעאן": "גליל תחתון",
-    "טייבה": "חפר",
-    "טייבה בגלבוע": "בקעת בית שאן",
-    "טירה": "חפר",
-    "טירת יהודה": "ירקון",
-    "טירת כרמל": "חיפה",
-    "טירת צבי": "בקעת בית שאן",
-    "טל - אל": "גליל עליון",
-    "טל מנשה": "שומרון",
-    "טל שחר": "בית שמש",
-    "טללים": "דרום הנגב",
-    "טלמון": "שומרון",
-    "טמרה": "גליל תחתון",
-    "טמרה בגלבוע": "תבור",
-    "טנא עומרים": "יהודה",
-    "טפחות": "גליל תחתון",
-    "יבוא דודי": "שומרון",
-    "יבול": "עוטף עזה",
-    "יבנאל": "גליל תחתון",
-    "יבנה": "דרום השפלה",
-    "יגור": "קריות",
-    "יגל": "השפלה",
-    "יד בנימין": "דרום השפלה",
-    "יד השמונה": "בית שמש",
-    "יד חנה": "חפר",
-    "יד מרדכי": "עוטף עזה",
-    "יד נתן": "לכיש",
-    "יד רמב''ם": "השפלה",
-    "יהוד מונוסון": "דן",
-    "יהל": "ערבה",
-    "יובלים": "גליל תחתון",
-    "יודפת": "גליל תחתון",
-    "יונתן": "גולן",
-    "יושיביה": "מערב הנגב",
-    "יזרעאל": "תבור",
-    "יחיעם": "קו העימות",
-    "יטבתה": "ערבה",
-    "ייט''ב": "בקעה",
-    "יכיני": "עוטף עזה",
-    "ינוב": "חפר",
-    "ינוח ג'ת": "גליל עליון",
-    "ינון": "לכיש",
-    "יסוד המעלה": "גליל עליון",
-    "יסודות": "דרום השפלה",
-    "יסעור": "גליל תחתון",
-    "יעבץ, יעף": "חפר",
-    "יעד": "גליל תחתון",
-    "יערה": "קו העימות",
-    "יפיע": "תבור",
-    "יפית": "בקעה",
-    "יפעת": "תבור",
-    "יפתח": "קו העימות",
-    "יצהר": "שומרון",
-    "יציץ": "השפלה",
-    "יקום": "שרון",
-    "יקיר": "שומרון",
-    "יקנעם המושבה והזורע": "מנשה",
-    "יקנעם עילית": "מנשה",
-    "יראון": "קו העימות",
-    "ירדנה": "בקעת בית שאן",
-    "ירוחם": "דרום הנגב",
-    "ירושלים - אזור תעשייה עטרות": "ירושלים",
-    "ירושלים - דרום": "ירושלים",
-    "ירושלים - כפר עקב": "ירושלים",
-    "ירושלים - מזרח": "ירושלים",
-    "ירושלים - מערב": "ירושלים",
-    "ירושלים - מרכז": "ירושלים",
-    "ירושלים - צפון": "ירושלים",
-    "ירחיב": "שרון",
-    "ירכא": "גליל עליון",
-    "ירקונה": "שרון",
-    "ישובי אומן": "תבור",
-    "ישובי יעל": "תבור",
-    "ישעי": "בית שמש",
-    "ישרש": "השפלה",
-    "יתד": "עוטף עזה",
-    "כאבול": "גליל תחתון",
-    "כאוכב אבו אלהיג'א": "גליל תחתון",
-    "כברי": "קו העימות",
-    "כדורי": "גליל תחתון",
-    "כוכב השחר": "שומרון",
-    "כוכב יאיר - צור יגאל": "שומרון",
-    "כוכב יעקב": "שומרון",
-    "כוכב מיכאל": "מערב לכיש",
-    "כורזים ורד הגליל": "גליל עליון",
-    "כחל": "גליל עליון",
-    "כינרת מושבה": "גליל תחתון",
-    "כינרת קבוצה": "גליל תחתון",
-    "כיסופים": "עוטף עזה",
-    "כישור": "גליל עליון",
-    "כליל": "גליל עליון",
-    "כלנית": "גליל תחתון",
-    "כמהין": "דרום הנגב",
-    "כמון - כמאנה מזרחית": "גליל תחתון",
-    "כנות": "לכיש",
-    "כנף": "קצרין",
-    "כסייפה": "דרום הנגב",
-    "כסלון": "בית שמש",
-    "כסרא סמיע": "גליל עליון",
-    "כעביה טבאש": "תבור",
-    "כפר אביב": "דרום השפלה",
-    "כפר אדומים": "יהודה",
-    "כפר אוריה": "בית שמש",
-    "כפר אחים": "לכיש",
-    "כפר אלדד": "יהודה",
-    "כפר ביאליק": "קריות",
-    "כפר ביל''ו": "השפלה",
-    "כפר בלום": "קו העימות",
-    "כפר בן נון": "השפלה",
-    "כפר ברא": "שרון",
-    "כפר ברוך": "תבור",
-    "כפר גדעון": "תבור",
-    "כפר גלים": "חיפה",
-    "כפר גליקסון": "מנשה",
-    "כפר גלעדי": "קו העימות",
-    "כפר גמילה מלכישוע": "בקעת בית שאן",
-    "כפר דניאל": "השפלה",
-    "כפר האורנים": "שומרון",
-    "כפר החורש": "תבור",
-    "כפר המכבי": "קריות",
-    "כפר הנגיד": "השפלה",
-    "כפר הנוער קריית יערים": "בית שמש",
-    "כפר הנוקדים": "דרום הנגב",
-    "כפר הנשיא": "גליל עליון",
-    "כפר הס": "חפר",
-    "כפר הרא''ה": "חפר",
-    "כפר הרי''ף וצומת ראם": "לכיש",
-    "כפר ויתקין": "חפר",
-    "כפר ורבורג": "לכיש",
-    "כפר ורדים": "קו העימות",
-    "כפר זוהרים": "לכיש",
-    "כפר זיתים": "גליל תחתון",
-    "כפר ח'וואלד": "קריות",
-    "כפר חב''ד": "השפלה",
-    "כפר חיטים": "גליל תחתון",
-    "כפר חיים": "חפר",
-    "כפר חנניה": "גליל תחתון",
-    "כפר חסידים": "קריות",
-    "כפר חרוב": "גולן",
-    "כפר טרומן": "ירקון",
-    "כפר יאסיף": "גליל עליון",
-    "כפר ידידיה": "חפר",
-    "כפר יהושע": "תבור",
-    "כפר יובל": "קו העימות",
-    "כפר יונה": "חפר",
-    "כפר יחזקאל": "תבור",
-    "כפר כמא": "גליל תחתון",
-    "כפר כנא": "תבור",
-    "כפר מונש": "חפר",
-    "כפר מימון ותושיה": "עוטף עזה",
-    "כפר מל''ל": "שרון",
-    "כפר מנדא": "גליל תחתון",
-    "כפר מנחם": "לכיש",
-    "כפר מסריק": "גליל עליון",
-    "כפר מצר": "תבור",
-    "כפר מרדכי": "דרום השפלה",
-    "כפר נהר הירדן": "גליל תחתון",
-    "כפר נוער בן שמן": "השפלה",
-    "כפר נטר": "שרון",
-    "כפר סאלד": "קו העימות",
-    "כפר סבא": "שרון",
-    "כפר סילבר": "מערב לכיש",
-    "כפר סירקין": "ירקון",
-    "כפר עבודה": "חפר",
-    "כפר עזה": "עוטף עזה",
-    "כפר עציון": "יהודה",
-    "כפר פינס": "מנשה",
-    "כפר קאסם": "שרון",
-    "כפר קיש": "גליל תחתון",
-    "כפר קרע": "ואדי ערה",
-    "כפר רופין": "בקעת בית שאן",
-    "כפר רות": "השפלה",
-    "כפר שמאי": "גליל עליון",
-    "כפר שמואל": "השפלה",
-    "כפר שמריהו": "שרון",
-    "כפר תבור": "תבור",
-    "כפר תפוח": "שומרון",
-    "כפר תקווה": "תבור",
-    "כרכום": "גליל עליון",
-    "כרם ביבנה": "דרום השפלה",
-    "כרם בן זמרה": "קו העימות",
-    "כרם מהר''ל": "חוף הכרמל",
-    "כרם רעים": "שומרון",
-    "כרם שלום": "עוטף עזה",
-    "כרמי יוסף": "השפלה",
-    "כרמי צור": "יהודה",
-    "כרמי קטיף ואמציה": "יהודה",
-    "כרמיאל": "גליל עליון",
-    "כרמיה": "עוטף עזה",
-    "כרמים": "מרכז הנגב",
-    "כרמית": "מרכז הנגב",
-    "כרמל": "יהודה",
-    "לב החולה": "קו העימות",
-    "לבון": "גליל עליון",
-    "לביא": "גליל תחתון",
-    "לבנים": "גליל תחתון",
-    "להב": "מרכז הנגב",
-    "להבות הבשן": "קו העימות",
-    "להבות חביבה": "ואדי ערה",
-    "להבים": "מרכז הנגב",
-    "לוד": "השפלה",
-    "לוזית": "בית שמש",
-    "לוחמי הגטאות": "גליל עליון",
-    "לוטם וחמדון": "גליל תחתון",
-    "לוטן": "ערבה",
-    "לטרון": "בית שמש",
-    "לימן": "קו העימות",
-    "לכיש": "לכיש",
-    "לפיד": "השפלה",
-    "לפידות": "גליל עליון",
-    "לקיה": "מרכז הנגב",
-    "מאור": "מנשה",
-    "מאיר שפיה": "חוף הכרמל",
-    "מבוא ביתר": "בית שמש",
-    "מבוא דותן": "שומרון",
-    "מבוא חורון": "שומרון",
-    "מבוא חמה": "גולן",
-    "מבוא מודיעים": "השפלה",
-    "מבואות יריחו": "בקעה",
-    "מבועים": "מערב הנגב",
-    "מבטחים, עמיעוז, ישע": "עוטף עזה",
-    "מבקיעים": "מערב לכיש",
-    "מבשרת ציון": "בית שמש",
-    "מג'דל כרום": "גליל עליון",
-    "מג'דל שמס": "גולן",
-    "מגדים": "חוף הכרמל",
-    "מגדל": "גליל תחתון",
-    "מגדל העמק": "תבור",
-    "מגדל עוז": "יהודה",
-    "מגדל תפן": "גליל עליון",
-    "מגדלים": "שומרון",
-    "מגל": "ואדי ערה",
-    "מגן": "עוטף עזה",
-    "מגן שאול": "תבור",
-    "מגרון": "שומרון",
-    "מגשימים": "ירקון",
-    "מדרך עוז": "מנשה",
-    "מדרשת בן גוריון": "דרום הנגב",
-    "מודיעין - ישפרו סנטר": "השפלה",
-    "מודיעין - ליגד סנטר": "השפלה",
-    "מודיעין מכבים רעות": "השפלה",
-    "מודיעין עילית": "שומרון",
-    "מולדת": "בקעת בית שאן",
-    "מועאוויה": "ואדי ערה",
-    "מוצא עילית": "בית שמש",
-    "מוקיבלה": "תבור",
-    "מורן": "גליל תחתון",
-    "מורשת": "גליל תחתון",
-    "מזור": "ירקון",
-    "מזכרת בתיה": "דרום השפלה",
-    "מזרע": "תבור",
-    "מזרעה": "גליל עליון",
-    "מחולה": "בקעה",
-    "מחניים": "גליל עליון",
-    "מחסיה": "בית שמש",
-    "מטווח ניר עם": "עוטף עזה",
-    "מטולה": "קו העימות",
-    "מטע": "בית שמש",
-    "מי עמי": "ואדי ערה",
-    "מייסר": "ואדי ערה",
-    "מיני ישראל - נחשון": "בית שמש",
-    "מיצד": "יהודה",
-    "מיצר": "גולן",
-    "מירב": "בקעת בית שאן",
-    "מירון": "גליל עליון",
-    "מישר": "דרום השפלה",
-    "מיתר": "דרום הנגב",
-    "מכון וינגייט": "שרון",
-    "מכורה": "בקעה",
-    "מכינת אלישע": "שומרון",
-    "מכמורת": "חפר",
-    "מכמנים - כמאנה מערבית": "גליל עליון",
-    "מלאכי השלום": "שומרון",
-    "מלונות ים המלח מרכז": "ים המלח",
-    "מלכיה": "קו העימות",
-    "מנוחה": "לכיש",
-    "מנוף": "גליל תחתון",
-    "מנות": "קו העימות",
-    "מנחמיה": "בקעת בית שאן",
-    "מנחת מחניים": "גליל עליון",
-    "מנרה": "קו העימות",
-    "מנשית זבדה": "תבור",
-    "מסד": "גליל תחתון",
-    "מסדה": "קצרין",
-    "מסוף אורנית": "שרון",
-    "מסילות": "בקעת בית שאן",
-    "מסילת ציון": "בית שמש",
-    "מסלול": "מערב הנגב",
-    "מסעדה": "גולן",
-    "מע'אר": "גליל תחתון",
-    "מעברות": "חפר",
-    "מעגלים, גבעולים, מלילות": "מערב הנגב",
-    "מעגן": "קצרין",
-    "מעגן מיכאל": "מנשה",
-    "מעוז חיים": "בקעת בית שאן",
-    "מעון": "יהודה",
-    "מעון צופיה": "דרום השפלה",
-    "מעונה": "קו העימות",
-    "מעיין ברוך": "קו העימות",
-    "מעיין צבי": "מנשה",
-    "מעיליא": "קו העימות",
-    "מעלה אדומים": "יהודה",
-    "מעלה אפרים": "בקעה",
-    "מעלה גלבוע": "בקעת בית שאן",
-    "מעלה גמלא": "קצרין",
-    "מעלה החמישה": "בית שמש",
-    "מעלה חבר": "יהודה",
-    "מעלה לבונה": "שומרון",
-    "מעלה מכמש": "שומרון",
-    "מעלה עירון": "ואדי ערה",
-    "מעלה עמוס": "יהודה",
-    "מעלה צביה": "גליל תחתון",
-    "מעלה רחבעם": "יהודה",
-    "מעלות תרשיחא": "קו העימות",
-    "מענית, גבעת חביבה": "מנשה",
-    "מעש": "ירקון",
-    "מפלסים": "עוטף עזה",
-    "מצדה": "ים המלח",
-    "מצובה": "קו העימות",
-    "מצוקי דרגות": "ים המלח",
-    "מצליח": "השפלה",
-    "מצפה": "גליל תחתון",
-    "מצפה אבי''ב": "גליל תחתון",
-    "מצפה אילן": "ואדי ערה",
-    "מצפה דני": "שומרון",
-    'מצפה זי"ו': "יהודה",
-    "מצפה חגית": "יהודה",
-    "מצפה יאיר": "יהודה",
-    "מצפה יריחו": "יהודה",
-    "מצפה מדרג": "ים המלח",
-    "מצפה נטופה": "גליל תחתון",
-    "מצפה רמון": "דרום הנגב",
-    "מצפה שלם": "ים המלח",
-    "מצפור פצאל": "בקעה",
-    "מצר": "ואדי ערה",
-    "מקווה ישראל": "דן",
-    "מרגליות": "קו העימות",
-    "מרום גולן": "גולן",
-    "מרחב עם": "דרום הנגב",
-    "מרחביה מושב": "תבור",
-    "מרחביה קיבוץ": "תבור",
-    "מרחצאות עין גדי": "ים המלח",
-    "מרכז אזורי דרום השרון": "שרון",
-    "מרכז אזורי מבואות חרמון": "קו העימות",
-    "מרכז אזורי מגילות": "בקעה",
-    "מרכז אזורי מרום גליל": "גליל עליון",
-    "מרכז אזורי משגב": "גליל תחתון",
-    "מרכז אזורי רמת כורזים": "גליל עליון",
-    "מרכז חבר": "תבור",
-    "מרכז מיר''ב": "חוף הכרמל",
-    "מרכז שפירא": "לכיש",
-    "מרעית": "דרום הנגב",
-    "משאבי שדה": "דרום הנגב",
-    "משגב דב": "דרום השפלה",
-    "משגב עם": "קו העימות",
-    "משהד": "תבור",
-    "משואה": "בקעה",
-    "משואות יצחק": "לכיש",
-    "משכיות": "בקעה",
-    "משמר איילון": "השפלה",
-    "משמר דוד": "השפלה",
-    "משמר הירדן": "גליל עליון",
-    "משמר הנגב": "מרכז הנגב",
-    "משמר העמק": "מנשה",
-    "משמר השבעה": "השפלה",
-    "משמר השרון": "חפר",
-    "משמרות": "מנשה",
-    "משמרת": "חפר",
-    "משען": "מערב לכיש",
-    "מתחם בני דרום": "דרום השפלה",
-    "מתחם גלילות": "שרון",
-    "מתחם סקי גלבוע": "תבור",
-    "מתחם פי גלילות": "שרון",
-    "מתחם שביל התפוזים": "מנשה",
-    "מתן": "שרון",
-    "מתת": "קו העימות",
-    "מתתיהו": "שומרון",
-    "נאות גולן": "גולן",
-    "נאות הכיכר": "ים המלח",
-    "נאות מרדכי": "קו העימות",
-    "נאות סמדר": "ערבה",
-    "נאות קדומים": "השפלה",
-    "נאעורה": "תבור",
-    "נבטים": "מרכז הנגב",
-    "נבי שועייב": "גליל תחתון",
-    "נגבה": "לכיש",
-    "נגוהות": "יהודה",
-    "נהורה": "לכיש",
-    "נהלל": "תבור",
-    "נהריה": "קו העימות",
-    "נוב": "גולן",
-    "נוגה": "לכיש",
-    "נוה איתן": "בקעת בית שאן",
-    "נווה": "עוטף עזה",
-    "נווה אור": "בקעת בית שאן",
-    "נווה אטי''ב": "גולן",
-    "נווה אילן": "בית שמש",
-    "נווה ארז": "שומרון",
-    "נווה דניאל": "יהודה",
-    "נווה זוהר": "ים המלח",
-    "נווה זיו": "קו העימות",
-    "נווה חריף": "ערבה",
-    "נווה ים": "חוף הכרמל",
-    "נווה ימין": "שרון",
-    "נווה ירק": "שרון",
-    "נווה מבטח": "לכיש",
-    "נווה מיכאל - רוגלית": "בית שמש",
-    "נווה צוף": "שומרון",
-    "נווה שלום": "בית שמש",
-    "נועם": "לכיש",
-    "נוף איילון, שעלבים": "השפלה",
-    "נוף הגליל": "תבור",
-    "נופי נחמיה": "שומרון",
-    "נופי פרת": "יהודה",
-    "נופים": "שומרון",
-    "נופית": "קריות",
-    "נופך": "ירקון",
-    "נוקדים": "יהודה",
-    "נורדיה": "חפר",
-    "נורית": "תבור",
-    "נחושה": "בית שמש",
-    "נחל עוז": "עוטף עזה",
-    "נחלה": "לכיש",
-    "נחליאל": "שומרון",
-    "נחלים": "ירקון",
-    "נחם": "בית שמש",
-    "נחף": "גליל עליון",
-    "נחשון": "בית שמש",
-    "נחשונים": "ירקון",
-    "נטועה": "קו העימות",
-    "נטור": "גולן",
-    "נטע": "יהודה",
-    "נטעים": "השפלה",
-    "נטף": "בית שמש",
-    "נילי": "שומרון",
-    "נין": "תבור",
-    "ניצן": "מערב לכיש",
-    "ניצנה": "דרום הנגב",
-    "ניצני עוז": "חפר",
-    "ניצנים": "מערב לכיש",
-    "ניר אליהו": "שרון",
-    "ניר בנים": "לכיש",
-    "ניר גלים": "דרום השפלה",
-    "ניר דוד": "בקעת בית שאן",
-    "ניר ח''ן": "לכיש",
-    "ניר יצחק": "עוטף עזה",
-    "ניר ישראל": "מערב לכיש",
-    "ניר משה": "מערב הנגב",
-    "ניר עוז": "עוטף עזה",
-    "ניר עם": "עוטף עזה",
-    "ניר עציון, ימין אורד": "חוף הכרמל",
-    "ניר עקיבא": "מערב הנגב",
-    "ניר צבי": "השפלה",
-    "נירים": "עוטף עזה",
-    "נירית": "שרון",
-    "נמל קיסריה": "מנשה",
-    "נמרוד": "גולן",
-    "נס הרים": "בית שמש",
-    "נס עמים": "גליל עליון",
-    "נס ציונה": "השפלה",
-    "נעורים": "חפר",
-    "נעלה": "שומרון",
-    "נעמה": "בקעה",
-    "נען": "השפלה",
-    "נערן": "בקעה",
-    "נצר חזני": "דרום השפלה",
-    "נצר סרני": "השפלה",
-    "נצרת": "תבור",
-    "נריה": "שומרון",
-    "נשר": "חיפה",
-    "נתיב הגדוד": "בקעה",
-    "נתיב הל''ה": "בית שמש",
-    "נתיב העשרה": "עוטף עזה",
-    "נתיב השיירה": "גליל עליון",
-    "נתיבות": "עוטף עזה",
-    "נתניה - מזרח": "שרון",
-    "נתניה - מערב": "שרון",
-    "סאג'ור": "גליל עליון",
-    "סאסא": "קו העימות",
-    "סביון": "דן",
-    "סגולה": "לכיש",
-    "סואעד חמירה": "תבור",
-    "סולם": "תבור",
-    "סוסיא": "יהודה",
-    "סוסיא הקדומה": "יהודה",
-    "סופה": "עוטף עזה",
-    "סכנין": "גליל תחתון",
-    "סלמה": "גליל תחתון",
-    "סלעית": "שומרון",
-    "סמר": "ערבה",
-    "סנדלה": "תבור",
-    "סנסנה": "יהודה",
-    "סעד": "עוטף עזה",
-    "סעווה": "דרום הנגב",
-    "סער": "קו העימות",
-    "ספיר": "ערבה",
-    "ספסופה - כפר חושן": "גליל עליון",
-    "סתריה": "השפלה",
-    "ע'ג'ר": "קו העימות",
-    "עבדון": "קו העימות",
-    "עברון": "קו העימות",
-    "עגור": "בית שמש",
-    "עדי": "תבור",
-    "עדי עד": "בקעה",
-    "עדנים": "שרון",
-    "עוז וגאון": "יהודה",
-    "עוזה": "לכיש",
-    "עוזייר, רומאנה": "תבור",
-    "עולש": "חפר",
-    "עומר": "מרכז הנגב",
-    "עופר": "חוף הכרמל",
-    "עופרים": "שומרון",
-    "עוצם": "לכיש",
-    "עזוז": "דרום הנגב",
-    "עזר": "לכיש",
-    "עזריאל": "חפר",
-    "עזריה": "השפלה",
-    "עזריקם": "לכיש",
-    "עטרת": "שומרון",
-    "עידן": "ערבה",
-    "עיינות": "השפלה",
-    "עילבון": "גליל תחתון",
-    "עילוט": "תבור",
-    "עין איילה": "חוף הכרמל",
-    "עין אל אסד": "גליל עליון",
-    "עין אל סהלה": "ואדי ערה",
-    "עין בוקק": "ים המלח",
-    "עין גב": "קצרין",
-    "עין גדי": "ים המלח",
-    "עין דור": "תבור",
-    "עין הבשור": "עוטף עזה",
-    "עין הוד": "חוף הכרמל",
-    "עין החורש": "חפר",
-    "עין המפרץ": "גליל עליון",
-    "עין הנצי''ב": "בקעת בית שאן",
-    "עין העמק": "מנשה",
-    "עין השופט": "מנשה",
-    "עין השלושה": "עוטף עזה",
-    "עין ורד": "חפר",
-    "עין זיוון": "גולן",
-    "עין חוד": "חוף הכרמל",
-    "עין חצבה": "ערבה",
-    "עין חרוד, תל יוסף": "תבור",
-    "עין יהב": "ערבה",
-    "עין יעקב": "קו העימות",
-    "עין כרמל": "חוף הכרמל",
-    "עין מאהל": "תבור",
-    "עין נקובא": "בית שמש",
-    "עין עירון": "מנשה",
-    "עין צורים": "לכיש",
-    "עין קנייא": "גולן",
-    "עין ראפה": "בית שמש",
-    "עין שמר": "מנשה",
-    "עין שריד": "חפר",
-    "עין תמר": "ים המלח",
-    "עינות קדם": "בקעה",
-    "עינת": "ירקון",
-    "עכו": "גליל עליון",
-    "עכו - אזור תעשייה": "גליל עליון",
-    "עכו - רמות ים": "גליל עליון",
-    "עלומים": "עוטף עזה",
-    "עלי": "שומרון",
-    "עלי זהב - לשם": "שומרון",
-    "עלמה": "קו העימות",
-    "עלמון": "יהודה",
-    "עמוקה": "גליל עליון",
-    "עמיחי": "שומרון",
-    "עמינדב": "בית שמש",
-    "עמיעד": "גליל עליון",
-    "עמיקם": "מנשה",
-    "עמיר": "קו העימות",
-    "עמנואל": "שומרון",
-    "עמקה": "גליל עליון",
-    "ענב": "שומרון",
-    "עספיא": "יערות הכרמל",
-    "עפולה": "תבור",
-    "עפרה": "שומרון",
-    "עץ אפרים": "שומרון",
-    "עצמון - שגב": "גליל תחתון",
-    "עראבה": "גליל תחתון",
-    "ערב אל נעים": "גליל תחתון",
-    "ערב אל עראמשה": "קו העימות",
-    "ערד": "דרום הנגב",
-    "ערוגות": "לכיש",
-    "ערערה": "ואדי ערה",
-    "ערערה בנגב": "דרום הנגב",
-    "עשהאל": "יהודה",
-    "עשרת": "דרום השפלה",
-    "עתלית": "חוף הכרמל",
-    "עתניאל": "יהודה",
-    "פארן": "ערבה",
-    "פארק אריאל שרון": "דן",
-    "פארק תעשיות מגדל עוז": "יהודה",
-    "פארק תעשיות פלמחים": "השפלה",
-    "פארק תעשייה ראם": "לכיש",
-    "פדואל": "שומרון",
-    "פדויים": "מערב הנגב",
-    "פדיה": "השפלה",
-    "פוריה כפר עבודה": "גליל תחתון",
-    "פוריה נווה עובד": "גליל תחתון",
-    "פוריה עילית": "גליל תחתון",
-    "פוריידיס": "חוף הכרמל",
-    "פורת": "חפר",
-    "פטיש": "מערב הנגב",
-    "פלך": "גליל עליון",
-    "פלמחים": "השפלה",
-    "פני קדם": "יהודה",
-    "פנימיית עין כרם": "בית שמש",
-    "פסגות": "שומרון",
-    "פסוטה": "קו העימות",
-    "פעמי תש''ז": "מערב הנגב",
-    "פצאל": "בקעה",
-    "פקיעין": "קו העימות",
-    "פקיעין החדשה": "קו העימות",
-    "פרדס חנה כרכור": "מנשה",
-    "פרדסיה": "חפר",
-    "פרוד": "גליל עליון",
-    "פרי גן": "עוטף עזה",
-    "פתח תקווה": "ירקון",
-    "פתחיה": "השפלה",
-    "צאלים": "מערב הנגב",
-    "צבעון": "קו העימות",
-    "צובה": "בית שמש",
-    "צוחר, אוהד": "עוטף עזה",
-    "צומת אלמוג": "בקעה",
-    "צומת הגוש": "יהודה",
-    "צופים": "שומרון",
-    "צופית": "שרון",
-    "צופר": "ערבה",
-    "צוקים": "ערבה",
-    "צור הדסה": "בית שמש",
-    "צור יצחק": "חפר",
-    "צור משה": "חפר",
-    "צור נתן": "חפר",
-    "צוריאל": "קו העימות",
-    "צורית גילון": "גליל עליון",
-    "ציפורי": "תבור",
-    "צלפון": "בית שמש",
-    "צמח": "קצרין",
-    "צפריה": "השפלה",
-    "צפרירים": "בית שמש",
-    "צפת - נוף כנרת": "גליל עליון",
-    "צפת - עיר": "גליל עליון",
-    "צפת - עכברה": "גליל עליון",
-    "צרופה": "חוף הכרמל",
-    "צרעה": "בית שמש",
-    "קבוצת גבע": "תבור",
-    "קבוצת יבנה": "דרום השפלה",
-    "קדומים": "שומרון",
-    "קדימה צורן": "חפר",
-    "קדיתא": "גליל עליון",
-    "קדם ערבה": "בקעה",
-    "קדמה": "לכיש",
-    "קדמת צבי": "קצרין",
-    "קדר": "יהודה",
-    "קדר דרום": "יהודה",
-    "קדרון": "דרום השפלה",
-    "קדרים": "גליל עליון",
-    "קדש ברנע": "דרום הנגב",
-    "קוממיות": "לכיש",
-    "קורנית": "גליל תחתון",
-    "קטורה": "ערבה",
-    "קיבוץ דן": "קו העימות",
-    "קיבוץ מגידו": "מנשה",
-    "קידה": "בקעה",
-    "קיסריה": "מנשה",
-    "קלחים": "מערב הנגב",
-    "קליה": "בקעה",
-    "קלנסווה": "חפר",
-    "קלע אלון": "קצרין",
-    "קסר א-סר": "דרום הנגב",
-    "קציר": "ואדי ערה",
-    "קצרין": "קצרין",
-    "קצרין - אזור תעשייה": "קצרין",
-    "קריית אונו": "דן",
-    "קריית אתא": "קריות",
-    "קריית ביאליק": "קריות",
-    "קריית גת, כרמי גת": "לכיש",
-    "קריית חינוך מרחבים": "מערב הנגב",
-    "קריית טבעון - בית זייד": "קריות",
-    "קריית ים": "קריות",
-    "קריית יערים": "בית שמש",
-    "קריית מוצקין": "קריות",
-    "קריית מלאכי": "לכיש",
-    "קריית נטפים": "שומרון",
-    "קריית ענבים": "בית שמש",
-    "קריית עקרון": "דרום השפלה",
-    "קריית שמונה": "קו העימות",
-    "קרית ארבע": "יהודה",
-    "קרני שומרון": "שומרון",
-    "קשת": "גולן",
-    "ראמה": "גליל עליון",
-    "ראס אל-עין": "גליל תחתון",
-    "ראס עלי": "קריות",
-    "ראש הנקרה": "קו העימות",
-    "ראש העין": "ירקון",
-    "ראש פינה": "גליל עליון",
-    "ראש צורים": "יהודה",
-    "ראשון לציון - מזרח": "השפלה",
-    "ראשון לציון - מערב": "השפלה",
-    "רבבה": "שומרון",
-    "רבדים": "לכיש",
-    "רביבים": "דרום הנגב",
-    "רביד": "גליל תחתון",
-    "רגבה": "גליל עליון",
-    "רגבים": "מנשה",
-    "רהט": "מרכז הנגב",
-    "רווחה": "לכיש",
-    "רוויה": "בקעת בית שאן",
-    "רוחמה": "מערב הנגב",
-    "רומת אל הייב": "תבור",
-    "רועי": "בקעה",
-    "רותם": "בקעה",
-    "רחוב": "בקעת בית שאן",
-    "רחובות": "השפלה",
-    "רחלים": "שומרון",
-    "רטורנו - גבעת שמש": "בית שמש",
-    "ריחאנייה": "קו העימות",
-    "ריחן": "שומרון",
-    "ריינה": "תבור",
-    "רימונים": "שומרון",
-    "רינתיה": "ירקון",
-    "רכסים": "קריות",
-    "רם און": "תבור",
-    "רמות": "קצרין",
-    "רמות השבים": "שרון",
-    "רמות מאיר": "השפלה",
-    "רמות מנשה": "מנשה",
-    "רמות נפתלי": "קו העימות",
-    "רמלה": "השפלה",
-    "רמת גן - מזרח": "דן",
-    "רמת גן - מערב": "דן",
-    "רמת דוד": "תבור",
-    "רמת הכובש": "חפר",
-    "רמת השופט": "מנשה",
-    "רמת השרון": "שרון",
-    "רמת טראמפ": "קצרין",
-    "רמת יוחנן": "קריות",
-    "רמת ישי": "תבור",
-    "רמת מגרון": "שומרון",
-    "רמת מגשימים": "גולן",
-    "רמת צבי": "תבור",
-    "רמת רזיאל": "בית שמש",
-    "רנן": "מערב הנגב",
-    "רעים": "עוטף עזה",
-    "רעננה": "שרון",
-    "רקפת": "גליל תחתון",
-    "רשפון": "שרון",
-    "רשפים, שלוחות, שלפים": "בקעת בית שאן",
-    "רתמים": "דרום הנגב",
-    "שאנטי במדבר": "דרום הנגב",
-    "שאר ישוב": "קו העימות",
-    "שבות רחל": "שומרון",
-    "שבי דרום": "מערב הנגב",
-    "שבי ציון": "קו העימות",
-    "שבי שומרון": "שומרון",
-    "שגב שלום": "דרום הנגב",
-    "שדה אילן": "גליל תחתון",
-    "שדה אליהו": "בקעת בית שאן",
-    "שדה אליעזר": "גליל עליון",
-    "שדה אפרים": "שומרון",
-    "שדה בועז": "יהודה",
-    "שדה בוקר": "דרום הנגב",
-    "שדה בר": "יהודה",
-    "שדה דוד": "לכיש",
-    "שדה ורבורג": "שרון",
-    "שדה יואב": "לכיש",
-    "שדה יעקב": "תבור",
-    "שדה יצחק": "מנשה",
-    "שדה משה": "לכיש",
-    "שדה נחום": "בקעת בית שאן",
-    "שדה נחמיה": "קו העימות",
-    "שדה ניצן": "עוטף עזה",
-    "שדה עוזיהו": "לכיש",
-    "שדה צבי": "מערב הנגב",
-    "שדות ים": "מנשה",
-    "שדות מיכה": "בית שמש",
-    "שדי אברהם": "עוטף עזה",
-    "שדי חמד": "שרון",
-    "שדי תרומות": "בקעת בית שאן",
-    "שדמה": "דרום השפלה",
-    "שדמות דבורה": "גליל תחתון",
-    "שדמות מחולה": "בקעה",
-    "שדרות, איבים": "עוטף עזה",
-    "שואבה": "בית שמש",
-    "שובל": "מרכז הנגב",
-    "שוהם": "ירקון",
-    "שומרה": "קו העימות",
-    "שומריה": "מרכז הנגב",
-    "שוקדה": "עוטף עזה",
-    "שורש": "בית שמש",
-    "שורשים": "גליל תחתון",
-    "שושנת העמקים": "חפר",
-    "שזור": "גליל עליון",
-    "שחר": "לכיש",
-    "שחרות": "ערבה",
-    "שיבולים": "מערב הנגב",
-    "שיבלי אום אלג'נם": "תבור",
-    "שיטים": "ערבה",
-    "שייח' דנון": "גליל עליון",
-    "שילה": "שומרון",
-    "שילת": "השפלה",
-    "שכניה": "גליל תחתון",
-    "שלווה": "לכיש",
-    "שלומי": "קו העימות",
-    "שלומית": "עוטף עזה",
-    "שלומציון": "בקעה",
-    "שמיר": "קו העימות",
-    "שמעה": "יהודה",
-    "שמרת": "גליל עליון",
-    "שמשית": "תבור",
-    "שני ליבנה": "יהודה",
-    "שניר": "קו העימות",
-    "שעב": "גליל תחתון",
-    "שעל": "קצרין",
-    "שער אפרים": "חפר",
-    "שער הגולן": "קצרין",
-    "שער העמקים": "קריות",
-    "שער מנשה": "מנשה",
-    "שערי תקווה": "שומרון",
-    "שפיים": "שרון",
-    "שפיר": "לכיש",
-    "שפר": "גליל עליון",
-    "שפרעם": "גליל תחתון",
-    "שקד": "שומרון",
-    "שקף": "יהודה",
-    "שרונה": "גליל תחתון",
-    "שריגים - לי-און": "בית שמש",
-    "שריד": "תבור",
-    "שרשרת": "מערב הנגב",
-    "שתולה": "קו העימות",
-    "שתולים": "לכיש",
-    "תארבין": "מרכז הנגב",
-    "תאשור": "מערב הנגב",
-    "תדהר": "מערב הנגב",
-    "תובל": "גליל עליון",
-    "תומר": "בקעה",
-    "תחנת רכבת כפר ברוך": "תבור",
-    "תחנת רכבת כפר יהושוע": "מנשה",
-    "תחנת רכבת קריית מלאכי - יואב": "לכיש",
-    "תחנת רכבת ראש העין": "שרון",
-    "תימורים": "לכיש",
-    "תירוש": "בית שמש",
-    "תל אביב - דרום העיר ויפו": "דן",
-    "תל אביב - מזרח": "דן",
-    "תל אביב - מרכז העיר": "דן",
-    "תל אביב - עבר הירקון": "דן",
-    "תל חי": "קו העימות",
-    "תל יצחק": "שרון",
-    "תל מונד": "חפר",
-    "תל עדשים": "תבור",
-    "תל ערד": "דרום הנגב",
-    "תל ציון": "שומרון",
-    "תל קציר": "קצרין",
-    "תל שבע": "דרום הנגב",
-    "תל תאומים": "בקעת בית שאן",
-    "תלם": "יהודה",
-    "תלמי אליהו": "עוטף עזה",
-    "תלמי אלעזר": "מנשה",
-    "תלמי ביל''ו": "מערב הנגב",
-    "תלמי יוסף": "עוטף עזה",
-    "תלמי יחיאל": "לכיש",
-    "תלמי יפה": "מערב לכיש",
-    "תלמים": "לכיש",
-    "תמרת": "תבור",
-    "תנובות": "חפר",
-    "תעוז": "בית שמש",
-    "תעשיון צריפין": "השפלה",
-    "תפרח": "מערב הנגב",
-    "תקומה": "עוטף עזה",
-    "תקוע": "יהודה",
-    "תקוע ד' וה'": "יהודה",
-    "תרום": "בית שמש",
-}
+from .tables import load_table
+
+AREA_TO_DISTRICT: dict[str, str] = load_table("area_to_district")
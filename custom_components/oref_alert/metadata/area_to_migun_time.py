@@ -1,1469 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-AREA_TO_MIGUN_TIME: dict[str, int] = {
-    "אבו גוש": 90,
-    "אבו סנאן": 30,
-    "אבו קרינאת": 90,
-    "אבו תלול": 90,
-    "אבטליון": 60,
-    "אביאל": 90,
-    "אביבים": 0,
-    "אביגדור": 45,
-    "אביגיל": 90,
-    "אביחיל": 90,
-    "אביעזר": 90,
-    "אבירים": 0,
-    "אביתר": 90,
-    "אבן יהודה": 90,
-    "אבן מנחם": 0,
-    "אבן ספיר": 90,
-    "אבן שמואל": 30,
-    "אבני איתן": 0,
-    "אבני חפץ": 90,
-    "אבנת": 90,
-    "אבשלום": 15,
-    "אדורה": 90,
-    "אדורים": 90,
-    "אדמית": 0,
-    "אדרת": 90,
-    "אודים": 90,
-    "אודם": 0,
-    "אום אל פחם": 90,
-    "אום אל קוטוף": 90,
-    "אום בטין": 90,
-    "אופקים": 45,
-    "אור הגנוז": 30,
-    "אור הנר": 15,
-    "אור יהודה": 90,
-    "אור עקיבא": 90,
-    "אורה": 90,
-    "אורות": 45,
-    "אורטל": 0,
-    "אורים": 30,
-    "אורנים": 60,
-    "אורנית": 90,
-    "אושה": 60,
-    "אזור": 90,
-    "אזור תעשייה אלון התבור": 60,
-    "אזור תעשייה אפק ולב הארץ": 90,
-    "אזור תעשייה אריאל": 90,
-    "אזור תעשייה באר טוביה": 45,
-    "אזור תעשייה בני יהודה": 0,
-    "אזור תעשייה בר-לב": 60,
-    "אזור תעשייה בראון": 90,
-    "אזור תעשייה ברוש": 90,
-    "אזור תעשייה ברקן": 90,
-    "אזור תעשייה גדרה": 60,
-    "אזור תעשייה דימונה": 90,
-    "אזור תעשייה הדרומי אשקלון": 30,
-    "אזור תעשייה הר טוב - צרעה": 90,
-    "אזור תעשייה חבל מודיעין שוהם": 90,
-    "אזור תעשייה יקנעם עילית": 90,
-    "אזור תעשייה כנות": 60,
-    "אזור תעשייה כפר יונה": 90,
-    "אזור תעשייה כרמיאל": 30,
-    "אזור תעשייה מבוא כרמל": 90,
-    "אזור תעשייה מבואות הגלבוע": 60,
-    "אזור תעשייה מישור אדומים": 90,
-    "אזור תעשייה מיתרים": 90,
-    "אזור תעשייה נ.ע.מ": 30,
-    "אזור תעשייה ניר עציון": 60,
-    "אזור תעשייה נשר - רמלה": 90,
-    "אזור תעשייה עד הלום": 45,
-    "אזור תעשייה עידן הנגב": 45,
-    "אזור תעשייה עמק חפר": 90,
-    "אזור תעשייה צ.ח.ר": 30,
-    "אזור תעשייה ציפורית": 60,
-    "אזור תעשייה צפוני אשקלון": 30,
-    "אזור תעשייה קדמת גליל": 60,
-    "אזור תעשייה קיסריה": 90,
-    "אזור תעשייה קריית ביאליק": 60,
-    "אזור תעשייה קריית גת": 45,
-    "אזור תעשייה רבדים": 60,
-    "אזור תעשייה רותם": 90,
-    "אזור תעשייה רמת דלתון": 0,
-    "אזור תעשייה שחורת": 30,
-    "אזור תעשייה שחק": 90,
-    "אזור תעשייה שער בנימין": 90,
-    "אזור תעשייה שער נעמן": 60,
-    "אזור תעשייה תימורים": 45,
-    "אזור תעשייה תרדיון": 60,
-    "אחווה": 45,
-    "אחוזם": 30,
-    "אחוזת ברק": 60,
-    "אחיה": 90,
-    "אחיהוד": 60,
-    "אחיטוב": 90,
-    "אחיסמך": 90,
-    "אחיעזר": 90,
-    "איבטין": 60,
-    "איבי הנחל": 90,
-    "איזור תעשייה מילואות צפון": 0,
-    "אייל": 90,
-    "איילת השחר": 30,
-    "איירפורט סיטי": 90,
-    "אילון": 0,
-    "אילות": 30,
-    "אילניה": 60,
-    "אילת": 30,
-    "אירוס": 90,
-    "איתמר": 90,
-    "איתן": 30,
-    "אכסאל": 60,
-    "אל סייד": 90,
-    "אל עזי": 45,
-    "אל עמארני, אל מסק": 90,
-    "אל עריאן": 90,
-    "אל פורעה": 90,
-    "אל רום": 0,
-    "אלומה": 45,
-    "אלומות": 60,
-    "אלון": 90,
-    "אלון הגליל": 60,
-    "אלון מורה": 90,
-    "אלון שבות": 90,
-    "אלוני אבא": 60,
-    "אלוני הבשן": 0,
-    "אלוני יצחק": 90,
-    "אלונים": 60,
-    "אלי עד": 0,
-    "אליאב": 60,
-    "אליכין": 90,
-    "אליפז ומכרות תמנע": 90,
-    "אליפלט": 30,
-    "אליקים": 90,
-    "אלישיב": 90,
-    "אלישמע": 90,
-    "אלמגור": 30,
-    "אלמוג": 90,
-    "אלעד": 90,
-    "אלעזר": 90,
-    "אלפי מנשה": 90,
-    "אלקוש": 0,
-    "אלקנה": 90,
-    "אמונים": 45,
-    "אמירים": 30,
-    "אמנון": 30,
-    "אמץ": 90,
-    "אניעם": 15,
-    "אעבלין": 60,
-    "אעירה השחר": 90,
-    "אפיק": 0,
-    "אפיקים": 60,
-    "אפק": 60,
-    "אפקה": 90,
-    "אפרת": 90,
-    "ארבל": 60,
-    "ארגמן": 90,
-    "ארז": 15,
-    "אריאל": 90,
-    "ארסוף": 90,
-    "אש קודש": 90,
-    "אשבול": 30,
-    "אשבל": 60,
-    "אשדוד - א,ב,ד,ה": 45,
-    "אשדוד - איזור תעשייה צפוני": 45,
-    "אשדוד - ג,ו,ז": 45,
-    "אשדוד - ח,ט,י,יג,יד,טז": 45,
-    "אשדוד - כל האזורים": 45,
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי": 45,
-    "אשדות יעקב": 60,
-    "אשחר": 60,
-    "אשכולות": 60,
-    "אשל הנשיא": 45,
-    "אשלים": 90,
-    "אשקלון - דרום": 30,
-    "אשקלון - כל האזורים": 30,
-    "אשקלון - צפון": 30,
-    "אשרת": 30,
-    "אשתאול": 90,
-    "אשתמוע": 90,
-    "אתר דודאים": 45,
-    "אתר ההנצחה גולני": 60,
-    "באקה אל גרבייה": 90,
-    "באר אורה": 90,
-    "באר גנים": 30,
-    "באר טוביה": 45,
-    "באר יעקב": 90,
-    "באר מילכה": 60,
-    "באר שבע - דרום": 60,
-    "באר שבע - כל האזורים": 60,
-    "באר שבע - מזרח": 60,
-    "באר שבע - מערב": 60,
-    "באר שבע - צפון": 60,
-    "בארות יצחק": 90,
-    "בארותיים": 90,
-    "בארי": 15,
-    "בוסתן הגליל": 30,
-    "בועיינה-נוג'ידאת": 60,
-    "בוקעתא": 0,
-    "בורגתה": 90,
-    "בחלק מהאזורים בארץ": 0,
-    "בחן": 90,
-    "בטחה": 45,
-    'בי"ס כרמים בנימינה': 90,
-    "ביצרון": 60,
-    "ביר אלמכסור": 60,
-    "ביר הדאג'": 90,
-    "ביריה": 30,
-    "בית אורן": 60,
-    "בית אל": 90,
-    "בית אלעזרי": 60,
-    "בית אלפא וחפציבה": 60,
-    "בית אריה": 90,
-    "בית ברל": 90,
-    "בית ג'אן": 30,
-    "בית גוברין": 60,
-    "בית גמליאל": 60,
-    "בית דגן": 90,
-    "בית הברכה": 90,
-    "בית הגדי": 30,
-    "בית הלוי": 90,
-    "בית הלל": 0,
-    "בית העלמין החדש נהריה": 30,
-    "בית העלמין החדש עכו": 30,
-    "בית העמק": 30,
-    "בית הערבה": 90,
-    "בית השיטה": 60,
-    "בית זית": 90,
-    "בית זרע": 60,
-    'בית חג"י': 90,
-    "בית חגלה": 90,
-    "בית חורון": 90,
-    "בית חלקיה": 60,
-    "בית חנן": 90,
-    "בית חנניה": 90,
-    "בית חרות": 90,
-    "בית חשמונאי": 90,
-    "בית יהושע": 90,
-    "בית יוסף": 60,
-    "בית ינאי": 90,
-    "בית יצחק - שער חפר": 90,
-    "בית ירח": 60,
-    "בית יתיר": 90,
-    "בית לחם הגלילית": 60,
-    "בית מאיר": 90,
-    "בית נחמיה": 90,
-    "בית ניר": 60,
-    "בית נקופה": 90,
-    "בית סוהר צלמון": 60,
-    "בית סוהר קישון": 60,
-    "בית ספר שדה מירון": 0,
-    "בית עובד": 90,
-    "בית עוזיאל": 90,
-    "בית עזרא": 45,
-    "בית עלמין מורשה": 90,
-    "בית עלמין תל רגב": 60,
-    "בית עריף": 90,
-    "בית צבי": 60,
-    "בית קמה": 45,
-    "בית קשת": 60,
-    "בית רימון": 60,
-    "בית שאן": 60,
-    "בית שמש": 90,
-    "בית שערים": 60,
-    "בית שקמה": 30,
-    "ביתן אהרן": 90,
-    "ביתר עילית": 90,
-    "בלפוריה": 60,
-    "בן זכאי": 60,
-    "בן עמי": 0,
-    "בן שמן": 90,
-    "בני אדם": 90,
-    "בני ברק": 90,
-    "בני דקלים": 60,
-    "בני דרום": 45,
-    "בני דרור": 90,
-    "בני יהודה וגבעת יואב": 15,
-    "בני נצרים": 30,
-    "בני עטרות": 90,
-    "בני עי''ש": 60,
-    "בני ציון": 90,
-    "בני ראם": 60,
-    "בניה": 60,
-    "בנימינה": 90,
-    "בסמת טבעון": 60,
-    "בענה": 30,
-    "בצרה": 90,
-    "בצת": 0,
-    "בקוע": 90,
-    "בקעות": 90,
-    "בר גיורא": 90,
-    "בר יוחאי": 30,
-    "בר כוכבא": 90,
-    "ברוכין": 90,
-    "ברור חיל": 30,
-    "ברוש": 30,
-    "ברחבי הארץ": 0,
-    "ברטעה": 90,
-    "ברכיה": 30,
-    "ברעם": 0,
-    "ברקאי": 90,
-    "ברקן": 90,
-    "ברקת": 90,
-    "בת הדר": 30,
-    "בת חן": 90,
-    "בת חפר": 90,
-    "בת ים": 90,
-    "בת עין": 90,
-    "בת שלמה": 60,
-    "בתי מלון ים המלח": 90,
-    "בתרונות": 90,
-    "ג'דידה מכר": 30,
-    "ג'וליס": 30,
-    "ג'לג'וליה": 90,
-    "ג'סר א-זרקא": 90,
-    "ג'ש - גוש חלב": 0,
-    "ג'ת": 90,
-    "גאולי תימן": 90,
-    "גאולים": 90,
-    "גאליה": 60,
-    "גבולות": 30,
-    "גבים, מכללת ספיר": 15,
-    "גבע בנימין": 90,
-    "גבע כרמל": 60,
-    "גבעון החדשה": 90,
-    "גבעות": 90,
-    "גבעות בר": 45,
-    "גבעות עדן": 90,
-    "גבעת אבני": 60,
-    "גבעת אלה": 60,
-    "גבעת אסף": 90,
-    "גבעת ברנר": 90,
-    "גבעת הראל": 90,
-    "גבעת הרואה": 90,
-    "גבעת השלושה": 90,
-    "גבעת וולפסון": 60,
-    "גבעת וושינגטון": 60,
-    "גבעת זאב": 90,
-    "גבעת חיים איחוד": 90,
-    "גבעת חיים מאוחד": 90,
-    "גבעת חן": 90,
-    "גבעת יערים": 90,
-    "גבעת ישעיהו": 60,
-    "גבעת כ''ח": 90,
-    "גבעת ניל''י": 90,
-    "גבעת עדה": 90,
-    "גבעת עוז": 90,
-    "גבעת פורת יוסף": 90,
-    "גבעת שמואל": 90,
-    "גבעת שפירא": 90,
-    "גבעתי": 45,
-    "גבעתיים": 90,
-    "גברעם": 15,
-    "גבת": 60,
-    "גדות": 30,
-    "גדעונה": 60,
-    "גדרה": 60,
-    "גונן": 15,
-    "גופנה": 90,
-    "גורן": 0,
-    "גורנות הגליל": 0,
-    "גזית": 60,
-    "גזר": 90,
-    "גיאה": 30,
-    "גיבתון": 90,
-    "גיזו": 90,
-    "גילת": 45,
-    "גינוסר": 60,
-    "גינתון": 90,
-    "גיתה": 30,
-    "גיתית": 90,
-    "גלאון": 45,
-    "גלגל": 90,
-    "גלעד": 90,
-    "גמזו": 90,
-    "גן הדרום": 60,
-    "גן השומרון": 90,
-    "גן חיים": 90,
-    "גן יאשיה": 90,
-    "גן יבנה": 45,
-    "גן נר": 60,
-    "גן שורק": 90,
-    "גן שלמה": 90,
-    "גן שמואל": 90,
-    "גנות": 90,
-    "גנות הדר": 90,
-    "גני הדר": 90,
-    "גני חוגה": 60,
-    "גני טל": 60,
-    "גני יוחנן": 90,
-    "גני עם": 90,
-    "גני תקווה": 90,
-    "גניגר": 60,
-    "געש": 90,
-    "געתון": 15,
-    "גפן": 60,
-    "גרופית": 90,
-    "גשור": 15,
-    "גשר": 60,
-    "גשר הזיו": 0,
-    "גת": 45,
-    "גת רימון": 90,
-    "דבוריה": 60,
-    "דביר": 45,
-    "דברת": 60,
-    "דגניה א": 60,
-    "דגניה ב": 60,
-    "דוב''ב": 0,
-    "דולב": 90,
-    "דור, נחשולים": 60,
-    "דורות": 30,
-    "דורות עילית": 90,
-    "דחי": 60,
-    "דימונה": 90,
-    "דיר אל-אסד": 30,
-    "דיר חנא": 60,
-    "דישון": 0,
-    "דליה": 90,
-    "דלית אל כרמל": 60,
-    "דלתון": 0,
-    "דמיידה": 60,
-    "דפנה": 0,
-    "דקל": 15,
-    "האון": 30,
-    "הבונים": 60,
-    "הגבעה הצהובה": 90,
-    "הגושרים": 0,
-    "הדר עם": 90,
-    "הוד השרון": 90,
-    "הודיה": 30,
-    "הודיות": 60,
-    "הושעיה": 60,
-    "הזורעים": 60,
-    "החווה של אורי כהן": 90,
-    "החווה של זוהר": 90,
-    "החווה של יאיא": 90,
-    "החווה של מנחם": 90,
-    "החווה של עשהאל": 90,
-    "החותרים": 60,
-    "היוגב": 60,
-    "היישוב היהודי חברון": 90,
-    "הילה": 0,
-    "המעפיל": 90,
-    "המרכז האקדמי רופין": 90,
-    "הסוללים": 60,
-    "העוגן": 90,
-    "הר אדר": 90,
-    "הר ברכה": 90,
-    "הר גילה": 90,
-    "הר חלוץ": 30,
-    "הר עמשא": 90,
-    "הראל": 90,
-    "הרדוף": 60,
-    "הרצליה - כל האזורים": 90,
-    "הרצליה - מערב": 90,
-    "הרצליה - מרכז וגליל ים": 90,
-    "הררית יחד": 60,
-    "ואדי אל חמאם": 60,
-    "ואדי אל נעם דרום": 90,
-    "ורד יריחו": 90,
-    "ורדון": 45,
-    "זבדיאל": 45,
-    "זוהר": 30,
-    "זיקים": 15,
-    "זיתן": 90,
-    "זכרון יעקב": 90,
-    "זכריה": 60,
-    "זמר": 90,
-    "זמרת, שובה": 15,
-    "זנוח": 90,
-    "זרועה": 30,
-    "זרזיר": 60,
-    "זרחיה": 45,
-    "זרעית": 0,
-    "חבצלת השרון וצוקי ים": 90,
-    "חג'אג'רה": 60,
-    "חגור": 90,
-    "חגלה": 90,
-    "חד נס": 15,
-    "חדיד": 90,
-    "חדרה - כל האזורים": 90,
-    "חדרה - מזרח": 90,
-    "חדרה - מערב": 90,
-    "חדרה - מרכז": 90,
-    "חדרה - נווה חיים": 90,
-    "חוות אביה": 90,
-    "חוות אביחי": 90,
-    "חוות אל נווה": 90,
-    "חוות אלחי": 90,
-    "חוות ארץ האיילים": 90,
-    "חוות אשכולות": 60,
-    "חוות בניהו": 90,
-    "חוות גלעד": 90,
-    "חוות גנות": 90,
-    "חוות דרומא": 90,
-    "חוות הרועה העברי": 90,
-    "חוות הרשאש": 90,
-    "חוות חנינא": 90,
-    "חוות טואמין": 90,
-    "חוות טליה": 90,
-    "חוות יאיר": 90,
-    "חוות יד השומר": 90,
-    "חוות יויו": 90,
-    "חוות ינון": 90,
-    "חוות מגדלים": 90,
-    "חוות מגנזי": 90,
-    "חוות מדבר חבר": 90,
-    "חוות מור ואברהם": 90,
-    "חוות מלאכי אברהם": 90,
-    "חוות מלכיאל": 90,
-    "חוות מנחם": 90,
-    "חוות מעלה אהוביה": 90,
-    "חוות מקנה יהודה": 90,
-    "חוות מרום שמואל": 90,
-    "חוות נווה צוף": 90,
-    'חוות נוף אב"י': 90,
-    "חוות נחל שילה": 90,
-    "חוות נחלת אבות": 90,
-    "חוות נחלת צבי": 90,
-    "חוות עדן": 90,
-    "חוות עולם חסד": 90,
-    "חוות עמיאל": 90,
-    "חוות פריאל": 90,
-    "חוות צאן קדר": 90,
-    "חוות צרידה": 90,
-    "חוות קשואלה": 90,
-    "חוות ראש תאנה": 90,
-    "חוות שדה": 90,
-    "חוות שוביאל": 90,
-    "חוות שחרית": 90,
-    "חוות תלם צפון": 90,
-    "חולדה": 90,
-    "חולון": 90,
-    "חולית": 15,
-    "חולתה": 30,
-    "חומש": 90,
-    "חוסן": 15,
-    "חוסנייה": 60,
-    "חוף אכזיב": 0,
-    "חוף בצת": 0,
-    "חוף זיקים": 15,
-    "חוף קליה": 90,
-    "חופית": 90,
-    "חוקוק": 60,
-    "חורה": 90,
-    "חורפיש": 0,
-    "חורשים": 90,
-    "חזון": 60,
-    "חיבת ציון": 90,
-    "חיננית": 90,
-    "חיפה - בת גלים ק.אליעזר": 60,
-    "חיפה - כל האזורים": 60,
-    "חיפה - כרמל, הדר ועיר תחתית": 60,
-    "חיפה - מערב": 60,
-    "חיפה - מפרץ": 60,
-    "חיפה - נווה שאנן ורמות כרמל": 60,
-    "חיפה - קריית חיים ושמואל": 60,
-    "חירן": 90,
-    "חלץ": 30,
-    "חמד": 90,
-    "חמדיה": 60,
-    "חמדת": 90,
-    "חמדת ימים": 30,
-    "חמרה": 90,
-    "חמת גדר": 15,
-    "חניאל": 90,
-    "חניון רעים אנדרטת הנובה": 15,
-    "חניתה": 0,
-    "חנתון": 60,
-    "חספין": 0,
-    "חפץ חיים": 60,
-    "חצב": 60,
-    "חצבה": 90,
-    "חצור": 45,
-    "חצור הגלילית": 30,
-    "חצרים": 60,
-    "חרב לאת": 90,
-    "חרוצים": 90,
-    "חרות": 90,
-    "חריש": 90,
-    "חרמש": 90,
-    "חרמש דרום": 90,
-    "חרשה": 90,
-    "חרשים": 30,
-    "חשמונאים": 90,
-    "טבריה": 60,
-    "טובא זנגריה": 30,
-    "טורעאן": 60,
-    "טייבה": 90,
-    "טייבה בגלבוע": 60,
-    "טירה": 90,
-    "טירת יהודה": 90,
-    "טירת כרמל": 60,
-    "טירת צבי": 60,
-    "טל - אל": 30,
-    "טל מנשה": 90,
-    "טל שחר": 90,
-    "טללים": 90,
-    "טלמון": 90,
-    "טמרה": 60,
-    "טמרה בגלבוע": 60,
-    "טנא עומרים": 90,
-    "טפחות": 60,
-    "יבוא דודי": 90,
-    "יבול": 15,
-    "יבנאל": 60,
-    "יבנה": 60,
-    "יגור": 60,
-    "יגל": 90,
-    "יד בנימין": 60,
-    "יד השמונה": 90,
-    "יד חנה": 90,
-    "יד מרדכי": 15,
-    "יד נתן": 30,
-    "יד רמב''ם": 90,
-    "יהוד מונוסון": 90,
-    "יהל": 90,
-    "יובלים": 60,
-    "יודפת": 60,
-    "יונתן": 0,
-    "יושיביה": 15,
-    "יזרעאל": 60,
-    "יחיעם": 15,
-    "יטבתה": 90,
-    "ייט''ב": 90,
-    "יכיני": 15,
-    "ינוב": 90,
-    "ינוח ג'ת": 30,
-    "ינון": 60,
-    "יסוד המעלה": 30,
-    "יסודות": 90,
-    "יסעור": 60,
-    "יעבץ, יעף": 90,
-    "יעד": 60,
-    "יערה": 0,
-    "יפיע": 60,
-    "יפית": 90,
-    "יפעת": 60,
-    "יפתח": 0,
-    "יצהר": 90,
-    "יציץ": 90,
-    "יקום": 90,
-    "יקיר": 90,
-    "יקנעם המושבה והזורע": 90,
-    "יקנעם עילית": 90,
-    "יראון": 0,
-    "ירדנה": 60,
-    "ירוחם": 90,
-    "ירושלים - אזור תעשייה עטרות": 90,
-    "ירושלים - דרום": 90,
-    "ירושלים - כל האזורים": 90,
-    "ירושלים - כפר עקב": 90,
-    "ירושלים - מזרח": 90,
-    "ירושלים - מערב": 90,
-    "ירושלים - מרכז": 90,
-    "ירושלים - צפון": 90,
-    "ירחיב": 90,
-    "ירכא": 30,
-    "ירקונה": 90,
-    "ישובי אומן": 60,
-    "ישובי יעל": 60,
-    "ישעי": 90,
-    "ישרש": 90,
-    "יתד": 15,
-    "כאבול": 60,
-    "כאוכב אבו אלהיג'א": 60,
-    "כברי": 0,
-    "כדורי": 60,
-    "כוכב השחר": 90,
-    "כוכב יאיר - צור יגאל": 90,
-    "כוכב יעקב": 90,
-    "כוכב מיכאל": 30,
-    "כורזים ורד הגליל": 30,
-    "כחל": 60,
-    "כינרת מושבה": 60,
-    "כינרת קבוצה": 60,
-    "כיסופים": 15,
-    "כישור": 30,
-    "כל הארץ": 0,
-    "כליל": 30,
-    "כלנית": 60,
-    "כמהין": 60,
-    "כמון - כמאנה מזרחית": 30,
-    "כנות": 60,
-    "כנף": 15,
-    "כסייפה": 90,
-    "כסלון": 90,
-    "כסרא סמיע": 30,
-    "כעביה טבאש": 60,
-    "כפר אביב": 60,
-    "כפר אדומים": 90,
-    "כפר אוריה": 90,
-    "כפר אחים": 45,
-    "כפר אלדד": 90,
-    "כפר ביאליק": 60,
-    "כפר ביל''ו": 90,
-    "כפר בלום": 0,
-    "כפר בן נון": 90,
-    "כפר ברא": 90,
-    "כפר ברוך": 60,
-    "כפר גדעון": 60,
-    "כפר גלים": 60,
-    "כפר גליקסון": 90,
-    "כפר גלעדי": 0,
-    "כפר גמילה מלכישוע": 60,
-    "כפר דניאל": 90,
-    "כפר האורנים": 90,
-    "כפר החורש": 60,
-    "כפר המכבי": 60,
-    "כפר הנגיד": 60,
-    "כפר הנוער קריית יערים": 90,
-    "כפר הנוקדים": 90,
-    "כפר הנשיא": 30,
-    "כפר הס": 90,
-    "כפר הרא''ה": 90,
-    "כפר הרי''ף וצומת ראם": 60,
-    "כפר ויתקין": 90,
-    "כפר ורבורג": 45,
-    "כפר ורדים": 15,
-    "כפר זוהרים": 60,
-    "כפר זיתים": 60,
-    "כפר ח'וואלד": 60,
-    "כפר חב''ד": 90,
-    "כפר חיטים": 60,
-    "כפר חיים": 90,
-    "כפר חנניה": 60,
-    "כפר חסידים": 60,
-    "כפר חרוב": 15,
-    "כפר טרומן": 90,
-    "כפר יאסיף": 30,
-    "כפר ידידיה": 90,
-    "כפר יהושע": 60,
-    "כפר יובל": 0,
-    "כפר יונה": 90,
-    "כפר יחזקאל": 60,
-    "כפר כמא": 60,
-    "כפר כנא": 60,
-    "כפר מונש": 90,
-    "כפר מימון ותושיה": 15,
-    "כפר מל''ל": 90,
-    "כפר מנדא": 60,
-    "כפר מנחם": 60,
-    "כפר מסריק": 30,
-    "כפר מצר": 60,
-    "כפר מרדכי": 60,
-    "כפר נהר הירדן": 60,
-    "כפר נוער בן שמן": 90,
-    "כפר נטר": 90,
-    "כפר סאלד": 15,
-    "כפר סבא": 90,
-    "כפר סילבר": 30,
-    "כפר סירקין": 90,
-    "כפר עבודה": 90,
-    "כפר עזה": 15,
-    "כפר עציון": 90,
-    "כפר פינס": 90,
-    "כפר קאסם": 90,
-    "כפר קיש": 60,
-    "כפר קרע": 90,
-    "כפר רופין": 60,
-    "כפר רות": 90,
-    "כפר שמאי": 30,
-    "כפר שמואל": 90,
-    "כפר שמריהו": 90,
-    "כפר תבור": 60,
-    "כפר תפוח": 90,
-    "כפר תקווה": 60,
-    "כרכום": 30,
-    "כרם ביבנה": 60,
-    "כרם בן זמרה": 0,
-    "כרם מהר''ל": 60,
-    "כרם רעים": 90,
-    "כרם שלום": 15,
-    "כרמי יוסף": 90,
-    "כרמי צור": 90,
-    "כרמי קטיף ואמציה": 60,
-    "כרמיאל": 30,
-    "כרמיה": 15,
-    "כרמים": 90,
-    "כרמית": 60,
-    "כרמל": 90,
-    "לב החולה": 0,
-    "לבון": 30,
-    "לביא": 60,
-    "לבנים": 60,
-    "להב": 45,
-    "להבות הבשן": 15,
-    "להבות חביבה": 90,
-    "להבים": 45,
-    "לוד": 90,
-    "לוזית": 60,
-    "לוחמי הגטאות": 30,
-    "לוטם וחמדון": 60,
-    "לוטן": 90,
-    "לטרון": 90,
-    "לימן": 0,
-    "לכיש": 45,
-    "לפיד": 90,
-    "לפידות": 30,
-    "לקיה": 60,
-    "מאור": 90,
-    "מאיר שפיה": 60,
-    "מבוא ביתר": 90,
-    "מבוא דותן": 90,
-    "מבוא חורון": 90,
-    "מבוא חמה": 15,
-    "מבוא מודיעים": 90,
-    "מבואות יריחו": 90,
-    "מבועים": 30,
-    "מבטחים, עמיעוז, ישע": 15,
-    "מבקיעים": 30,
-    "מבשרת ציון": 90,
-    "מג'דל כרום": 30,
-    "מג'דל שמס": 0,
-    "מגדים": 60,
-    "מגדל": 60,
-    "מגדל העמק": 60,
-    "מגדל עוז": 90,
-    "מגדל תפן": 30,
-    "מגדלים": 90,
-    "מגל": 90,
-    "מגן": 15,
-    "מגן שאול": 60,
-    "מגרון": 90,
-    "מגשימים": 90,
-    "מדרך עוז": 90,
-    "מדרשת בן גוריון": 90,
-    "מודיעין - ישפרו סנטר": 90,
-    "מודיעין - ליגד סנטר": 90,
-    "מודיעין מכבים רעות": 90,
-    "מודיעין עילית": 90,
-    "מולדת": 60,
-    "מועאוויה": 90,
-    "מוצא עילית": 90,
-    "מוקיבלה": 60,
-    "מורן": 60,
-    "מורשת": 60,
-    "מזור": 90,
-    "מזכרת בתיה": 90,
-    "מזרע": 60,
-    "מזרעה": 30,
-    "מחולה": 90,
-    "מחניים": 30,
-    "מחסיה": 90,
-    "מטווח ניר עם": 15,
-    "מטולה": 0,
-    "מטע": 90,
-    "מי עמי": 90,
-    "מייסר": 90,
-    "מיני ישראל - נחשון": 90,
-    "מיצד": 90,
-    "מיצר": 0,
-    "מירב": 60,
-    "מירון": 30,
-    "מישר": 60,
-    "מיתר": 90,
-    "מכון וינגייט": 90,
-    "מכורה": 90,
-    "מכינת אלישע": 90,
-    "מכמורת": 90,
-    "מכמנים - כמאנה מערבית": 30,
-    "מלאכי השלום": 90,
-    "מלונות ים המלח מרכז": 90,
-    "מלכיה": 0,
-    "מנוחה": 45,
-    "מנוף": 60,
-    "מנות": 0,
-    "מנחמיה": 60,
-    "מנחת מחניים": 30,
-    "מנרה": 0,
-    "מנשית זבדה": 60,
-    "מסד": 60,
-    "מסדה": 30,
-    "מסוף אורנית": 90,
-    "מסילות": 60,
-    "מסילת ציון": 90,
-    "מסלול": 30,
-    "מסעדה": 0,
-    "מע'אר": 60,
-    "מעברות": 90,
-    "מעגלים, גבעולים, מלילות": 30,
-    "מעגן": 30,
-    "מעגן מיכאל": 90,
-    "מעוז חיים": 60,
-    "מעון": 90,
-    "מעון צופיה": 60,
-    "מעונה": 0,
-    "מעיין ברוך": 0,
-    "מעיין צבי": 90,
-    "מעיליא": 0,
-    "מעלה אדומים": 90,
-    "מעלה אפרים": 90,
-    "מעלה גלבוע": 60,
-    "מעלה גמלא": 15,
-    "מעלה החמישה": 90,
-    "מעלה חבר": 90,
-    "מעלה לבונה": 90,
-    "מעלה מכמש": 90,
-    "מעלה עירון": 90,
-    "מעלה עמוס": 90,
-    "מעלה צביה": 60,
-    "מעלה רחבעם": 90,
-    "מעלות תרשיחא": 0,
-    "מענית, גבעת חביבה": 90,
-    "מעש": 90,
-    "מפלסים": 15,
-    "מצדה": 90,
-    "מצובה": 0,
-    "מצוקי דרגות": 90,
-    "מצליח": 90,
-    "מצפה": 60,
-    "מצפה אבי''ב": 60,
-    "מצפה אילן": 90,
-    "מצפה דני": 90,
-    'מצפה זי"ו': 90,
-    "מצפה חגית": 90,
-    "מצפה יאיר": 90,
-    "מצפה יריחו": 90,
-    "מצפה מדרג": 90,
-    "מצפה נטופה": 60,
-    "מצפה רמון": 90,
-    "מצפה שלם": 90,
-    "מצפור פצאל": 90,
-    "מצר": 90,
-    "מקווה ישראל": 90,
-    "מרגליות": 0,
-    "מרום גולן": 0,
-    "מרחב עם": 90,
-    "מרחביה מושב": 60,
-    "מרחביה קיבוץ": 60,
-    "מרחצאות עין גדי": 90,
-    "מרכז אזורי דרום השרון": 90,
-    "מרכז אזורי מבואות חרמון": 0,
-    "מרכז אזורי מגילות": 90,
-    "מרכז אזורי מרום גליל": 30,
-    "מרכז אזורי משגב": 60,
-    "מרכז אזורי רמת כורזים": 30,
-    "מרכז חבר": 60,
-    "מרכז מיר''ב": 60,
-    "מרכז שפירא": 45,
-    "מרעית": 90,
-    "משאבי שדה": 90,
-    "משגב דב": 60,
-    "משגב עם": 0,
-    "משהד": 60,
-    "משואה": 90,
-    "משואות יצחק": 45,
-    "משכיות": 90,
-    "משמר איילון": 90,
-    "משמר דוד": 90,
-    "משמר הירדן": 30,
-    "משמר הנגב": 45,
-    "משמר העמק": 90,
-    "משמר השבעה": 90,
-    "משמר השרון": 90,
-    "משמרות": 90,
-    "משמרת": 90,
-    "משען": 30,
-    "מתחם בני דרום": 60,
-    "מתחם גלילות": 90,
-    "מתחם סקי גלבוע": 60,
-    "מתחם פי גלילות": 90,
-    "מתחם שביל התפוזים": 90,
-    "מתן": 90,
-    "מתת": 0,
-    "מתתיהו": 90,
-    "נאות גולן": 15,
-    "נאות הכיכר": 90,
-    "נאות מרדכי": 0,
-    "נאות סמדר": 90,
-    "נאות קדומים": 90,
-    "נאעורה": 60,
-    "נבטים": 90,
-    "נבי שועייב": 60,
-    "נגבה": 30,
-    "נגוהות": 60,
-    "נהורה": 30,
-    "נהלל": 60,
-    "נהריה": 15,
-    "נוב": 0,
-    "נוגה": 30,
-    "נוה איתן": 60,
-    "נווה": 30,
-    "נווה אור": 60,
-    "נווה אטי''ב": 0,
-    "נווה אילן": 90,
-    "נווה ארז": 90,
-    "נווה דניאל": 90,
-    "נווה זוהר": 90,
-    "נווה זיו": 0,
-    "נווה חריף": 90,
-    "נווה ים": 60,
-    "נווה ימין": 90,
-    "נווה ירק": 90,
-    "נווה מבטח": 60,
-    "נווה מיכאל - רוגלית": 90,
-    "נווה צוף": 90,
-    "נווה שלום": 90,
-    "נועם": 45,
-    "נוף איילון, שעלבים": 90,
-    "נוף הגליל": 60,
-    "נופי נחמיה": 90,
-    "נופי פרת": 90,
-    "נופים": 90,
-    "נופית": 60,
-    "נופך": 90,
-    "נוקדים": 90,
-    "נורדיה": 90,
-    "נורית": 60,
-    "נחושה": 60,
-    "נחל עוז": 15,
-    "נחלה": 45,
-    "נחליאל": 90,
-    "נחלים": 90,
-    "נחם": 90,
-    "נחף": 30,
-    "נחשון": 90,
-    "נחשונים": 90,
-    "נטועה": 0,
-    "נטור": 0,
-    "נטע": 60,
-    "נטעים": 90,
-    "נטף": 90,
-    "נילי": 90,
-    "נין": 60,
-    "ניצן": 45,
-    "ניצנה": 60,
-    "ניצני עוז": 90,
-    "ניצנים": 30,
-    "ניר אליהו": 90,
-    "ניר בנים": 45,
-    "ניר גלים": 45,
-    "ניר דוד": 60,
-    "ניר ח''ן": 30,
-    "ניר יצחק": 15,
-    "ניר ישראל": 30,
-    "ניר משה": 30,
-    "ניר עוז": 15,
-    "ניר עם": 15,
-    "ניר עציון, ימין אורד": 60,
-    "ניר עקיבא": 30,
-    "ניר צבי": 90,
-    "נירים": 15,
-    "נירית": 90,
-    "נמל קיסריה": 90,
-    "נמרוד": 0,
-    "נס הרים": 90,
-    "נס עמים": 30,
-    "נס ציונה": 90,
-    "נעורים": 90,
-    "נעלה": 90,
-    "נעמה": 90,
-    "נען": 90,
-    "נערן": 90,
-    "נצר חזני": 90,
-    "נצר סרני": 90,
-    "נצרת": 60,
-    "נריה": 90,
-    "נשר": 60,
-    "נתיב הגדוד": 90,
-    "נתיב הל''ה": 90,
-    "נתיב העשרה": 15,
-    "נתיב השיירה": 30,
-    "נתיבות": 30,
-    "נתניה - כל האזורים": 90,
-    "נתניה - מזרח": 90,
-    "נתניה - מערב": 90,
-    "סאג'ור": 30,
-    "סאסא": 0,
-    "סביון": 90,
-    "סגולה": 45,
-    "סואעד חמירה": 60,
-    "סולם": 60,
-    "סוסיא": 90,
-    "סוסיא הקדומה": 90,
-    "סופה": 15,
-    "סכנין": 60,
-    "סלמה": 60,
-    "סלעית": 90,
-    "סמר": 90,
-    "סנדלה": 60,
-    "סנסנה": 60,
-    "סעד": 15,
-    "סעווה": 90,
-    "סער": 0,
-    "ספיר": 90,
-    "ספסופה - כפר חושן": 30,
-    "סתריה": 90,
-    "ע'ג'ר": 0,
-    "עבדון": 0,
-    "עברון": 15,
-    "עגור": 60,
-    "עדי": 60,
-    "עדי עד": 90,
-    "עדנים": 90,
-    "עוז וגאון": 90,
-    "עוזה": 30,
-    "עוזייר, רומאנה": 60,
-    "עולש": 90,
-    "עומר": 60,
-    "עופר": 60,
-    "עופרים": 90,
-    "עוצם": 30,
-    "עזוז": 90,
-    "עזר": 45,
-    "עזריאל": 90,
-    "עזריה": 90,
-    "עזריקם": 45,
-    "עטרת": 90,
-    "עידן": 90,
-    "עיינות": 90,
-    "עילבון": 60,
-    "עילוט": 60,
-    "עין איילה": 60,
-    "עין אל אסד": 30,
-    "עין אל סהלה": 90,
-    "עין בוקק": 90,
-    "עין גב": 15,
-    "עין גדי": 90,
-    "עין דור": 60,
-    "עין הבשור": 15,
-    "עין הוד": 60,
-    "עין החורש": 90,
-    "עין המפרץ": 30,
-    "עין הנצי''ב": 60,
-    "עין העמק": 90,
-    "עין השופט": 90,
-    "עין השלושה": 15,
-    "עין ורד": 90,
-    "עין זיוון": 0,
-    "עין חוד": 60,
-    "עין חצבה": 90,
-    "עין חרוד, תל יוסף": 60,
-    "עין יהב": 90,
-    "עין יעקב": 15,
-    "עין כרמל": 60,
-    "עין מאהל": 60,
-    "עין נקובא": 90,
-    "עין עירון": 90,
-    "עין צורים": 45,
-    "עין קנייא": 0,
-    "עין ראפה": 90,
-    "עין שמר": 90,
-    "עין שריד": 90,
-    "עין תמר": 90,
-    "עינות קדם": 90,
-    "עינת": 90,
-    "עכו": 30,
-    "עכו - אזור תעשייה": 30,
-    "עכו - כל האזורים": 30,
-    "עכו - רמות ים": 30,
-    "עלומים": 15,
-    "עלי": 90,
-    "עלי זהב - לשם": 90,
-    "עלמה": 0,
-    "עלמון": 90,
-    "עמוקה": 30,
-    "עמיחי": 90,
-    "עמינדב": 90,
-    "עמיעד": 30,
-    "עמיקם": 90,
-    "עמיר": 15,
-    "עמנואל": 90,
-    "עמקה": 30,
-    "ענב": 90,
-    "עספיא": 60,
-    "עפולה": 60,
-    "עפרה": 90,
-    "עץ אפרים": 90,
-    "עצמון - שגב": 60,
-    "עראבה": 60,
-    "ערב אל נעים": 30,
-    "ערב אל עראמשה": 0,
-    "ערד": 90,
-    "ערוגות": 45,
-    "ערערה": 90,
-    "ערערה בנגב": 90,
-    "עשהאל": 90,
-    "עשרת": 60,
-    "עתלית": 60,
-    "עתניאל": 90,
-    "פארן": 90,
-    "פארק אריאל שרון": 90,
-    "פארק תעשיות מגדל עוז": 90,
-    "פארק תעשיות פלמחים": 90,
-    "פארק תעשייה ראם": 60,
-    "פדואל": 90,
-    "פדויים": 45,
-    "פדיה": 90,
-    "פוריה כפר עבודה": 60,
-    "פוריה נווה עובד": 60,
-    "פוריה עילית": 60,
-    "פוריידיס": 60,
-    "פורת": 90,
-    "פטיש": 30,
-    "פלך": 30,
-    "פלמחים": 90,
-    "פני קדם": 90,
-    "פנימיית עין כרם": 90,
-    "פסגות": 90,
-    "פסוטה": 0,
-    "פעמי תש''ז": 30,
-    "פצאל": 90,
-    "פקיעין": 15,
-    "פקיעין החדשה": 15,
-    "פרדס חנה כרכור": 90,
-    "פרדסיה": 90,
-    "פרוד": 30,
-    "פרי גן": 15,
-    "פתח תקווה": 90,
-    "פתחיה": 90,
-    "צאלים": 30,
-    "צבעון": 0,
-    "צובה": 90,
-    "צוחר, אוהד": 15,
-    "צומת אלמוג": 90,
-    "צומת הגוש": 90,
-    "צופים": 90,
-    "צופית": 90,
-    "צופר": 90,
-    "צוקים": 90,
-    "צור הדסה": 90,
-    "צור יצחק": 90,
-    "צור משה": 90,
-    "צור נתן": 90,
-    "צוריאל": 0,
-    "צורית גילון": 30,
-    "ציפורי": 60,
-    "צלפון": 90,
-    "צמח": 30,
-    "צפריה": 90,
-    "צפרירים": 60,
-    "צפת - כל האזורים": 30,
-    "צפת - נוף כנרת": 30,
-    "צפת - עיר": 30,
-    "צפת - עכברה": 30,
-    "צרופה": 60,
-    "צרעה": 90,
-    "קבוצת גבע": 60,
-    "קבוצת יבנה": 60,
-    "קדומים": 90,
-    "קדימה צורן": 90,
-    "קדיתא": 30,
-    "קדם ערבה": 90,
-    "קדמה": 45,
-    "קדמת צבי": 15,
-    "קדר": 90,
-    "קדר דרום": 90,
-    "קדרון": 60,
-    "קדרים": 60,
-    "קדש ברנע": 60,
-    "קוממיות": 45,
-    "קורנית": 60,
-    "קטורה": 90,
-    "קיבוץ דן": 0,
-    "קיבוץ מגידו": 90,
-    "קידה": 90,
-    "קיסריה": 90,
-    "קלחים": 30,
-    "קליה": 90,
-    "קלנסווה": 90,
-    "קלע אלון": 15,
-    "קסר א-סר": 90,
-    "קציר": 90,
-    "קצרין": 30,
-    "קצרין - אזור תעשייה": 30,
-    "קריית אונו": 90,
-    "קריית אתא": 60,
-    "קריית ביאליק": 60,
-    "קריית גת, כרמי גת": 45,
-    "קריית חינוך מרחבים": 45,
-    "קריית טבעון - בית זייד": 60,
-    "קריית ים": 60,
-    "קריית יערים": 90,
-    "קריית מוצקין": 60,
-    "קריית מלאכי": 45,
-    "קריית נטפים": 90,
-    "קריית ענבים": 90,
-    "קריית עקרון": 90,
-    "קריית שמונה": 0,
-    "קרית ארבע": 90,
-    "קרני שומרון": 90,
-    "קשת": 0,
-    "ראמה": 30,
-    "ראס אל-עין": 60,
-    "ראס עלי": 60,
-    "ראש הנקרה": 0,
-    "ראש העין": 90,
-    "ראש פינה": 30,
-    "ראש צורים": 90,
-    "ראשון לציון - כל האזורים": 90,
-    "ראשון לציון - מזרח": 90,
-    "ראשון לציון - מערב": 90,
-    "רבבה": 90,
-    "רבדים": 60,
-    "רביבים": 90,
-    "רביד": 60,
-    "רגבה": 30,
-    "רגבים": 90,
-    "רהט": 45,
-    "רווחה": 45,
-    "רוויה": 60,
-    "רוחמה": 30,
-    "רומת אל הייב": 60,
-    "רועי": 90,
-    "רותם": 90,
-    "רחוב": 60,
-    "רחובות": 90,
-    "רחלים": 90,
-    "רטורנו - גבעת שמש": 90,
-    "ריחאנייה": 0,
-    "ריחן": 90,
-    "ריינה": 60,
-    "רימונים": 90,
-    "רינתיה": 90,
-    "רכסים": 60,
-    "רם און": 60,
-    "רמות": 15,
-    "רמות השבים": 90,
-    "רמות מאיר": 90,
-    "רמות מנשה": 90,
-    "רמות נפתלי": 0,
-    "רמלה": 90,
-    "רמת גן - כל האזורים": 90,
-    "רמת גן - מזרח": 90,
-    "רמת גן - מערב": 90,
-    "רמת דוד": 60,
-    "רמת הכובש": 90,
-    "רמת השופט": 90,
-    "רמת השרון": 90,
-    "רמת טראמפ": 15,
-    "רמת יוחנן": 60,
-    "רמת ישי": 60,
-    "רמת מגרון": 90,
-    "רמת מגשימים": 0,
-    "רמת צבי": 60,
-    "רמת רזיאל": 90,
-    "רנן": 30,
-    "רעים": 15,
-    "רעננה": 90,
-    "רקפת": 60,
-    "רשפון": 90,
-    "רשפים, שלוחות, שלפים": 60,
-    "רתמים": 90,
-    "שאנטי במדבר": 90,
-    "שאר ישוב": 0,
-    "שבות רחל": 90,
-    "שבי דרום": 30,
-    "שבי ציון": 30,
-    "שבי שומרון": 90,
-    "שגב שלום": 90,
-    "שדה אילן": 60,
-    "שדה אליהו": 60,
-    "שדה אליעזר": 30,
-    "שדה אפרים": 90,
-    "שדה בועז": 90,
-    "שדה בוקר": 90,
-    "שדה בר": 90,
-    "שדה דוד": 30,
-    "שדה ורבורג": 90,
-    "שדה יואב": 30,
-    "שדה יעקב": 60,
-    "שדה יצחק": 90,
-    "שדה משה": 45,
-    "שדה נחום": 60,
-    "שדה נחמיה": 0,
-    "שדה ניצן": 15,
-    "שדה עוזיהו": 45,
-    "שדה צבי": 30,
-    "שדות ים": 90,
-    "שדות מיכה": 60,
-    "שדי אברהם": 15,
-    "שדי חמד": 90,
-    "שדי תרומות": 60,
-    "שדמה": 60,
-    "שדמות דבורה": 60,
-    "שדמות מחולה": 90,
-    "שדרות, איבים": 15,
-    "שואבה": 90,
-    "שובל": 45,
-    "שוהם": 90,
-    "שומרה": 0,
-    "שומריה": 60,
-    "שוקדה": 15,
-    "שורש": 90,
-    "שורשים": 60,
-    "שושנת העמקים": 90,
-    "שזור": 30,
-    "שחר": 30,
-    "שחרות": 90,
-    "שיבולים": 30,
-    "שיבלי אום אלג'נם": 60,
-    "שיטים": 90,
-    "שייח' דנון": 30,
-    "שילה": 90,
-    "שילת": 90,
-    "שכניה": 60,
-    "שלווה": 30,
-    "שלומי": 0,
-    "שלומית": 30,
-    "שלומציון": 90,
-    "שמיר": 15,
-    "שמעה": 90,
-    "שמרת": 30,
-    "שמשית": 60,
-    "שני ליבנה": 90,
-    "שניר": 0,
-    "שעב": 60,
-    "שעל": 15,
-    "שער אפרים": 90,
-    "שער הגולן": 30,
-    "שער העמקים": 60,
-    "שער מנשה": 90,
-    "שערי תקווה": 90,
-    "שפיים": 90,
-    "שפיר": 45,
-    "שפר": 30,
-    "שפרעם": 60,
-    "שקד": 90,
-    "שקף": 60,
-    "שרונה": 60,
-    "שריגים - לי-און": 60,
-    "שריד": 60,
-    "שרשרת": 30,
-    "שתולה": 0,
-    "שתולים": 45,
-    "תארבין": 45,
-    "תאשור": 30,
-    "תדהר": 30,
-    "תובל": 30,
-    "תומר": 90,
-    "תחנת רכבת כפר ברוך": 60,
-    "תחנת רכבת כפר יהושוע": 60,
-    "תחנת רכבת קריית מלאכי - יואב": 60,
-    "תחנת רכבת ראש העין": 90,
-    "תימורים": 45,
-    "תירוש": 60,
-    "תל אביב - דרום העיר ויפו": 90,
-    "תל אביב - כל האזורים": 90,
-    "תל אביב - מזרח": 90,
-    "תל אביב - מרכז העיר": 90,
-    "תל אביב - עבר הירקון": 90,
-    "תל חי": 0,
-    "תל יצחק": 90,
-    "תל מונד": 90,
-    "תל עדשים": 60,
-    "תל ערד": 90,
-    "תל ציון": 90,
-    "תל קציר": 30,
-    "תל שבע": 90,
-    "תל תאומים": 60,
-    "תלם": 90,
-    "תלמי אליהו": 15,
-    "תלמי אלעזר": 90,
-    "תלמי ביל''ו": 30,
-    "תלמי יוסף": 15,
-    "תלמי יחיאל": 45,
-    "תלמי יפה": 30,
-    "תלמים": 30,
-    "תמרת": 60,
-    "תנובות": 90,
-    "תעוז": 90,
-    "תעשיון צריפין": 90,
-    "תפרח": 45,
-    "תקומה": 15,
-    "תקוע": 90,
-    "תקוע ד' וה'": 90,
-    "תרום": 90,
-}
+from .tables import load_table
+
+AREA_TO_MIGUN_TIME: dict[str, int] = load_table("area_to_migun_time")
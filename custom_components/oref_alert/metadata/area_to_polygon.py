@@ -1,39 +1,85 @@
-"""Helper for loading area to polygon map."""
+"""Helper for loading area to polygon map.
 
-import json
-import zipfile
-from io import BytesIO
+The map is stored as a zlib-compressed binary table (little-endian):
+header ("OAP1", number of areas, number of points), the offset of each area's
+first point (uint32, plus the total), the points (float64 lat/lon pairs) and
+the area names (UTF-8, separated by new lines).
+"""
+
+import asyncio
+import struct
+import zlib
+from collections.abc import Sequence
 from pathlib import Path
 
-import aiofiles
-from shapely.geometry import Point, Polygon
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import Point
+
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"OAP1"
+
+_areas: list[str] = []
+_tree: STRtree | None = None
+_lock = asyncio.Lock()
+
 
-_area_to_polygon: dict[str, list[tuple[float, float]]] = {}
+def _load() -> tuple[list[str], STRtree]:
+    """Decode the binary table and build the spatial index (blocking)."""
+    data = zlib.decompress(Path(__file__).with_suffix(".bin").read_bytes())
+    magic, areas_count, points_count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        msg = f"Unknown area to polygon format: {magic!r}"
+        raise ValueError(msg)
+    position = _HEADER.size
+    offsets = np.frombuffer(data, "<u4", areas_count + 1, position)
+    position += offsets.nbytes
+    points = np.frombuffer(data, "<f8", points_count * 2, position).reshape(-1, 2)
+    position += points.nbytes
+    areas = data[position:].decode("utf-8").split("\n")
+    polygons = shapely.polygons(
+        shapely.linearrings(
+            points, indices=np.repeat(np.arange(areas_count), np.diff(offsets))
+        )
+    )
+    shapely.prepare(polygons)
+    return areas, STRtree(polygons)
 
 
 async def init_area_to_polygon() -> None:
-    """Unzip and load the area to polygon map."""
-    global _area_to_polygon  # noqa: PLW0603
-    if _area_to_polygon:
-        return
-    async with aiofiles.open(
-        Path(__file__).with_suffix(".json.zip"), mode="rb"
-    ) as zip_file_raw:
-        zip_raw = await zip_file_raw.read()
-    with (
-        zipfile.ZipFile(BytesIO(zip_raw)) as zip_file,
-        zip_file.open(f"{Path(__file__).stem}.json") as json_file,
-    ):
-        _area_to_polygon = json.load(json_file)
+    """Load the area to polygon map."""
+    global _areas, _tree  # noqa: PLW0603
+    async with _lock:
+        if _tree is not None:
+            return
+        _areas, _tree = await asyncio.get_running_loop().run_in_executor(None, _load)
 
 
 def find_area(lat: float, lon: float) -> str | None:
     """Find an area using lat/lon."""
-    point = Point(lat, lon)
-    for area, polygon in _area_to_polygon.items():
-        if Polygon(polygon).contains(point):
-            return area
-    return None
+    if _tree is None:
+        return None
+    # The 1st area (in the map's order) wins when polygons overlap.
+    indices = _tree.query(Point(lat, lon), predicate="within")
+    return _areas[indices.min()] if len(indices) else None
+
+
+def find_areas(points: Sequence[tuple[float, float]]) -> list[str | None]:
+    """Find the areas of multiple lat/lon points in a single query."""
+    areas: list[str | None] = [None] * len(points)
+    if _tree is None or not points:
+        return areas
+    matches: dict[int, int] = {}
+    for point, area in zip(
+        *_tree.query(shapely.points(points), predicate="within").tolist(),
+        strict=True,
+    ):
+        if point not in matches or area < matches[point]:
+            matches[point] = area
+    for point, area in matches.items():
+        areas[point] = _areas[area]
+    return areas
 
 
 async def async_find_area(lat: float, lon: float) -> str | None:
@@ -1,1502 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-AREAS_AND_GROUPS: list[str] = [
-    "אבו גוש",
-    "אבו סנאן",
-    "אבו קרינאת",
-    "אבו תלול",
-    "אבטליון",
-    "אביאל",
-    "אביבים",
-    "אביגדור",
-    "אביגיל",
-    "אביחיל",
-    "אביעזר",
-    "אבירים",
-    "אביתר",
-    "אבן יהודה",
-    "אבן מנחם",
-    "אבן ספיר",
-    "אבן שמואל",
-    "אבני איתן",
-    "אבני חפץ",
-    "אבנת",
-    "אבשלום",
-    "אדורה",
-    "אדורים",
-    "אדמית",
-    "אדרת",
-    "אודים",
-    "אודם",
-    "אום אל פחם",
-    "אום אל קוטוף",
-    "אום בטין",
-    "אופקים",
-    "אור הגנוז",
-    "אור הנר",
-    "אור יהודה",
-    "אור עקיבא",
-    "אורה",
-    "אורות",
-    "אורטל",
-    "אורים",
-    "אורנים",
-    "אורנית",
-    "אושה",
-    "אזור",
-    "אזור תעשייה אלון התבור",
-    "אזור תעשייה אפק ולב הארץ",
-    "אזור תעשייה אריאל",
-    "אזור תעשייה באר טוביה",
-    "אזור תעשייה בני יהודה",
-    "אזור תעשייה בר-לב",
-    "אזור תעשייה בראון",
-    "אזור תעשייה ברוש",
-    "אזור תעשייה ברקן",
-    "אזור תעשייה גדרה",
-    "אזור תעשייה דימונה",
-    "אזור תעשייה הדרומי אשקלון",
-    "אזור תעשייה הר טוב - צרעה",
-    "אזור תעשייה חבל מודיעין שוהם",
-    "אזור תעשייה יקנעם עילית",
-    "אזור תעשייה כנות",
-    "אזור תעשייה כפר יונה",
-    "אזור תעשייה כרמיאל",
-    "אזור תעשייה מבוא כרמל",
-    "אזור תעשייה מבואות הגלבוע",
-    "אזור תעשייה מישור אדומים",
-    "אזור תעשייה מיתרים",
-    "אזור תעשייה נ.ע.מ",
-    "אזור תעשייה ניר עציון",
-    "אזור תעשייה נשר - רמלה",
-    "אזור תעשייה עד הלום",
-    "אזור תעשייה עידן הנגב",
-    "אזור תעשייה עמק חפר",
-    "אזור תעשייה צ.ח.ר",
-    "אזור תעשייה ציפורית",
-    "אזור תעשייה צפוני אשקלון",
-    "אזור תעשייה קדמת גליל",
-    "אזור תעשייה קיסריה",
-    "אזור תעשייה קריית ביאליק",
-    "אזור תעשייה קריית גת",
-    "אזור תעשייה רבדים",
-    "אזור תעשייה רותם",
-    "אזור תעשייה רמת דלתון",
-    "אזור תעשייה שחורת",
-    "אזור תעשייה שחק",
-    "אזור תעשייה שער בנימין",
-    "אזור תעשייה שער נעמן",
-    "אזור תעשייה תימורים",
-    "אזור תעשייה תרדיון",
-    "אחווה",
-    "אחוזם",
-    "אחוזת ברק",
-    "אחיה",
-    "אחיהוד",
-    "אחיטוב",
-    "אחיסמך",
-    "אחיעזר",
-    "איבטין",
-    "איבי הנחל",
-    "איזור תעשייה מילואות צפון",
-    "אייל",
-    "איילת השחר",
-    "איירפורט סיטי",
-    "אילון",
-    "אילות",
-    "אילניה",
-    "אילת",
-    "אירוס",
-    "איתמר",
-    "איתן",
-    "אכסאל",
-    "אל סייד",
-    "אל עזי",
-    "אל עמארני, אל מסק",
-    "אל עריאן",
-    "אל פורעה",
-    "אל רום",
-    "אלומה",
-    "אלומות",
-    "אלון",
-    "אלון הגליל",
-    "אלון מורה",
-    "אלון שבות",
-    "אלוני אבא",
-    "אלוני הבשן",
-    "אלוני יצחק",
-    "אלונים",
-    "אלי עד",
-    "אליאב",
-    "אליכין",
-    "אליפז ומכרות תמנע",
-    "אליפלט",
-    "אליקים",
-    "אלישיב",
-    "אלישמע",
-    "אלמגור",
-    "אלמוג",
-    "אלעד",
-    "אלעזר",
-    "אלפי מנשה",
-    "אלקוש",
-    "אלקנה",
-    "אמונים",
-    "אמירים",
-    "אמנון",
-    "אמץ",
-    "אניעם",
-    "אעבלין",
-    "אעירה השחר",
-    "אפיק",
-    "אפיקים",
-    "אפק",
-    "אפקה",
-    "אפרת",
-    "ארבל",
-    "ארגמן",
-    "ארז",
-    "אריאל",
-    "ארסוף",
-    "אש קודש",
-    "אשבול",
-    "אשבל",
-    "אשדוד - א,ב,ד,ה",
-    "אשדוד - איזור תעשייה צפוני",
-    "אשדוד - ג,ו,ז",
-    "אשדוד - ח,ט,י,יג,יד,טז",
-    "אשדוד - כל האזורים",
-    "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
-    "אשדות יעקב",
-    "אשחר",
-    "אשכולות",
-    "אשל הנשיא",
-    "אשלים",
-    "אשקלון - דרום",
-    "אשקלון - כל האזורים",
-    "אשקלון - צפון",
-    "אשרת",
-    "אשתאול",
-    "אשתמוע",
-    "אתר דודאים",
-    "אתר ההנצחה גולני",
-    "באקה אל גרבייה",
-    "באר אורה",
-    "באר גנים",
-    "באר טוביה",
-    "באר יעקב",
-    "באר מילכה",
-    "באר שבע - דרום",
-    "באר שבע - כל האזורים",
-    "באר שבע - מזרח",
-    "באר שבע - מערב",
-    "באר שבע - צפון",
-    "בארות יצחק",
-    "בארותיים",
-    "בארי",
-    "בוסתן הגליל",
-    "בועיינה-נוג'ידאת",
-    "בוקעתא",
-    "בורגתה",
-    "בחלק מהאזורים בארץ",
-    "בחן",
-    "בטחה",
-    'בי"ס כרמים בנימינה',
-    "ביצרון",
-    "ביר אלמכסור",
-    "ביר הדאג'",
-    "ביריה",
-    "בית אורן",
-    "בית אל",
-    "בית אלעזרי",
-    "בית אלפא וחפציבה",
-    "בית אריה",
-    "בית ברל",
-    "בית ג'אן",
-    "בית גוברין",
-    "בית גמליאל",
-    "בית דגן",
-    "בית הברכה",
-    "בית הגדי",
-    "בית הלוי",
-    "בית הלל",
-    "בית העלמין החדש נהריה",
-    "בית העלמין החדש עכו",
-    "בית העמק",
-    "בית הערבה",
-    "בית השיטה",
-    "בית זית",
-    "בית זרע",
-    'בית חג"י',
-    "בית חגלה",
-    "בית חורון",
-    "בית חלקיה",
-    "בית חנן",
-    "בית חנניה",
-    "בית חרות",
-    "בית חשמונאי",
-    "בית יהושע",
-    "בית יוסף",
-    "בית ינאי",
-    "בית יצחק - שער חפר",
-    "בית ירח",
-    "בית יתיר",
-    "בית לחם הגלילית",
-    "בית מאיר",
-    "בית נחמיה",
-    "בית ניר",
-    "בית נקופה",
-    "בית סוהר צלמון",
-    "בית סוהר קישון",
-    "בית ספר שדה מירון",
-    "בית עובד",
-    "בית עוזיאל",
-    "בית עזרא",
-    "בית עלמין מורשה",
-    "בית עלמין תל רגב",
-    "בית עריף",
-    "בית צבי",
-    "בית קמה",
-    "בית קשת",
-    "בית רימון",
-    "בית שאן",
-    "בית שמש",
-    "בית שערים",
-    "בית שקמה",
-    "ביתן אהרן",
-    "ביתר עילית",
-    "בלפוריה",
-    "בן זכאי",
-    "בן עמי",
-    "בן שמן",
-    "בני אדם",
-    "בני ברק",
-    "בני דקלים",
-    "בני דרום",
-    "בני דרור",
-    "בני יהודה וגבעת יואב",
-    "בני נצרים",
-    "בני עטרות",
-    "בני עי''ש",
-    "בני ציון",
-    "בני ראם",
-    "בניה",
-    "בנימינה",
-    "בסמת טבעון",
-    "בענה",
-    "בצרה",
-    "בצת",
-    "בקוע",
-    "בקעות",
-    "בר גיורא",
-    "בר יוחאי",
-    "בר כוכבא",
-    "ברוכין",
-    "ברור חיל",
-    "ברוש",
-    "ברחבי הארץ",
-    "ברטעה",
-    "ברכיה",
-    "ברעם",
-    "ברקאי",
-    "ברקן",
-    "ברקת",
-    "בת הדר",
-    "בת חן",
-    "בת חפר",
-    "בת ים",
-    "בת עין",
-    "בת שלמה",
-    "בתי מלון ים המלח",
-    "בתרונות",
-    "ג'דידה מכר",
-    "ג'וליס",
-    "ג'לג'וליה",
-    "ג'סר א-זרקא",
-    "ג'ש - גוש חלב",
-    "ג'ת",
-    "גאולי תימן",
-    "גאולים",
-    "גאליה",
-    "גבולות",
-    "גבים, מכללת ספיר",
-    "גבע בנימין",
-    "גבע כרמל",
-    "גבעון החדשה",
-    "גבעות",
-    "גבעות בר",
-    "גבעות עדן",
-    "גבעת אבני",
-    "גבעת אלה",
-    "גבעת אסף",
-    "גבעת ברנר",
-    "גבעת הראל",
-    "גבעת הרואה",
-    "גבעת השלושה",
-    "גבעת וולפסון",
-    "גבעת וושינגטון",
-    "גבעת זאב",
-    "גבעת חיים איחוד",
-    "גבעת חיים מאוחד",
-    "גבעת חן",
-    "גבעת יערים",
-    "גבעת ישעיהו",
-    "גבעת כ''ח",
-    "גבעת ניל''י",
-    "גבעת עדה",
-    "גבעת עוז",
-    "גבעת פורת יוסף",
-    "גבעת שמואל",
-    "גבעת שפירא",
-    "גבעתי",
-    "גבעתיים",
-    "גברעם",
-    "גבת",
-    "גדות",
-    "גדעונה",
-    "גדרה",
-    "גונן",
-    "גופנה",
-    "גורן",
-    "גורנות הגליל",
-    "גזית",
-    "גזר",
-    "גיאה",
-    "גיבתון",
-    "גיזו",
-    "גילת",
-    "גינוסר",
-    "גינתון",
-    "גיתה",
-    "גיתית",
-    "גלאון",
-    "גלגל",
-    "גלעד",
-    "גמזו",
-    "גן הדרום",
-    "גן השומרון",
-    "גן חיים",
-    "גן יאשיה",
-    "גן יבנה",
-    "גן נר",
-    "גן שורק",
-    "גן שלמה",
-    "גן שמואל",
-    "גנות",
-    "גנות הדר",
-    "גני הדר",
-    "גני חוגה",
-    "גני טל",
-    "גני יוחנן",
-    "גני עם",
-    "גני תקווה",
-    "גניגר",
-    "געש",
-    "געתון",
-    "גפן",
-    "גרופית",
-    "גשור",
-    "גשר",
-    "גשר הזיו",
-    "גת",
-    "גת רימון",
-    "דבוריה",
-    "דביר",
-    "דברת",
-    "דגניה א",
-    "דגניה ב",
-    "דוב''ב",
-    "דולב",
-    "דור, נחשולים",
-    "דורות",
-    "דורות עילית",
-    "דחי",
-    "דימונה",
-    "דיר אל-אסד",
-    "דיר חנא",
-    "דישון",
-    "דליה",
-    "דלית אל כרמל",
-    "דלתון",
-    "דמיידה",
-    "דפנה",
-    "דקל",
-    "האון",
-    "הבונים",
-    "הגבעה הצהובה",
-    "הגושרים",
-    "הדר עם",
-    "הוד השרון",
-    "הודיה",
-    "הודיות",
-    "הושעיה",
-    "הזורעים",
-    "החווה של אורי כהן",
-    "החווה של זוהר",
-    "החווה של יאיא",
-    "החווה של מנחם",
-    "החווה של עשהאל",
-    "החותרים",
-    "היוגב",
-    "היישוב היהודי חברון",
-    "הילה",
-    "המעפיל",
-    "המרכז האקדמי רופין",
-    "הסוללים",
-    "העוגן",
-    "הר אדר",
-    "הר ברכה",
-    "הר גילה",
-    "הר חלוץ",
-    "הר עמשא",
-    "הראל",
-    "הרדוף",
-    "הרצליה - כל האזורים",
-    "הרצליה - מערב",
-    "הרצליה - מרכז וגליל ים",
-    "הררית יחד",
-    "ואדי אל חמאם",
-    "ואדי אל נעם דרום",
-    "ורד יריחו",
-    "ורדון",
-    "זבדיאל",
-    "זוהר",
-    "זיקים",
-    "זיתן",
-    "זכרון יעקב",
-    "זכריה",
-    "זמר",
-    "זמרת, שובה",
-    "זנוח",
-    "זרועה",
-    "זרזיר",
-    "זרחיה",
-    "זרעית",
-    "חבצלת השרון וצוקי ים",
-    "חג'אג'רה",
-    "חגור",
-    "חגלה",
-    "חד נס",
-    "חדיד",
-    "חדרה - כל האזורים",
-    "חדרה - מזרח",
-    "חדרה - מערב",
-    "חדרה - מרכז",
-    "חדרה - נווה חיים",
-    "חוות אביה",
-    "חוות אביחי",
-    "חוות אל נווה",
-    "חוות אלחי",
-    "חוות ארץ האיילים",
-    "חוות אשכולות",
-    "חוות בניהו",
-    "חוות גלעד",
-    "חוות גנות",
-    "חוות דרומא",
-    "חוות הרועה העברי",
-    "חוות הרשאש",
-    "חוות חנינא",
-    "חוות טואמין",
-    "חוות טליה",
-    "חוות יאיר",
-    "חוות יד השומר",
-    "חוות יויו",
-    "חוות ינון",
-    "חוות מגדלים",
-    "חוות מגנזי",
-    "חוות מדבר חבר",
-    "חוות מור ואברהם",
-    "חוות מלאכי אברהם",
-    "חוות מלכיאל",
-    "חוות מנחם",
-    "חוות מעלה אהוביה",
-    "חוות מקנה יהודה",
-    "חוות מרום שמואל",
-    "חוות נווה צוף",
-    'חוות נוף אב"י',
-    "חוות נחל שילה",
-    "חוות נחלת אבות",
-    "חוות נחלת צבי",
-    "חוות עדן",
-    "חוות עולם חסד",
-    "חוות עמיאל",
-    "חוות פריאל",
-    "חוות צאן קדר",
-    "חוות צרידה",
-    "חוות קשואלה",
-    "חוות ראש תאנה",
-    "חוות שדה",
-    "חוות שוביאל",
-    "חוות שחרית",
-    "חוות תלם צפון",
-    "חולדה",
-    "חולון",
-    "חולית",
-    "חולתה",
-    "חומש",
-    "חוסן",
-    "חוסנייה",
-    "חוף אכזיב",
-    "חוף בצת",
-    "חוף זיקים",
-    "חוף קליה",
-    "חופית",
-    "חוקוק",
-    "חורה",
-    "חורפיש",
-    "חורשים",
-    "חזון",
-    "חיבת ציון",
-    "חיננית",
-    "חיפה - בת גלים ק.אליעזר",
-    "חיפה - כל האזורים",
-    "חיפה - כרמל, הדר ועיר תחתית",
-    "חיפה - מערב",
-    "חיפה - מפרץ",
-    "חיפה - נווה שאנן ורמות כרמל",
-    "חיפה - קריית חיים ושמואל",
-    "חירן",
-    "חלץ",
-    "חמד",
-    "חמדיה",
-    "חמדת",
-    "חמדת ימים",
-    "חמרה",
-    "חמת גדר",
-    "חניאל",
-    "חניון רעים אנדרטת הנובה",
-    "חניתה",
-    "חנתון",
-    "חספין",
-    "חפץ חיים",
-    "חצב",
-    "חצבה",
-    "חצור",
-    "חצור הגלילית",
-    "חצרים",
-    "חרב לאת",
-    "חרוצים",
-    "חרות",
-    "חריש",
-    "חרמש",
-    "חרמש דרום",
-    "חרשה",
-    "חרשים",
-    "חשמונאים",
-    "טבריה",
-    "טובא זנגריה",
-    "טורעאן",
-    "טייבה",
-    "טייבה בגלבוע",
-    "טירה",
-    "טירת יהודה",
-    "טירת כרמל",
-    "טירת צבי",
-    "טל - אל",
-    "טל מנשה",
-    "טל שחר",
-    "טללים",
-    "טלמון",
-    "טמרה",
-    "טמרה בגלבוע",
-    "טנא עומרים",
-    "טפחות",
-    "יבוא דודי",
-    "יבול",
-    "יבנאל",
-    "יבנה",
-    "יגור",
-    "יגל",
-    "יד בנימין",
-    "יד השמונה",
-    "יד חנה",
-    "יד מרדכי",
-    "יד נתן",
-    "יד רמב''ם",
-    "יהוד מונוסון",
-    "יהל",
-    "יובלים",
-    "יודפת",
-    "יונתן",
-    "יושיביה",
-    "יזרעאל",
-    "יחיעם",
-    "יטבתה",
-    "ייט''ב",
-    "יכיני",
-    "ינוב",
-    "ינוח ג'ת",
-    "ינון",
-    "יסוד המעלה",
-    "יסודות",
-    "יסעור",
-    "יעבץ, יעף",
-    "יעד",
-    "יערה",
-    "יפיע",
-    "יפית",
-    "יפעת",
-    "יפתח",
-    "יצהר",
-    "יציץ",
-    "יקום",
-    "יקיר",
-    "יקנעם המושבה והזורע",
-    "יקנעם עילית",
-    "יראון",
-    "ירדנה",
-    "ירוחם",
-    "ירושלים - אזור תעשייה עטרות",
-    "ירושלים - דרום",
-    "ירושלים - כל האזורים",
-    "ירושלים - כפר עקב",
-    "ירושלים - מזרח",
-    "ירושלים - מערב",
-    "ירושלים - מרכז",
-    "ירושלים - צפון",
-    "ירחיב",
-    "ירכא",
-    "ירקונה",
-    "ישובי אומן",
-    "ישובי יעל",
-    "ישעי",
-    "ישרש",
-    "יתד",
-    "כאבול",
-    "כאוכב אבו אלהיג'א",
-    "כברי",
-    "כדורי",
-    "כוכב השחר",
-    "כוכב יאיר - צור יגאל",
-    "כוכב יעקב",
-    "כוכב מיכאל",
-    "כורזים ורד הגליל",
-    "כחל",
-    "כינרת מושבה",
-    "כינרת קבוצה",
-    "כיסופים",
-    "כישור",
-    "כל הארץ",
-    "כליל",
-    "כלנית",
-    "כמהין",
-    "כמון - כמאנה מזרחית",
-    "כנות",
-    "כנף",
-    "כסייפה",
-    "כסלון",
-    "כסרא סמיע",
-    "כעביה טבאש",
-    "כפר אביב",
-    "כפר אדומים",
-    "כפר אוריה",
-    "כפר אחים",
-    "כפר אלדד",
-    "כפר ביאליק",
-    "כפר ביל''ו",
-    "כפר בלום",
-    "כפר בן נון",
-    "כפר ברא",
-    "כפר ברוך",
-    "כפר גדעון",
-    "כפר גלים",
-    "כפר גליקסון",
-    "כפר גלעדי",
-    "כפר גמילה מלכישוע",
-    "כפר דניאל",
-    "כפר האורנים",
-    "כפר החורש",
-    "כפר המכבי",
-    "כפר הנגיד",
-    "כפר הנוער קריית יערים",
-    "כפר הנוקדים",
-    "כפר הנשיא",
-    "כפר הס",
-    "כפר הרא''ה",
-    "כפר הרי''ף וצומת ראם",
-    "כפר ויתקין",
-    "כפר ורבורג",
-    "כפר ורדים",
-    "כפר זוהרים",
-    "כפר זיתים",
-    "כפר ח'וואלד",
-    "כפר חב''ד",
-    "כפר חיטים",
-    "כפר חיים",
-    "כפר חנניה",
-    "כפר חסידים",
-    "כפר חרוב",
-    "כפר טרומן",
-    "כפר יאסיף",
-    "כפר ידידיה",
-    "כפר יהושע",
-    "כפר יובל",
-    "כפר יונה",
-    "כפר יחזקאל",
-    "כפר כמא",
-    "כפר כנא",
-    "כפר מונש",
-    "כפר מימון ותושיה",
-    "כפר מל''ל",
-    "כפר מנדא",
-    "כפר מנחם",
-    "כפר מסריק",
-    "כפר מצר",
-    "כפר מרדכי",
-    "כפר נהר הירדן",
-    "כפר נוער בן שמן",
-    "כפר נטר",
-    "כפר סאלד",
-    "כפר סבא",
-    "כפר סילבר",
-    "כפר סירקין",
-    "כפר עבודה",
-    "כפר עזה",
-    "כפר עציון",
-    "כפר פינס",
-    "כפר קאסם",
-    "כפר קיש",
-    "כפר קרע",
-    "כפר רופין",
-    "כפר רות",
-    "כפר שמאי",
-    "כפר שמואל",
-    "כפר שמריהו",
-    "כפר תבור",
-    "כפר תפוח",
-    "כפר תקווה",
-    "כרכום",
-    "כרם ביבנה",
-    "כרם בן זמרה",
-    "כרם מהר''ל",
-    "כרם רעים",
-    "כרם שלום",
-    "כרמי יוסף",
-    "כרמי צור",
-    "כרמי קטיף ואמציה",
-    "כרמיאל",
-    "כרמיה",
-    "כרמים",
-    "כרמית",
-    "כרמל",
-    "לב החולה",
-    "לבון",
-    "לביא",
-    "לבנים",
-    "להב",
-    "להבות הבשן",
-    "להבות חביבה",
-    "להבים",
-    "לוד",
-    "לוזית",
-    "לוחמי הגטאות",
-    "לוטם וחמדון",
-    "לוטן",
-    "לטרון",
-    "לימן",
-    "לכיש",
-    "לפיד",
-    "לפידות",
-    "לקיה",
-    "מאור",
-    "מאיר שפיה",
-    "מבוא ביתר",
-    "מבוא דותן",
-    "מבוא חורון",
-    "מבוא חמה",
-    "מבוא מודיעים",
-    "מבואות יריחו",
-    "מבועים",
-    "מבטחים, עמיעוז, ישע",
-    "מבקיעים",
-    "מבשרת ציון",
-    "מג'דל כרום",
-    "מג'דל שמס",
-    "מגדים",
-    "מגדל",
-    "מגדל העמק",
-    "מגדל עוז",
-    "מגדל תפן",
-    "מגדלים",
-    "מגל",
-    "מגן",
-    "מגן שאול",
-    "מגרון",
-    "מגשימים",
-    "מדרך עוז",
-    "מדרשת בן גוריון",
-    "מודיעין - ישפרו סנטר",
-    "מודיעין - ליגד סנטר",
-    "מודיעין מכבים רעות",
-    "מודיעין עילית",
-    "מולדת",
-    "מועאוויה",
-    "מוצא עילית",
-    "מוקיבלה",
-    "מורן",
-    "מורשת",
-    "מזור",
-    "מזכרת בתיה",
-    "מזרע",
-    "מזרעה",
-    "מחוז אילת",
-    "מחוז בית שמש",
-    "מחוז בקעה",
-    "מחוז בקעת בית שאן",
-    "מחוז גולן",
-    "מחוז גליל עליון",
-    "מחוז גליל תחתון",
-    "מחוז דן",
-    "מחוז דרום הנגב",
-    "מחוז דרום השפלה",
-    "מחוז השפלה",
-    "מחוז ואדי ערה",
-    "מחוז חוף הכרמל",
-    "מחוז חיפה",
-    "מחוז חפר",
-    "מחוז יהודה",
-    "מחוז ים המלח",
-    "מחוז יערות הכרמל",
-    "מחוז ירושלים",
-    "מחוז ירקון",
-    "מחוז לכיש",
-    "מחוז מנשה",
-    "מחוז מערב הנגב",
-    "מחוז מערב לכיש",
-    "מחוז מרכז הנגב",
-    "מחוז עוטף עזה",
-    "מחוז ערבה",
-    "מחוז קו העימות",
-    "מחוז קצרין",
-    "מחוז קריות",
-    "מחוז שומרון",
-    "מחוז שרון",
-    "מחוז תבור",
-    "מחולה",
-    "מחניים",
-    "מחסיה",
-    "מטווח ניר עם",
-    "מטולה",
-    "מטע",
-    "מי עמי",
-    "מייסר",
-    "מיני ישראל - נחשון",
-    "מיצד",
-    "מיצר",
-    "מירב",
-    "מירון",
-    "מישר",
-    "מיתר",
-    "מכון וינגייט",
-    "מכורה",
-    "מכינת אלישע",
-    "מכמורת",
-    "מכמנים - כמאנה מערבית",
-    "מלאכי השלום",
-    "מלונות ים המלח מרכז",
-    "מלכיה",
-    "מנוחה",
-    "מנוף",
-    "מנות",
-    "מנחמיה",
-    "מנחת מחניים",
-    "מנרה",
-    "מנשית זבדה",
-    "מסד",
-    "מסדה",
-    "מסוף אורנית",
-    "מסילות",
-    "מסילת ציון",
-    "מסלול",
-    "מסעדה",
-    "מע'אר",
-    "מעברות",
-    "מעגלים, גבעולים, מלילות",
-    "מעגן",
-    "מעגן מיכאל",
-    "מעוז חיים",
-    "מעון",
-    "מעון צופיה",
-    "מעונה",
-    "מעיין ברוך",
-    "מעיין צבי",
-    "מעיליא",
-    "מעלה אדומים",
-    "מעלה אפרים",
-    "מעלה גלבוע",
-    "מעלה גמלא",
-    "מעלה החמישה",
-    "מעלה חבר",
-    "מעלה לבונה",
-    "מעלה מכמש",
-    "מעלה עירון",
-    "מעלה עמוס",
-    "מעלה צביה",
-    "מעלה רחבעם",
-    "מעלות תרשיחא",
-    "מענית, גבעת חביבה",
-    "מעש",
-    "מפלסים",
-    "מצדה",
-    "מצובה",
-    "מצוקי דרגות",
-    "מצליח",
-    "מצפה",
-    "מצפה אבי''ב",
-    "מצפה אילן",
-    "מצפה דני",
-    'מצפה זי"ו',
-    "מצפה חגית",
-    "מצפה יאיר",
-    "מצפה יריחו",
-    "מצפה מדרג",
-    "מצפה נטופה",
-    "מצפה רמון",
-    "מצפה שלם",
-    "מצפור פצאל",
-    "מצר",
-    "מקווה ישראל",
-    "מרגליות",
-    "מרום גולן",
-    "מרחב עם",
-    "מרחביה מושב",
-    "מרחביה קיבוץ",
-    "מרחצאות עין גדי",
-    "מרכז אזורי דרום השרון",
-    "מרכז אזורי מבואות חרמון",
-    "מרכז אזורי מגילות",
-    "מרכז אזורי מרום גליל",
-    "מרכז אזורי משגב",
-    "מרכז אזורי רמת כורזים",
-    "מרכז חבר",
-    "מרכז מיר''ב",
-    "מרכז שפירא",
-    "מרעית",
-    "משאבי שדה",
-    "משגב דב",
-    "משגב עם",
-    "משהד",
-    "משואה",
-    "משואות יצחק",
-    "משכיות",
-    "משמר איילון",
-    "משמר דוד",
-    "משמר הירדן",
-    "משמר הנגב",
-    "משמר העמק",
-    "משמר השבעה",
-    "משמר השרון",
-    "משמרות",
-    "משמרת",
-    "משען",
-    "מתחם בני דרום",
-    "מתחם גלילות",
-    "מתחם סקי גלבוע",
-    "מתחם פי גלילות",
-    "מתחם שביל התפוזים",
-    "מתן",
-    "מתת",
-    "מתתיהו",
-    "נאות גולן",
-    "נאות הכיכר",
-    "נאות מרדכי",
-    "נאות סמדר",
-    "נאות קדומים",
-    "נאעורה",
-    "נבטים",
-    "נבי שועייב",
-    "נגבה",
-    "נגוהות",
-    "נהורה",
-    "נהלל",
-    "נהריה",
-    "נוב",
-    "נוגה",
-    "נוה איתן",
-    "נווה",
-    "נווה אור",
-    "נווה אטי''ב",
-    "נווה אילן",
-    "נווה ארז",
-    "נווה דניאל",
-    "נווה זוהר",
-    "נווה זיו",
-    "נווה חריף",
-    "נווה ים",
-    "נווה ימין",
-    "נווה ירק",
-    "נווה מבטח",
-    "נווה מיכאל - רוגלית",
-    "נווה צוף",
-    "נווה שלום",
-    "נועם",
-    "נוף איילון, שעלבים",
-    "נוף הגליל",
-    "נופי נחמיה",
-    "נופי פרת",
-    "נופים",
-    "נופית",
-    "נופך",
-    "נוקדים",
-    "נורדיה",
-    "נורית",
-    "נחושה",
-    "נחל עוז",
-    "נחלה",
-    "נחליאל",
-    "נחלים",
-    "נחם",
-    "נחף",
-    "נחשון",
-    "נחשונים",
-    "נטועה",
-    "נטור",
-    "נטע",
-    "נטעים",
-    "נטף",
-    "נילי",
-    "נין",
-    "ניצן",
-    "ניצנה",
-    "ניצני עוז",
-    "ניצנים",
-    "ניר אליהו",
-    "ניר בנים",
-    "ניר גלים",
-    "ניר דוד",
-    "ניר ח''ן",
-    "ניר יצחק",
-    "ניר ישראל",
-    "ניר משה",
-    "ניר עוז",
-    "ניר עם",
-    "ניר עציון, ימין אורד",
-    "ניר עקיבא",
-    "ניר צבי",
-    "נירים",
-    "נירית",
-    "נמל קיסריה",
-    "נמרוד",
-    "נס הרים",
-    "נס עמים",
-    "נס ציונה",
-    "נעורים",
-    "נעלה",
-    "נעמה",
-    "נען",
-    "נערן",
-    "נצר חזני",
-    "נצר סרני",
-    "נצרת",
-    "נריה",
-    "נשר",
-    "נתיב הגדוד",
-    "נתיב הל''ה",
-    "נתיב העשרה",
-    "נתיב השיירה",
-    "נתיבות",
-    "נתניה - כל האזורים",
-    "נתניה - מזרח",
-    "נתניה - מערב",
-    "סאג'ור",
-    "סאסא",
-    "סביון",
-    "סגולה",
-    "סואעד חמירה",
-    "סולם",
-    "סוסיא",
-    "סוסיא הקדומה",
-    "סופה",
-    "סכנין",
-    "סלמה",
-    "סלעית",
-    "סמר",
-    "סנדלה",
-    "סנסנה",
-    "סעד",
-    "סעווה",
-    "סער",
-    "ספיר",
-    "ספסופה - כפר חושן",
-    "סתריה",
-    "ע'ג'ר",
-    "עבדון",
-    "עברון",
-    "עגור",
-    "עדי",
-    "עדי עד",
-    "עדנים",
-    "עוז וגאון",
-    "עוזה",
-    "עוזייר, רומאנה",
-    "עולש",
-    "עומר",
-    "עופר",
-    "עופרים",
-    "עוצם",
-    "עזוז",
-    "עזר",
-    "עזריאל",
-    "עזריה",
-    "עזריקם",
-    "עטרת",
-    "עידן",
-    "עיינות",
-    "עילבון",
-    "עילוט",
-    "עין איילה",
-    "עין אל אסד",
-    "עין אל סהלה",
-    "עין בוקק",
-    "עין גב",
-    "עין גדי",
-    "עין דור",
-    "עין הבשור",
-    "עין הוד",
-    "עין החורש",
-    "עין המפרץ",
-    "עין הנצי''ב",
-    "עין העמק",
-    "עין השופט",
-    "עין השלושה",
-    "עין ורד",
-    "עין זיוון",
-    "עין חוד",
-    "עין חצבה",
-    "עין חרוד, תל יוסף",
-    "עין יהב",
-    "עין יעקב",
-    "עין כרמל",
-    "עין מאהל",
-    "עין נקובא",
-    "עין עירון",
-    "עין צורים",
-    "עין קנייא",
-    "עין ראפה",
-    "עין שמר",
-    "עין שריד",
-    "עין תמר",
-    "עינות קדם",
-    "עינת",
-    "עכו",
-    "עכו - אזור תעשייה",
-    "עכו - כל האזורים",
-    "עכו - רמות ים",
-    "עלומים",
-    "עלי",
-    "עלי זהב - לשם",
-    "עלמה",
-    "עלמון",
-    "עמוקה",
-    "עמיחי",
-    "עמינדב",
-    "עמיעד",
-    "עמיקם",
-    "עמיר",
-    "עמנואל",
-    "עמקה",
-    "ענב",
-    "עספיא",
-    "עפולה",
-    "עפרה",
-    "עץ אפרים",
-    "עצמון - שגב",
-    "עראבה",
-    "ערב אל נעים",
-    "ערב אל עראמשה",
-    "ערד",
-    "ערוגות",
-    "ערערה",
-    "ערערה בנגב",
-    "עשהאל",
-    "עשרת",
-    "עתלית",
-    "עתניאל",
-    "פארן",
-    "פארק אריאל שרון",
-    "פארק תעשיות מגדל עוז",
-    "פארק תעשיות פלמחים",
-    "פארק תעשייה ראם",
-    "פדואל",
-    "פדויים",
-    "פדיה",
-    "פוריה כפר עבודה",
-    "פוריה נווה עובד",
-    "פוריה עילית",
-    "פוריידיס",
-    "פורת",
-    "פטיש",
-    "פלך",
-    "פלמחים",
-    "פני קדם",
-    "פנימיית עין כרם",
-    "פסגות",
-    "פסוטה",
-    "פעמי תש''ז",
-    "פצאל",
-    "פקיעין",
-    "פקיעין החדשה",
-    "פרדס חנה כרכור",
-    "פרדסיה",
-    "פרוד",
-    "פרי גן",
-    "פתח תקווה",
-    "פתחיה",
-    "צאלים",
-    "צבעון",
-    "צובה",
-    "צוחר, אוהד",
-    "צומת אלמוג",
-    "צומת הגוש",
-    "צופים",
-    "צופית",
-    "צופר",
-    "צוקים",
-    "צור הדסה",
-    "צור יצחק",
-    "צור משה",
-    "צור נתן",
-    "צוריאל",
-    "צורית גילון",
-    "ציפורי",
-    "צלפון",
-    "צמח",
-    "צפריה",
-    "צפרירים",
-    "צפת - כל האזורים",
-    "צפת - נוף כנרת",
-    "צפת - עיר",
-    "צפת - עכברה",
-    "צרופה",
-    "צרעה",
-    "קבוצת גבע",
-    "קבוצת יבנה",
-    "קדומים",
-    "קדימה צורן",
-    "קדיתא",
-    "קדם ערבה",
-    "קדמה",
-    "קדמת צבי",
-    "קדר",
-    "קדר דרום",
-    "קדרון",
-    "קדרים",
-    "קדש ברנע",
-    "קוממיות",
-    "קורנית",
-    "קטורה",
-    "קיבוץ דן",
-    "קיבוץ מגידו",
-    "קידה",
-    "קיסריה",
-    "קלחים",
-    "קליה",
-    "קלנסווה",
-    "קלע אלון",
-    "קסר א-סר",
-    "קציר",
-    "קצרין",
-    "קצרין - אזור תעשייה",
-    "קריית אונו",
-    "קריית אתא",
-    "קריית ביאליק",
-    "קריית גת, כרמי גת",
-    "קריית חינוך מרחבים",
-    "קריית טבעון - בית זייד",
-    "קריית ים",
-    "קריית יערים",
-    "קריית מוצקין",
-    "קריית מלאכי",
-    "קריית נטפים",
-    "קריית ענבים",
-    "קריית עקרון",
-    "קריית שמונה",
-    "קרית ארבע",
-    "קרני שומרון",
-    "קשת",
-    "ראמה",
-    "ראס אל-עין",
-    "ראס עלי",
-    "ראש הנקרה",
-    "ראש העין",
-    "ראש פינה",
-    "ראש צורים",
-    "ראשון לציון - כל האזורים",
-    "ראשון לציון - מזרח",
-    "ראשון לציון - מערב",
-    "רבבה",
-    "רבדים",
-    "רביבים",
-    "רביד",
-    "רגבה",
-    "רגבים",
-    "רהט",
-    "רווחה",
-    "רוויה",
-    "רוחמה",
-    "רומת אל הייב",
-    "רועי",
-    "רותם",
-    "רחוב",
-    "רחובות",
-    "רחלים",
-    "רטורנו - גבעת שמש",
-    "ריחאנייה",
-    "ריחן",
-    "ריינה",
-    "רימונים",
-    "רינתיה",
-    "רכסים",
-    "רם און",
-    "רמות",
-    "רמות השבים",
-    "רמות מאיר",
-    "רמות מנשה",
-    "רמות נפתלי",
-    "רמלה",
-    "רמת גן - כל האזורים",
-    "רמת גן - מזרח",
-    "רמת גן - מערב",
-    "רמת דוד",
-    "רמת הכובש",
-    "רמת השופט",
-    "רמת השרון",
-    "רמת טראמפ",
-    "רמת יוחנן",
-    "רמת ישי",
-    "רמת מגרון",
-    "רמת מגשימים",
-    "רמת צבי",
-    "רמת רזיאל",
-    "רנן",
-    "רעים",
-    "רעננה",
-    "רקפת",
-    "רשפון",
-    "רשפים, שלוחות, שלפים",
-    "רתמים",
-    "שאנטי במדבר",
-    "שאר ישוב",
-    "שבות רחל",
-    "שבי דרום",
-    "שבי ציון",
-    "שבי שומרון",
-    "שגב שלום",
-    "שדה אילן",
-    "שדה אליהו",
-    "שדה אליעזר",
-    "שדה אפרים",
-    "שדה בועז",
-    "שדה בוקר",
-    "שדה בר",
-    "שדה דוד",
-    "שדה ורבורג",
-    "שדה יואב",
-    "שדה יעקב",
-    "שדה יצחק",
-    "שדה משה",
-    "שדה נחום",
-    "שדה נחמיה",
-    "שדה ניצן",
-    "שדה עוזיהו",
-    "שדה צבי",
-    "שדות ים",
-    "שדות מיכה",
-    "שדי אברהם",
-    "שדי חמד",
-    "שדי תרומות",
-    "שדמה",
-    "שדמות דבורה",
-    "שדמות מחולה",
-    "שדרות, איבים",
-    "שואבה",
-    "שובל",
-    "שוהם",
-    "שומרה",
-    "שומריה",
-    "שוקדה",
-    "שורש",
-    "שורשים",
-    "שושנת העמקים",
-    "שזור",
-    "שחר",
-    "שחרות",
-    "שיבולים",
-    "שיבלי אום אלג'נם",
-    "שיטים",
-    "שייח' דנון",
-    "שילה",
-    "שילת",
-    "שכניה",
-    "שלווה",
-    "שלומי",
-    "שלומית",
-    "שלומציון",
-    "שמיר",
-    "שמעה",
-    "שמרת",
-    "שמשית",
-    "שני ליבנה",
-    "שניר",
-    "שעב",
-    "שעל",
-    "שער אפרים",
-    "שער הגולן",
-    "שער העמקים",
-    "שער מנשה",
-    "שערי תקווה",
-    "שפיים",
-    "שפיר",
-    "שפר",
-    "שפרעם",
-    "שקד",
-    "שקף",
-    "שרונה",
-    "שריגים - לי-און",
-    "שריד",
-    "שרשרת",
-    "שתולה",
-    "שתולים",
-    "תארבין",
-    "תאשור",
-    "תדהר",
-    "תובל",
-    "תומר",
-    "תחנת רכבת כפר ברוך",
-    "תחנת רכבת כפר יהושוע",
-    "תחנת רכבת קריית מלאכי - יואב",
-    "תחנת רכבת ראש העין",
-    "תימורים",
-    "תירוש",
-    "תל אביב - דרום העיר ויפו",
-    "תל אביב - כל האזורים",
-    "תל אביב - מזרח",
-    "תל אביב - מרכז העיר",
-    "תל אביב - עבר הירקון",
-    "תל חי",
-    "תל יצחק",
-    "תל מונד",
-    "תל עדשים",
-    "תל ערד",
-    "תל ציון",
-    "תל קציר",
-    "תל שבע",
-    "תל תאומים",
-    "תלם",
-    "תלמי אליהו",
-    "תלמי אלעזר",
-    "תלמי ביל''ו",
-    "תלמי יוסף",
-    "תלמי יחיאל",
-    "תלמי יפה",
-    "תלמים",
-    "תמרת",
-    "תנובות",
-    "תעוז",
-    "תעשיון צריפין",
-    "תפרח",
-    "תקומה",
-    "תקוע",
-    "תקוע ד' וה'",
-    "תרום",
-]
+from .tables import load_table
+
+AREAS_AND_GROUPS: list[str] = load_table("areas_and_groups")
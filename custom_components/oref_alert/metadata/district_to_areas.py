@@ -1,1511 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-DISTRICT_AREAS: dict[str, list[str]] = {
-    "מחוז אילת": ["אזור תעשייה שחורת", "אילות", "אילת"],
-    "מחוז בית שמש": [
-        "אבו גוש",
-        "אביעזר",
-        "אבן ספיר",
-        "אדרת",
-        "אורה",
-        "אזור תעשייה ברוש",
-        "אזור תעשייה הר טוב - צרעה",
-        "אשתאול",
-        "בית זית",
-        "בית מאיר",
-        "בית נקופה",
-        "בית שמש",
-        "בקוע",
-        "בר גיורא",
-        "גבעות עדן",
-        "גבעת יערים",
-        "גבעת ישעיהו",
-        "גיזו",
-        "גפן",
-        "הר אדר",
-        "הראל",
-        "זכריה",
-        "זנוח",
-        "טל שחר",
-        "יד השמונה",
-        "ישעי",
-        "כסלון",
-        "כפר אוריה",
-        "כפר הנוער קריית יערים",
-        "לוזית",
-        "לטרון",
-        "מבוא ביתר",
-        "מבשרת ציון",
-        "מוצא עילית",
-        "מחסיה",
-        "מטע",
-        "מיני ישראל - נחשון",
-        "מסילת ציון",
-        "מעלה החמישה",
-        "נווה אילן",
-        "נווה מיכאל - רוגלית",
-        "נווה שלום",
-        "נחושה",
-        "נחם",
-        "נחשון",
-        "נטף",
-        "נס הרים",
-        "נתיב הל''ה",
-        "עגור",
-        "עין נקובא",
-        "עין ראפה",
-        "עמינדב",
-        "פנימיית עין כרם",
-        "צובה",
-        "צור הדסה",
-        "צלפון",
-        "צפרירים",
-        "צרעה",
-        "קריית יערים",
-        "קריית ענבים",
-        "רטורנו - גבעת שמש",
-        "רמת רזיאל",
-        "שדות מיכה",
-        "שואבה",
-        "שורש",
-        "שריגים - לי-און",
-        "תירוש",
-        "תעוז",
-        "תרום",
-    ],
-    "מחוז בקעה": [
-        "אלמוג",
-        "ארגמן",
-        "אש קודש",
-        "בית הערבה",
-        "בית חגלה",
-        "בקעות",
-        "בתרונות",
-        "גיתית",
-        "גלגל",
-        "החווה של אורי כהן",
-        "החווה של יאיא",
-        "החווה של מנחם",
-        "החווה של עשהאל",
-        "ורד יריחו",
-        "חוות גנות",
-        "חוות הרשאש",
-        "חוות יד השומר",
-        "חוות עמיאל",
-        "חוות פריאל",
-        "חוף קליה",
-        "חמדת",
-        "חמרה",
-        "ייט''ב",
-        "יפית",
-        "מבואות יריחו",
-        "מחולה",
-        "מכורה",
-        "מעלה אפרים",
-        "מצפור פצאל",
-        "מרכז אזורי מגילות",
-        "משואה",
-        "משכיות",
-        "נעמה",
-        "נערן",
-        "נתיב הגדוד",
-        "עדי עד",
-        "עינות קדם",
-        "פצאל",
-        "צומת אלמוג",
-        "קדם ערבה",
-        "קידה",
-        "קליה",
-        "רועי",
-        "רותם",
-        "שדמות מחולה",
-        "שלומציון",
-        "תומר",
-    ],
-    "מחוז בקעת בית שאן": [
-        "בית אלפא וחפציבה",
-        "בית השיטה",
-        "בית יוסף",
-        "בית שאן",
-        "גני חוגה",
-        "גשר",
-        "חמדיה",
-        "טייבה בגלבוע",
-        "טירת צבי",
-        "ירדנה",
-        "כפר גמילה מלכישוע",
-        "כפר רופין",
-        "מולדת",
-        "מירב",
-        "מנחמיה",
-        "מסילות",
-        "מעוז חיים",
-        "מעלה גלבוע",
-        "נוה איתן",
-        "נווה אור",
-        "ניר דוד",
-        "עין הנצי''ב",
-        "רוויה",
-        "רחוב",
-        "רשפים, שלוחות, שלפים",
-        "שדה אליהו",
-        "שדה נחום",
-        "שדי תרומות",
-        "תל תאומים",
-    ],
-    "מחוז גולן": [
-        "אבני איתן",
-        "אודם",
-        "אורטל",
-        "אזור תעשייה בני יהודה",
-        "אל רום",
-        "אלוני הבשן",
-        "אלי עד",
-        "אפיק",
-        "בוקעתא",
-        "בני יהודה וגבעת יואב",
-        "גשור",
-        "חספין",
-        "יונתן",
-        "כפר חרוב",
-        "מבוא חמה",
-        "מג'דל שמס",
-        "מיצר",
-        "מסעדה",
-        "מרום גולן",
-        "נאות גולן",
-        "נוב",
-        "נווה אטי''ב",
-        "נטור",
-        "נמרוד",
-        "עין זיוון",
-        "עין קנייא",
-        "קשת",
-        "רמת מגשימים",
-    ],
-    "מחוז גליל עליון": [
-        "אבו סנאן",
-        "אור הגנוז",
-        "אזור תעשייה כרמיאל",
-        "אזור תעשייה צ.ח.ר",
-        "אזור תעשייה שער נעמן",
-        "איילת השחר",
-        "אליפלט",
-        "אמירים",
-        "אמנון",
-        "אשרת",
-        "בוסתן הגליל",
-        "ביריה",
-        "בית ג'אן",
-        "בית העלמין החדש עכו",
-        "בית העמק",
-        "בענה",
-        "בר יוחאי",
-        "ג'דידה מכר",
-        "ג'וליס",
-        "גדות",
-        "גיתה",
-        "דיר אל-אסד",
-        "הר חלוץ",
-        "חולתה",
-        "חמדת ימים",
-        "חצור הגלילית",
-        "חרשים",
-        "טובא זנגריה",
-        "טל - אל",
-        "ינוח ג'ת",
-        "יסוד המעלה",
-        "ירכא",
-        "כורזים ורד הגליל",
-        "כחל",
-        "כישור",
-        "כליל",
-        "כסרא סמיע",
-        "כפר הנשיא",
-        "כפר יאסיף",
-        "כפר מסריק",
-        "כפר שמאי",
-        "כרכום",
-        "כרמיאל",
-        "לבון",
-        "לוחמי הגטאות",
-        "לפידות",
-        "מג'דל כרום",
-        "מגדל תפן",
-        "מזרעה",
-        "מחניים",
-        "מירון",
-        "מכמנים - כמאנה מערבית",
-        "מנחת מחניים",
-        "מרכז אזורי מרום גליל",
-        "מרכז אזורי רמת כורזים",
-        "משמר הירדן",
-        "נחף",
-        "נס עמים",
-        "נתיב השיירה",
-        "סאג'ור",
-        "ספסופה - כפר חושן",
-        "עין אל אסד",
-        "עין המפרץ",
-        "עכו",
-        "עכו - אזור תעשייה",
-        "עכו - רמות ים",
-        "עמוקה",
-        "עמיעד",
-        "עמקה",
-        "פלך",
-        "פרוד",
-        "צורית גילון",
-        "צפת - נוף כנרת",
-        "צפת - עיר",
-        "צפת - עכברה",
-        "קדיתא",
-        "קדרים",
-        "ראמה",
-        "ראש פינה",
-        "רגבה",
-        "שדה אליעזר",
-        "שזור",
-        "שייח' דנון",
-        "שמרת",
-        "שפר",
-        "תובל",
-    ],
-    "מחוז גליל תחתון": [
-        "אבטליון",
-        "אזור תעשייה בר-לב",
-        "אזור תעשייה קדמת גליל",
-        "אזור תעשייה תרדיון",
-        "אחיהוד",
-        "אילניה",
-        "אלומות",
-        "אעבלין",
-        "אפיקים",
-        "אפק",
-        "ארבל",
-        "אשבל",
-        "אשדות יעקב",
-        "אשחר",
-        "אתר ההנצחה גולני",
-        "בועיינה-נוג'ידאת",
-        "ביר אלמכסור",
-        "בית זרע",
-        "בית ירח",
-        "בית סוהר צלמון",
-        "בית קשת",
-        "בית רימון",
-        "גבעת אבני",
-        "גינוסר",
-        "דגניה א",
-        "דגניה ב",
-        "דיר חנא",
-        "דמיידה",
-        "הודיות",
-        "הזורעים",
-        "הררית יחד",
-        "ואדי אל חמאם",
-        "חוסנייה",
-        "חוקוק",
-        "חזון",
-        "טבריה",
-        "טורעאן",
-        "טמרה",
-        "טפחות",
-        "יבנאל",
-        "יובלים",
-        "יודפת",
-        "יסעור",
-        "יעד",
-        "כאבול",
-        "כאוכב אבו אלהיג'א",
-        "כדורי",
-        "כינרת מושבה",
-        "כינרת קבוצה",
-        "כלנית",
-        "כמון - כמאנה מזרחית",
-        "כפר זיתים",
-        "כפר חיטים",
-        "כפר חנניה",
-        "כפר כמא",
-        "כפר מנדא",
-        "כפר נהר הירדן",
-        "כפר קיש",
-        "לביא",
-        "לבנים",
-        "לוטם וחמדון",
-        "מגדל",
-        "מורן",
-        "מורשת",
-        "מנוף",
-        "מסד",
-        "מע'אר",
-        "מעלה צביה",
-        "מצפה",
-        "מצפה אבי''ב",
-        "מצפה נטופה",
-        "מרכז אזורי משגב",
-        "נבי שועייב",
-        "סכנין",
-        "סלמה",
-        "עילבון",
-        "עצמון - שגב",
-        "עראבה",
-        "ערב אל נעים",
-        "פוריה כפר עבודה",
-        "פוריה נווה עובד",
-        "פוריה עילית",
-        "קורנית",
-        "ראס אל-עין",
-        "רביד",
-        "רקפת",
-        "שדה אילן",
-        "שדמות דבורה",
-        "שורשים",
-        "שכניה",
-        "שעב",
-        "שפרעם",
-        "שרונה",
-    ],
-    "מחוז דן": [
-        "אור יהודה",
-        "אזור",
-        "בחלק מהאזורים בארץ",
-        "בני ברק",
-        "בת ים",
-        "גבעת שמואל",
-        "גבעתיים",
-        "גני תקווה",
-        "חולון",
-        "יהוד מונוסון",
-        "מקווה ישראל",
-        "סביון",
-        "פארק אריאל שרון",
-        "קריית אונו",
-        "רמת גן - מזרח",
-        "רמת גן - מערב",
-        "תל אביב - דרום העיר ויפו",
-        "תל אביב - מזרח",
-        "תל אביב - מרכז העיר",
-        "תל אביב - עבר הירקון",
-    ],
-    "מחוז דרום הנגב": [
-        "אבו קרינאת",
-        "אבו תלול",
-        "אום בטין",
-        "אזור תעשייה דימונה",
-        "אזור תעשייה רותם",
-        "אל סייד",
-        "אל פורעה",
-        "אשלים",
-        "באר מילכה",
-        "ביר הדאג'",
-        "דימונה",
-        "חורה",
-        "טללים",
-        "ירוחם",
-        "כמהין",
-        "כסייפה",
-        "כפר הנוקדים",
-        "מדרשת בן גוריון",
-        "מיתר",
-        "מצפה רמון",
-        "מרחב עם",
-        "מרעית",
-        "משאבי שדה",
-        "ניצנה",
-        "סעווה",
-        "עזוז",
-        "ערד",
-        "ערערה בנגב",
-        "קדש ברנע",
-        "קסר א-סר",
-        "רביבים",
-        "רתמים",
-        "שאנטי במדבר",
-        "שגב שלום",
-        "שדה בוקר",
-        "תל ערד",
-        "תל שבע",
-    ],
-    "מחוז דרום השפלה": [
-        "אזור תעשייה גדרה",
-        "בית אלעזרי",
-        "בית גמליאל",
-        "בית חלקיה",
-        "בן זכאי",
-        "בני דרום",
-        "בני ראם",
-        "בניה",
-        "גבעת ברנר",
-        "גבעת וושינגטון",
-        "גדרה",
-        "גיבתון",
-        "גן הדרום",
-        "גן שלמה",
-        "גני טל",
-        "חפץ חיים",
-        "יבנה",
-        "יד בנימין",
-        "יסודות",
-        "כפר אביב",
-        "כפר מרדכי",
-        "כרם ביבנה",
-        "מזכרת בתיה",
-        "מישר",
-        "מעון צופיה",
-        "משגב דב",
-        "מתחם בני דרום",
-        "ניר גלים",
-        "נצר חזני",
-        "עשרת",
-        "קבוצת יבנה",
-        "קדרון",
-        "קריית עקרון",
-        "שדמה",
-    ],
-    "מחוז השפלה": [
-        "אזור תעשייה נשר - רמלה",
-        "אחיסמך",
-        "אחיעזר",
-        "אירוס",
-        "באר יעקב",
-        "בית דגן",
-        "בית חנן",
-        "בית חשמונאי",
-        "בית עובד",
-        "בית עוזיאל",
-        "בן שמן",
-        "גאליה",
-        "גזר",
-        "גינתון",
-        "גמזו",
-        "גן שורק",
-        "גנות",
-        "גני הדר",
-        "גני יוחנן",
-        "זיתן",
-        "חולדה",
-        "חמד",
-        "חשמונאים",
-        "יגל",
-        "יד רמב''ם",
-        "יציץ",
-        "ישרש",
-        "כפר ביל''ו",
-        "כפר בן נון",
-        "כפר דניאל",
-        "כפר הנגיד",
-        "כפר חב''ד",
-        "כפר נוער בן שמן",
-        "כפר רות",
-        "כפר שמואל",
-        "כרמי יוסף",
-        "לוד",
-        "לפיד",
-        "מבוא מודיעים",
-        "מודיעין - ישפרו סנטר",
-        "מודיעין - ליגד סנטר",
-        "מודיעין מכבים רעות",
-        "מצליח",
-        "משמר איילון",
-        "משמר דוד",
-        "משמר השבעה",
-        "נאות קדומים",
-        "נוף איילון, שעלבים",
-        "נטעים",
-        "ניר צבי",
-        "נס ציונה",
-        "נען",
-        "נצר סרני",
-        "סתריה",
-        "עזריה",
-        "עיינות",
-        "פארק תעשיות פלמחים",
-        "פדיה",
-        "פלמחים",
-        "פתחיה",
-        "צפריה",
-        "ראשון לציון - מזרח",
-        "ראשון לציון - מערב",
-        "רחובות",
-        "רמות מאיר",
-        "רמלה",
-        "שילת",
-        "תעשיון צריפין",
-    ],
-    "מחוז ואדי ערה": [
-        "אום אל פחם",
-        "אום אל קוטוף",
-        "אל עריאן",
-        "באקה אל גרבייה",
-        "ברטעה",
-        "ברקאי",
-        "ג'ת",
-        "חריש",
-        "כפר קרע",
-        "להבות חביבה",
-        "מגל",
-        "מועאוויה",
-        "מי עמי",
-        "מייסר",
-        "מעלה עירון",
-        "מצפה אילן",
-        "מצר",
-        "עין אל סהלה",
-        "ערערה",
-        "קציר",
-    ],
-    "מחוז חוף הכרמל": [
-        "אזור תעשייה ניר עציון",
-        "בית צבי",
-        "בת שלמה",
-        "גבע כרמל",
-        "דור, נחשולים",
-        "הבונים",
-        "כרם מהר''ל",
-        "מאיר שפיה",
-        "מגדים",
-        "מרכז מיר''ב",
-        "נווה ים",
-        "ניר עציון, ימין אורד",
-        "עופר",
-        "עין איילה",
-        "עין הוד",
-        "עין חוד",
-        "עין כרמל",
-        "עתלית",
-        "פוריידיס",
-        "צרופה",
-    ],
-    "מחוז חיפה": [
-        "החותרים",
-        "חיפה - בת גלים ק.אליעזר",
-        "חיפה - כרמל, הדר ועיר תחתית",
-        "חיפה - מערב",
-        "חיפה - מפרץ",
-        "חיפה - נווה שאנן ורמות כרמל",
-        "חיפה - קריית חיים ושמואל",
-        "טירת כרמל",
-        "כפר גלים",
-        "נשר",
-    ],
-    "מחוז חפר": [
-        "אביחיל",
-        "אזור תעשייה כפר יונה",
-        "אזור תעשייה עמק חפר",
-        "אחיטוב",
-        "אייל",
-        "אליכין",
-        "אלישיב",
-        "אמץ",
-        "בארותיים",
-        "בורגתה",
-        "בחן",
-        "בית הלוי",
-        "בית חרות",
-        "בית ינאי",
-        "בית יצחק - שער חפר",
-        "ביתן אהרן",
-        "בני דרור",
-        "בת חן",
-        "בת חפר",
-        "גאולי תימן",
-        "גאולים",
-        "גבעת חיים איחוד",
-        "גבעת חיים מאוחד",
-        "גבעת שפירא",
-        "גן יאשיה",
-        "גנות הדר",
-        "הדר עם",
-        "המעפיל",
-        "המרכז האקדמי רופין",
-        "העוגן",
-        "זמר",
-        "חבצלת השרון וצוקי ים",
-        "חגלה",
-        "חופית",
-        "חיבת ציון",
-        "חניאל",
-        "חרב לאת",
-        "חרות",
-        "טייבה",
-        "טירה",
-        "יד חנה",
-        "ינוב",
-        "יעבץ, יעף",
-        "כפר הס",
-        "כפר הרא''ה",
-        "כפר ויתקין",
-        "כפר חיים",
-        "כפר ידידיה",
-        "כפר יונה",
-        "כפר מונש",
-        "כפר עבודה",
-        "מכמורת",
-        "מעברות",
-        "משמר השרון",
-        "משמרת",
-        "נורדיה",
-        "ניצני עוז",
-        "נעורים",
-        "עולש",
-        "עזריאל",
-        "עין החורש",
-        "עין ורד",
-        "עין שריד",
-        "פורת",
-        "פרדסיה",
-        "צור יצחק",
-        "צור משה",
-        "צור נתן",
-        "קדימה צורן",
-        "קלנסווה",
-        "רמת הכובש",
-        "שושנת העמקים",
-        "שער אפרים",
-        "תל מונד",
-        "תנובות",
-    ],
-    "מחוז יהודה": [
-        "אביגיל",
-        "אדורה",
-        "אדורים",
-        "אזור תעשייה מישור אדומים",
-        "אזור תעשייה מיתרים",
-        "איבי הנחל",
-        "אלון",
-        "אלון שבות",
-        "אליאב",
-        "אלעזר",
-        "אפקה",
-        "אפרת",
-        "אשכולות",
-        "אשתמוע",
-        "בית הברכה",
-        'בית חג"י',
-        "בית יתיר",
-        "ביתר עילית",
-        "בני אדם",
-        "בני דקלים",
-        "בר כוכבא",
-        "בת עין",
-        "גבעות",
-        "הגבעה הצהובה",
-        "היישוב היהודי חברון",
-        "הר גילה",
-        "הר עמשא",
-        "חוות ארץ האיילים",
-        "חוות אשכולות",
-        "חוות דרומא",
-        "חוות הרועה העברי",
-        "חוות טואמין",
-        "חוות טליה",
-        "חוות יויו",
-        "חוות מדבר חבר",
-        "חוות מור ואברהם",
-        "חוות מלאכי אברהם",
-        "חוות מקנה יהודה",
-        "חוות נחלת אבות",
-        "חוות עדן",
-        "חוות צאן קדר",
-        "חוות קשואלה",
-        "חוות תלם צפון",
-        "חירן",
-        "טנא עומרים",
-        "כפר אדומים",
-        "כפר אלדד",
-        "כפר עציון",
-        "כרמי צור",
-        "כרמי קטיף ואמציה",
-        "כרמל",
-        "מגדל עוז",
-        "מיצד",
-        "מעון",
-        "מעלה אדומים",
-        "מעלה חבר",
-        "מעלה עמוס",
-        "מעלה רחבעם",
-        'מצפה זי"ו',
-        "מצפה חגית",
-        "מצפה יאיר",
-        "מצפה יריחו",
-        "נגוהות",
-        "נווה דניאל",
-        "נופי פרת",
-        "נוקדים",
-        "נטע",
-        "סוסיא",
-        "סוסיא הקדומה",
-        "סנסנה",
-        "עוז וגאון",
-        "עלמון",
-        "עשהאל",
-        "עתניאל",
-        "פארק תעשיות מגדל עוז",
-        "פני קדם",
-        "צומת הגוש",
-        "קדר",
-        "קדר דרום",
-        "קרית ארבע",
-        "ראש צורים",
-        "שדה בועז",
-        "שדה בר",
-        "שמעה",
-        "שני ליבנה",
-        "שקף",
-        "תלם",
-        "תקוע",
-        "תקוע ד' וה'",
-    ],
-    "מחוז ים המלח": [
-        "אבנת",
-        "בתי מלון ים המלח",
-        "חוות מנחם",
-        "מלונות ים המלח מרכז",
-        "מצדה",
-        "מצוקי דרגות",
-        "מצפה מדרג",
-        "מצפה שלם",
-        "מרחצאות עין גדי",
-        "נאות הכיכר",
-        "נווה זוהר",
-        "עין בוקק",
-        "עין גדי",
-        "עין תמר",
-    ],
-    "מחוז יערות הכרמל": ["בית אורן", "גבעת וולפסון", "דלית אל כרמל", "עספיא"],
-    "מחוז ירושלים": [
-        "גבעת זאב",
-        "ירושלים - אזור תעשייה עטרות",
-        "ירושלים - דרום",
-        "ירושלים - כפר עקב",
-        "ירושלים - מזרח",
-        "ירושלים - מערב",
-        "ירושלים - מרכז",
-        "ירושלים - צפון",
-    ],
-    "מחוז ירקון": [
-        "אזור תעשייה אפק ולב הארץ",
-        "אזור תעשייה חבל מודיעין שוהם",
-        "איירפורט סיטי",
-        "אלעד",
-        "בארות יצחק",
-        "בית נחמיה",
-        "בית עריף",
-        "בני עטרות",
-        "ברקת",
-        "גבעת השלושה",
-        "גבעת כ''ח",
-        "גת רימון",
-        "חדיד",
-        "טירת יהודה",
-        "כפר טרומן",
-        "כפר סירקין",
-        "מגשימים",
-        "מזור",
-        "מעש",
-        "נופך",
-        "נחלים",
-        "נחשונים",
-        "עינת",
-        "פתח תקווה",
-        "ראש העין",
-        "רינתיה",
-        "שוהם",
-    ],
-    "מחוז לכיש": [
-        "אביגדור",
-        "אבן שמואל",
-        "אורות",
-        "אזור תעשייה באר טוביה",
-        "אזור תעשייה כנות",
-        "אזור תעשייה עד הלום",
-        "אזור תעשייה קריית גת",
-        "אזור תעשייה רבדים",
-        "אזור תעשייה תימורים",
-        "אחווה",
-        "אחוזם",
-        "איתן",
-        "אל עזי",
-        "אלומה",
-        "אמונים",
-        "אשדוד - א,ב,ד,ה",
-        "אשדוד - איזור תעשייה צפוני",
-        "אשדוד - ג,ו,ז",
-        "אשדוד - ח,ט,י,יג,יד,טז",
-        "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
-        "באר טוביה",
-        "ביצרון",
-        "בית גוברין",
-        "בית ניר",
-        "בית עזרא",
-        "בני עי''ש",
-        "גבעתי",
-        "גלאון",
-        "גן יבנה",
-        "גת",
-        "ורדון",
-        "זבדיאל",
-        "זוהר",
-        "זרחיה",
-        "חצב",
-        "חצור",
-        "יד נתן",
-        "ינון",
-        "כנות",
-        "כפר אחים",
-        "כפר הרי''ף וצומת ראם",
-        "כפר ורבורג",
-        "כפר זוהרים",
-        "כפר מנחם",
-        "לכיש",
-        "מנוחה",
-        "מרכז שפירא",
-        "משואות יצחק",
-        "נגבה",
-        "נהורה",
-        "נוגה",
-        "נווה מבטח",
-        "נועם",
-        "נחלה",
-        "ניר בנים",
-        "ניר ח''ן",
-        "סגולה",
-        "עוזה",
-        "עוצם",
-        "עזר",
-        "עזריקם",
-        "עין צורים",
-        "ערוגות",
-        "פארק תעשייה ראם",
-        "קדמה",
-        "קוממיות",
-        "קריית גת, כרמי גת",
-        "קריית מלאכי",
-        "רבדים",
-        "רווחה",
-        "שדה דוד",
-        "שדה יואב",
-        "שדה משה",
-        "שדה עוזיהו",
-        "שחר",
-        "שלווה",
-        "שפיר",
-        "שתולים",
-        "תחנת רכבת קריית מלאכי - יואב",
-        "תימורים",
-        "תלמי יחיאל",
-        "תלמים",
-    ],
-    "מחוז מנשה": [
-        "אביאל",
-        "אור עקיבא",
-        "אזור תעשייה יקנעם עילית",
-        "אזור תעשייה מבוא כרמל",
-        "אזור תעשייה קיסריה",
-        "אלוני יצחק",
-        "אליקים",
-        'בי"ס כרמים בנימינה',
-        "בית חנניה",
-        "בנימינה",
-        "ג'סר א-זרקא",
-        "גבעת ניל''י",
-        "גבעת עדה",
-        "גבעת עוז",
-        "גלעד",
-        "גן השומרון",
-        "גן שמואל",
-        "דליה",
-        "זכרון יעקב",
-        "חדרה - מזרח",
-        "חדרה - מערב",
-        "חדרה - מרכז",
-        "חדרה - נווה חיים",
-        "יקנעם המושבה והזורע",
-        "יקנעם עילית",
-        "כפר גליקסון",
-        "כפר פינס",
-        "מאור",
-        "מדרך עוז",
-        "מעגן מיכאל",
-        "מעיין צבי",
-        "מענית, גבעת חביבה",
-        "משמר העמק",
-        "משמרות",
-        "מתחם שביל התפוזים",
-        "נמל קיסריה",
-        "עין העמק",
-        "עין השופט",
-        "עין עירון",
-        "עין שמר",
-        "עמיקם",
-        "פרדס חנה כרכור",
-        "קיבוץ מגידו",
-        "קיסריה",
-        "רגבים",
-        "רמות מנשה",
-        "רמת השופט",
-        "שדה יצחק",
-        "שדות ים",
-        "שער מנשה",
-        "תחנת רכבת כפר יהושוע",
-        "תלמי אלעזר",
-    ],
-    "מחוז מערב הנגב": [
-        "אופקים",
-        "אורים",
-        "אזור תעשייה נ.ע.מ",
-        "אשבול",
-        "אשל הנשיא",
-        "בטחה",
-        "בית הגדי",
-        "ברור חיל",
-        "ברוש",
-        "גבולות",
-        "גילת",
-        "דורות",
-        "זרועה",
-        "יושיביה",
-        "מבועים",
-        "מסלול",
-        "מעגלים, גבעולים, מלילות",
-        "ניר משה",
-        "ניר עקיבא",
-        "פדויים",
-        "פטיש",
-        "פעמי תש''ז",
-        "צאלים",
-        "קלחים",
-        "קריית חינוך מרחבים",
-        "רוחמה",
-        "רנן",
-        "שבי דרום",
-        "שדה צבי",
-        "שיבולים",
-        "שרשרת",
-        "תאשור",
-        "תדהר",
-        "תלמי ביל''ו",
-        "תפרח",
-    ],
-    "מחוז מערב לכיש": [
-        "אזור תעשייה הדרומי אשקלון",
-        "אזור תעשייה צפוני אשקלון",
-        "אשקלון - דרום",
-        "אשקלון - צפון",
-        "באר גנים",
-        "בית שקמה",
-        "ברכיה",
-        "בת הדר",
-        "גיאה",
-        "הודיה",
-        "חלץ",
-        "כוכב מיכאל",
-        "כפר סילבר",
-        "מבקיעים",
-        "משען",
-        "ניצן",
-        "ניצנים",
-        "ניר ישראל",
-        "תלמי יפה",
-    ],
-    "מחוז מרכז הנגב": [
-        "אזור תעשייה עידן הנגב",
-        "אתר דודאים",
-        "באר שבע - דרום",
-        "באר שבע - מזרח",
-        "באר שבע - מערב",
-        "באר שבע - צפון",
-        "בית קמה",
-        "גבעות בר",
-        "דביר",
-        "ואדי אל נעם דרום",
-        "חצרים",
-        "כרמים",
-        "כרמית",
-        "להב",
-        "להבים",
-        "לקיה",
-        "משמר הנגב",
-        "נבטים",
-        "עומר",
-        "רהט",
-        "שובל",
-        "שומריה",
-        "תארבין",
-    ],
-    "מחוז עוטף עזה": [
-        "אבשלום",
-        "אור הנר",
-        "ארז",
-        "בארי",
-        "בני נצרים",
-        "גבים, מכללת ספיר",
-        "גברעם",
-        "דקל",
-        "זיקים",
-        "זמרת, שובה",
-        "חולית",
-        "חוף זיקים",
-        "חניון רעים אנדרטת הנובה",
-        "יבול",
-        "יד מרדכי",
-        "יכיני",
-        "יתד",
-        "כיסופים",
-        "כפר מימון ותושיה",
-        "כפר עזה",
-        "כרם שלום",
-        "כרמיה",
-        "מבטחים, עמיעוז, ישע",
-        "מגן",
-        "מטווח ניר עם",
-        "מפלסים",
-        "נווה",
-        "נחל עוז",
-        "ניר יצחק",
-        "ניר עוז",
-        "ניר עם",
-        "נירים",
-        "נתיב העשרה",
-        "נתיבות",
-        "סופה",
-        "סעד",
-        "עין הבשור",
-        "עין השלושה",
-        "עלומים",
-        "פרי גן",
-        "צוחר, אוהד",
-        "רעים",
-        "שדה ניצן",
-        "שדי אברהם",
-        "שדרות, איבים",
-        "שוקדה",
-        "שלומית",
-        "תלמי אליהו",
-        "תלמי יוסף",
-        "תקומה",
-    ],
-    "מחוז ערבה": [
-        "אל עמארני, אל מסק",
-        "אליפז ומכרות תמנע",
-        "באר אורה",
-        "גרופית",
-        "חצבה",
-        "יהל",
-        "יטבתה",
-        "לוטן",
-        "נאות סמדר",
-        "נווה חריף",
-        "סמר",
-        "ספיר",
-        "עידן",
-        "עין חצבה",
-        "עין יהב",
-        "פארן",
-        "צופר",
-        "צוקים",
-        "קטורה",
-        "שחרות",
-        "שיטים",
-    ],
-    "מחוז קו העימות": [
-        "אביבים",
-        "אבירים",
-        "אבן מנחם",
-        "אדמית",
-        "אזור תעשייה רמת דלתון",
-        "איזור תעשייה מילואות צפון",
-        "אילון",
-        "אלקוש",
-        "בית הלל",
-        "בית העלמין החדש נהריה",
-        "בית ספר שדה מירון",
-        "בן עמי",
-        "בצת",
-        "ברעם",
-        "ג'ש - גוש חלב",
-        "גונן",
-        "גורן",
-        "גורנות הגליל",
-        "געתון",
-        "גשר הזיו",
-        "דוב''ב",
-        "דישון",
-        "דלתון",
-        "דפנה",
-        "הגושרים",
-        "הילה",
-        "זרעית",
-        "חוסן",
-        "חוף אכזיב",
-        "חוף בצת",
-        "חורפיש",
-        "חניתה",
-        "יחיעם",
-        "יערה",
-        "יפתח",
-        "יראון",
-        "כברי",
-        "כפר בלום",
-        "כפר גלעדי",
-        "כפר ורדים",
-        "כפר יובל",
-        "כפר סאלד",
-        "כרם בן זמרה",
-        "לב החולה",
-        "להבות הבשן",
-        "לימן",
-        "מטולה",
-        "מלכיה",
-        "מנות",
-        "מנרה",
-        "מעונה",
-        "מעיין ברוך",
-        "מעיליא",
-        "מעלות תרשיחא",
-        "מצובה",
-        "מרגליות",
-        "מרכז אזורי מבואות חרמון",
-        "משגב עם",
-        "מתת",
-        "נאות מרדכי",
-        "נהריה",
-        "נווה זיו",
-        "נטועה",
-        "סאסא",
-        "סער",
-        "ע'ג'ר",
-        "עבדון",
-        "עברון",
-        "עין יעקב",
-        "עלמה",
-        "עמיר",
-        "ערב אל עראמשה",
-        "פסוטה",
-        "פקיעין",
-        "פקיעין החדשה",
-        "צבעון",
-        "צוריאל",
-        "קיבוץ דן",
-        "קריית שמונה",
-        "ראש הנקרה",
-        "ריחאנייה",
-        "רמות נפתלי",
-        "שאר ישוב",
-        "שבי ציון",
-        "שדה נחמיה",
-        "שומרה",
-        "שלומי",
-        "שמיר",
-        "שניר",
-        "שתולה",
-        "תל חי",
-    ],
-    "מחוז קצרין": [
-        "אלמגור",
-        "אניעם",
-        "האון",
-        "חד נס",
-        "חמת גדר",
-        "כנף",
-        "מסדה",
-        "מעגן",
-        "מעלה גמלא",
-        "עין גב",
-        "צמח",
-        "קדמת צבי",
-        "קלע אלון",
-        "קצרין",
-        "קצרין - אזור תעשייה",
-        "רמות",
-        "רמת טראמפ",
-        "שעל",
-        "שער הגולן",
-        "תל קציר",
-    ],
-    "מחוז קריות": [
-        "אורנים",
-        "אושה",
-        "אזור תעשייה קריית ביאליק",
-        "איבטין",
-        "בית סוהר קישון",
-        "בית עלמין תל רגב",
-        "בסמת טבעון",
-        "יגור",
-        "כפר ביאליק",
-        "כפר המכבי",
-        "כפר ח'וואלד",
-        "כפר חסידים",
-        "נופית",
-        "קריית אתא",
-        "קריית ביאליק",
-        "קריית טבעון - בית זייד",
-        "קריית ים",
-        "קריית מוצקין",
-        "ראס עלי",
-        "רכסים",
-        "רמת יוחנן",
-        "שער העמקים",
-    ],
-    "מחוז שומרון": [
-        "אביתר",
-        "אבני חפץ",
-        "אורנית",
-        "אזור תעשייה אריאל",
-        "אזור תעשייה בראון",
-        "אזור תעשייה ברקן",
-        "אזור תעשייה שחק",
-        "אזור תעשייה שער בנימין",
-        "אחיה",
-        "איתמר",
-        "אלון מורה",
-        "אלפי מנשה",
-        "אלקנה",
-        "אעירה השחר",
-        "אריאל",
-        "בית אל",
-        "בית אריה",
-        "בית חורון",
-        "ברוכין",
-        "ברקן",
-        "גבע בנימין",
-        "גבעון החדשה",
-        "גבעת אסף",
-        "גבעת הראל",
-        "גבעת הרואה",
-        "גבעת פורת יוסף",
-        "גופנה",
-        "דולב",
-        "דורות עילית",
-        "החווה של זוהר",
-        "הר ברכה",
-        "חוות אביה",
-        "חוות אביחי",
-        "חוות אל נווה",
-        "חוות אלחי",
-        "חוות בניהו",
-        "חוות גלעד",
-        "חוות חנינא",
-        "חוות יאיר",
-        "חוות ינון",
-        "חוות מגדלים",
-        "חוות מגנזי",
-        "חוות מלכיאל",
-        "חוות מעלה אהוביה",
-        "חוות מרום שמואל",
-        "חוות נווה צוף",
-        'חוות נוף אב"י',
-        "חוות נחל שילה",
-        "חוות נחלת צבי",
-        "חוות עולם חסד",
-        "חוות צרידה",
-        "חוות ראש תאנה",
-        "חוות שדה",
-        "חוות שוביאל",
-        "חוות שחרית",
-        "חומש",
-        "חיננית",
-        "חרמש",
-        "חרמש דרום",
-        "חרשה",
-        "טל מנשה",
-        "טלמון",
-        "יבוא דודי",
-        "יצהר",
-        "יקיר",
-        "כוכב השחר",
-        "כוכב יאיר - צור יגאל",
-        "כוכב יעקב",
-        "כפר האורנים",
-        "כפר תפוח",
-        "כרם רעים",
-        "מבוא דותן",
-        "מבוא חורון",
-        "מגדלים",
-        "מגרון",
-        "מודיעין עילית",
-        "מכינת אלישע",
-        "מלאכי השלום",
-        "מעלה לבונה",
-        "מעלה מכמש",
-        "מצפה דני",
-        "מתתיהו",
-        "נווה ארז",
-        "נווה צוף",
-        "נופי נחמיה",
-        "נופים",
-        "נחליאל",
-        "נילי",
-        "נעלה",
-        "נריה",
-        "סלעית",
-        "עופרים",
-        "עטרת",
-        "עלי",
-        "עלי זהב - לשם",
-        "עמיחי",
-        "עמנואל",
-        "ענב",
-        "עפרה",
-        "עץ אפרים",
-        "פדואל",
-        "פסגות",
-        "צופים",
-        "קדומים",
-        "קריית נטפים",
-        "קרני שומרון",
-        "רבבה",
-        "רחלים",
-        "ריחן",
-        "רימונים",
-        "רמת מגרון",
-        "שבות רחל",
-        "שבי שומרון",
-        "שדה אפרים",
-        "שילה",
-        "שערי תקווה",
-        "שקד",
-        "תל ציון",
-    ],
-    "מחוז שרון": [
-        "אבן יהודה",
-        "אודים",
-        "אלישמע",
-        "ארסוף",
-        "בית ברל",
-        "בית יהושע",
-        "בית עלמין מורשה",
-        "בני ציון",
-        "בצרה",
-        "ג'לג'וליה",
-        "גבעת חן",
-        "גן חיים",
-        "גני עם",
-        "געש",
-        "הוד השרון",
-        "הרצליה - מערב",
-        "הרצליה - מרכז וגליל ים",
-        "חגור",
-        "חורשים",
-        "חרוצים",
-        "יקום",
-        "ירחיב",
-        "ירקונה",
-        "כפר ברא",
-        "כפר מל''ל",
-        "כפר נטר",
-        "כפר סבא",
-        "כפר קאסם",
-        "כפר שמריהו",
-        "מכון וינגייט",
-        "מסוף אורנית",
-        "מרכז אזורי דרום השרון",
-        "מתחם גלילות",
-        "מתחם פי גלילות",
-        "מתן",
-        "נווה ימין",
-        "נווה ירק",
-        "ניר אליהו",
-        "נירית",
-        "נתניה - מזרח",
-        "נתניה - מערב",
-        "עדנים",
-        "צופית",
-        "רמות השבים",
-        "רמת השרון",
-        "רעננה",
-        "רשפון",
-        "שדה ורבורג",
-        "שדי חמד",
-        "שפיים",
-        "תחנת רכבת ראש העין",
-        "תל יצחק",
-    ],
-    "מחוז תבור": [
-        "אזור תעשייה אלון התבור",
-        "אזור תעשייה מבואות הגלבוע",
-        "אזור תעשייה ציפורית",
-        "אחוזת ברק",
-        "אכסאל",
-        "אלון הגליל",
-        "אלוני אבא",
-        "אלונים",
-        "בית לחם הגלילית",
-        "בית שערים",
-        "בלפוריה",
-        "גבעת אלה",
-        "גבת",
-        "גדעונה",
-        "גזית",
-        "גן נר",
-        "גניגר",
-        "דבוריה",
-        "דברת",
-        "דחי",
-        "הושעיה",
-        "היוגב",
-        "הסוללים",
-        "הרדוף",
-        "זרזיר",
-        "חג'אג'רה",
-        "חנתון",
-        "טמרה בגלבוע",
-        "יזרעאל",
-        "יפיע",
-        "יפעת",
-        "ישובי אומן",
-        "ישובי יעל",
-        "כעביה טבאש",
-        "כפר ברוך",
-        "כפר גדעון",
-        "כפר החורש",
-        "כפר יהושע",
-        "כפר יחזקאל",
-        "כפר כנא",
-        "כפר מצר",
-        "כפר תבור",
-        "כפר תקווה",
-        "מגדל העמק",
-        "מגן שאול",
-        "מוקיבלה",
-        "מזרע",
-        "מנשית זבדה",
-        "מרחביה מושב",
-        "מרחביה קיבוץ",
-        "מרכז חבר",
-        "משהד",
-        "מתחם סקי גלבוע",
-        "נאעורה",
-        "נהלל",
-        "נוף הגליל",
-        "נורית",
-        "נין",
-        "נצרת",
-        "סואעד חמירה",
-        "סולם",
-        "סנדלה",
-        "עדי",
-        "עוזייר, רומאנה",
-        "עילוט",
-        "עין דור",
-        "עין חרוד, תל יוסף",
-        "עין מאהל",
-        "עפולה",
-        "ציפורי",
-        "קבוצת גבע",
-        "רומת אל הייב",
-        "ריינה",
-        "רם און",
-        "רמת דוד",
-        "רמת ישי",
-        "רמת צבי",
-        "שדה יעקב",
-        "שיבלי אום אלג'נם",
-        "שמשית",
-        "שריד",
-        "תחנת רכבת כפר ברוך",
-        "תל עדשים",
-        "תמרת",
-    ],
-}
+from .tables import load_table
+
+DISTRICT_AREAS: dict[str, list[str]] = load_table("district_to_areas")
@@ -1,1454 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-SEGMENT_TO_AREA: dict[int, str] = {
-    5000004: "אילת",
-    5000009: "אילות",
-    5000010: "אזור תעשייה שחורת",
-    5000012: "באר אורה",
-    5000015: "אליפז ומכרות תמנע",
-    5000016: "סמר",
-    5000018: "יטבתה",
-    5000019: "שחרות",
-    5000022: "גרופית",
-    5000023: "קטורה",
-    5000024: "לוטן",
-    5000026: "נווה חריף",
-    5000027: "נאות סמדר",
-    5000028: "יהל",
-    5000030: "שיטים",
-    5000033: "פארן",
-    5000035: "צוקים",
-    5000036: "צופר",
-    5000038: "מצפה רמון",
-    5000039: "ספיר",
-    5000044: "עין יהב",
-    5000046: "חצבה",
-    5000047: "עזוז",
-    5000049: "עין חצבה",
-    5000050: "עידן",
-    5000052: "שאנטי במדבר",
-    5000053: "מדרשת בן גוריון",
-    5000054: "שדה בוקר",
-    5000055: "ניצנה",
-    5000058: "מרחב עם",
-    5000059: "קדש ברנע",
-    5000073: "ירוחם",
-    5000075: "טללים",
-    5000077: "משאבי שדה",
-    5000078: "ביר הדאג'",
-    5000083: "רביבים",
-    5000085: "רתמים",
-    5000087: "אזור תעשייה דימונה",
-    5000088: "דימונה",
-    5000089: "אזור תעשייה רותם",
-    5000090: "קסר א-סר",
-    5000091: "ואדי אל נעם דרום",
-    5000092: "אבו קרינאת",
-    5000095: "בני נצרים",
-    5000098: "ערערה בנגב",
-    5000099: "נווה",
-    5000102: "שלומית",
-    5000103: "אבו תלול",
-    5000104: "נווה זוהר",
-    5000105: "יבול",
-    5000106: "שגב שלום",
-    5000108: "בתי מלון ים המלח",
-    5000109: "אבשלום",
-    5000110: "דקל",
-    5000112: "יתד",
-    5000113: "תלמי יוסף",
-    5000114: "צאלים",
-    5000115: "אל פורעה",
-    5000117: "שדי אברהם",
-    5000118: "גבולות",
-    5000119: "עין בוקק",
-    5000120: "פרי גן",
-    5000121: "שדה ניצן",
-    5000124: "באר שבע - מזרח",
-    5000125: "נבטים",
-    5000126: "כסייפה",
-    5000127: "כרם שלום",
-    5000128: "חולית",
-    5000129: "תלמי אליהו",
-    5000131: "תל שבע",
-    5000133: "סופה",
-    5000134: "ניר יצחק",
-    5000135: "מבטחים, עמיעוז, ישע",
-    5000136: "צוחר, אוהד",
-    5000137: "סעווה",
-    5000139: "חצרים",
-    5000141: "באר שבע - מערב",
-    5000143: "ערד",
-    5000144: "אום בטין",
-    5000147: "עומר",
-    5000150: "מרעית",
-    5000151: "עין הבשור",
-    5000153: "לקיה",
-    5000154: "מגן",
-    5000155: "אופקים",
-    5000156: "חורה",
-    5000158: "אורים",
-    5000159: "ניר עוז",
-    5000161: "פטיש",
-    5000162: "מסלול",
-    5000163: "קריית חינוך מרחבים",
-    5000164: "גילת",
-    5000166: "פדויים",
-    5000167: "תפרח",
-    5000168: "אשל הנשיא",
-    5000169: "מיתר",
-    5000170: "מצדה",
-    5000171: "נירים",
-    5000172: "רנן",
-    5000173: "בטחה",
-    5000175: "כרמית",
-    5000176: "כרמים",
-    5000178: "עין השלושה",
-    5000179: "תארבין",
-    5000181: "גבעות בר",
-    5000182: "הר עמשא",
-    5000184: "משמר הנגב",
-    5000185: "להבים",
-    5000186: "שני ליבנה",
-    5000188: "כיסופים",
-    5000189: "ברוש",
-    5000190: "תאשור",
-    5000191: "רהט",
-    5000192: "סנסנה",
-    5000193: "בית יתיר",
-    5000194: "רעים",
-    5000195: "תדהר",
-    5000196: "אזור תעשייה עידן הנגב",
-    5000197: "להב",
-    5000198: "טנא עומרים",
-    5000199: "אזור תעשייה מיתרים",
-    5000200: "מעגלים, גבעולים, מלילות",
-    5000201: "שיבולים",
-    5000202: "שרשרת",
-    5000203: "אשכולות",
-    5000204: "שמעה",
-    5000205: "סוסיא",
-    5000206: "נתיבות",
-    5000207: "אזור תעשייה נ.ע.מ",
-    5000208: "שובל",
-    5000209: "שוקדה",
-    5000210: "דביר",
-    5000211: "מעון",
-    5000212: "בארי",
-    5000213: "כפר מימון ותושיה",
-    5000214: "תלמי ביל''ו",
-    5000215: "פעמי תש''ז",
-    5000216: "שומריה",
-    5000217: "כרמל",
-    5000218: "מרחצאות עין גדי",
-    5000219: "עלומים",
-    5000220: "זמרת, שובה",
-    5000222: "תקומה",
-    5000223: "יושיביה",
-    5000224: "מבועים",
-    5000225: "אשבול",
-    5000226: "קלחים",
-    5000227: "בית קמה",
-    5000229: "עתניאל",
-    5000231: "שדה צבי",
-    5000232: "זרועה",
-    5000233: "עין גדי",
-    5000234: "נחל עוז",
-    5000235: "סעד",
-    5000236: "ניר עקיבא",
-    5000237: "שבי דרום",
-    5000239: "כפר עזה",
-    5000240: "יכיני",
-    5000241: "ניר משה",
-    5000242: "נטע",
-    5000243: "מעלה חבר",
-    5000244: "מפלסים",
-    5000245: "רוחמה",
-    5000246: "נגוהות",
-    5000247: 'בית חג"י',
-    5000248: "שדרות, איבים",
-    5000249: "דורות",
-    5000251: "מטווח ניר עם",
-    5000252: "ניר עם",
-    5000254: "בני דקלים",
-    5000255: "שקף",
-    5000257: "אליאב",
-    5000258: "קרית ארבע",
-    5000261: "כרמי קטיף ואמציה",
-    5000263: "ארז",
-    5000264: "אחוזם",
-    5000266: "אור הנר",
-    5000267: "ברור חיל",
-    5000268: "תלמים",
-    5000269: "שלווה",
-    5000270: "לכיש",
-    5000271: "אדורה",
-    5000272: "נתיב העשרה",
-    5000273: "איתן",
-    5000274: "נועם",
-    5000275: "תלם",
-    5000276: "חלץ",
-    5000277: "שדה דוד",
-    5000278: "אבן שמואל",
-    5000280: "מצפה שלם",
-    5000281: "יד מרדכי",
-    5000282: "גברעם",
-    5000283: "עוזה",
-    5000284: "אזור תעשייה קריית גת",
-    5000287: "זוהר",
-    5000288: "מיצד",
-    5000289: "פני קדם",
-    5000290: "זיקים",
-    5000291: "כרמיה",
-    5000292: "ניר ח''ן",
-    5000293: "קריית גת, כרמי גת",
-    5000294: "מעלה עמוס",
-    5000295: "מצוקי דרגות",
-    5000297: "תלמי יפה",
-    5000298: "שחר",
-    5000300: "שדה משה",
-    5000301: "בית גוברין",
-    5000302: "כרמי צור",
-    5000304: "מבקיעים",
-    5000305: "אזור תעשייה הדרומי אשקלון",
-    5000306: "גיאה",
-    5000307: "כוכב מיכאל",
-    5000308: "נוגה",
-    5000309: "נהורה",
-    5000310: "כפר זוהרים",
-    5000311: "בית שקמה",
-    5000312: "עוצם",
-    5000314: "גת",
-    5000315: "גלאון",
-    5000316: "נחושה",
-    5000317: "בת הדר",
-    5000318: "שדה יואב",
-    5000319: "רווחה",
-    5000320: "אשקלון - צפון",
-    5000321: "משען",
-    5000322: "יד נתן",
-    5000323: "אלומה",
-    5000324: "מנוחה",
-    5000325: "בית ניר",
-    5000326: "כפר עציון",
-    5000328: "מגדל עוז",
-    5000329: "אפרת",
-    5000330: "תקוע",
-    5000331: "נוקדים",
-    5000333: "אזור תעשייה צפוני אשקלון",
-    5000334: "נגבה",
-    5000335: "קוממיות",
-    5000336: "זבדיאל",
-    5000337: "נחלה",
-    5000338: "צפרירים",
-    5000339: "אדרת",
-    5000340: "בת עין",
-    5000341: "אלון שבות",
-    5000342: "כפר אלדד",
-    5000344: "ברכיה",
-    5000345: "הודיה",
-    5000346: "ניר בנים",
-    5000347: "סגולה",
-    5000348: "ורדון",
-    5000349: "גבעת ישעיהו",
-    5000350: "גבעות עדן",
-    5000351: "אלעזר",
-    5000352: "כפר סילבר",
-    5000353: "זרחיה",
-    5000354: "שריגים - לי-און",
-    5000355: "נווה מיכאל - רוגלית",
-    5000356: "ראש צורים",
-    5000357: "ניר ישראל",
-    5000358: "לוזית",
-    5000359: "אביעזר",
-    5000360: "גבעות",
-    5000361: "נווה דניאל",
-    5000362: "באר גנים",
-    5000365: "משואות יצחק",
-    5000366: "מרכז שפירא",
-    5000367: "עין צורים",
-    5000368: "שפיר",
-    5000369: "עגור",
-    5000370: "נתיב הל''ה",
-    5000371: "ביתר עילית",
-    5000372: "אבנת",
-    5000373: "אביגדור",
-    5000374: "קדמה",
-    5000376: "ניצנים",
-    5000377: "כפר ורבורג",
-    5000378: "תימורים",
-    5000380: "זכריה",
-    5000382: "באר טוביה",
-    5000384: "אזור תעשייה באר טוביה",
-    5000385: "קריית מלאכי",
-    5000386: "אזור תעשייה תימורים",
-    5000387: "אל עזי",
-    5000388: "שדות מיכה",
-    5000389: "מטע",
-    5000390: "צור הדסה",
-    5000391: "ירושלים - מרכז",
-    5000394: "בית עזרא",
-    5000395: "גבעתי",
-    5000396: "ערוגות",
-    5000397: "כפר מנחם",
-    5000399: "אזור תעשייה ברוש",
-    5000400: "בר גיורא",
-    5000401: "מבוא ביתר",
-    5000402: "הר גילה",
-    5000404: "ניצן",
-    5000405: "עזר",
-    5000406: "אמונים",
-    5000407: "אורות",
-    5000408: "כפר אחים",
-    5000409: "ינון",
-    5000410: "כפר הרי''ף וצומת ראם",
-    5000411: "גפן",
-    5000412: "בית שמש",
-    5000413: "זנוח",
-    5000415: "ירושלים - דרום",
-    5000416: "שדה עוזיהו",
-    5000417: "עזריקם",
-    5000419: "אחווה",
-    5000420: "תלמי יחיאל",
-    5000421: "תירוש",
-    5000422: "מחסיה",
-    5000423: "נס הרים",
-    5000425: "אזור תעשייה עד הלום",
-    5000427: "ישעי",
-    5000428: "עמינדב",
-    5000429: "אורה",
-    5000431: "קדר",
-    5000432: "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
-    5000433: "אשדוד - ח,ט,י,יג,יד,טז",
-    5000434: "שתולים",
-    5000435: "חצור",
-    5000436: "פארק תעשייה ראם",
-    5000437: "חצב",
-    5000438: "בני ראם",
-    5000439: "רבדים",
-    5000440: "צרעה",
-    5000441: "אזור תעשייה הר טוב - צרעה",
-    5000442: "נחם",
-    5000443: "אבן ספיר",
-    5000444: "קליה",
-    5000447: "גן יבנה",
-    5000448: "כסלון",
-    5000449: "רמת רזיאל",
-    5000454: "מעלה אדומים",
-    5000455: "אשדוד - ג,ו,ז",
-    5000456: "בני עי''ש",
-    5000457: "גני טל",
-    5000458: "חפץ חיים",
-    5000460: "רטורנו - גבעת שמש",
-    5000461: "תרום",
-    5000462: "אשתאול",
-    5000464: "צובה",
-    5000465: "פנימיית עין כרם",
-    5000466: "בית זית",
-    5000468: "אשדוד - א,ב,ד,ה",
-    5000470: "ביצרון",
-    5000471: "בית חלקיה",
-    5000472: "יד בנימין",
-    5000473: "כפר אוריה",
-    5000474: "גבעת יערים",
-    5000475: "עין ראפה",
-    5000478: "אזור תעשייה מישור אדומים",
-    5000480: "גן הדרום",
-    5000481: "נווה מבטח",
-    5000482: "כנות",
-    5000483: "אזור תעשייה כנות",
-    5000484: "גדרה",
-    5000486: "טל שחר",
-    5000487: "צלפון",
-    5000488: "תעוז",
-    5000489: "מסילת ציון",
-    5000490: "בית מאיר",
-    5000491: "שורש",
-    5000492: "שואבה",
-    5000493: "עין נקובא",
-    5000494: "מבשרת ציון",
-    5000495: "מוצא עילית",
-    5000496: "ירושלים - מזרח",
-    5000499: "אלמוג",
-    5000500: "בני דרום",
-    5000501: "קבוצת יבנה",
-    5000502: "משגב דב",
-    5000503: "מישר",
-    5000504: "קדרון",
-    5000505: "גיזו",
-    5000506: "הראל",
-    5000507: "נווה אילן",
-    5000509: "יד השמונה",
-    5000510: "קריית יערים",
-    5000511: "אבו גוש",
-    5000512: "בית נקופה",
-    5000513: "קריית ענבים",
-    5000517: "ניר גלים",
-    5000518: "כרם ביבנה",
-    5000519: "גבעת וושינגטון",
-    5000520: "עשרת",
-    5000522: "יסודות",
-    5000523: "נצר חזני",
-    5000524: "משמר דוד",
-    5000525: "נווה שלום",
-    5000526: "מעלה החמישה",
-    5000527: "ירושלים - צפון",
-    5000529: "בית הערבה",
-    5000530: "אשדוד - איזור תעשייה צפוני",
-    5000531: "כפר אביב",
-    5000532: "שדמה",
-    5000533: "כפר מרדכי",
-    5000534: "מזכרת בתיה",
-    5000535: "חולדה",
-    5000536: "בקוע",
-    5000537: "נחשון",
-    5000538: "הר אדר",
-    5000539: "נופי פרת",
-    5000540: "כפר אדומים",
-    5000541: "מצפה יריחו",
-    5000543: "בניה",
-    5000544: "בית אלעזרי",
-    5000545: "לטרון",
-    5000546: "נטף",
-    5000549: "עלמון",
-    5000550: "ורד יריחו",
-    5000553: "כרמי יוסף",
-    5000554: "מבוא חורון",
-    5000556: "אלון",
-    5000557: "בן זכאי",
-    5000558: "בית גמליאל",
-    5000559: "גני יוחנן",
-    5000560: "קריית עקרון",
-    5000561: "פדיה",
-    5000562: "כפר בן נון",
-    5000564: "ירושלים - אזור תעשייה עטרות",
-    5000565: "גבע בנימין",
-    5000566: "יבנה",
-    5000567: "גבעת ברנר",
-    5000568: "יציץ",
-    5000569: "פתחיה",
-    5000570: "גבעת זאב",
-    5000571: "גאליה",
-    5000572: "גן שלמה",
-    5000575: "כפר ביל''ו",
-    5000577: "רמות מאיר",
-    5000578: "בית עוזיאל",
-    5000579: "גזר",
-    5000580: "משמר איילון",
-    5000582: "נוף איילון, שעלבים",
-    5000584: "אזור תעשייה שער בנימין",
-    5000585: "כפר הנגיד",
-    5000587: "רחובות",
-    5000589: "גני הדר",
-    5000590: "נען",
-    5000591: "סתריה",
-    5000592: "עזריה",
-    5000593: "כפר שמואל",
-    5000594: "מודיעין - ישפרו סנטר",
-    5000596: "בית חורון",
-    5000597: "תל ציון",
-    5000598: "כוכב יעקב",
-    5000599: "מגרון",
-    5000700: "נתיב הגדוד",
-    5000701: "חולון",
-    5000702: "משמר השבעה",
-    5000703: "טירת יהודה",
-    5000704: "אזור תעשייה חבל מודיעין שוהם",
-    5000705: "נווה צוף",
-    5000706: "עטרת",
-    5000707: "גלגל",
-    5000709: "אזור",
-    5000710: "גנות",
-    5000711: "חמד",
-    5000712: "בני עטרות",
-    5000713: "ברקת",
-    5000714: "עופרים",
-    5000715: "מקווה ישראל",
-    5000716: "אור יהודה",
-    5000717: "יהוד מונוסון",
-    5000719: "גבעת כ''ח",
-    5000720: "תומר",
-    5000722: "תל אביב - דרום העיר ויפו",
-    5000724: "תל אביב - מזרח",
-    5000726: "סביון",
-    5000727: "בארות יצחק",
-    5000728: "בית אריה",
-    5000730: "רמת גן - מזרח",
-    5000732: "מגשימים",
-    5000733: "נופך",
-    5000734: "רינתיה",
-    5000735: "אלעד",
-    5000737: "קריית אונו",
-    5000738: "נחלים",
-    5000739: "מזור",
-    5000740: "שילה",
-    5000741: "פצאל",
-    5000742: "תל אביב - מרכז העיר",
-    5000744: "גבעתיים",
-    5000745: "רמת גן - מערב",
-    5000746: "גני תקווה",
-    5000747: "מעש",
-    5000748: "נחשונים",
-    5000749: "פדואל",
-    5000750: "מעלה לבונה",
-    5000754: "בני ברק",
-    5000755: "גבעת שמואל",
-    5000758: "גת רימון",
-    5000761: "כפר סירקין",
-    5000763: "עלי זהב - לשם",
-    5000764: "עלי",
-    5000765: "אחיה",
-    5000766: "יפית",
-    5000772: "עינת",
-    5000775: "מעלה אפרים",
-    5000781: "ראש העין",
-    5000782: "ברוכין",
-    5000783: "תל אביב - עבר הירקון",
-    5000785: "פתח תקווה",
-    5000787: "גבעת השלושה",
-    5000788: "ברקן",
-    5000789: "מגדלים",
-    5000792: "אזור תעשייה אפק ולב הארץ",
-    5000793: "כפר קאסם",
-    5000794: "אלקנה",
-    5000795: "אריאל",
-    5000796: "נופי נחמיה",
-    5000797: "רחלים",
-    5000798: "גיתית",
-    5000799: "משואה",
-    5000800: "עץ אפרים",
-    5000801: "קריית נטפים",
-    5000802: "רמת השרון",
-    5000804: "אורנית",
-    5000805: "שערי תקווה",
-    5000806: "רבבה",
-    5000807: "כפר תפוח",
-    5000810: "הוד השרון",
-    5000812: "עדנים",
-    5000813: "נווה ירק",
-    5000814: "מרכז אזורי דרום השרון",
-    5000815: "חגור",
-    5000816: "חורשים",
-    5000817: "כפר ברא",
-    5000818: "מתחם גלילות",
-    5000822: "ירקונה",
-    5000823: "נירית",
-    5000824: "הרצליה - מרכז וגליל ים",
-    5000825: "גני עם",
-    5000827: "אלישמע",
-    5000828: "ג'לג'וליה",
-    5000829: "ירחיב",
-    5000830: "מתן",
-    5000831: "יקיר",
-    5000832: "נופים",
-    5000834: "הרצליה - מערב",
-    5000837: "גבעת חן",
-    5000838: "רמות השבים",
-    5000839: "שדי חמד",
-    5000840: "כפר סבא",
-    5000841: "עמנואל",
-    5000842: "כפר מל''ל",
-    5000843: "נווה ימין",
-    5000844: "אלפי מנשה",
-    5000846: "קרני שומרון",
-    5000847: "מכורה",
-    5000848: "כפר שמריהו",
-    5000849: "רעננה",
-    5000851: "יצהר",
-    5000852: "איתמר",
-    5000853: "ארגמן",
-    5000854: "צופית",
-    5000855: "רשפון",
-    5000856: "גן חיים",
-    5000857: "שדה ורבורג",
-    5000858: "בית ברל",
-    5000859: "ניר אליהו",
-    5000860: "צופים",
-    5000861: "הר ברכה",
-    5000862: "ארסוף",
-    5000863: "בצרה",
-    5000864: "אייל",
-    5000865: "חמרה",
-    5000866: "שפיים",
-    5000867: "בני ציון",
-    5000868: "רמת הכובש",
-    5000869: "טירה",
-    5000870: "כוכב יאיר - צור יגאל",
-    5000871: "קדומים",
-    5000872: "געש",
-    5000873: "חרוצים",
-    5000874: "משמרת",
-    5000876: "חרות",
-    5000877: "אלון מורה",
-    5000878: "יקום",
-    5000879: "כפר הס",
-    5000880: "צור יצחק",
-    5000881: "צור נתן",
-    5000882: "סלעית",
-    5000883: "אזור תעשייה בראון",
-    5000884: "תל יצחק",
-    5000885: "תל מונד",
-    5000886: "טייבה",
-    5000887: "בקעות",
-    5000888: "מכון וינגייט",
-    5000889: "אודים",
-    5000890: "בית יהושע",
-    5000891: "אבן יהודה",
-    5000892: "בני דרור",
-    5000893: "עין ורד",
-    5000894: "כפר עבודה",
-    5000895: "עזריאל",
-    5000896: "רועי",
-    5000897: "חמדת",
-    5000899: "כפר נטר",
-    5000900: "קדימה צורן",
-    5000901: "פורת",
-    5000902: "יעבץ, יעף",
-    5000904: "שבי שומרון",
-    5000906: "עין שריד",
-    5000907: "קלנסווה",
-    5000910: "שער אפרים",
-    5000911: "אבני חפץ",
-    5000912: "ענב",
-    5000913: "נתניה - מזרח",
-    5000914: "צור משה",
-    5000915: "גאולים",
-    5000916: "פרדסיה",
-    5000917: "ינוב",
-    5000918: "תנובות",
-    5000919: "ניצני עוז",
-    5000920: "נתניה - מערב",
-    5000921: "נורדיה",
-    5000922: "כפר יונה",
-    5000923: "בארותיים",
-    5000925: "בית יצחק - שער חפר",
-    5000926: "גנות הדר",
-    5000927: "בורגתה",
-    5000928: "יד חנה",
-    5000930: "חניאל",
-    5000931: "עולש",
-    5000932: "בת חפר",
-    5000933: "משכיות",
-    5000934: "כפר ידידיה",
-    5000935: "המרכז האקדמי רופין",
-    5000936: "כפר מונש",
-    5000937: "גן יאשיה",
-    5000938: "שושנת העמקים",
-    5000940: "אביחיל",
-    5000941: "הדר עם",
-    5000942: "כפר חיים",
-    5000943: "בית הלוי",
-    5000944: "בחן",
-    5000945: "רותם",
-    5000946: "שדמות מחולה",
-    5000947: "חבצלת השרון וצוקי ים",
-    5000949: "בת חן",
-    5000950: "ביתן אהרן",
-    5000951: "גבעת שפירא",
-    5000952: "משמר השרון",
-    5000953: "מעברות",
-    5000954: "העוגן",
-    5000955: "אמץ",
-    5000956: "זמר",
-    5000957: "נעורים",
-    5000958: "בית חרות",
-    5000959: "בית ינאי",
-    5000960: "כפר ויתקין",
-    5000961: "אלישיב",
-    5000962: "המעפיל",
-    5000963: "מחולה",
-    5000964: "חופית",
-    5000966: "כפר הרא''ה",
-    5000967: "חגלה",
-    5000968: "גבעת חיים מאוחד",
-    5000969: "עין החורש",
-    5000970: "אחיטוב",
-    5000971: "מגל",
-    5000972: "אזור תעשייה עמק חפר",
-    5000973: "גאולי תימן",
-    5000974: "חיבת ציון",
-    5000975: "גבעת חיים איחוד",
-    5000976: "להבות חביבה",
-    5000977: "ג'ת",
-    5000978: "מכמורת",
-    5000979: "חרב לאת",
-    5000980: "אליכין",
-    5000981: "שדה יצחק",
-    5000982: "באקה אל גרבייה",
-    5000983: "חדרה - מזרח",
-    5000984: "חדרה - מערב",
-    5000985: "חדרה - מרכז",
-    5000986: "מאור",
-    5000987: "חרמש",
-    5000988: "מבוא דותן",
-    5000989: "חדרה - נווה חיים",
-    5000991: "טירת צבי",
-    5000992: "גן שמואל",
-    5000993: "תלמי אלעזר",
-    5000994: "מצר",
-    5000995: "שדי תרומות",
-    5000998: "שער מנשה",
-    5000999: "מייסר",
-    5001000: "כפר גמילה מלכישוע",
-    5001001: "תל תאומים",
-    5001002: "שדה אליהו",
-    5001003: "פרדס חנה כרכור",
-    5001004: "גן השומרון",
-    5001005: "עין שמר",
-    5001006: "מענית, גבעת חביבה",
-    5001008: "חריש",
-    5001009: "מירב",
-    5001010: "רוויה",
-    5001011: "רחוב",
-    5001015: "אום אל קוטוף",
-    5001016: "מצפה אילן",
-    5001017: "ברטעה",
-    5001018: "ריחן",
-    5001019: "כפר רופין",
-    5001020: "אזור תעשייה קיסריה",
-    5001022: "ברקאי",
-    5001023: "שקד",
-    5001024: "מעלה גלבוע",
-    5001025: "רשפים, שלוחות, שלפים",
-    5001027: "עין הנצי''ב",
-    5001028: "שדות ים",
-    5001029: "קיסריה",
-    5001030: "משמרות",
-    5001031: "כפר פינס",
-    5001032: "עין עירון",
-    5001033: "קציר",
-    5001034: "טל מנשה",
-    5001035: "חיננית",
-    5001039: "כפר קרע",
-    5001040: "ערערה",
-    5001041: "עין אל סהלה",
-    5001042: "בית שאן",
-    5001043: "נמל קיסריה",
-    5001044: "אור עקיבא",
-    5001045: "כפר גליקסון",
-    5001046: "אל עריאן",
-    5001047: "אום אל פחם",
-    5001048: "מי עמי",
-    5001049: "מסילות",
-    5001051: "נוה איתן",
-    5001052: "מעוז חיים",
-    5001053: "בנימינה",
-    5001054: "אלוני יצחק",
-    5001055: "ניר דוד",
-    5001056: "גבעת עדה",
-    5001057: "רגבים",
-    5001060: "מוקיבלה",
-    5001061: "מגן שאול",
-    5001062: "בית אלפא וחפציבה",
-    5001063: "ג'סר א-זרקא",
-    5001064: "בית חנניה",
-    5001065: "אביאל",
-    5001066: "מועאוויה",
-    5001067: "רם און",
-    5001068: "סנדלה",
-    5001069: "גן נר",
-    5001070: "שדה נחום",
-    5001071: "חמדיה",
-    5001072: "מעגן מיכאל",
-    5001073: 'בי"ס כרמים בנימינה',
-    5001074: "גבעת ניל''י",
-    5001075: "מעלה עירון",
-    5001076: "מרכז חבר",
-    5001077: "ישובי יעל",
-    5001078: "נורית",
-    5001081: "זכרון יעקב",
-    5001083: "גלעד",
-    5001084: "גבעת עוז",
-    5001085: "גדעונה",
-    5001086: "עין חרוד, תל יוסף",
-    5001087: "בית השיטה",
-    5001088: "מעיין צבי",
-    5001089: "עמיקם",
-    5001090: "ישובי אומן",
-    5001091: "יזרעאל",
-    5001092: "כפר יחזקאל",
-    5001094: "בית יוסף",
-    5001095: "קיבוץ מגידו",
-    5001096: "אזור תעשייה מבואות הגלבוע",
-    5001097: "קבוצת גבע",
-    5001098: "ירדנה",
-    5001099: "פוריידיס",
-    5001100: "מאיר שפיה",
-    5001101: "רמות מנשה",
-    5001102: "דליה",
-    5001103: "עין השופט",
-    5001104: "מדרך עוז",
-    5001106: "רמת צבי",
-    5001107: "מולדת",
-    5001108: "נווה אור",
-    5001109: "דור, נחשולים",
-    5001110: "בת שלמה",
-    5001112: "עפולה",
-    5001115: "רמת השופט",
-    5001116: "משמר העמק",
-    5001117: "היוגב",
-    5001118: "מרחביה מושב",
-    5001119: "מרחביה קיבוץ",
-    5001120: "סולם",
-    5001121: "נאעורה",
-    5001122: "טייבה בגלבוע",
-    5001123: "עופר",
-    5001125: "אזור תעשייה מבוא כרמל",
-    5001128: "הבונים",
-    5001129: "עין איילה",
-    5001131: "אליקים",
-    5001132: "עין העמק",
-    5001134: "דחי",
-    5001135: "גשר",
-    5001136: "כרם מהר''ל",
-    5001137: "יקנעם עילית",
-    5001138: "יקנעם המושבה והזורע",
-    5001139: "בלפוריה",
-    5001140: "נין",
-    5001141: "אזור תעשייה אלון התבור",
-    5001142: "טמרה בגלבוע",
-    5001143: "צרופה",
-    5001144: "מרכז מיר''ב",
-    5001145: "כפר ברוך",
-    5001146: "כפר גדעון",
-    5001147: "אחוזת ברק",
-    5001148: "גזית",
-    5001149: "גבע כרמל",
-    5001150: "אזור תעשייה יקנעם עילית",
-    5001152: "מזרע",
-    5001153: "תל עדשים",
-    5001154: "דברת",
-    5001156: "כפר מצר",
-    5001157: "שריד",
-    5001158: "מגדל העמק",
-    5001159: "גניגר",
-    5001160: "עין דור",
-    5001161: "אשדות יעקב",
-    5001162: "עין כרמל",
-    5001163: "כפר יהושע",
-    5001164: "גבת",
-    5001165: "יפעת",
-    5001166: "כפר קיש",
-    5001167: "מנחמיה",
-    5001169: "נווה ים",
-    5001171: "עתלית",
-    5001172: "דלית אל כרמל",
-    5001173: "תחנת רכבת כפר יהושוע",
-    5001174: "נהלל",
-    5001175: "רמת דוד",
-    5001176: "יפיע",
-    5001177: "נצרת",
-    5001178: "אכסאל",
-    5001179: "דבוריה",
-    5001180: "שיבלי אום אלג'נם",
-    5001181: "כפר תבור",
-    5001182: "עין חוד",
-    5001183: "קריית טבעון - בית זייד",
-    5001184: "שדה יעקב",
-    5001185: "בית שערים",
-    5001186: "נוף הגליל",
-    5001188: "אפיקים",
-    5001189: "מסדה",
-    5001190: "עין הוד",
-    5001191: "ניר עציון, ימין אורד",
-    5001193: "רמת ישי",
-    5001195: "שדמות דבורה",
-    5001196: "בית זרע",
-    5001197: "שער הגולן",
-    5001198: "חמת גדר",
-    5001200: "עספיא",
-    5001202: "כפר תקווה",
-    5001204: "מנשית זבדה",
-    5001205: "זרזיר",
-    5001206: "תמרת",
-    5001207: "כפר החורש",
-    5001209: "כדורי",
-    5001210: "יבנאל",
-    5001211: "דגניה ב",
-    5001212: "צמח",
-    5001213: "מגדים",
-    5001214: "בית צבי",
-    5001216: "אורנים",
-    5001217: "אלונים",
-    5001218: "עילוט",
-    5001219: "ריינה",
-    5001221: "עין מאהל",
-    5001222: "אלומות",
-    5001223: "כינרת קבוצה",
-    5001224: "דגניה א",
-    5001226: "מעגן",
-    5001227: "תל קציר",
-    5001228: "גבעת וולפסון",
-    5001230: "שער העמקים",
-    5001231: "אלוני אבא",
-    5001232: "גבעת אלה",
-    5001234: "בית קשת",
-    5001235: "כפר כמא",
-    5001236: "שרונה",
-    5001237: "פוריה כפר עבודה",
-    5001238: "כינרת מושבה",
-    5001239: "בית ירח",
-    5001240: "בית אורן",
-    5001242: "יגור",
-    5001243: "כפר חסידים",
-    5001244: "בסמת טבעון",
-    5001245: "בית לחם הגלילית",
-    5001246: "חג'אג'רה",
-    5001247: "שמשית",
-    5001248: "משהד",
-    5001250: "פוריה עילית",
-    5001251: "האון",
-    5001253: "רכסים",
-    5001254: "ציפורי",
-    5001255: "כפר כנא",
-    5001256: "פוריה נווה עובד",
-    5001257: "מבוא חמה",
-    5001258: "החותרים",
-    5001259: "טירת כרמל",
-    5001262: "כעביה טבאש",
-    5001263: "הסוללים",
-    5001265: "אילניה",
-    5001267: "שדה אילן",
-    5001268: "הזורעים",
-    5001269: "כפר גלים",
-    5001270: "חיפה - נווה שאנן ורמות כרמל",
-    5001271: "נשר",
-    5001272: "איבטין",
-    5001273: "נופית",
-    5001275: "הרדוף",
-    5001276: "אלון הגליל",
-    5001277: "הושעיה",
-    5001278: "אזור תעשייה ציפורית",
-    5001282: "כפר ח'וואלד",
-    5001283: "ראס עלי",
-    5001284: "סואעד חמירה",
-    5001285: "ביר אלמכסור",
-    5001286: "רומת אל הייב",
-    5001287: "כפר נהר הירדן",
-    5001289: "כפר חרוב",
-    5001290: "מיצר",
-    5001292: "חיפה - מערב",
-    5001295: "עדי",
-    5001296: "טורעאן",
-    5001297: "גבעת אבני",
-    5001298: "טבריה",
-    5001299: "עין גב",
-    5001302: "חיפה - כרמל, הדר ועיר תחתית",
-    5001304: "קריית אתא",
-    5001305: "כפר המכבי",
-    5001306: "רמת יוחנן",
-    5001307: "שפרעם",
-    5001308: "חנתון",
-    5001309: "עוזייר, רומאנה",
-    5001310: "בית רימון",
-    5001312: "לביא",
-    5001313: "אזור תעשייה קדמת גליל",
-    5001314: "אפיק",
-    5001319: "אושה",
-    5001320: "כפר מנדא",
-    5001322: "הודיות",
-    5001323: "מצפה",
-    5001324: "נאות גולן",
-    5001328: "בועיינה-נוג'ידאת",
-    5001329: "מצפה נטופה",
-    5001330: "כפר חיטים",
-    5001331: "בני יהודה וגבעת יואב",
-    5001336: "חיפה - מפרץ",
-    5001337: "קריית ביאליק",
-    5001338: "כפר ביאליק",
-    5001339: "אעבלין",
-    5001340: "דמיידה",
-    5001341: "כפר זיתים",
-    5001342: "ארבל",
-    5001343: "אזור תעשייה בני יהודה",
-    5001344: "אלי עד",
-    5001347: "קריית מוצקין",
-    5001348: "מורשת",
-    5001349: "גשור",
-    5001351: "קריית ים",
-    5001352: "אפק",
-    5001353: "מצפה אבי''ב",
-    5001354: "כאוכב אבו אלהיג'א",
-    5001355: "יודפת",
-    5001356: "עילבון",
-    5001357: "ואדי אל חמאם",
-    5001358: "מגדל",
-    5001359: "אבני איתן",
-    5001360: "טמרה",
-    5001361: "קורנית",
-    5001362: "עראבה",
-    5001363: "אבטליון",
-    5001364: "נוב",
-    5001366: "מנוף",
-    5001367: "שכניה",
-    5001368: "רקפת",
-    5001370: "הררית יחד",
-    5001371: "מסד",
-    5001372: "גינוסר",
-    5001373: "רמות",
-    5001374: "חספין",
-    5001375: "רמת מגשימים",
-    5001378: "מרכז אזורי משגב",
-    5001380: "סכנין",
-    5001381: "דיר חנא",
-    5001382: "רביד",
-    5001383: "נטור",
-    5001384: "כאבול",
-    5001385: "עצמון - שגב",
-    5001386: "אזור תעשייה תרדיון",
-    5001387: "טפחות",
-    5001388: "לבנים",
-    5001389: "אזור תעשייה שער נעמן",
-    5001390: "יעד",
-    5001391: "יובלים",
-    5001392: "אשבל",
-    5001393: "מע'אר",
-    5001394: "כלנית",
-    5001395: "כנף",
-    5001396: "כפר מסריק",
-    5001397: "עכו - אזור תעשייה",
-    5001398: "שעב",
-    5001399: "אשחר",
-    5001400: "לוטם וחמדון",
-    5001401: "סלמה",
-    5001403: "חוקוק",
-    5001404: "עין המפרץ",
-    5001405: "יסעור",
-    5001407: "שורשים",
-    5001408: "ערב אל נעים",
-    5001409: "מעלה צביה",
-    5001410: "כחל",
-    5001411: "מעלה גמלא",
-    5001414: "אחיהוד",
-    5001415: "אזור תעשייה בר-לב",
-    5001416: "צורית גילון",
-    5001417: "כרמיאל",
-    5001418: "חוסנייה",
-    5001419: "חזון",
-    5001421: "קדרים",
-    5001422: "אמנון",
-    5001423: "עכו",
-    5001424: "ג'דידה מכר",
-    5001425: "מג'דל כרום",
-    5001426: "מכמנים - כמאנה מערבית",
-    5001427: "כמון - כמאנה מזרחית",
-    5001428: "ראס אל-עין",
-    5001431: "כורזים ורד הגליל",
-    5001432: "אלמגור",
-    5001433: "טל - אל",
-    5001434: "בענה",
-    5001435: "אזור תעשייה כרמיאל",
-    5001436: "מורן",
-    5001437: "כפר חנניה",
-    5001440: "פלך",
-    5001441: "תובל",
-    5001442: "דיר אל-אסד",
-    5001443: "נחף",
-    5001444: "שזור",
-    5001445: "עמיעד",
-    5001446: "חד נס",
-    5001448: "ג'וליס",
-    5001449: "כישור",
-    5001450: "לבון",
-    5001451: "סאג'ור",
-    5001452: "ראמה",
-    5001453: "עין אל אסד",
-    5001454: "אמירים",
-    5001455: "פרוד",
-    5001457: "כרכום",
-    5001458: "בוסתן הגליל",
-    5001459: "שמרת",
-    5001461: "כפר יאסיף",
-    5001462: "ירכא",
-    5001463: "הר חלוץ",
-    5001464: "שפר",
-    5001466: "אליפלט",
-    5001467: "יונתן",
-    5001469: "לוחמי הגטאות",
-    5001470: "אבו סנאן",
-    5001471: "לפידות",
-    5001472: "כסרא סמיע",
-    5001473: "חרשים",
-    5001474: "בית ג'אן",
-    5001475: "כפר שמאי",
-    5001477: "צפת - עיר",
-    5001479: "רגבה",
-    5001480: "נס עמים",
-    5001481: "בית העמק",
-    5001482: "אשרת",
-    5001483: "גיתה",
-    5001484: "פקיעין",
-    5001486: "ראש פינה",
-    5001487: "טובא זנגריה",
-    5001488: "אניעם",
-    5001489: "שבי ציון",
-    5001490: "מזרעה",
-    5001491: "עמקה",
-    5001492: "כליל",
-    5001493: "ינוח ג'ת",
-    5001494: "מגדל תפן",
-    5001496: "אזור תעשייה צ.ח.ר",
-    5001499: "נהריה",
-    5001500: "עברון",
-    5001501: "נתיב השיירה",
-    5001502: "מירון",
-    5001503: "ביריה",
-    5001506: "חצור הגלילית",
-    5001508: "מנחת מחניים",
-    5001509: "כפר הנשיא",
-    5001510: "קשת",
-    5001511: "שייח' דנון",
-    5001512: "יחיעם",
-    5001513: "כפר ורדים",
-    5001514: "חוסן",
-    5001517: "מחניים",
-    5001518: "קצרין",
-    5001520: "בן עמי",
-    5001522: "געתון",
-    5001523: "מעלות תרשיחא",
-    5001525: "מרכז אזורי מרום גליל",
-    5001526: "בר יוחאי",
-    5001527: "קדיתא",
-    5001528: "עמוקה",
-    5001531: "כברי",
-    5001533: "עין יעקב",
-    5001534: "מעונה",
-    5001535: "צוריאל",
-    5001536: "חורפיש",
-    5001537: "ספסופה - כפר חושן",
-    5001538: "אור הגנוז",
-    5001539: "משמר הירדן",
-    5001540: "מעיליא",
-    5001541: "ג'ש - גוש חלב",
-    5001542: "דלתון",
-    5001543: "גדות",
-    5001544: "סער",
-    5001545: "גשר הזיו",
-    5001546: "נווה זיו",
-    5001547: "אלקוש",
-    5001548: "סאסא",
-    5001549: "צבעון",
-    5001550: "אזור תעשייה רמת דלתון",
-    5001552: "איילת השחר",
-    5001553: "קדמת צבי",
-    5001555: "מנות",
-    5001556: "הילה",
-    5001557: "אבירים",
-    5001558: "מתת",
-    5001560: "כרם בן זמרה",
-    5001562: "איזור תעשייה מילואות צפון",
-    5001563: "לימן",
-    5001564: "עבדון",
-    5001565: "גורן",
-    5001566: "פסוטה",
-    5001567: "ריחאנייה",
-    5001568: "שדה אליעזר",
-    5001569: "אלוני הבשן",
-    5001570: "מצובה",
-    5001571: "אילון",
-    5001572: "גורנות הגליל",
-    5001574: "דוב''ב",
-    5001575: "ברעם",
-    5001576: "עלמה",
-    5001577: "יסוד המעלה",
-    5001578: "חולתה",
-    5001581: "בצת",
-    5001582: "שלומי",
-    5001583: "יערה",
-    5001585: "נטועה",
-    5001588: "אבן מנחם",
-    5001590: "ראש הנקרה",
-    5001591: "חניתה",
-    5001592: "אדמית",
-    5001593: "ערב אל עראמשה",
-    5001595: "שומרה",
-    5001596: "שתולה",
-    5001598: "יראון",
-    5001599: "דישון",
-    5001603: "זרעית",
-    5001604: "אביבים",
-    5001605: "רמות נפתלי",
-    5001606: "אורטל",
-    5001608: "מלכיה",
-    5001610: "עין זיוון",
-    5001613: "מרכז אזורי מבואות חרמון",
-    5001614: "שעל",
-    5001617: "יפתח",
-    5001618: "גונן",
-    5001621: "קלע אלון",
-    5001622: "מרום גולן",
-    5001625: "להבות הבשן",
-    5001626: "נאות מרדכי",
-    5001627: "שמיר",
-    5001631: "כפר בלום",
-    5001633: "עמיר",
-    5001634: "שדה נחמיה",
-    5001635: "אל רום",
-    5001636: "מנרה",
-    5001637: "קריית שמונה",
-    5001638: "כפר סאלד",
-    5001639: "אודם",
-    5001640: "בית הלל",
-    5001641: "בוקעתא",
-    5001642: "מרגליות",
-    5001649: "הגושרים",
-    5001650: "שאר ישוב",
-    5001652: "תל חי",
-    5001653: "דפנה",
-    5001654: "עין קנייא",
-    5001655: "מסעדה",
-    5001657: "כפר גלעדי",
-    5001658: "מעיין ברוך",
-    5001659: "קיבוץ דן",
-    5001660: "שניר",
-    5001661: "משגב עם",
-    5001662: "כפר יובל",
-    5001664: "נמרוד",
-    5001665: "מג'דל שמס",
-    5001667: "ע'ג'ר",
-    5001668: "נווה אטי''ב",
-    5001669: "מטולה",
-    5001713: "שדה בר",
-    5001714: "מתחם בני דרום",
-    5001715: "אתר ההנצחה גולני",
-    5001716: "מרכז אזורי מגילות",
-    5001721: "תחנת רכבת ראש העין",
-    5001722: "בית ספר שדה מירון",
-    5001723: "חוות יאיר",
-    5001724: "עדי עד",
-    5001725: "קידה",
-    5001729: "שבות רחל",
-    5001730: "אזור תעשייה ניר עציון",
-    5001736: "היישוב היהודי חברון",
-    5001748: "באר שבע - צפון",
-    5001749: "באר שבע - דרום",
-    5001751: "מתחם פי גלילות",
-    5001752: "אתר דודאים",
-    5001759: "גבים, מכללת ספיר",
-    5001760: "בית הגדי",
-    5001761: "מעון צופיה",
-    5001768: "כמהין",
-    5001771: "באר מילכה",
-    5001772: "נאות הכיכר",
-    5001774: "אשלים",
-    5001775: "עין תמר",
-    5001776: "מעלה מכמש",
-    5001779: "גיבתון",
-    5001780: "בית חשמונאי",
-    5001783: "מצליח",
-    5001784: "יד רמב''ם",
-    5001785: "מודיעין מכבים רעות",
-    5001786: "פסגות",
-    5001790: "ישרש",
-    5001791: "מודיעין - ליגד סנטר",
-    5001792: "כפר רות",
-    5001793: "עיינות",
-    5001794: "בית עובד",
-    5001795: "נס ציונה",
-    5001796: "נצר סרני",
-    5001797: "רמלה",
-    5001799: "אזור תעשייה נשר - רמלה",
-    5001801: "שילת",
-    5001802: "לפיד",
-    5001803: "כפר האורנים",
-    5001804: "מבואות יריחו",
-    5001805: "נעמה",
-    5001806: "בית חנן",
-    5001807: "אירוס",
-    5001809: "באר יעקב",
-    5001811: "אחיסמך",
-    5001812: "גמזו",
-    5001813: "חשמונאים",
-    5001814: "מודיעין עילית",
-    5001815: "דולב",
-    5001817: "פלמחים",
-    5001818: "נטעים",
-    5001819: "כפר דניאל",
-    5001820: "מבוא מודיעים",
-    5001821: "מתתיהו",
-    5001822: "בית אל",
-    5001823: "רימונים",
-    5001826: "גן שורק",
-    5001827: "ראשון לציון - מזרח",
-    5001829: "ניר צבי",
-    5001830: "לוד",
-    5001831: "בן שמן",
-    5001832: "טלמון",
-    5001833: "חרשה",
-    5001834: "פארק תעשיות פלמחים",
-    5001835: "נריה",
-    5001836: "עפרה",
-    5001837: "ייט''ב",
-    5001838: "ראשון לציון - מערב",
-    5001840: "תעשיון צריפין",
-    5001842: "גינתון",
-    5001843: "כפר נוער בן שמן",
-    5001845: "נילי",
-    5001846: "נעלה",
-    5001847: "כוכב השחר",
-    5001849: "אחיעזר",
-    5001850: "זיתן",
-    5001851: "חדיד",
-    5001852: "בית נחמיה",
-    5001853: "יגל",
-    5001854: "כפר טרומן",
-    5001856: "נחליאל",
-    5001858: "נערן",
-    5001860: "בית דגן",
-    5001861: "כפר חב''ד",
-    5001863: "איירפורט סיטי",
-    5001864: "בית עריף",
-    5001865: "שוהם",
-    5001866: "בת ים",
-    5001869: "צפריה",
-    5001871: "בית עלמין תל רגב",
-    5001874: "מלונות ים המלח מרכז",
-    5001875: "קצרין - אזור תעשייה",
-    5001878: "חיפה - קריית חיים ושמואל",
-    5001880: "עשהאל",
-    5001883: "אדורים",
-    5001884: "חוות גלעד",
-    5001890: "גבעת הראל",
-    5001891: "גבעת אסף",
-    5001894: "עמיחי",
-    5001921: "אל סייד",
-    5001922: "ירושלים - מערב",
-    5001923: "מעלה רחבעם",
-    5001925: "תל ערד",
-    5001926: "ירושלים - כפר עקב",
-    5001928: "בית סוהר קישון",
-    5001929: "אל עמארני, אל מסק",
-    5001931: "בית סוהר צלמון",
-    5001932: "אשקלון - דרום",
-    5001933: "אזור תעשייה ברקן",
-    5001937: "תחנת רכבת קריית מלאכי - יואב",
-    5001938: "רמת טראמפ",
-    5001939: "אזור תעשייה שחק",
-    5001942: "אזור תעשייה אריאל",
-    5001943: "צומת הגוש",
-    5001945: "פקיעין החדשה",
-    5001949: "גבעון החדשה",
-    5001955: "כרם רעים",
-    5001956: "מיני ישראל - נחשון",
-    5001961: "פארק אריאל שרון",
-    5001963: "כפר הנוער קריית יערים",
-    5002005: "צפת - עכברה",
-    5002006: "צפת - נוף כנרת",
-    5002007: "בית העלמין החדש נהריה",
-    5002014: "חוף קליה",
-    5002017: "נאות קדומים",
-    5002019: "חוף זיקים",
-    5002021: "לב החולה",
-    5002023: "אזור תעשייה קריית ביאליק",
-    5002025: "פארק תעשיות מגדל עוז",
-    5002026: "אזור תעשייה כפר יונה",
-    5002191: "מתחם סקי גלבוע",
-    5002192: "בית העלמין החדש עכו",
-    5002194: "גני חוגה",
-    5002195: "אזור תעשייה גדרה",
-    5002200: "בית עלמין מורשה",
-    5002201: "נבי שועייב",
-    5002202: "תחנת רכבת כפר ברוך",
-    5002203: "מתחם שביל התפוזים",
-    5002204: "כפר הנוקדים",
-    5002207: "אזור תעשייה רבדים",
-    5002209: "חוף בצת",
-    5002210: "עינות קדם",
-    5002211: "החווה של זוהר",
-    5002212: "מצפור פצאל",
-    5002213: "חוות הרשאש",
-    5002214: "שלומציון",
-    5002215: "חוות גנות",
-    5002216: "החווה של מנחם",
-    5002217: "החווה של עשהאל",
-    5002218: "חוות יד השומר",
-    5002219: "בתרונות",
-    5002220: "החווה של אורי כהן",
-    5002221: "החווה של יאיא",
-    5002222: "חוות עמיאל",
-    5002223: "בית חגלה",
-    5002224: "קדם ערבה",
-    5002225: "צומת אלמוג",
-    5002226: "מסוף אורנית",
-    5002227: "מרכז אזורי רמת כורזים",
-    5002228: "חמדת ימים",
-    5002229: "עכו - רמות ים",
-    5002230: "איבי הנחל",
-    5002231: "הגבעה הצהובה",
-    5002232: "חוות ארץ האיילים",
-    5002233: "חוות קשואלה",
-    5002234: "עוז וגאון",
-    5002235: "חוות נחלת אבות",
-    5002236: "שדה בועז",
-    5002237: "חוות עדן",
-    5002238: "בית הברכה",
-    5002239: "קדר דרום",
-    5002240: "חוות צאן קדר",
-    5002241: "תקוע ד' וה'",
-    5002242: "חוות אביחי",
-    5002243: "חוות עולם חסד",
-    5002245: "חוף אכזיב",
-    5002247: "גבעת פורת יוסף",
-    5002248: "חוות מגדלים",
-    5002249: "אביתר",
-    5002250: "חוות שדה",
-    5002251: "חומש",
-    5002252: "חוות אלחי",
-    5002253: "חוות שוביאל",
-    5002254: "חוות שחרית",
-    5002255: "דורות עילית",
-    5002256: 'חוות נוף אב"י',
-    5002257: "חוות צרידה",
-    5002258: "חרמש דרום",
-    5002259: "חוות אל נווה",
-    5002260: "חוות אביה",
-    5002261: "חוות מדבר חבר",
-    5002262: "אביגיל",
-    5002263: "מצפה יאיר",
-    5002264: "סוסיא הקדומה",
-    5002265: "חוות טואמין",
-    5002266: "חוות דרומא",
-    5002267: "חוות טליה",
-    5002268: "חירן",
-    5002269: "חוות מקנה יהודה",
-    5002270: "אשתמוע",
-    5002271: "אפקה",
-    5002272: "חוות מור ואברהם",
-    5002273: "חוות אשכולות",
-    5002274: "חוות מנחם",
-    5002275: "חוות יויו",
-    5002276: "חוות מלאכי אברהם",
-    5002277: "מצפה מדרג",
-    5002278: 'מצפה זי"ו',
-    5002281: "חוות תלם צפון",
-    5002282: "חוות פריאל",
-    5002284: "חניון רעים אנדרטת הנובה",
-    5002285: "מכינת אלישע",
-    5002286: "גבעת הרואה",
-    5002287: "בני אדם",
-    5002288: "מצפה חגית",
-    5002289: "נווה ארז",
-    5002290: "מצפה דני",
-    5002291: "חוות מרום שמואל",
-    5002292: "שדה אפרים",
-    5002293: "חוות מגנזי",
-    5002294: "גופנה",
-    5002295: "יבוא דודי",
-    5002296: "אש קודש",
-    5002297: "חוות נחל שילה",
-    5002298: "חוות ראש תאנה",
-    5002299: "חוות מלכיאל",
-    5002300: "חוות מעלה אהוביה",
-    5002301: "חוות נחלת צבי",
-    5002302: "רמת מגרון",
-    5002303: "חוות ינון",
-    5002304: "אעירה השחר",
-    5002305: "חוות חנינא",
-    5002306: "חוות בניהו",
-    5002307: "חוות הרועה העברי",
-    5002308: "חוות נווה צוף",
-    5002309: "בר כוכבא",
-    5002327: "מלאכי השלום",
-    5002330: "חיפה - בת גלים ק.אליעזר",
-    5004000: "בחלק מהאזורים בארץ",
-}
+from .tables import load_table
+
+SEGMENT_TO_AREA: dict[int, str] = load_table("segment_to_area")
@@ -0,0 +1,174 @@
+"""Helper for loading the metadata tables.
+
+The tables are stored in tables.bin (little-endian): header ("OAT1", number
+of strings, number of tables), the table directory (name, kind, offset and
+number of items of each table, uint32), the string pool (UTF-8, separated by
+new lines, prefixed by its size) and the data of the tables. Strings are
+stored once and referenced by their index in the pool, so the tables share
+the same str objects.
+
+A table is decoded the first time it's loaded, the pool with the first table.
+"""
+
+from __future__ import annotations
+
+import struct
+from enum import IntEnum
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+_HEADER = struct.Struct("<4sII")
+_ENTRY = struct.Struct("<IIII")
+_MAGIC = b"OAT1"
+_PATH = Path(__file__).with_name("tables.bin")
+
+
+class TableKind(IntEnum):
+    """Layout of a table's data (columns of uint32 string indices or numbers)."""
+
+    STR_SET = 0  # strings
+    STR_LIST = 1  # strings
+    STR_TO_STR = 2  # keys, values
+    STR_TO_INT = 3  # keys, values (int32)
+    INT_TO_STR = 4  # keys (int32), values
+    STR_TO_STR_LIST = 5  # keys, offset of each list (plus the total), values
+    AREA_INFO = 6  # keys, lat (float64), lon (float64), segment (int32)
+
+
+def _unpack(code: str, count: int, data: bytes, offset: int) -> tuple[list, int]:
+    """Unpack a column, return it and the offset after it."""
+    column = struct.Struct(f"<{count}{code}")
+    return list(column.unpack_from(data, offset)), offset + column.size
+
+
+@cache
+def _read() -> tuple[bytes, list[str], dict[str, tuple[TableKind, int, int]]]:
+    """Read the file, the string pool and the table directory (blocking)."""
+    data = _PATH.read_bytes()
+    magic, strings_count, tables_count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        msg = f"Unknown metadata tables format: {magic!r}"
+        raise ValueError(msg)
+    entries = [
+        _ENTRY.unpack_from(data, _HEADER.size + index * _ENTRY.size)
+        for index in range(tables_count)
+    ]
+    position = _HEADER.size + tables_count * _ENTRY.size
+    (pool_size,) = struct.unpack_from("<I", data, position)
+    position += 4
+    strings = data[position : position + pool_size].decode("utf-8").split("\n")
+    if len(strings) != strings_count:
+        msg = "Corrupted metadata tables string pool"
+        raise ValueError(msg)
+    directory = {
+        strings[name]: (TableKind(kind), offset, count)
+        for name, kind, offset, count in entries
+    }
+    return data, strings, directory
+
+
+@cache
+def load_table(name: str) -> Any:
+    """Decode a table (blocking, the tables are loaded while importing)."""
+    data, strings, directory = _read()
+    kind, offset, count = directory[name]
+    keys, offset = _unpack(
+        "i" if kind == TableKind.INT_TO_STR else "I", count, data, offset
+    )
+    if kind != TableKind.INT_TO_STR:
+        keys = [strings[key] for key in keys]
+    if kind == TableKind.STR_SET:
+        return set(keys)
+    if kind == TableKind.STR_LIST:
+        return keys
+    if kind == TableKind.STR_TO_INT:
+        return dict(zip(keys, _unpack("i", count, data, offset)[0], strict=True))
+    if kind in (TableKind.STR_TO_STR, TableKind.INT_TO_STR):
+        values, _ = _unpack("I", count, data, offset)
+        return {key: strings[value] for key, value in zip(keys, values, strict=True)}
+    if kind == TableKind.STR_TO_STR_LIST:
+        bounds, offset = _unpack("I", count + 1, data, offset)
+        values, _ = _unpack("I", bounds[-1], data, offset)
+        values = [strings[value] for value in values]
+        return {
+            key: values[start:end]
+            for key, start, end in zip(keys, bounds, bounds[1:], strict=False)
+        }
+    lat, offset = _unpack("d", count, data, offset)
+    lon, offset = _unpack("d", count, data, offset)
+    segment, _ = _unpack("i", count, data, offset)
+    return {
+        key: {"lat": key_lat, "lon": key_lon, "segment": key_segment}
+        for key, key_lat, key_lon, key_segment in zip(
+            keys, lat, lon, segment, strict=True
+        )
+    }
+
+
+def _kind(table: Any) -> TableKind:
+    """Return the layout of a table."""
+    if isinstance(table, set):
+        return TableKind.STR_SET
+    if isinstance(table, list):
+        return TableKind.STR_LIST
+    value = next(iter(table.values()))
+    if isinstance(next(iter(table)), int):
+        return TableKind.INT_TO_STR
+    if isinstance(value, dict):
+        return TableKind.AREA_INFO
+    if isinstance(value, list):
+        return TableKind.STR_TO_STR_LIST
+    if isinstance(value, int):
+        return TableKind.STR_TO_INT
+    return TableKind.STR_TO_STR
+
+
+def dump(tables: dict[str, Any]) -> bytes:
+    """Encode the tables in the format of tables.bin (used by the generator)."""
+    strings: dict[str, int] = {}
+
+    def _index(string: str) -> int:
+        return strings.setdefault(string, len(strings))
+
+    def _pack(code: str, values: list) -> bytes:
+        return struct.pack(f"<{len(values)}{code}", *values)
+
+    directory: list[tuple[int, TableKind, int]] = []
+    columns: list[bytes] = []
+    for name, table in tables.items():
+        kind = _kind(table)
+        # Sets are sorted, so the file is the same each time it's generated
+        keys = sorted(table) if kind == TableKind.STR_SET else list(table)
+        directory.append((_index(name), kind, len(keys)))
+        if kind == TableKind.INT_TO_STR:
+            column = _pack("i", keys)
+        else:
+            column = _pack("I", [_index(key) for key in keys])
+        values = list(table.values()) if isinstance(table, dict) else []
+        if kind == TableKind.STR_TO_INT:
+            column += _pack("i", values)
+        elif kind in (TableKind.STR_TO_STR, TableKind.INT_TO_STR):
+            column += _pack("I", [_index(value) for value in values])
+        elif kind == TableKind.STR_TO_STR_LIST:
+            bounds = [0]
+            for value in values:
+                bounds.append(bounds[-1] + len(value))
+            column += _pack("I", bounds)
+            column += _pack("I", [_index(item) for value in values for item in value])
+        elif kind == TableKind.AREA_INFO:
+            column += _pack("d", [value["lat"] for value in values])
+            column += _pack("d", [value["lon"] for value in values])
+            column += _pack("i", [value["segment"] for value in values])
+        columns.append(column)
+
+    pool = "\n".join(strings).encode("utf-8")
+    offset = _HEADER.size + len(tables) * _ENTRY.size + 4 + len(pool)
+    output = [_HEADER.pack(_MAGIC, len(strings), len(tables))]
+    for (name, kind, count), column in zip(directory, columns, strict=True):
+        output.append(_ENTRY.pack(name, kind, offset, count))
+        offset += len(column)
+    output.append(struct.pack("<I", len(pool)))
+    output.append(pool)
+    output.extend(columns)
+    return b"".join(output)
@@ -1,1454 +1,5 @@
 """GENERATED FILE. DO NOT EDIT MANUALLY."""
 
-TZEVAADOM_ID_TO_AREA: dict[int, str] = {
-    4: "אילת",
-    9: "אילות",
-    10: "אזור תעשייה שחורת",
-    12: "באר אורה",
-    15: "אליפז ומכרות תמנע",
-    16: "סמר",
-    18: "יטבתה",
-    19: "שחרות",
-    22: "גרופית",
-    23: "קטורה",
-    24: "לוטן",
-    26: "נווה חריף",
-    27: "נאות סמדר",
-    28: "יהל",
-    30: "שיטים",
-    33: "פארן",
-    35: "צוקים",
-    36: "צופר",
-    38: "מצפה רמון",
-    39: "ספיר",
-    44: "עין יהב",
-    46: "חצבה",
-    47: "עזוז",
-    49: "עין חצבה",
-    50: "עידן",
-    52: "שאנטי במדבר",
-    53: "מדרשת בן גוריון",
-    54: "שדה בוקר",
-    55: "ניצנה",
-    58: "מרחב עם",
-    59: "קדש ברנע",
-    73: "ירוחם",
-    75: "טללים",
-    77: "משאבי שדה",
-    78: "ביר הדאג'",
-    83: "רביבים",
-    85: "רתמים",
-    87: "אזור תעשייה דימונה",
-    88: "דימונה",
-    89: "אזור תעשייה רותם",
-    90: "קסר א-סר",
-    91: "ואדי אל נעם דרום",
-    92: "אבו קרינאת",
-    95: "בני נצרים",
-    98: "ערערה בנגב",
-    99: "נווה",
-    102: "שלומית",
-    103: "אבו תלול",
-    104: "נווה זוהר",
-    105: "יבול",
-    106: "שגב שלום",
-    108: "בתי מלון ים המלח",
-    109: "אבשלום",
-    110: "דקל",
-    112: "יתד",
-    113: "תלמי יוסף",
-    114: "צאלים",
-    115: "אל פורעה",
-    117: "שדי אברהם",
-    118: "גבולות",
-    119: "עין בוקק",
-    120: "פרי גן",
-    121: "שדה ניצן",
-    124: "באר שבע - מזרח",
-    125: "נבטים",
-    126: "כסייפה",
-    127: "כרם שלום",
-    128: "חולית",
-    129: "תלמי אליהו",
-    131: "תל שבע",
-    133: "סופה",
-    134: "ניר יצחק",
-    135: "מבטחים, עמיעוז, ישע",
-    136: "צוחר, אוהד",
-    137: "סעווה",
-    139: "חצרים",
-    141: "באר שבע - מערב",
-    143: "ערד",
-    144: "אום בטין",
-    147: "עומר",
-    150: "מרעית",
-    151: "עין הבשור",
-    153: "לקיה",
-    154: "מגן",
-    155: "אופקים",
-    156: "חורה",
-    158: "אורים",
-    159: "ניר עוז",
-    161: "פטיש",
-    162: "מסלול",
-    163: "קריית חינוך מרחבים",
-    164: "גילת",
-    166: "פדויים",
-    167: "תפרח",
-    168: "אשל הנשיא",
-    169: "מיתר",
-    170: "מצדה",
-    171: "נירים",
-    172: "רנן",
-    173: "בטחה",
-    175: "כרמית",
-    176: "כרמים",
-    178: "עין השלושה",
-    179: "תארבין",
-    181: "גבעות בר",
-    182: "הר עמשא",
-    184: "משמר הנגב",
-    185: "להבים",
-    186: "שני ליבנה",
-    188: "כיסופים",
-    189: "ברוש",
-    190: "תאשור",
-    191: "רהט",
-    192: "סנסנה",
-    193: "בית יתיר",
-    194: "רעים",
-    195: "תדהר",
-    196: "אזור תעשייה עידן הנגב",
-    197: "להב",
-    198: "טנא עומרים",
-    199: "אזור תעשייה מיתרים",
-    200: "מעגלים, גבעולים, מלילות",
-    201: "שיבולים",
-    202: "שרשרת",
-    203: "אשכולות",
-    204: "שמעה",
-    205: "סוסיא",
-    206: "נתיבות",
-    207: "אזור תעשייה נ.ע.מ",
-    208: "שובל",
-    209: "שוקדה",
-    210: "דביר",
-    211: "מעון",
-    212: "בארי",
-    213: "כפר מימון ותושיה",
-    214: "תלמי ביל''ו",
-    215: "פעמי תש''ז",
-    216: "שומריה",
-    217: "כרמל",
-    218: "מרחצאות עין גדי",
-    219: "עלומים",
-    220: "זמרת, שובה",
-    222: "תקומה",
-    223: "יושיביה",
-    224: "מבועים",
-    225: "אשבול",
-    226: "קלחים",
-    227: "בית קמה",
-    229: "עתניאל",
-    231: "שדה צבי",
-    232: "זרועה",
-    233: "עין גדי",
-    234: "נחל עוז",
-    235: "סעד",
-    236: "ניר עקיבא",
-    237: "שבי דרום",
-    239: "כפר עזה",
-    240: "יכיני",
-    241: "ניר משה",
-    242: "נטע",
-    243: "מעלה חבר",
-    244: "מפלסים",
-    245: "רוחמה",
-    246: "נגוהות",
-    247: 'בית חג"י',
-    248: "שדרות, איבים",
-    249: "דורות",
-    251: "מטווח ניר עם",
-    252: "ניר עם",
-    254: "בני דקלים",
-    255: "שקף",
-    257: "אליאב",
-    258: "קרית ארבע",
-    261: "כרמי קטיף ואמציה",
-    263: "ארז",
-    264: "אחוזם",
-    266: "אור הנר",
-    267: "ברור חיל",
-    268: "תלמים",
-    269: "שלווה",
-    270: "לכיש",
-    271: "אדורה",
-    272: "נתיב העשרה",
-    273: "איתן",
-    274: "נועם",
-    275: "תלם",
-    276: "חלץ",
-    277: "שדה דוד",
-    278: "אבן שמואל",
-    280: "מצפה שלם",
-    281: "יד מרדכי",
-    282: "גברעם",
-    283: "עוזה",
-    284: "אזור תעשייה קריית גת",
-    287: "זוהר",
-    288: "מיצד",
-    289: "פני קדם",
-    290: "זיקים",
-    291: "כרמיה",
-    292: "ניר ח''ן",
-    293: "קריית גת, כרמי גת",
-    294: "מעלה עמוס",
-    295: "מצוקי דרגות",
-    297: "תלמי יפה",
-    298: "שחר",
-    300: "שדה משה",
-    301: "בית גוברין",
-    302: "כרמי צור",
-    304: "מבקיעים",
-    305: "אזור תעשייה הדרומי אשקלון",
-    306: "גיאה",
-    307: "כוכב מיכאל",
-    308: "נוגה",
-    309: "נהורה",
-    310: "כפר זוהרים",
-    311: "בית שקמה",
-    312: "עוצם",
-    314: "גת",
-    315: "גלאון",
-    316: "נחושה",
-    317: "בת הדר",
-    318: "שדה יואב",
-    319: "רווחה",
-    320: "אשקלון - צפון",
-    321: "משען",
-    322: "יד נתן",
-    323: "אלומה",
-    324: "מנוחה",
-    325: "בית ניר",
-    326: "כפר עציון",
-    328: "מגדל עוז",
-    329: "אפרת",
-    330: "תקוע",
-    331: "נוקדים",
-    333: "אזור תעשייה צפוני אשקלון",
-    334: "נגבה",
-    335: "קוממיות",
-    336: "זבדיאל",
-    337: "נחלה",
-    338: "צפרירים",
-    339: "אדרת",
-    340: "בת עין",
-    341: "אלון שבות",
-    342: "כפר אלדד",
-    344: "ברכיה",
-    345: "הודיה",
-    346: "ניר בנים",
-    347: "סגולה",
-    348: "ורדון",
-    349: "גבעת ישעיהו",
-    350: "גבעות עדן",
-    351: "אלעזר",
-    352: "כפר סילבר",
-    353: "זרחיה",
-    354: "שריגים - לי-און",
-    355: "נווה מיכאל - רוגלית",
-    356: "ראש צורים",
-    357: "ניר ישראל",
-    358: "לוזית",
-    359: "אביעזר",
-    360: "גבעות",
-    361: "נווה דניאל",
-    362: "באר גנים",
-    365: "משואות יצחק",
-    366: "מרכז שפירא",
-    367: "עין צורים",
-    368: "שפיר",
-    369: "עגור",
-    370: "נתיב הל''ה",
-    371: "ביתר עילית",
-    372: "אבנת",
-    373: "אביגדור",
-    374: "קדמה",
-    376: "ניצנים",
-    377: "כפר ורבורג",
-    378: "תימורים",
-    380: "זכריה",
-    382: "באר טוביה",
-    384: "אזור תעשייה באר טוביה",
-    385: "קריית מלאכי",
-    386: "אזור תעשייה תימורים",
-    387: "אל עזי",
-    388: "שדות מיכה",
-    389: "מטע",
-    390: "צור הדסה",
-    391: "ירושלים - מרכז",
-    394: "בית עזרא",
-    395: "גבעתי",
-    396: "ערוגות",
-    397: "כפר מנחם",
-    399: "אזור תעשייה ברוש",
-    400: "בר גיורא",
-    401: "מבוא ביתר",
-    402: "הר גילה",
-    404: "ניצן",
-    405: "עזר",
-    406: "אמונים",
-    407: "אורות",
-    408: "כפר אחים",
-    409: "ינון",
-    410: "כפר הרי''ף וצומת ראם",
-    411: "גפן",
-    412: "בית שמש",
-    413: "זנוח",
-    415: "ירושלים - דרום",
-    416: "שדה עוזיהו",
-    417: "עזריקם",
-    419: "אחווה",
-    420: "תלמי יחיאל",
-    421: "תירוש",
-    422: "מחסיה",
-    423: "נס הרים",
-    425: "אזור תעשייה עד הלום",
-    427: "ישעי",
-    428: "עמינדב",
-    429: "אורה",
-    431: "קדר",
-    432: "אשדוד -יא,יב,טו,יז,מרינה,סיטי",
-    433: "אשדוד - ח,ט,י,יג,יד,טז",
-    434: "שתולים",
-    435: "חצור",
-    436: "פארק תעשייה ראם",
-    437: "חצב",
-    438: "בני ראם",
-    439: "רבדים",
-    440: "צרעה",
-    441: "אזור תעשייה הר טוב - צרעה",
-    442: "נחם",
-    443: "אבן ספיר",
-    444: "קליה",
-    447: "גן יבנה",
-    448: "כסלון",
-    449: "רמת רזיאל",
-    454: "מעלה אדומים",
-    455: "אשדוד - ג,ו,ז",
-    456: "בני עי''ש",
-    457: "גני טל",
-    458: "חפץ חיים",
-    460: "רטורנו - גבעת שמש",
-    461: "תרום",
-    462: "אשתאול",
-    464: "צובה",
-    465: "פנימיית עין כרם",
-    466: "בית זית",
-    468: "אשדוד - א,ב,ד,ה",
-    470: "ביצרון",
-    471: "בית חלקיה",
-    472: "יד בנימין",
-    473: "כפר אוריה",
-    474: "גבעת יערים",
-    475: "עין ראפה",
-    478: "אזור תעשייה מישור אדומים",
-    480: "גן הדרום",
-    481: "נווה מבטח",
-    482: "כנות",
-    483: "אזור תעשייה כנות",
-    484: "גדרה",
-    486: "טל שחר",
-    487: "צלפון",
-    488: "תעוז",
-    489: "מסילת ציון",
-    490: "בית מאיר",
-    491: "שורש",
-    492: "שואבה",
-    493: "עין נקובא",
-    494: "מבשרת ציון",
-    495: "מוצא עילית",
-    496: "ירושלים - מזרח",
-    499: "אלמוג",
-    500: "בני דרום",
-    501: "קבוצת יבנה",
-    502: "משגב דב",
-    503: "מישר",
-    504: "קדרון",
-    505: "גיזו",
-    506: "הראל",
-    507: "נווה אילן",
-    509: "יד השמונה",
-    510: "קריית יערים",
-    511: "אבו גוש",
-    512: "בית נקופה",
-    513: "קריית ענבים",
-    517: "ניר גלים",
-    518: "כרם ביבנה",
-    519: "גבעת וושינגטון",
-    520: "עשרת",
-    522: "יסודות",
-    523: "נצר חזני",
-    524: "משמר דוד",
-    525: "נווה שלום",
-    526: "מעלה החמישה",
-    527: "ירושלים - צפון",
-    529: "בית הערבה",
-    530: "אשדוד - איזור תעשייה צפוני",
-    531: "כפר אביב",
-    532: "שדמה",
-    533: "כפר מרדכי",
-    534: "מזכרת בתיה",
-    535: "חולדה",
-    536: "בקוע",
-    537: "נחשון",
-    538: "הר אדר",
-    539: "נופי פרת",
-    540: "כפר אדומים",
-    541: "מצפה יריחו",
-    543: "בניה",
-    544: "בית אלעזרי",
-    545: "לטרון",
-    546: "נטף",
-    549: "עלמון",
-    550: "ורד יריחו",
-    553: "כרמי יוסף",
-    554: "מבוא חורון",
-    556: "אלון",
-    557: "בן זכאי",
-    558: "בית גמליאל",
-    559: "גני יוחנן",
-    560: "קריית עקרון",
-    561: "פדיה",
-    562: "כפר בן נון",
-    564: "ירושלים - אזור תעשייה עטרות",
-    565: "גבע בנימין",
-    566: "יבנה",
-    567: "גבעת ברנר",
-    568: "יציץ",
-    569: "פתחיה",
-    570: "גבעת זאב",
-    571: "גאליה",
-    572: "גן שלמה",
-    575: "כפר ביל''ו",
-    577: "רמות מאיר",
-    578: "בית עוזיאל",
-    579: "גזר",
-    580: "משמר איילון",
-    582: "נוף איילון, שעלבים",
-    584: "אזור תעשייה שער בנימין",
-    585: "כפר הנגיד",
-    587: "רחובות",
-    589: "גני הדר",
-    590: "נען",
-    591: "סתריה",
-    592: "עזריה",
-    593: "כפר שמואל",
-    594: "מודיעין - ישפרו סנטר",
-    596: "בית חורון",
-    597: "תל ציון",
-    598: "כוכב יעקב",
-    599: "מגרון",
-    700: "נתיב הגדוד",
-    701: "חולון",
-    702: "משמר השבעה",
-    703: "טירת יהודה",
-    704: "אזור תעשייה חבל מודיעין שוהם",
-    705: "נווה צוף",
-    706: "עטרת",
-    707: "גלגל",
-    709: "אזור",
-    710: "גנות",
-    711: "חמד",
-    712: "בני עטרות",
-    713: "ברקת",
-    714: "עופרים",
-    715: "מקווה ישראל",
-    716: "אור יהודה",
-    717: "יהוד מונוסון",
-    719: "גבעת כ''ח",
-    720: "תומר",
-    722: "תל אביב - דרום העיר ויפו",
-    724: "תל אביב - מזרח",
-    726: "סביון",
-    727: "בארות יצחק",
-    728: "בית אריה",
-    730: "רמת גן - מזרח",
-    732: "מגשימים",
-    733: "נופך",
-    734: "רינתיה",
-    735: "אלעד",
-    737: "קריית אונו",
-    738: "נחלים",
-    739: "מזור",
-    740: "שילה",
-    741: "פצאל",
-    742: "תל אביב - מרכז העיר",
-    744: "גבעתיים",
-    745: "רמת גן - מערב",
-    746: "גני תקווה",
-    747: "מעש",
-    748: "נחשונים",
-    749: "פדואל",
-    750: "מעלה לבונה",
-    754: "בני ברק",
-    755: "גבעת שמואל",
-    758: "גת רימון",
-    761: "כפר סירקין",
-    763: "עלי זהב - לשם",
-    764: "עלי",
-    765: "אחיה",
-    766: "יפית",
-    772: "עינת",
-    775: "מעלה אפרים",
-    781: "ראש העין",
-    782: "ברוכין",
-    783: "תל אביב - עבר הירקון",
-    785: "פתח תקווה",
-    787: "גבעת השלושה",
-    788: "ברקן",
-    789: "מגדלים",
-    792: "אזור תעשייה אפק ולב הארץ",
-    793: "כפר קאסם",
-    794: "אלקנה",
-    795: "אריאל",
-    796: "נופי נחמיה",
-    797: "רחלים",
-    798: "גיתית",
-    799: "משואה",
-    800: "עץ אפרים",
-    801: "קריית נטפים",
-    802: "רמת השרון",
-    804: "אורנית",
-    805: "שערי תקווה",
-    806: "רבבה",
-    807: "כפר תפוח",
-    810: "הוד השרון",
-    812: "עדנים",
-    813: "נווה ירק",
-    814: "מרכז אזורי דרום השרון",
-    815: "חגור",
-    816: "חורשים",
-    817: "כפר ברא",
-    818: "מתחם גלילות",
-    822: "ירקונה",
-    823: "נירית",
-    824: "הרצליה - מרכז וגליל ים",
-    825: "גני עם",
-    827: "אלישמע",
-    828: "ג'לג'וליה",
-    829: "ירחיב",
-    830: "מתן",
-    831: "יקיר",
-    832: "נופים",
-    834: "הרצליה - מערב",
-    837: "גבעת חן",
-    838: "רמות השבים",
-    839: "שדי חמד",
-    840: "כפר סבא",
-    841: "עמנואל",
-    842: "כפר מל''ל",
-    843: "נווה ימין",
-    844: "אלפי מנשה",
-    846: "קרני שומרון",
-    847: "מכורה",
-    848: "כפר שמריהו",
-    849: "רעננה",
-    851: "יצהר",
-    852: "איתמר",
-    853: "ארגמן",
-    854: "צופית",
-    855: "רשפון",
-    856: "גן חיים",
-    857: "שדה ורבורג",
-    858: "בית ברל",
-    859: "ניר אליהו",
-    860: "צופים",
-    861: "הר ברכה",
-    862: "ארסוף",
-    863: "בצרה",
-    864: "אייל",
-    865: "חמרה",
-    866: "שפיים",
-    867: "בני ציון",
-    868: "רמת הכובש",
-    869: "טירה",
-    870: "כוכב יאיר - צור יגאל",
-    871: "קדומים",
-    872: "געש",
-    873: "חרוצים",
-    874: "משמרת",
-    876: "חרות",
-    877: "אלון מורה",
-    878: "יקום",
-    879: "כפר הס",
-    880: "צור יצחק",
-    881: "צור נתן",
-    882: "סלעית",
-    883: "אזור תעשייה בראון",
-    884: "תל יצחק",
-    885: "תל מונד",
-    886: "טייבה",
-    887: "בקעות",
-    888: "מכון וינגייט",
-    889: "אודים",
-    890: "בית יהושע",
-    891: "אבן יהודה",
-    892: "בני דרור",
-    893: "עין ורד",
-    894: "כפר עבודה",
-    895: "עזריאל",
-    896: "רועי",
-    897: "חמדת",
-    899: "כפר נטר",
-    900: "קדימה צורן",
-    901: "פורת",
-    902: "יעבץ, יעף",
-    904: "שבי שומרון",
-    906: "עין שריד",
-    907: "קלנסווה",
-    910: "שער אפרים",
-    911: "אבני חפץ",
-    912: "ענב",
-    913: "נתניה - מזרח",
-    914: "צור משה",
-    915: "גאולים",
-    916: "פרדסיה",
-    917: "ינוב",
-    918: "תנובות",
-    919: "ניצני עוז",
-    920: "נתניה - מערב",
-    921: "נורדיה",
-    922: "כפר יונה",
-    923: "בארותיים",
-    925: "בית יצחק - שער חפר",
-    926: "גנות הדר",
-    927: "בורגתה",
-    928: "יד חנה",
-    930: "חניאל",
-    931: "עולש",
-    932: "בת חפר",
-    933: "משכיות",
-    934: "כפר ידידיה",
-    935: "המרכז האקדמי רופין",
-    936: "כפר מונש",
-    937: "גן יאשיה",
-    938: "שושנת העמקים",
-    940: "אביחיל",
-    941: "הדר עם",
-    942: "כפר חיים",
-    943: "בית הלוי",
-    944: "בחן",
-    945: "רותם",
-    946: "שדמות מחולה",
-    947: "חבצלת השרון וצוקי ים",
-    949: "בת חן",
-    950: "ביתן אהרן",
-    951: "גבעת שפירא",
-    952: "משמר השרון",
-    953: "מעברות",
-    954: "העוגן",
-    955: "אמץ",
-    956: "זמר",
-    957: "נעורים",
-    958: "בית חרות",
-    959: "בית ינאי",
-    960: "כפר ויתקין",
-    961: "אלישיב",
-    962: "המעפיל",
-    963: "מחולה",
-    964: "חופית",
-    966: "כפר הרא''ה",
-    967: "חגלה",
-    968: "גבעת חיים מאוחד",
-    969: "עין החורש",
-    970: "אחיטוב",
-    971: "מגל",
-    972: "אזור תעשייה עמק חפר",
-    973: "גאולי תימן",
-    974: "חיבת ציון",
-    975: "גבעת חיים איחוד",
-    976: "להבות חביבה",
-    977: "ג'ת",
-    978: "מכמורת",
-    979: "חרב לאת",
-    980: "אליכין",
-    981: "שדה יצחק",
-    982: "באקה אל גרבייה",
-    983: "חדרה - מזרח",
-    984: "חדרה - מערב",
-    985: "חדרה - מרכז",
-    986: "מאור",
-    987: "חרמש",
-    988: "מבוא דותן",
-    989: "חדרה - נווה חיים",
-    991: "טירת צבי",
-    992: "גן שמואל",
-    993: "תלמי אלעזר",
-    994: "מצר",
-    995: "שדי תרומות",
-    998: "שער מנשה",
-    999: "מייסר",
-    1000: "כפר גמילה מלכישוע",
-    1001: "תל תאומים",
-    1002: "שדה אליהו",
-    1003: "פרדס חנה כרכור",
-    1004: "גן השומרון",
-    1005: "עין שמר",
-    1006: "מענית, גבעת חביבה",
-    1008: "חריש",
-    1009: "מירב",
-    1010: "רוויה",
-    1011: "רחוב",
-    1015: "אום אל קוטוף",
-    1016: "מצפה אילן",
-    1017: "ברטעה",
-    1018: "ריחן",
-    1019: "כפר רופין",
-    1020: "אזור תעשייה קיסריה",
-    1022: "ברקאי",
-    1023: "שקד",
-    1024: "מעלה גלבוע",
-    1025: "רשפים, שלוחות, שלפים",
-    1027: "עין הנצי''ב",
-    1028: "שדות ים",
-    1029: "קיסריה",
-    1030: "משמרות",
-    1031: "כפר פינס",
-    1032: "עין עירון",
-    1033: "קציר",
-    1034: "טל מנשה",
-    1035: "חיננית",
-    1039: "כפר קרע",
-    1040: "ערערה",
-    1041: "עין אל סהלה",
-    1042: "בית שאן",
-    1043: "נמל קיסריה",
-    1044: "אור עקיבא",
-    1045: "כפר גליקסון",
-    1046: "אל עריאן",
-    1047: "אום אל פחם",
-    1048: "מי עמי",
-    1049: "מסילות",
-    1051: "נוה איתן",
-    1052: "מעוז חיים",
-    1053: "בנימינה",
-    1054: "אלוני יצחק",
-    1055: "ניר דוד",
-    1056: "גבעת עדה",
-    1057: "רגבים",
-    1060: "מוקיבלה",
-    1061: "מגן שאול",
-    1062: "בית אלפא וחפציבה",
-    1063: "ג'סר א-זרקא",
-    1064: "בית חנניה",
-    1065: "אביאל",
-    1066: "מועאוויה",
-    1067: "רם און",
-    1068: "סנדלה",
-    1069: "גן נר",
-    1070: "שדה נחום",
-    1071: "חמדיה",
-    1072: "מעגן מיכאל",
-    1073: 'בי"ס כרמים בנימינה',
-    1074: "גבעת ניל''י",
-    1075: "מעלה עירון",
-    1076: "מרכז חבר",
-    1077: "ישובי יעל",
-    1078: "נורית",
-    1081: "זכרון יעקב",
-    1083: "גלעד",
-    1084: "גבעת עוז",
-    1085: "גדעונה",
-    1086: "עין חרוד, תל יוסף",
-    1087: "בית השיטה",
-    1088: "מעיין צבי",
-    1089: "עמיקם",
-    1090: "ישובי אומן",
-    1091: "יזרעאל",
-    1092: "כפר יחזקאל",
-    1094: "בית יוסף",
-    1095: "קיבוץ מגידו",
-    1096: "אזור תעשייה מבואות הגלבוע",
-    1097: "קבוצת גבע",
-    1098: "ירדנה",
-    1099: "פוריידיס",
-    1100: "מאיר שפיה",
-    1101: "רמות מנשה",
-    1102: "דליה",
-    1103: "עין השופט",
-    1104: "מדרך עוז",
-    1106: "רמת צבי",
-    1107: "מולדת",
-    1108: "נווה אור",
-    1109: "דור, נחשולים",
-    1110: "בת שלמה",
-    1112: "עפולה",
-    1115: "רמת השופט",
-    1116: "משמר העמק",
-    1117: "היוגב",
-    1118: "מרחביה מושב",
-    1119: "מרחביה קיבוץ",
-    1120: "סולם",
-    1121: "נאעורה",
-    1122: "טייבה בגלבוע",
-    1123: "עופר",
-    1125: "אזור תעשייה מבוא כרמל",
-    1128: "הבונים",
-    1129: "עין איילה",
-    1131: "אליקים",
-    1132: "עין העמק",
-    1134: "דחי",
-    1135: "גשר",
-    1136: "כרם מהר''ל",
-    1137: "יקנעם עילית",
-    1138: "יקנעם המושבה והזורע",
-    1139: "בלפוריה",
-    1140: "נין",
-    1141: "אזור תעשייה אלון התבור",
-    1142: "טמרה בגלבוע",
-    1143: "צרופה",
-    1144: "מרכז מיר''ב",
-    1145: "כפר ברוך",
-    1146: "כפר גדעון",
-    1147: "אחוזת ברק",
-    1148: "גזית",
-    1149: "גבע כרמל",
-    1150: "אזור תעשייה יקנעם עילית",
-    1152: "מזרע",
-    1153: "תל עדשים",
-    1154: "דברת",
-    1156: "כפר מצר",
-    1157: "שריד",
-    1158: "מגדל העמק",
-    1159: "גניגר",
-    1160: "עין דור",
-    1161: "אשדות יעקב",
-    1162: "עין כרמל",
-    1163: "כפר יהושע",
-    1164: "גבת",
-    1165: "יפעת",
-    1166: "כפר קיש",
-    1167: "מנחמיה",
-    1169: "נווה ים",
-    1171: "עתלית",
-    1172: "דלית אל כרמל",
-    1173: "תחנת רכבת כפר יהושוע",
-    1174: "נהלל",
-    1175: "רמת דוד",
-    1176: "יפיע",
-    1177: "נצרת",
-    1178: "אכסאל",
-    1179: "דבוריה",
-    1180: "שיבלי אום אלג'נם",
-    1181: "כפר תבור",
-    1182: "עין חוד",
-    1183: "קריית טבעון - בית זייד",
-    1184: "שדה יעקב",
-    1185: "בית שערים",
-    1186: "נוף הגליל",
-    1188: "אפיקים",
-    1189: "מסדה",
-    1190: "עין הוד",
-    1191: "ניר עציון, ימין אורד",
-    1193: "רמת ישי",
-    1195: "שדמות דבורה",
-    1196: "בית זרע",
-    1197: "שער הגולן",
-    1198: "חמת גדר",
-    1200: "עספיא",
-    1202: "כפר תקווה",
-    1204: "מנשית זבדה",
-    1205: "זרזיר",
-    1206: "תמרת",
-    1207: "כפר החורש",
-    1209: "כדורי",
-    1210: "יבנאל",
-    1211: "דגניה ב",
-    1212: "צמח",
-    1213: "מגדים",
-    1214: "בית צבי",
-    1216: "אורנים",
-    1217: "אלונים",
-    1218: "עילוט",
-    1219: "ריינה",
-    1221: "עין מאהל",
-    1222: "אלומות",
-    1223: "כינרת קבוצה",
-    1224: "דגניה א",
-    1226: "מעגן",
-    1227: "תל קציר",
-    1228: "גבעת וולפסון",
-    1230: "שער העמקים",
-    1231: "אלוני אבא",
-    1232: "גבעת אלה",
-    1234: "בית קשת",
-    1235: "כפר כמא",
-    1236: "שרונה",
-    1237: "פוריה כפר עבודה",
-    1238: "כינרת מושבה",
-    1239: "בית ירח",
-    1240: "בית אורן",
-    1242: "יגור",
-    1243: "כפר חסידים",
-    1244: "בסמת טבעון",
-    1245: "בית לחם הגלילית",
-    1246: "חג'אג'רה",
-    1247: "שמשית",
-    1248: "משהד",
-    1250: "פוריה עילית",
-    1251: "האון",
-    1253: "רכסים",
-    1254: "ציפורי",
-    1255: "כפר כנא",
-    1256: "פוריה נווה עובד",
-    1257: "מבוא חמה",
-    1258: "החותרים",
-    1259: "טירת כרמל",
-    1262: "כעביה טבאש",
-    1263: "הסוללים",
-    1265: "אילניה",
-    1267: "שדה אילן",
-    1268: "הזורעים",
-    1269: "כפר גלים",
-    1270: "חיפה - נווה שאנן ורמות כרמל",
-    1271: "נשר",
-    1272: "איבטין",
-    1273: "נופית",
-    1275: "הרדוף",
-    1276: "אלון הגליל",
-    1277: "הושעיה",
-    1278: "אזור תעשייה ציפורית",
-    1282: "כפר ח'וואלד",
-    1283: "ראס עלי",
-    1284: "סואעד חמירה",
-    1285: "ביר אלמכסור",
-    1286: "רומת אל הייב",
-    1287: "כפר נהר הירדן",
-    1289: "כפר חרוב",
-    1290: "מיצר",
-    1292: "חיפה - מערב",
-    1295: "עדי",
-    1296: "טורעאן",
-    1297: "גבעת אבני",
-    1298: "טבריה",
-    1299: "עין גב",
-    1302: "חיפה - כרמל, הדר ועיר תחתית",
-    1304: "קריית אתא",
-    1305: "כפר המכבי",
-    1306: "רמת יוחנן",
-    1307: "שפרעם",
-    1308: "חנתון",
-    1309: "עוזייר, רומאנה",
-    1310: "בית רימון",
-    1312: "לביא",
-    1313: "אזור תעשייה קדמת גליל",
-    1314: "אפיק",
-    1319: "אושה",
-    1320: "כפר מנדא",
-    1322: "הודיות",
-    1323: "מצפה",
-    1324: "נאות גולן",
-    1328: "בועיינה-נוג'ידאת",
-    1329: "מצפה נטופה",
-    1330: "כפר חיטים",
-    1331: "בני יהודה וגבעת יואב",
-    1336: "חיפה - מפרץ",
-    1337: "קריית ביאליק",
-    1338: "כפר ביאליק",
-    1339: "אעבלין",
-    1340: "דמיידה",
-    1341: "כפר זיתים",
-    1342: "ארבל",
-    1343: "אזור תעשייה בני יהודה",
-    1344: "אלי עד",
-    1347: "קריית מוצקין",
-    1348: "מורשת",
-    1349: "גשור",
-    1351: "קריית ים",
-    1352: "אפק",
-    1353: "מצפה אבי''ב",
-    1354: "כאוכב אבו אלהיג'א",
-    1355: "יודפת",
-    1356: "עילבון",
-    1357: "ואדי אל חמאם",
-    1358: "מגדל",
-    1359: "אבני איתן",
-    1360: "טמרה",
-    1361: "קורנית",
-    1362: "עראבה",
-    1363: "אבטליון",
-    1364: "נוב",
-    1366: "מנוף",
-    1367: "שכניה",
-    1368: "רקפת",
-    1370: "הררית יחד",
-    1371: "מסד",
-    1372: "גינוסר",
-    1373: "רמות",
-    1374: "חספין",
-    1375: "רמת מגשימים",
-    1378: "מרכז אזורי משגב",
-    1380: "סכנין",
-    1381: "דיר חנא",
-    1382: "רביד",
-    1383: "נטור",
-    1384: "כאבול",
-    1385: "עצמון - שגב",
-    1386: "אזור תעשייה תרדיון",
-    1387: "טפחות",
-    1388: "לבנים",
-    1389: "אזור תעשייה שער נעמן",
-    1390: "יעד",
-    1391: "יובלים",
-    1392: "אשבל",
-    1393: "מע'אר",
-    1394: "כלנית",
-    1395: "כנף",
-    1396: "כפר מסריק",
-    1397: "עכו - אזור תעשייה",
-    1398: "שעב",
-    1399: "אשחר",
-    1400: "לוטם וחמדון",
-    1401: "סלמה",
-    1403: "חוקוק",
-    1404: "עין המפרץ",
-    1405: "יסעור",
-    1407: "שורשים",
-    1408: "ערב אל נעים",
-    1409: "מעלה צביה",
-    1410: "כחל",
-    1411: "מעלה גמלא",
-    1414: "אחיהוד",
-    1415: "אזור תעשייה בר-לב",
-    1416: "צורית גילון",
-    1417: "כרמיאל",
-    1418: "חוסנייה",
-    1419: "חזון",
-    1421: "קדרים",
-    1422: "אמנון",
-    1423: "עכו",
-    1424: "ג'דידה מכר",
-    1425: "מג'דל כרום",
-    1426: "מכמנים - כמאנה מערבית",
-    1427: "כמון - כמאנה מזרחית",
-    1428: "ראס אל-עין",
-    1431: "כורזים ורד הגליל",
-    1432: "אלמגור",
-    1433: "טל - אל",
-    1434: "בענה",
-    1435: "אזור תעשייה כרמיאל",
-    1436: "מורן",
-    1437: "כפר חנניה",
-    1440: "פלך",
-    1441: "תובל",
-    1442: "דיר אל-אסד",
-    1443: "נחף",
-    1444: "שזור",
-    1445: "עמיעד",
-    1446: "חד נס",
-    1448: "ג'וליס",
-    1449: "כישור",
-    1450: "לבון",
-    1451: "סאג'ור",
-    1452: "ראמה",
-    1453: "עין אל אסד",
-    1454: "אמירים",
-    1455: "פרוד",
-    1457: "כרכום",
-    1458: "בוסתן הגליל",
-    1459: "שמרת",
-    1461: "כפר יאסיף",
-    1462: "ירכא",
-    1463: "הר חלוץ",
-    1464: "שפר",
-    1466: "אליפלט",
-    1467: "יונתן",
-    1469: "לוחמי הגטאות",
-    1470: "אבו סנאן",
-    1471: "לפידות",
-    1472: "כסרא סמיע",
-    1473: "חרשים",
-    1474: "בית ג'אן",
-    1475: "כפר שמאי",
-    1477: "צפת - עיר",
-    1479: "רגבה",
-    1480: "נס עמים",
-    1481: "בית העמק",
-    1482: "אשרת",
-    1483: "גיתה",
-    1484: "פקיעין",
-    1486: "ראש פינה",
-    1487: "טובא זנגריה",
-    1488: "אניעם",
-    1489: "שבי ציון",
-    1490: "מזרעה",
-    1491: "עמקה",
-    1492: "כליל",
-    1493: "ינוח ג'ת",
-    1494: "מגדל תפן",
-    1496: "אזור תעשייה צ.ח.ר",
-    1499: "נהריה",
-    1500: "עברון",
-    1501: "נתיב השיירה",
-    1502: "מירון",
-    1503: "ביריה",
-    1506: "חצור הגלילית",
-    1508: "מנחת מחניים",
-    1509: "כפר הנשיא",
-    1510: "קשת",
-    1511: "שייח' דנון",
-    1512: "יחיעם",
-    1513: "כפר ורדים",
-    1514: "חוסן",
-    1517: "מחניים",
-    1518: "קצרין",
-    1520: "בן עמי",
-    1522: "געתון",
-    1523: "מעלות תרשיחא",
-    1525: "מרכז אזורי מרום גליל",
-    1526: "בר יוחאי",
-    1527: "קדיתא",
-    1528: "עמוקה",
-    1531: "כברי",
-    1533: "עין יעקב",
-    1534: "מעונה",
-    1535: "צוריאל",
-    1536: "חורפיש",
-    1537: "ספסופה - כפר חושן",
-    1538: "אור הגנוז",
-    1539: "משמר הירדן",
-    1540: "מעיליא",
-    1541: "ג'ש - גוש חלב",
-    1542: "דלתון",
-    1543: "גדות",
-    1544: "סער",
-    1545: "גשר הזיו",
-    1546: "נווה זיו",
-    1547: "אלקוש",
-    1548: "סאסא",
-    1549: "צבעון",
-    1550: "אזור תעשייה רמת דלתון",
-    1552: "איילת השחר",
-    1553: "קדמת צבי",
-    1555: "מנות",
-    1556: "הילה",
-    1557: "אבירים",
-    1558: "מתת",
-    1560: "כרם בן זמרה",
-    1562: "איזור תעשייה מילואות צפון",
-    1563: "לימן",
-    1564: "עבדון",
-    1565: "גורן",
-    1566: "פסוטה",
-    1567: "ריחאנייה",
-    1568: "שדה אליעזר",
-    1569: "אלוני הבשן",
-    1570: "מצובה",
-    1571: "אילון",
-    1572: "גורנות הגליל",
-    1574: "דוב''ב",
-    1575: "ברעם",
-    1576: "עלמה",
-    1577: "יסוד המעלה",
-    1578: "חולתה",
-    1581: "בצת",
-    1582: "שלומי",
-    1583: "יערה",
-    1585: "נטועה",
-    1588: "אבן מנחם",
-    1590: "ראש הנקרה",
-    1591: "חניתה",
-    1592: "אדמית",
-    1593: "ערב אל עראמשה",
-    1595: "שומרה",
-    1596: "שתולה",
-    1598: "יראון",
-    1599: "דישון",
-    1603: "זרעית",
-    1604: "אביבים",
-    1605: "רמות נפתלי",
-    1606: "אורטל",
-    1608: "מלכיה",
-    1610: "עין זיוון",
-    1613: "מרכז אזורי מבואות חרמון",
-    1614: "שעל",
-    1617: "יפתח",
-    1618: "גונן",
-    1621: "קלע אלון",
-    1622: "מרום גולן",
-    1625: "להבות הבשן",
-    1626: "נאות מרדכי",
-    1627: "שמיר",
-    1631: "כפר בלום",
-    1633: "עמיר",
-    1634: "שדה נחמיה",
-    1635: "אל רום",
-    1636: "מנרה",
-    1637: "קריית שמונה",
-    1638: "כפר סאלד",
-    1639: "אודם",
-    1640: "בית הלל",
-    1641: "בוקעתא",
-    1642: "מרגליות",
-    1649: "הגושרים",
-    1650: "שאר ישוב",
-    1652: "תל חי",
-    1653: "דפנה",
-    1654: "עין קנייא",
-    1655: "מסעדה",
-    1657: "כפר גלעדי",
-    1658: "מעיין ברוך",
-    1659: "קיבוץ דן",
-    1660: "שניר",
-    1661: "משגב עם",
-    1662: "כפר יובל",
-    1664: "נמרוד",
-    1665: "מג'דל שמס",
-    1667: "ע'ג'ר",
-    1668: "נווה אטי''ב",
-    1669: "מטולה",
-    1713: "שדה בר",
-    1714: "מתחם בני דרום",
-    1715: "אתר ההנצחה גולני",
-    1716: "מרכז אזורי מגילות",
-    1721: "תחנת רכבת ראש העין",
-    1722: "בית ספר שדה מירון",
-    1723: "חוות יאיר",
-    1724: "עדי עד",
-    1725: "קידה",
-    1729: "שבות רחל",
-    1730: "אזור תעשייה ניר עציון",
-    1736: "היישוב היהודי חברון",
-    1748: "באר שבע - צפון",
-    1749: "באר שבע - דרום",
-    1751: "מתחם פי גלילות",
-    1752: "אתר דודאים",
-    1759: "גבים, מכללת ספיר",
-    1760: "בית הגדי",
-    1761: "מעון צופיה",
-    1768: "כמהין",
-    1771: "באר מילכה",
-    1772: "נאות הכיכר",
-    1774: "אשלים",
-    1775: "עין תמר",
-    1776: "מעלה מכמש",
-    1779: "גיבתון",
-    1780: "בית חשמונאי",
-    1783: "מצליח",
-    1784: "יד רמב''ם",
-    1785: "מודיעין מכבים רעות",
-    1786: "פסגות",
-    1790: "ישרש",
-    1791: "מודיעין - ליגד סנטר",
-    1792: "כפר רות",
-    1793: "עיינות",
-    1794: "בית עובד",
-    1795: "נס ציונה",
-    1796: "נצר סרני",
-    1797: "רמלה",
-    1799: "אזור תעשייה נשר - רמלה",
-    1801: "שילת",
-    1802: "לפיד",
-    1803: "כפר האורנים",
-    1804: "מבואות יריחו",
-    1805: "נעמה",
-    1806: "בית חנן",
-    1807: "אירוס",
-    1809: "באר יעקב",
-    1811: "אחיסמך",
-    1812: "גמזו",
-    1813: "חשמונאים",
-    1814: "מודיעין עילית",
-    1815: "דולב",
-    1817: "פלמחים",
-    1818: "נטעים",
-    1819: "כפר דניאל",
-    1820: "מבוא מודיעים",
-    1821: "מתתיהו",
-    1822: "בית אל",
-    1823: "רימונים",
-    1826: "גן שורק",
-    1827: "ראשון לציון - מזרח",
-    1829: "ניר צבי",
-    1830: "לוד",
-    1831: "בן שמן",
-    1832: "טלמון",
-    1833: "חרשה",
-    1834: "פארק תעשיות פלמחים",
-    1835: "נריה",
-    1836: "עפרה",
-    1837: "ייט''ב",
-    1838: "ראשון לציון - מערב",
-    1840: "תעשיון צריפין",
-    1842: "גינתון",
-    1843: "כפר נוער בן שמן",
-    1845: "נילי",
-    1846: "נעלה",
-    1847: "כוכב השחר",
-    1849: "אחיעזר",
-    1850: "זיתן",
-    1851: "חדיד",
-    1852: "בית נחמיה",
-    1853: "יגל",
-    1854: "כפר טרומן",
-    1856: "נחליאל",
-    1858: "נערן",
-    1860: "בית דגן",
-    1861: "כפר חב''ד",
-    1863: "איירפורט סיטי",
-    1864: "בית עריף",
-    1865: "שוהם",
-    1866: "בת ים",
-    1869: "צפריה",
-    1871: "בית עלמין תל רגב",
-    1874: "מלונות ים המלח מרכז",
-    1875: "קצרין - אזור תעשייה",
-    1878: "חיפה - קריית חיים ושמואל",
-    1880: "עשהאל",
-    1883: "אדורים",
-    1884: "חוות גלעד",
-    1890: "גבעת הראל",
-    1891: "גבעת אסף",
-    1894: "עמיחי",
-    1921: "אל סייד",
-    1922: "ירושלים - מערב",
-    1923: "מעלה רחבעם",
-    1925: "תל ערד",
-    1926: "ירושלים - כפר עקב",
-    1928: "בית סוהר קישון",
-    1929: "אל עמארני, אל מסק",
-    1931: "בית סוהר צלמון",
-    1932: "אשקלון - דרום",
-    1933: "אזור תעשייה ברקן",
-    1937: "תחנת רכבת קריית מלאכי - יואב",
-    1938: "רמת טראמפ",
-    1939: "אזור תעשייה שחק",
-    1942: "אזור תעשייה אריאל",
-    1943: "צומת הגוש",
-    1945: "פקיעין החדשה",
-    1949: "גבעון החדשה",
-    1955: "כרם רעים",
-    1956: "מיני ישראל - נחשון",
-    1961: "פארק אריאל שרון",
-    1963: "כפר הנוער קריית יערים",
-    2005: "צפת - עכברה",
-    2006: "צפת - נוף כנרת",
-    2007: "בית העלמין החדש נהריה",
-    2014: "חוף קליה",
-    2017: "נאות קדומים",
-    2019: "חוף זיקים",
-    2021: "לב החולה",
-    2023: "אזור תעשייה קריית ביאליק",
-    2025: "פארק תעשיות מגדל עוז",
-    2026: "אזור תעשייה כפר יונה",
-    2191: "מתחם סקי גלבוע",
-    2192: "בית העלמין החדש עכו",
-    2194: "גני חוגה",
-    2195: "אזור תעשייה גדרה",
-    2200: "בית עלמין מורשה",
-    2201: "נבי שועייב",
-    2202: "תחנת רכבת כפר ברוך",
-    2203: "מתחם שביל התפוזים",
-    2204: "כפר הנוקדים",
-    2207: "אזור תעשייה רבדים",
-    2209: "חוף בצת",
-    2210: "עינות קדם",
-    2211: "החווה של זוהר",
-    2212: "מצפור פצאל",
-    2213: "חוות הרשאש",
-    2214: "שלומציון",
-    2215: "חוות גנות",
-    2216: "החווה של מנחם",
-    2217: "החווה של עשהאל",
-    2218: "חוות יד השומר",
-    2219: "בתרונות",
-    2220: "החווה של אורי כהן",
-    2221: "החווה של יאיא",
-    2222: "חוות עמיאל",
-    2223: "בית חגלה",
-    2224: "קדם ערבה",
-    2225: "צומת אלמוג",
-    2226: "מסוף אורנית",
-    2227: "מרכז אזורי רמת כורזים",
-    2228: "חמדת ימים",
-    2229: "עכו - רמות ים",
-    2230: "איבי הנחל",
-    2231: "הגבעה הצהובה",
-    2232: "חוות ארץ האיילים",
-    2233: "חוות קשואלה",
-    2234: "עוז וגאון",
-    2235: "חוות נחלת אבות",
-    2236: "שדה בועז",
-    2237: "חוות עדן",
-    2238: "בית הברכה",
-    2239: "קדר דרום",
-    2240: "חוות צאן קדר",
-    2241: "תקוע ד' וה'",
-    2242: "חוות אביחי",
-    2243: "חוות עולם חסד",
-    2245: "חוף אכזיב",
-    2247: "גבעת פורת יוסף",
-    2248: "חוות מגדלים",
-    2249: "אביתר",
-    2250: "חוות שדה",
-    2251: "חומש",
-    2252: "חוות אלחי",
-    2253: "חוות שוביאל",
-    2254: "חוות שחרית",
-    2255: "דורות עילית",
-    2256: 'חוות נוף אב"י',
-    2257: "חוות צרידה",
-    2258: "חרמש דרום",
-    2259: "חוות אל נווה",
-    2260: "חוות אביה",
-    2261: "חוות מדבר חבר",
-    2262: "אביגיל",
-    2263: "מצפה יאיר",
-    2264: "סוסיא הקדומה",
-    2265: "חוות טואמין",
-    2266: "חוות דרומא",
-    2267: "חוות טליה",
-    2268: "חירן",
-    2269: "חוות מקנה יהודה",
-    2270: "אשתמוע",
-    2271: "אפקה",
-    2272: "חוות מור ואברהם",
-    2273: "חוות אשכולות",
-    2274: "חוות מנחם",
-    2275: "חוות יויו",
-    2276: "חוות מלאכי אברהם",
-    2277: "מצפה מדרג",
-    2278: 'מצפה זי"ו',
-    2281: "חוות תלם צפון",
-    2282: "חוות פריאל",
-    2284: "חניון רעים אנדרטת הנובה",
-    2285: "מכינת אלישע",
-    2286: "גבעת הרואה",
-    2287: "בני אדם",
-    2288: "מצפה חגית",
-    2289: "נווה ארז",
-    2290: "מצפה דני",
-    2291: "חוות מרום שמואל",
-    2292: "שדה אפרים",
-    2293: "חוות מגנזי",
-    2294: "גופנה",
-    2295: "יבוא דודי",
-    2296: "אש קודש",
-    2297: "חוות נחל שילה",
-    2298: "חוות ראש תאנה",
-    2299: "חוות מלכיאל",
-    2300: "חוות מעלה אהוביה",
-    2301: "חוות נחלת צבי",
-    2302: "רמת מגרון",
-    2303: "חוות ינון",
-    2304: "אעירה השחר",
-    2305: "חוות חנינא",
-    2306: "חוות בניהו",
-    2307: "חוות הרועה העברי",
-    2308: "חוות נווה צוף",
-    2309: "בר כוכבא",
-    2327: "מלאכי השלום",
-    2330: "חיפה - בת גלים ק.אליעזר",
-    10000000: "כל הארץ",
-}
+from .tables import load_table
+
+TZEVAADOM_ID_TO_AREA: dict[int, str] = load_table("tzevaadom_id_to_area")
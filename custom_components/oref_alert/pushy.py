@@ -7,12 +7,16 @@ import hashlib
 import json
 import logging
 import ssl
+import threading
+import time
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Final
 
 import homeassistant.util.dt as dt_util
+from homeassistant.core import callback
 from homeassistant.exceptions import IntegrationError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.instance_id import async_get
 from paho.mqtt.client import Client as MQTTClient
 from paho.mqtt.client import MQTTMessage
@@ -38,6 +42,9 @@ from .metadata.segment_to_area import SEGMENT_TO_AREA
 from .ttl_deque import TTLDeque
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
     from homeassistant.core import HomeAssistant
     from paho.mqtt.reasoncodes import ReasonCode
 
@@ -48,6 +55,7 @@ MQTT_HOST: Final = "mqtt-{timestamp}.ioref.io"
 MQTT_PORT: Final = 443
 MQTT_KEEPALIVE: Final = 300
 MQTT_QOS: Final = 1
+MQTT_BATCH_WINDOW: Final = 0.2
 REQUEST_RETRIES = 3
 PUSHY_CREDENTIALS_KEY: Final = "pushy_credentials"
 TOKEN_KEY: Final = "token"  # noqa: S105
@@ -87,6 +95,12 @@ class PushyNotifications:
         self._http_client = async_get_clientsession(hass)
         self._credentials: dict[str, str] = {}
         self._mqtt: MQTTClient | None = None
+        self.connected: bool = False
+        self.heartbeat_interval: float = MQTT_KEEPALIVE
+        self.last_message: float = 0.0
+        self._pending: list[dict[str, Any]] = []
+        self._pending_lock = threading.Lock()
+        self._unsub_flush: Callable[[], None] | None = None
         self.alerts: TTLDeque = TTLDeque(
             config_entry.options[CONF_ALERT_ACTIVE_DURATION]
         )
@@ -248,6 +262,10 @@ class PushyNotifications:
         self._mqtt.on_connect = lambda _c, _u, _f, reason_code, _p: self.on_connect(
             reason_code
         )
+        self._mqtt.on_disconnect = lambda _c, _u, _f, reason_code, _p: (
+            self.on_disconnect(reason_code)
+        )
+        self._mqtt.on_log = lambda _client, _userdata, _level, text: self.on_log(text)
         self._mqtt.connect_async(
             MQTT_HOST.replace("{timestamp}", str(int(dt_util.now().timestamp()))),
             MQTT_PORT,
@@ -259,49 +277,88 @@ class PushyNotifications:
         """Subscribe on successful connect."""
         if not reason_code.is_failure and self._mqtt:
             self._mqtt.subscribe(self._credentials.get(TOKEN_KEY, ""), MQTT_QOS)
+            self.last_message = time.monotonic()
+            self.connected = True
             LOGGER.debug("MQTT subscribe is done.")
         else:
             LOGGER.warning(f"MQTT connection failed: {reason_code.getName()}.")  # type: ignore[no-untyped-call]
 
+    def on_disconnect(self, reason_code: ReasonCode) -> None:
+        """Poll fast until reconnected (paho reconnects automatically)."""
+        LOGGER.debug(f"MQTT disconnected: {reason_code.getName()}.")  # type: ignore[no-untyped-call]
+        if self.connected:
+            self.connected = False
+            asyncio.run_coroutine_threadsafe(
+                self._config_entry.runtime_data.updater.async_push_event(),
+                self._hass.loop,
+            )
+
+    def on_log(self, text: str) -> None:
+        """Track the MQTT keepalive (paho has no callback for the ping response)."""
+        if text == "Received PINGRESP":
+            self.last_message = time.monotonic()
+
     def on_message(self, message: MQTTMessage) -> None:
-        """MQTT message processing."""
+        """MQTT message processing (called from the MQTT thread)."""
+        self.last_message = time.monotonic()
         try:
             content = json.loads(message.payload.decode("utf-8"))
             LOGGER.debug("MQTT message: %s", content)
             if content.get("test"):
                 return
-            new_alert = False
-            alert_date = dt_util.parse_datetime(
-                content["time"], raise_on_error=True
-            ).strftime("%Y-%m-%d %H:%M:%S")
-            if (
-                category := pushy_thread_id_to_history_category(
-                    int(content["threatId"])
-                )
-            ) is not None:
-                for area in [
-                    SEGMENT_TO_AREA[int(segment)]
-                    for segment in content["citiesIds"].split(",")
-                    if int(segment) in SEGMENT_TO_AREA
-                ]:
-                    self.alerts.add(
-                        {
-                            DATE_FIELD: alert_date,
-                            TITLE_FIELD: content[TITLE_FIELD],
-                            AREA_FIELD: area,
-                            CATEGORY_FIELD: category,
-                            CHANNEL_FIELD: AlertSource.MOBILE,
-                        }
-                    )
-                    new_alert = True
-            if new_alert:
-                asyncio.run_coroutine_threadsafe(
-                    self._config_entry.runtime_data.coordinator.async_refresh(),
-                    self._hass.loop,
-                )
+            with self._pending_lock:
+                self._pending.append(content)
+                if len(self._pending) > 1:
+                    return  # A flush is already scheduled.
+            self._hass.loop.call_soon_threadsafe(self._schedule_flush)
         except:  # noqa: E722
             LOGGER.exception("Failed to process MQTT message.")
 
+    @callback
+    def _schedule_flush(self) -> None:
+        """Process the messages which arrive within the batch window together."""
+        self._unsub_flush = async_call_later(self._hass, MQTT_BATCH_WINDOW, self._flush)
+
+    @callback
+    def _flush(self, _: datetime) -> None:
+        """Convert the batch of messages to alerts and refresh once."""
+        self._unsub_flush = None
+        with self._pending_lock:
+            messages, self._pending = self._pending, []
+        alerts: dict[tuple[str, int, str], dict[str, Any]] = {}
+        dates: dict[str, str] = {}
+        for content in messages:
+            try:
+                if (
+                    category := pushy_thread_id_to_history_category(
+                        int(content["threatId"])
+                    )
+                ) is None:
+                    continue
+                if (alert_date := dates.get(content["time"])) is None:
+                    alert_date = dates[content["time"]] = dt_util.parse_datetime(
+                        content["time"], raise_on_error=True
+                    ).strftime("%Y-%m-%d %H:%M:%S")
+                for segment in map(int, content["citiesIds"].split(",")):
+                    if (area := SEGMENT_TO_AREA.get(segment)) is not None:
+                        alerts.setdefault(
+                            (area, category, alert_date),
+                            {
+                                DATE_FIELD: alert_date,
+                                TITLE_FIELD: content[TITLE_FIELD],
+                                AREA_FIELD: area,
+                                CATEGORY_FIELD: category,
+                                CHANNEL_FIELD: AlertSource.MOBILE,
+                            },
+                        )
+            except:  # noqa: E722
+                LOGGER.exception("Failed to process MQTT message.")
+        if alerts:
+            self.alerts.add_many(alerts.values())
+            self._hass.async_create_task(
+                self._config_entry.runtime_data.updater.async_push_event()
+            )
+
     async def start(self) -> None:
         """Register for notifications."""
         if (credentials := self._config_entry.data.get(PUSHY_CREDENTIALS_KEY)) is None:
@@ -316,6 +373,10 @@ class PushyNotifications:
 
     async def stop(self) -> None:
         """Unregister."""
+        self.connected = False
         if self._mqtt:
             await self._hass.async_add_executor_job(self._mqtt.disconnect)
             await self._hass.async_add_executor_job(self._mqtt.loop_stop)
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
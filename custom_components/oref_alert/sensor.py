@@ -8,14 +8,13 @@ from typing import TYPE_CHECKING, Any
 
 import homeassistant.util.dt as dt_util
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.components.sensor.const import SensorDeviceClass
-from homeassistant.const import Platform, UnitOfTime
+from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
+from homeassistant.const import EntityCategory, Platform, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import event as event_helper
 from homeassistant.util import slugify
 
 from .const import (
-    AREA_FIELD,
     ATTR_ALERT,
     ATTR_AREA,
     ATTR_DISPLAY,
@@ -23,13 +22,12 @@ from .const import (
     CONF_ALERT_ACTIVE_DURATION,
     CONF_AREAS,
     CONF_SENSORS,
-    DATE_FIELD,
     END_TIME_ID_SUFFIX,
-    IST,
     OREF_ALERT_UNIQUE_ID,
     TIME_TO_SHELTER_ID_SUFFIX,
     AlertType,
 )
+from .coordinator import OREF_ALERTS_URL, OREF_HISTORY_URL
 from .entity import OrefAlertCoordinatorEntity
 from .metadata import ALL_AREAS_ALIASES
 from .metadata.area_to_migun_time import AREA_TO_MIGUN_TIME
@@ -41,9 +39,12 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import OrefAlertConfigEntry
+    from .coordinator import OrefAlertFetchStats
 
 PARALLEL_UPDATES = 0
 
+FETCH_SOURCES = {"Alerts": OREF_ALERTS_URL, "History": OREF_HISTORY_URL}
+
 SECONDS_IN_A_MINUTE = 60
 
 
@@ -64,6 +65,16 @@ async def async_setup_entry(
     async_add_entities(
         [TimeToShelterSensor(name, area, config_entry) for name, area in entities]
         + [AlertEndTimeSensor(name, area, config_entry) for name, area in entities]
+        + [
+            entity_class(source, url, config_entry)
+            for source, url in FETCH_SOURCES.items()
+            for entity_class in (
+                FetchBytesSensor,
+                FetchNotModifiedSensor,
+                FetchRetriesSensor,
+                FetchParseTimeSensor,
+            )
+        ]
     )
 
 
@@ -83,6 +94,7 @@ class OrefAlertTimerSensor(OrefAlertCoordinatorEntity, SensorEntity):
         super().__init__(config_entry)
         self._active_duration: int = config_entry.options[CONF_ALERT_ACTIVE_DURATION]
         self._area: str = area
+        self._areas: frozenset[str] = frozenset({area}) | ALL_AREAS_ALIASES
         self._alert: AlertType | None = None
         self._alert_timestamp: float | None = None
         self._unsub_update: Callable[[], None] | None = None
@@ -96,19 +108,12 @@ class OrefAlertTimerSensor(OrefAlertCoordinatorEntity, SensorEntity):
                 return self._alert
             self._alert = None
             self._alert_timestamp = None
-        for alert in self.coordinator.data.active_alerts:
-            if (
-                alert[AREA_FIELD] == self._area
-                or alert[AREA_FIELD] in ALL_AREAS_ALIASES
-            ):
-                if not self.coordinator.is_synthetic_alert(alert):
-                    self._alert = alert
-                    self._alert_timestamp = (
-                        dt_util.parse_datetime(alert[DATE_FIELD], raise_on_error=True)
-                        .replace(tzinfo=IST)
-                        .timestamp()
-                    )
-                return alert
+        if records := self.coordinator.data.select_active_alerts(self._areas):
+            alert = records[0].alert
+            if not self.coordinator.is_synthetic_alert(alert):
+                self._alert = alert
+                self._alert_timestamp = records[0].timestamp
+            return alert
         return None
 
     def _get_alert_timestamp(self) -> float | None:
@@ -266,3 +271,83 @@ class AlertEndTimeSensor(OrefAlertTimerSensor):
             ATTR_ALERT: self._get_alert(),
             ATTR_DISPLAY: self.oref_display_value(),
         }
+
+
+class OrefAlertFetchSensor(OrefAlertCoordinatorEntity, SensorEntity):
+    """Representation of a diagnostic sensor of fetching an Oref URL."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        source: str,
+        url: str,
+        config_entry: OrefAlertConfigEntry,
+    ) -> None:
+        """Initialize object with defaults."""
+        super().__init__(config_entry)
+        self._url: str = url
+        self._attr_translation_placeholders = {"source": source}
+        self._attr_unique_id = (
+            f"{OREF_ALERT_UNIQUE_ID}_{source.lower()}_{self._attr_translation_key}"
+        )
+        self.entity_id = f"{Platform.SENSOR}.{self._attr_unique_id}"
+
+    @property
+    def _stats(self) -> OrefAlertFetchStats:
+        """Return the fetch counters of the URL."""
+        return self.coordinator.fetch_stats[self._url]
+
+
+class FetchBytesSensor(OrefAlertFetchSensor):
+    """Representation of the downloaded bytes sensor."""
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_translation_key = "fetch_bytes"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of downloaded bytes."""
+        return self._stats.bytes
+
+
+class FetchNotModifiedSensor(OrefAlertFetchSensor):
+    """Representation of the not modified (304) responses sensor."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_translation_key = "fetch_not_modified"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of not modified responses."""
+        return self._stats.not_modified
+
+
+class FetchRetriesSensor(OrefAlertFetchSensor):
+    """Representation of the request retries sensor."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_translation_key = "fetch_retries"
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of retries."""
+        return self._stats.retries
+
+
+class FetchParseTimeSensor(OrefAlertFetchSensor):
+    """Representation of the last response parse time sensor."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 2
+    _attr_translation_key = "fetch_parse_time"
+
+    @property
+    def native_value(self) -> float:
+        """Return the parse time of the last response."""
+        return self._stats.parse_time * 1000
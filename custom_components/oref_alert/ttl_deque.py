@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.util.dt as dt_util
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 class TTLDeque:
     """Add items to the beginning of the list and removes items when TTL expires."""
@@ -22,6 +25,12 @@ class TTLDeque:
         self._deque.appendleft((dt_util.now(), item))
         self._prune()
 
+    def add_many(self, items: Iterable[Any]) -> None:
+        """Add multiple items (same as calling add() for each one)."""
+        now = dt_util.now()
+        self._deque.extendleft((now, item) for item in items)
+        self._prune()
+
     def _prune(self) -> None:
         """Remove expired items."""
         now = dt_util.now()
@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import enum
 import secrets
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Final
 
@@ -78,6 +79,9 @@ class TzevaAdomNotifications:
         self._ids: TTLDeque = TTLDeque(config_entry.options[CONF_ALERT_ACTIVE_DURATION])
         self._http_client = async_get_clientsession(hass)
         self._ws: ClientWebSocketResponse | None = None
+        self.connected: bool = False
+        self.heartbeat_interval: float = WS_HEARTBEAT
+        self.last_message: float = 0.0
         self._stop = asyncio.Event()
         self._task: asyncio.Task[None] | None = None
 
@@ -107,12 +111,22 @@ class TzevaAdomNotifications:
                     WS_URL,
                     origin=ORIGIN_HEADER,
                     heartbeat=WS_HEARTBEAT,
+                    # Ping / pong are received here to track the heartbeat.
+                    autoping=False,
                 ) as self._ws:
+                    # The WS heartbeat closes the connection if pong is missing.
+                    self.connected = True
+                    self.last_message = time.monotonic()
                     while True:
                         message = await self._ws.receive()
+                        self.last_message = time.monotonic()
                         match message.type:
                             case aiohttp.WSMsgType.TEXT:
                                 await self._on_message(message.json())
+                            case aiohttp.WSMsgType.PING:
+                                await self._ws.pong(message.data)
+                            case aiohttp.WSMsgType.PONG:
+                                pass
                             case (
                                 aiohttp.WSMsgType.CLOSING
                                 | aiohttp.WSMsgType.CLOSE
@@ -133,7 +147,11 @@ class TzevaAdomNotifications:
             except:  # noqa: E722
                 LOGGER.exception("Error in WS listener")
             if self._stop.is_set():
+                self.connected = False
                 break
+            if self.connected:
+                self.connected = False
+                await self._config_entry.runtime_data.updater.async_push_event()
             await self._close()
             await self._delay()
 
@@ -225,7 +243,7 @@ class TzevaAdomNotifications:
                 new_alert = True
 
             if new_alert:
-                await self._config_entry.runtime_data.coordinator.async_refresh()
+                await self._config_entry.runtime_data.updater.async_push_event()
 
         except:  # noqa: E722
             LOGGER.exception("Error processing WS message")
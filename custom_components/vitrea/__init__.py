@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import logging
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN
+from .const import DOMAIN, STORAGE_VERSION
 from .hub import VitreaHub
 
+_LOGGER = logging.getLogger(__name__)
+
 # TODO List the platforms that you want to support.
 # For your initial PR, limit it to 1 platform.
 PLATFORMS: list[Platform] = [
@@ -33,6 +38,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         port=entry.data["port"],
         append_room_name=entry.data["append_room_to_name"],
         supports_led_commands=entry.data.get("supports_led_commands", False),
+        entry_id=entry.entry_id,
+        version=entry.data.get("version", ""),
     )
     filter_mw = entry.data.get("filter_mw", True)
     success, reason = await hass.data[DOMAIN][entry.entry_id].read_gateway(
@@ -41,9 +48,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not success:
         raise ConfigEntryNotReady(reason)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    hub = hass.data[DOMAIN][entry.entry_id]
+    if hub.cached_database is not None and not hub.database_revalidated:
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_database(hass, entry),
+            "vitrea-revalidate-database",
+        )
     return True
 
 
+async def _async_revalidate_database(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Refresh the cached database and reload the entry if it changed."""
+    hub = hass.data[DOMAIN][entry.entry_id]
+    try:
+        changed = await hub.revalidate_database()
+    except (ConnectionError, TimeoutError, ValueError) as err:
+        _LOGGER.warning("Could not revalidate the Vitrea database: %s", err)
+        return
+    if changed:
+        # Entities are created once per platform, reload them from the new copy
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
@@ -51,3 +78,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hub = hass.data[DOMAIN].pop(entry.entry_id)
         await hub.controller.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the cached database of a config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -7,6 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
+from .entity import VitreaEntity
 from .hub import PushButton
 import logging
 
@@ -28,12 +29,13 @@ async def async_setup_entry(
     )
 
 
-class PushButtonSensor(BinarySensorEntity):
+class PushButtonSensor(VitreaEntity, BinarySensorEntity):
     _attr_device_class = None
     _attr_icon = "mdi:gesture-tap-button"
 
     def __init__(self, push_button):
         self._push_button = push_button
+        self._hub = push_button.hub
         self._attr_name = push_button.name
         self._attr_unique_id = (
             f"{push_button.hub.hub_id}-{push_button.node_id}-{push_button.key_id}"
@@ -57,6 +59,7 @@ class PushButtonSensor(BinarySensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
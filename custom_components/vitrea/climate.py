@@ -15,6 +15,7 @@ from homeassistant.components.climate import (
     UnitOfTemperature,
 )
 from .const import DOMAIN
+from .entity import VitreaEntity
 from .hub import Climate
 from .vitrea_integration.utils.enums import (
     ThermostatTemperatureModes,
@@ -41,7 +42,7 @@ async def async_setup_entry(
     )
 
 
-class VitreaClimate(ClimateEntity):
+class VitreaClimate(VitreaEntity, ClimateEntity):
     """Representation of a Vitrea Switch for Home Assistant."""
 
     _attr_should_poll = False
@@ -66,6 +67,7 @@ class VitreaClimate(ClimateEntity):
     def __init__(self, thermostat: Climate):
         """Initialize the switch."""
         self._thermostat = thermostat
+        self._hub = thermostat.hub
         self._attr_name = thermostat.name
         self._attr_unique_id = f"{thermostat.hub.hub_id}-{thermostat.node_id}"
         self._attr_device_info = {
@@ -167,6 +169,7 @@ class VitreaClimate(ClimateEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
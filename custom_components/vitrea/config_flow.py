@@ -47,6 +47,7 @@ class VitreaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data={
                     **user_input,
                     "supports_led_commands": result.get("supports_led_commands", False),
+                    "version": result.get("version", ""),
                 },
             )
         return self.async_show_form(
@@ -5,6 +5,8 @@ from enum import StrEnum
 
 DOMAIN = "vitrea"
 
+STORAGE_VERSION = 1
+
 
 class VitreaFeatures(StrEnum):
     """Vitrea features."""
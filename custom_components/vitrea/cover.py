@@ -9,6 +9,7 @@ from homeassistant.components.cover import (
 )
 
 from .const import DOMAIN
+from .entity import VitreaEntity
 from .hub import Cover
 
 
@@ -26,7 +27,7 @@ async def async_setup_entry(
     )
 
 
-class VitreaCover(CoverEntity):
+class VitreaCover(VitreaEntity, CoverEntity):
     _attr_should_poll = False
     _attr_device_class = CoverDeviceClass.BLIND
     _attr_supported_features = (
@@ -38,6 +39,7 @@ class VitreaCover(CoverEntity):
 
     def __init__(self, cover: Cover):
         self._cover = cover
+        self._hub = cover.hub
         self._attr_name = cover.name
         self._attr_unique_id = f"{cover.hub.hub_id}-{cover.node_id}-{cover.key_id}"
         self._attr_device_info = {
@@ -49,6 +51,7 @@ class VitreaCover(CoverEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         self._cover.register_callback(self.schedule_update_ha_state)
 
     async def async_will_remove_from_hass(self) -> None:
@@ -0,0 +1,31 @@
+"""Diagnostics support for Vitrea."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    hub = hass.data[DOMAIN][entry.entry_id]
+    controller = hub.controller
+    return {
+        "online": hub.online,
+        "devices": len(hub.devices),
+        "scenes": len(hub.scenes),
+        "hvacs": len(hub.hvacs),
+        "responses": {
+            "queue_depth": controller.queue_depth,
+            "max_queue_depth": controller.max_queue_depth,
+            "processed_frames": controller.processed_frames,
+            "coalesced_updates": controller.coalesced_updates,
+            "dropped_frames": controller.dropped_frames,
+        },
+    }
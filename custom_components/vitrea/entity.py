@@ -0,0 +1,21 @@
+"""Base entity of the Vitrea integration."""
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+
+from .hub import VitreaHub
+
+
+class VitreaEntity(Entity):
+    """Entity which writes its state when its hub goes online or offline."""
+
+    _hub: VitreaHub
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the availability signal of the hub."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self._hub.availability_signal, self.async_write_ha_state
+            )
+        )
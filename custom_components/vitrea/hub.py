@@ -7,7 +7,10 @@ from .vitrea_integration.models.thermostat import (
     Thermostat,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 
+from .const import DOMAIN, STORAGE_VERSION
 from .vitrea_integration import VBoxController
 from .vitrea_integration.models.blind import Blind
 from .vitrea_integration.models.light import Dimmer
@@ -23,6 +26,44 @@ from .vitrea_integration.utils.enums import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def database_fingerprint(data: dict) -> dict:
+    """
+    Return the parts of a serialized database which the entities are built from.
+
+    The serialized lists are built from sets, so the items are keyed by their id
+    to compare databases regardless of the order.
+    """
+
+    def room_name(item):
+        return (item.get("room") or {}).get("name", "")
+
+    return {
+        **{
+            ("key", key.get("keypad_id"), key.get("id")): (
+                key.get("name"),
+                key.get("type", {}).get("value", 0),
+                room_name(key),
+            )
+            for key in data.get("keys", [])
+        },
+        **{
+            ("scenario", scenario.get("id")): (
+                scenario.get("name"),
+                room_name(scenario),
+            )
+            for scenario in data.get("scenarios", [])
+        },
+        **{
+            ("ac", hvac.get("id")): (
+                hvac.get("name"),
+                hvac.get("type", {}).get("value", 99),
+                room_name(hvac),
+            )
+            for hvac in data.get("air_conditioners", [])
+        },
+    }
+
+
 class Switch(Toggle):
     """Representation of a Vitrea Switch."""
 
@@ -223,6 +264,8 @@ class VitreaHub:
         hass: HomeAssistant,
         append_room_name: bool = True,
         supports_led_commands: bool = False,
+        entry_id: str | None = None,
+        version: str = "",
     ) -> None:
         """Initialize the Vitrea Hub."""
         self.host = host
@@ -238,25 +281,100 @@ class VitreaHub:
             ip=host, port=port, status_update_callback=self.update_state_callback
         )
         self.supports_led_commands = supports_led_commands
+        self.version = version
+        self.store = (
+            Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+            if entry_id
+            else None
+        )
+        self.cached_database: dict | None = None
+        # The cached copy was just read from the controller (reload after a change)
+        self.database_revalidated = False
 
     async def read_gateway(self, filter_mw: bool = True):
         """Initialize the Vitrea Hub."""
-        self.online = await self.controller.connect()
+        self.cached_database = await self._load_database()
+        self.online = await self.controller.connect(
+            ignore_db=self.cached_database is not None
+        )
         if not self.online:
             reason = "Failed to connect to Vitrea Gateway"
             _LOGGER.error(reason)
             return False, reason
-        await self._get_devices(filter_mw)
+        if self.cached_database is not None:
+            _LOGGER.debug("Using the cached Vitrea database")
+            data = self.cached_database
+        else:
+            data = self.controller.database.serialize()
+            await self._save_database(data)
+        await self._get_devices(filter_mw, data)
         if not self.devices:
             reason = "Failed to get devices from Vitrea Gateway"
             _LOGGER.error(reason)
             return False, reason
+        if self.cached_database is not None:
+            # connect() skipped the database read and the full status request
+            await self.controller.use_cached_database()
+            if self.database_revalidated:
+                await self._save_database(self.cached_database)
         return True, ""
 
-    async def _get_devices(self, filter_mw: bool):
+    async def _load_database(self) -> dict | None:
+        """Load the database cached for this controller and version."""
+        if self.store is None:
+            return None
+        cached = await self.store.async_load()
+        if (
+            not cached
+            or cached.get("controller_id") != self.hub_id
+            or cached.get("version") != self.version
+        ):
+            return None
+        self.database_revalidated = cached.get("revalidated", False)
+        return cached.get("database")
+
+    async def _save_database(self, data: dict, revalidated: bool = False):
+        """Cache the serialized database."""
+        if self.store is None:
+            return
+        await self.store.async_save(
+            {
+                "controller_id": self.hub_id,
+                "version": self.version,
+                "database": data,
+                "revalidated": revalidated,
+            }
+        )
+
+    async def revalidate_database(self) -> bool:
+        """
+        Re-read the database from the controller and update the cached copy.
+
+        Returns:
+            True if the entities built from the cached copy are outdated.
+        """
+        if self.cached_database is None:
+            return False
+        cached, self.cached_database = self.cached_database, None
+        data = (await self.controller.read_vitrea_db()).serialize()
+        old = database_fingerprint(cached)
+        new = database_fingerprint(data)
+        # The reload that follows a change uses the new copy as is
+        await self._save_database(data, revalidated=old != new)
+        if old == new:
+            _LOGGER.debug("The cached Vitrea database is up to date")
+            return False
+        _LOGGER.info(
+            "Vitrea database changed: %d added, %d removed, %d modified",
+            len(new.keys() - old.keys()),
+            len(old.keys() - new.keys()),
+            sum(1 for key in old.keys() & new.keys() if old[key] != new[key]),
+        )
+        return True
+
+    async def _get_devices(self, filter_mw: bool, data: dict):
         """Get devices from Vitrea."""
         _LOGGER.debug("Fetching Vitrea devices")
-        data = self.controller.database.serialize()
         for key in data.get("keys", []):
             if filter_mw and (
                 "MW" in key.get("name", "")
@@ -312,6 +430,11 @@ class VitreaHub:
         """Return the ID of this Vitrea Hub."""
         return self._id
 
+    @property
+    def availability_signal(self) -> str:
+        """Return the signal which is sent when the hub goes online/offline."""
+        return f"{DOMAIN}_{self._id}_availability"
+
     async def test_connection(self):
         """Test the connection to the Vitrea Hub."""
         return self.controller.connection.connected
@@ -324,13 +447,12 @@ class VitreaHub:
             if device:
                 await device.update_state(result)
         elif result.get("type") == "connection":
-            self.online = result.get("status")
-            for device in self.devices.values():
-                await device.publish_updates()
-            for scene in self.scenes.values():
-                await scene.publish_updates()
-            for hvac in self.hvacs.values():
-                await hvac.publish_updates()
+            online = result.get("status")
+            if online == self.online:
+                return
+            self.online = online
+            # Entities subscribe to the hub's availability signal
+            async_dispatcher_send(self.hass, self.availability_signal)
         elif result.get("type") == "ac_status":
             hvac = self.hvacs.get(f"N{result.get('ac_id'):03d}", None)
             if hvac:
@@ -19,6 +19,7 @@ from homeassistant.util.percentage import (
 )
 
 from .const import DOMAIN, VitreaFeatures
+from .entity import VitreaEntity
 from .hub import Light
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,7 +40,7 @@ async def async_setup_entry(
     )
 
 
-class VitreaLight(LightEntity):
+class VitreaLight(VitreaEntity, LightEntity):
     """Representation of a Vitrea Light for Home Assistant."""
 
     _attr_should_poll = False
@@ -47,6 +48,7 @@ class VitreaLight(LightEntity):
     def __init__(self, light: Light):
         """Initialize the light."""
         self._light = light
+        self._hub = light.hub
         self._attr_name = light.name
         self._attr_unique_id = f"{light.hub.hub_id}-{light.node_id}-{light.key_id}"
         self._attr_device_info = {
@@ -58,6 +60,7 @@ class VitreaLight(LightEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
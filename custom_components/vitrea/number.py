@@ -10,6 +10,7 @@ from homeassistant.helpers import (
 )
 
 from .const import DOMAIN, VitreaFeatures
+from .entity import VitreaEntity
 from .hub import Switch
 import voluptuous as vol
 
@@ -28,7 +29,7 @@ async def async_setup_entry(
     )
 
 
-class VitreaSwitchCountdown(NumberEntity):
+class VitreaSwitchCountdown(VitreaEntity, NumberEntity):
     """Representation of a Vitrea Switch for Home Assistant."""
 
     _attr_should_poll = False
@@ -43,6 +44,7 @@ class VitreaSwitchCountdown(NumberEntity):
     def __init__(self, switch: Switch):
         """Initialize the switch."""
         self._switch = switch
+        self._hub = switch.hub
         self._attr_name = f"{switch.name} Countdown"
         self._attr_unique_id = (
             f"{switch.hub.hub_id}-{switch.node_id}-{switch.key_id}-countdown"
@@ -57,6 +59,7 @@ class VitreaSwitchCountdown(NumberEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
@@ -3,6 +3,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
 from .const import DOMAIN
+from .entity import VitreaEntity
 from .hub import Scene as HubScene
 import voluptuous as vol
 
@@ -21,12 +22,13 @@ async def async_setup_entry(
     )
 
 
-class VitreaScene(Scene):
+class VitreaScene(VitreaEntity, Scene):
     """Representation of a Vitrea Scene for Home Assistant."""
 
     def __init__(self, scene: HubScene):
         """Initialize the scene."""
         self._scene = scene
+        self._hub = scene.hub
         self._attr_name = scene.name
         self._attr_unique_id = f"{scene.hub.hub_id}-{scene.scene_id}"
         self._attr_device_info = {
@@ -43,6 +45,7 @@ class VitreaScene(Scene):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method that will be called when the device is updated.
@@ -9,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN
+from .entity import VitreaEntity
 from .hub import SatelliteButton
 import logging
 
@@ -29,7 +30,7 @@ async def async_setup_entry(
     )
 
 
-class SatelliteSensor(SensorEntity):
+class SatelliteSensor(VitreaEntity, SensorEntity):
     _attr_device_class = SensorDeviceClass.ENUM
     _attr_options = ["Short", "Long", "Release"]
     _attr_last_reset: datetime | None = None
@@ -37,6 +38,7 @@ class SatelliteSensor(SensorEntity):
 
     def __init__(self, satellite):
         self._satellite = satellite
+        self._hub = satellite.hub
         self._attr_name = satellite.name
         self._attr_unique_id = (
             f"{satellite.hub.hub_id}-{satellite.node_id}-{satellite.key_id}"
@@ -60,6 +62,7 @@ class SatelliteSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
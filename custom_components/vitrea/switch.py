@@ -11,6 +11,7 @@ from homeassistant.helpers import (
 )
 
 from .const import DOMAIN, VitreaFeatures
+from .entity import VitreaEntity
 from .hub import SatelliteButton, Switch, PushButton
 import voluptuous as vol
 
@@ -49,7 +50,7 @@ async def async_setup_entry(
     )
 
 
-class VitreaSwitch(SwitchEntity):
+class VitreaSwitch(VitreaEntity, SwitchEntity):
     """Representation of a Vitrea Switch for Home Assistant."""
 
     _attr_should_poll = False
@@ -58,6 +59,7 @@ class VitreaSwitch(SwitchEntity):
     def __init__(self, switch: Switch):
         """Initialize the switch."""
         self._switch = switch
+        self._hub = switch.hub
         self._attr_name = switch.name
         self._attr_unique_id = f"{switch.hub.hub_id}-{switch.node_id}-{switch.key_id}"
         self._attr_device_info = {
@@ -70,6 +72,7 @@ class VitreaSwitch(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         # Importantly for a push integration, the module that will be getting updates
         # needs to notify HA of changes. The dummy device has a registercallback
         # method, so to this we add the 'self.async_write_ha_state' method, to be
@@ -119,7 +122,7 @@ class VitreaSwitch(SwitchEntity):
         return self._switch.is_on
 
 
-class VitreaSatelliteIndicatorLed(SwitchEntity):
+class VitreaSatelliteIndicatorLed(VitreaEntity, SwitchEntity):
     """Representation of a Vitrea Satellite Indicator Led."""
 
     _attr_should_poll = False
@@ -128,6 +131,7 @@ class VitreaSatelliteIndicatorLed(SwitchEntity):
     def __init__(self, switch: SatelliteButton):
         """Initialize the switch."""
         self._switch = switch
+        self._hub = switch.hub
         self._attr_name = switch.name
         self._attr_unique_id = (
             f"{switch.hub.hub_id}-{switch.node_id}-{switch.key_id}-indicator-led"
@@ -135,6 +139,7 @@ class VitreaSatelliteIndicatorLed(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         self._switch.register_callback(self.schedule_update_ha_state)
 
     async def async_will_remove_from_hass(self) -> None:
@@ -162,7 +167,7 @@ class VitreaSatelliteIndicatorLed(SwitchEntity):
         return self._switch.hub.online
 
 
-class VitreaPushButtonIndicatorLed(SwitchEntity):
+class VitreaPushButtonIndicatorLed(VitreaEntity, SwitchEntity):
     """Representation of a Vitrea Satellite Indicator Led."""
 
     _attr_should_poll = False
@@ -171,6 +176,7 @@ class VitreaPushButtonIndicatorLed(SwitchEntity):
     def __init__(self, switch: PushButton):
         """Initialize the switch."""
         self._switch = switch
+        self._hub = switch.hub
         self._attr_name = switch.name
         self._attr_unique_id = (
             f"{switch.hub.hub_id}-{switch.node_id}-{switch.key_id}-indicator-led"
@@ -178,6 +184,7 @@ class VitreaPushButtonIndicatorLed(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when this Entity has been added to HA."""
+        await super().async_added_to_hass()
         self._switch.register_callback(self.schedule_update_ha_state)
 
     async def async_will_remove_from_hass(self) -> None:
@@ -6,9 +6,9 @@ This integration allows you to control Vitrea devices.
 """
 
 import asyncio
+import contextlib
 import logging
-import socket
-from .vbox_controller import VBoxController
+from .vbox_controller import DEFAULT_PORT, VBoxController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,20 +17,33 @@ COMMANDS = {"ascii": {"auth": {"cmd": b"P:VITREA\r\n", "res": b"S:PSW:OK\r\n"}}}
 
 async def authenticate_vitrea_device(host: str, port: int) -> bool:
     """Authenticate to the Vitrea Gateway."""
+    auth = COMMANDS.get("ascii", {}).get("auth", {})
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.connect((host, port))
-            s.settimeout(5)
-            s.sendall(COMMANDS.get("ascii", {}).get("auth", {}).get("cmd"))
-            data = s.recv(1024)
-            if data == b"S:PSW:OK\r\n":
-                s.close()
-                return True
-    except (ConnectionError, TimeoutError) as e:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=5
+        )
+    except (OSError, asyncio.TimeoutError) as e:
         _LOGGER.warning("Could not init Vitrea due to %s", e)
+        return False
+    try:
+        writer.write(auth.get("cmd"))
+        await writer.drain()
+        data = await asyncio.wait_for(reader.readuntil(b"\r\n"), timeout=5)
+        return data == auth.get("res")
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+        _LOGGER.warning("Could not init Vitrea due to %s", e)
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError, asyncio.TimeoutError):
+            await asyncio.wait_for(writer.wait_closed(), timeout=5)
     return False
 
 
 async def validate_controller_availability(ip: str, port: int) -> dict:
     """Check if the Vitrea Gateway is available and supported."""
     return await VBoxController.validate_controller_availability(ip, port)
+
+
+async def discover_controllers(hosts, port: int = DEFAULT_PORT) -> dict:
+    """Probe a list (or a subnet) of hosts for Vitrea Gateways."""
+    return await VBoxController.discover_controllers(hosts, port)
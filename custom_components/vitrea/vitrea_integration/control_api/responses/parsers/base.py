@@ -6,8 +6,14 @@ class ResponseParser(ABC):
     """
     Abstract base class for all response parsers. Each specific parser will
     inherit from this class and implement the parse method.
+
+    Parsers are stateless and shared, so parse must not keep per-response
+    state on the instance.
     """
 
+    # Whether parse takes the raw bytes instead of the decoded string
+    BYTES_INPUT = False
+
     @abstractmethod
     async def parse(self, response):
         """
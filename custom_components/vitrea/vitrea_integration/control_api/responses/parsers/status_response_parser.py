@@ -1,14 +1,52 @@
 # parsers/status_response_parser.py
 from .base import ResponseParser
 import logging
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 # TODO - DND, Ring etc...
 
 
+class NodeStatus:
+    """
+    Status of a node's key.
+
+    A compact record which is created for every status frame. It can be read
+    like the dictionaries the other parsers return (`status.get("key")` or
+    `status["key"]`).
+    """
+
+    __slots__ = ("node_id", "key", "status", "sub_type", "parameters")
+
+    type = "node_status"
+
+    def __init__(self, node_id, key, status, sub_type, parameters):
+        self.node_id = node_id
+        self.key = key
+        self.status = status
+        self.sub_type = sub_type
+        self.parameters = parameters
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __repr__(self):
+        return (
+            f"NodeStatus(node_id={self.node_id}, key={self.key}, "
+            f"status={self.status}, sub_type={self.sub_type}, "
+            f"parameters={self.parameters})"
+        )
+
+
 class StatusResponseParser(ResponseParser):
+    BYTES_INPUT = True
+
     TYPE_MAPPINGS = {
         "O": "toggle_on",
         "F": "toggle_off",
@@ -44,32 +82,33 @@ class StatusResponseParser(ResponseParser):
         - PP...P is the parameter of the command.
         - <CR><LF> is the Carriage Return and Line Feed.
 
-        :param response: The raw response string from the VBox.
-        :return: A structured dictionary with the node status.
+        :param response: The raw response bytes (or string) from the VBox.
+        :return: A NodeStatus record.
         """
         try:
-            response = response.strip()
-            parts = response.split(":")
+            if isinstance(response, str):
+                response = response.encode()
+            parts = response.strip().split(b":")
             if len(parts) < 4:
                 raise ValueError("Incomplete status response")
 
-            node_id = int(parts[1][1:])
-            key = int(parts[2])
-            status_code = parts[3]
-            params = parts[4] if len(parts) > 4 else None
-
-            node_status = {
-                "type": "node_status",
-                "node_id": node_id,
-                "key": key,
-                "status": self.STATUS_MAPPINGS.get(status_code, None),
-                "sub_type": self.TYPE_MAPPINGS.get(status_code, "unknown"),
-                "parameters": params,
-                "timestamp": datetime.now(),
-            }
-
-            return node_status
+            status, sub_type = _STATUS_CODES.get(parts[3], _UNKNOWN_CODE)
+            return NodeStatus(
+                int(parts[1][1:]),  # node_id
+                int(parts[2]),  # key
+                status,
+                sub_type,
+                parts[4].decode() if len(parts) > 4 else None,  # parameters
+            )
 
         except Exception as e:
             logger.error(f"Error parsing status response: {response} - Error: {e}")
             raise
+
+
+# Status code (as bytes) to the status and the sub type
+_STATUS_CODES = {
+    code.encode(): (StatusResponseParser.STATUS_MAPPINGS.get(code, None), sub_type)
+    for code, sub_type in StatusResponseParser.TYPE_MAPPINGS.items()
+}
+_UNKNOWN_CODE = (None, "unknown")
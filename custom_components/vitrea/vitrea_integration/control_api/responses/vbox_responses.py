@@ -16,64 +16,72 @@ import logging
 _LOGGER = logging.getLogger(__name__)
 
 
+# Response prefix to parser, the longest matching prefix wins
+PARSERS = {
+    "E": ErrorResponseParser(),
+    "S:N": StatusResponseParser(),
+    "S:R": ScenarioStatusResponseParser(),
+    "S:A": ACStatusResponseParser(),
+    "T": ControllerClockResponseParser(),
+    "S:O": OutputStatusResponseParser(),
+    "S:I": InputStatusResponseParser(),
+    "S:C": RoomOccupancyResponseParser(),
+    "S:PSW": AckResponseParser(),
+    "V": VersionResponseParser(),
+    "ERROR": ErrorResponseParser(),
+}
+
+# Node's key is a byte of the prefix, None holds the parser of the prefix
+_PARSER_TRIE: dict = {}
+for _prefix, _parser in PARSERS.items():
+    _node = _PARSER_TRIE
+    for _byte in _prefix.encode():
+        _node = _node.setdefault(_byte, {})
+    _node[None] = _parser
+
+_ACTION_EXECUTED = b"OK"
+
+
 def get_parser(response_prefix):
     """
-    Returns an instance of the appropriate parser based on the response prefix.
+    Returns the parser of the longest prefix which matches the response.
 
-    :param response_prefix: The prefix of the response string indicating its type.
-    :return: An instance of the corresponding parser.
+    :param response_prefix: The response (or its prefix), as a string or bytes.
+    :return: The shared instance of the corresponding parser.
     """
-    parsers = {
-        "E": ErrorResponseParser,
-        "S:N": StatusResponseParser,
-        "S:R": ScenarioStatusResponseParser,
-        "S:A": ACStatusResponseParser,
-        "T": ControllerClockResponseParser,
-        "S:O": OutputStatusResponseParser,
-        "S:I": InputStatusResponseParser,
-        "S:C": RoomOccupancyResponseParser,
-        "S:PSW": AckResponseParser,
-        "V": VersionResponseParser,
-        "OK": "",
-        "ERROR": ErrorResponseParser,
-    }
-
-    # Select the parser class based on the response prefix
-    parser_class = parsers.get(response_prefix)
-    if parser_class:
-        return parser_class()
-    else:
-        # If no exact match, check for startswith matches
-        for prefix, parser_cls in parsers.items():
-            if response_prefix.startswith(prefix):
-                return parser_cls()
+    if isinstance(response_prefix, str):
+        response_prefix = response_prefix.encode()
+    parser = None
+    node = _PARSER_TRIE
+    for byte in response_prefix:
+        node = node.get(byte)
+        if node is None:
+            break
+        parser = node.get(None, parser)
+    if parser is None:
         raise ValueError(f"No parser available for response prefix: {response_prefix}")
+    return parser
 
 
 def parse_response(response):
     """Parse an incoming message from the VBox and return a structured dictionary."""
-    # Decode byte string to utf-8 if it's not already a string
-    if isinstance(response, bytes):
-        response = response.decode('utf-8', errors='replace').strip()
-    # Extract the prefix for parser selection
-    if len(response.split("\r\n")) > 1:
-        response_parts = response.split("\r\n")
-        multi_response = []
-        for split_response in response_parts:
-            multi_response.append(parse_response(split_response))
-        return multi_response
-    response_parts = response.split(":", 2)  # Split only on the first two colons
-    if len(response_parts) < 2:
-        if response == "OK":
+    if isinstance(response, str):
+        response = response.encode()
+    response = response.strip()
+    if b"\r\n" in response:
+        return [parse_response(part) for part in response.split(b"\r\n")]
+    if b":" not in response:
+        if response == _ACTION_EXECUTED:
             return {"type": "acknowledgment", "message": "Action Executed"}
-        raise ValueError(f"Invalid response format: {response}")
-
-    response_prefix = ":".join(response_parts[:2])
+        raise ValueError(
+            f"Invalid response format: {response.decode('utf-8', errors='replace')}"
+        )
 
     try:
-        parser = get_parser(response_prefix)
-        parsed_response = parser.parse(response)  # Call parse on the instance
-        return parsed_response
+        parser = get_parser(response)
+        if not parser.BYTES_INPUT:
+            response = response.decode("utf-8", errors="replace")
+        return parser.parse(response)
     except VitreaException as e:
         _LOGGER.error(f"Error from Vitrea Controller: {e}")
         return {}
@@ -35,6 +35,7 @@ class Satellite(BaseDevice):
         self.key_id = key_id
         self.native_value = "Release"
         self.indicator_value = False
+        self._release_task = None
 
     async def get_state(self):
         pass
@@ -43,12 +44,20 @@ class Satellite(BaseDevice):
         event_data = self._VITREA_TO_HASS_MAPPING.get(data["sub_type"])
         if event_data is None:
             return
+        if self._release_task is not None:
+            self._release_task.cancel()
+            self._release_task = None
         self.native_value = event_data
         await self.publish_updates()
         if event_data == "Short":
-            await asyncio.sleep(1)
-            self.native_value = "Release"
-            await self.publish_updates()
+            # Don't hold the controller's response handling for the release
+            self._release_task = asyncio.create_task(self._release(delay=1))
+
+    async def _release(self, delay: float):
+        await asyncio.sleep(delay)
+        self._release_task = None
+        self.native_value = "Release"
+        await self.publish_updates()
 
     async def turn_on_indicator(self):
         await self.controller.connection.send(
@@ -1,14 +1,16 @@
 import asyncio
 import datetime
 import logging
+import time
+from collections import deque
 from typing import Callable, Optional
 
-from .commands.acs import GetACNumbers
+from .commands.acs import GetACNumbers, GetACParams
 from .commands.base import BaseParameterCommandGenerator
-from .commands.floors import GetFloorNumbers
-from .commands.keys import GetKeypadNumbers
-from .commands.rooms import GetRoomNumbers
-from .commands.scenarios import GetScenarioNumbers
+from .commands.floors import GetFloorNumbers, GetFloorParams
+from .commands.keys import GetKeypadNumbers, GetKeyParams
+from .commands.rooms import GetRoomNumbers, GetRoomParams
+from .commands.scenarios import GetScenarioNumbers, GetScenarioParams
 from .responses.parser import DBResponseParserFactory
 
 from ...models.database import (
@@ -21,9 +23,39 @@ from ...models.database import (
     ScenarioModel,
     VitreaDatabaseModel,
 )
+from ...utils.enums import CommandNumber
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of parameter requests kept in flight while reading the DB.
+DEFAULT_WINDOW = 4
+
+PARAMS_COMMANDS = {
+    CommandNumber.GetFloorParams.value,
+    CommandNumber.GetRoomParams.value,
+    CommandNumber.GetKeyParams.value,
+    CommandNumber.GetACParams.value,
+    CommandNumber.GetSceneParams.value,
+}
+
+
+def correlation_key(frame: bytes) -> tuple:
+    """
+    Return the key which matches a parameter response to its request.
+
+    Request and response frames share the layout: header (4 bytes), command
+    number (1 byte), length (2 bytes) and then the id of the requested item
+    (for keys: the keypad id followed by the key id).
+    """
+    command = frame[4]
+    if command not in PARAMS_COMMANDS:
+        return (command,)
+    item_id = int.from_bytes(frame[7:9], byteorder="big")
+    if command == CommandNumber.GetKeyParams.value:
+        # Keypad 0 is requested as 256
+        return (command, 0 if item_id == 256 else item_id, frame[9])
+    return (command, item_id)
+
 
 class SequentialCallback:
     """
@@ -118,19 +150,27 @@ class VitreaDatabaseReader:
     Read the Vitrea database and store data in a structured way.
 
     This class requires a write callback to send commands to the Vitrea controller.
-    It implements a promise-based sequential request/response system to ensure
-    commands are sent only after receiving the previous command's response.
+    The item numbers are requested one at a time. The parameters of the items
+    are then requested through a window of `window` outstanding requests, and
+    responses are matched to their requests by the item id. A timeout falls
+    back to sequential mode (window of 1), which older controllers require.
 
     Attributes:
         writer: Callback function for sending commands
         db: VitreaDatabaseModel instance storing the parsed database
         pending_request: Future object for the current pending request
         request_lock: Lock ensuring sequential command execution
+        window: Maximal number of parameter requests in flight
+        requests_sent, retries, read_time: Statistics of the last DB read
     """
 
-    def __init__(self, write: Callable):
+    def __init__(self, write: Callable, window: int = DEFAULT_WINDOW):
         """Initialize the database reader with a write callback."""
         self.writer = write
+        self.window = max(window, 1)
+        self.requests_sent = 0
+        self.retries = 0
+        self.read_time: Optional[float] = None
         self.db = VitreaDatabaseModel()
         self.pending_request: Optional[asyncio.Future] = None
         self.request_lock = asyncio.Lock()
@@ -143,6 +183,9 @@ class VitreaDatabaseReader:
         self._pending_scenarios = []
         self._pending_keys = {}  # Dict: {keypad_id: [key_id1, key_id2, ...]}
         self._sequential_callback = SequentialCallback(self)
+        # Pipelined processing state
+        self._pipelined = False
+        self._in_flight: dict[tuple, asyncio.Future] = {}
 
     async def send_command(
         self, command_generator: BaseParameterCommandGenerator, timeout: float = 1.0, current_attempt: int = 0, 
@@ -177,6 +220,7 @@ class VitreaDatabaseReader:
             self.pending_request = asyncio.Future()
             command = await command_generator.serialize()
             _LOGGER.debug("Sending command: %s", command.hex())
+            self.requests_sent += 1
             await self.writer(command)
 
             # Store reference to the Future before releasing lock
@@ -204,6 +248,7 @@ class VitreaDatabaseReader:
                 if self.pending_request is future:
                     self.pending_request = None
             if isinstance(e, asyncio.TimeoutError):
+                self.retries += 1
                 return await self.send_command(command_generator, timeout, current_attempt + 1, max_attempts)
             raise e
 
@@ -251,6 +296,10 @@ class VitreaDatabaseReader:
             data: Raw response bytes from controller
         """
         _LOGGER.debug("feed() called with data: %s", data.hex()[:50])
+        if (in_flight := self._in_flight.pop(correlation_key(data), None)) is not None:
+            await self._feed_in_flight(data, in_flight)
+            return
+
         # Resolve pending promise if it exists
         future_to_resolve = None
         async with self.request_lock:
@@ -281,28 +330,7 @@ class VitreaDatabaseReader:
             items = await parser.parse_response()
             _LOGGER.debug("Parser returned items: %s", type(items))
 
-            # Update database
-            if isinstance(items, list):
-                for item in items:
-                    if isinstance(item, BaseVitreaModel):
-                        self.db.add_object(item)
-            elif isinstance(items, dict):
-                for key, value in items.items():
-                    match key:
-                        case "no_of_floors":
-                            self.db.no_of_floors = value
-                        case "no_of_rooms":
-                            self.db.no_of_rooms = value
-                        case "no_of_keys":
-                            self.db.no_of_keys = value
-                        case "no_of_acs":
-                            self.db.no_of_acs = value
-                        case "no_of_scenarios":
-                            self.db.no_of_scenarios = value
-                        case _:
-                            pass
-            else:
-                _LOGGER.warning("Unknown response for DB Reader: %s", items)
+            self._store_items(items)
 
             # Resolve promise first so send_command() can continue
             if not future_to_resolve.done():
@@ -313,7 +341,8 @@ class VitreaDatabaseReader:
 
             # Process follow-up commands asynchronously as a task
             # send_command() will wait for this task to complete
-            if self._follow_up_commands:
+            # In pipelined mode the follow-ups are sent by _read_pipelined()
+            if self._follow_up_commands and not self._pipelined:
                 async def process_follow_ups():
                     try:
                         await self._process_follow_up_commands()
@@ -336,14 +365,166 @@ class VitreaDatabaseReader:
                 future_to_resolve.set_exception(e)
             raise
 
+    def _store_items(self, items):
+        """Update the database with the parsed items."""
+        if isinstance(items, list):
+            for item in items:
+                if isinstance(item, BaseVitreaModel):
+                    self.db.add_object(item)
+        elif isinstance(items, dict):
+            for key, value in items.items():
+                match key:
+                    case "no_of_floors":
+                        self.db.no_of_floors = value
+                    case "no_of_rooms":
+                        self.db.no_of_rooms = value
+                    case "no_of_keys":
+                        self.db.no_of_keys = value
+                    case "no_of_acs":
+                        self.db.no_of_acs = value
+                    case "no_of_scenarios":
+                        self.db.no_of_scenarios = value
+                    case _:
+                        pass
+        else:
+            _LOGGER.warning("Unknown response for DB Reader: %s", items)
+
+    async def _feed_in_flight(self, data: bytes, future: asyncio.Future):
+        """Process the response of a pipelined request."""
+        parser = DBResponseParserFactory.create_parser(
+            raw_data=data, send_callback=self._sequential_callback
+        )
+        if parser is None:
+            _LOGGER.error("Parser is None for data: %s", data.hex())
+            if not future.done():
+                future.set_exception(ValueError("No parser found for response"))
+            return
+        try:
+            items = await parser.parse_response()
+            self._store_items(items)
+        except Exception as e:
+            _LOGGER.error(e, stack_info=True)
+            if not future.done():
+                future.set_exception(e)
+            raise
+        if not future.done():
+            future.set_result(items)
+
+    def _drain_pending(self) -> list[BaseParameterCommandGenerator]:
+        """Return the commands of all the pending items and clear them."""
+        commands = self._follow_up_commands
+        self._follow_up_commands = []
+        commands += [GetFloorParams(floor_id) for floor_id in self._pending_floors]
+        commands += [GetRoomParams(room_id) for room_id in self._pending_rooms]
+        commands += [GetACParams(ac_id) for ac_id in self._pending_acs]
+        commands += [
+            GetScenarioParams(scenario_id) for scenario_id in self._pending_scenarios
+        ]
+        for keypad_id, key_ids in self._pending_keys.items():
+            # Convert keypad_id 0 to 256 (as per v2 behavior)
+            request_keypad_id = 256 if keypad_id == 0 else keypad_id
+            commands += [
+                GetKeyParams(keypad_id=request_keypad_id, key_id=key_id)
+                for key_id in key_ids
+            ]
+        self._pending_floors = []
+        self._pending_rooms = []
+        self._pending_acs = []
+        self._pending_scenarios = []
+        self._pending_keys = {}
+        return commands
+
+    async def _request(
+        self,
+        command_generator: BaseParameterCommandGenerator,
+        timeout: float = 1.0,
+        max_attempts: int = 3,
+    ):
+        """Send a pipelined command and wait for its (correlated) response."""
+        command = await command_generator.serialize()
+        key = correlation_key(command)
+        for _ in range(max_attempts):
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            _LOGGER.debug("Sending pipelined command: %s", command.hex())
+            self.requests_sent += 1
+            await self.writer(command)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                if self._in_flight.get(key) is future:
+                    del self._in_flight[key]
+                self.retries += 1
+                if self.window > 1:
+                    _LOGGER.warning(
+                        "Timeout waiting for %s, falling back to sequential DB read",
+                        command_generator.command_number,
+                    )
+                    self.window = 1
+        raise TimeoutError(
+            f"Max attempts reached for command {command_generator.command_number}"
+        )
+
+    async def _run_pipeline(self, commands: list[BaseParameterCommandGenerator]):
+        """Send the commands while keeping up to `window` of them in flight."""
+        queue = deque(commands)
+
+        async def worker(index: int):
+            # Only the 1st worker continues after falling back to sequential mode
+            while queue and (index == 0 or self.window > 1):
+                await self._request(queue.popleft())
+
+        await asyncio.gather(
+            *(worker(index) for index in range(min(self.window, len(queue))))
+        )
+
+    async def _read_pipelined(self):
+        """Read the item numbers and then pipeline the items' parameters."""
+        self._pipelined = True
+        try:
+            commands = []
+            for command_generator in (
+                GetFloorNumbers(),
+                GetRoomNumbers(),
+                GetKeypadNumbers(),
+                GetACNumbers(),
+                GetScenarioNumbers(),
+            ):
+                await self.send_command(command_generator)
+                commands += self._drain_pending()
+            _LOGGER.debug("Requesting %d items' parameters", len(commands))
+            await self._run_pipeline(commands)
+        finally:
+            self._pipelined = False
+
+    async def _read_sequential(self):
+        """Read the database one command at a time."""
+        # Send commands sequentially, waiting for each response and all follow-ups
+        _LOGGER.debug("Starting database read - getting floors")
+        await self.get_floors()  # Waits for response and all floor follow-ups
+        _LOGGER.debug("Floors loaded: %d/%d", len(self.db.floors), self.db.no_of_floors)
+
+        await self.get_rooms()  # Waits for response and all room follow-ups
+        _LOGGER.debug("Rooms loaded: %d/%d", len(self.db.rooms), self.db.no_of_rooms)
+
+        await self.get_keypads()  # Waits for response and all keypad follow-ups
+        _LOGGER.debug("Keypads loaded: %d", len(self.db.keypads))
+
+        await self.get_acs()  # Waits for response and all AC follow-ups
+        _LOGGER.debug("ACs loaded: %d/%d", len(self.db.air_conditioners), self.db.no_of_acs)
+
+        await self.get_scenarios()  # Waits for response and all scenario follow-ups
+        _LOGGER.debug("Scenarios loaded: %d/%d", len(self.db.scenarios), self.db.no_of_scenarios)
+
     async def read_vitrea_controller(
         self, force: bool = False, timeout_seconds: int = 45
     ) -> VitreaDatabaseModel:
         """
-        Sequentially read all database data from the Vitrea controller.
+        Read all database data from the Vitrea controller.
 
-        Commands are sent one at a time, waiting for each response and all
-        follow-up commands to complete before proceeding to the next command.
+        With a window of 1, commands are sent one at a time, waiting for each
+        response and all follow-up commands to complete before proceeding to
+        the next command. Otherwise, the parameters are read pipelined.
 
         Args:
             force: Force reload even if database is already loaded
@@ -358,23 +539,15 @@ class VitreaDatabaseReader:
         if not self.db.is_loaded() or force:
             timeout = datetime.timedelta(seconds=timeout_seconds)
             start_time = datetime.datetime.now()
-            
-            # Send commands sequentially, waiting for each response and all follow-ups
-            _LOGGER.debug("Starting database read - getting floors")
-            await self.get_floors()  # Waits for response and all floor follow-ups
-            _LOGGER.debug("Floors loaded: %d/%d", len(self.db.floors), self.db.no_of_floors)
-            
-            await self.get_rooms()  # Waits for response and all room follow-ups
-            _LOGGER.debug("Rooms loaded: %d/%d", len(self.db.rooms), self.db.no_of_rooms)
-            
-            await self.get_keypads()  # Waits for response and all keypad follow-ups
-            _LOGGER.debug("Keypads loaded: %d", len(self.db.keypads))
-            
-            await self.get_acs()  # Waits for response and all AC follow-ups
-            _LOGGER.debug("ACs loaded: %d/%d", len(self.db.air_conditioners), self.db.no_of_acs)
-            
-            await self.get_scenarios()  # Waits for response and all scenario follow-ups
-            _LOGGER.debug("Scenarios loaded: %d/%d", len(self.db.scenarios), self.db.no_of_scenarios)
+            started = time.monotonic()
+            self.requests_sent = 0
+            self.retries = 0
+
+            if self.window > 1:
+                _LOGGER.debug("Starting pipelined database read")
+                await self._read_pipelined()
+            else:
+                await self._read_sequential()
 
             # Ensure all follow-up tasks have completed
             if self._follow_up_task and not self._follow_up_task.done():
@@ -415,5 +588,12 @@ class VitreaDatabaseReader:
                     )
                 await asyncio.sleep(0.1)
             
-            _LOGGER.debug("Database fully loaded")
+            self.read_time = time.monotonic() - started
+            _LOGGER.info(
+                "Vitrea database read in %.2fs (%d requests, %d retries, window %d)",
+                self.read_time,
+                self.requests_sent,
+                self.retries,
+                self.window,
+            )
         return self.db
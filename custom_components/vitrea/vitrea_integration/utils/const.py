@@ -1,4 +1,5 @@
 PARAM_API_PREFIX = "5654483c"
+PARAM_API_HEADER = b"VTH<"
 SUPPORTED_VERSIONS = {
     7: 99,
     8: 63,
@@ -0,0 +1,89 @@
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+BINARY_PREFIX = b"VT"
+BINARY_HEADER_LENGTH = 7
+LINE_END = b"\r\n"
+# Same limit as asyncio.StreamReader.readuntil()
+MAX_BUFFER_SIZE = 2**16
+
+
+class FrameDecoder:
+    """
+    Incremental decoder of the VBox byte stream.
+
+    The stream mixes binary parameter API frames and text lines:
+    - Binary frames: "VT" + 3 bytes ("H<" and the command number) + 2 bytes
+      length (lower 12 bits) + payload of that length.
+    - Text lines: anything else, up to and including "\\r\\n".
+
+    Data is appended to a single buffer and complete frames are sliced out of
+    it, so partial reads and coalesced frames are handled without re-reading
+    the socket for each frame.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def reset(self):
+        """Drop any buffered (partial) data."""
+        self._buffer.clear()
+        self._position = 0
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """
+        Add received data and return the frames which are complete.
+
+        Args:
+            data: Raw bytes read from the socket
+
+        Returns:
+            List of complete frames, in the order they were received
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        position = self._position
+        end = len(buffer)
+        while position < end:
+            if buffer.startswith(BINARY_PREFIX, position):
+                if end - position < BINARY_HEADER_LENGTH:
+                    break
+                length = (
+                    int.from_bytes(
+                        buffer[position + 5 : position + BINARY_HEADER_LENGTH],
+                        byteorder="big",
+                    )
+                    & 0x0FFF
+                )
+                frame_end = position + BINARY_HEADER_LENGTH + length
+                if frame_end > end:
+                    break
+            elif end - position == 1 and buffer[position] == BINARY_PREFIX[0]:
+                # Can't tell yet if this is a binary frame
+                break
+            else:
+                line_end = buffer.find(LINE_END, position)
+                if line_end == -1:
+                    break
+                frame_end = line_end + len(LINE_END)
+            frames.append(bytes(buffer[position:frame_end]))
+            position = frame_end
+
+        if position == end:
+            buffer.clear()
+            position = 0
+        elif end - position > MAX_BUFFER_SIZE:
+            _LOGGER.warning(
+                "Dropping %d bytes of undecodable data", end - position
+            )
+            buffer.clear()
+            position = 0
+        elif position > MAX_BUFFER_SIZE // 2:
+            # Compact once in a while instead of on every frame
+            del buffer[:position]
+            position = 0
+        self._position = position
+        return frames
@@ -2,14 +2,20 @@ import asyncio
 import contextlib
 import logging
 import threading
+from collections import deque
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 from typing import Any
 
 from .control_api.commands import AuthenticateCommand
+from .utils.frame_decoder import FrameDecoder
 
 _LOGGER = logging.getLogger(__name__)
 
+READ_CHUNK_SIZE = 4096
+KEEP_ALIVE_INTERVAL = timedelta(seconds=20)
+RX_TIMEOUT = timedelta(seconds=45)
+
 
 def _create_task(awaitable: Awaitable[Any], *, name: str) -> asyncio.Task:
     """Create background tasks with a common exception handler."""
@@ -68,6 +74,9 @@ class VBoxConnection:
         self._writer_task: asyncio.Task | None = None
         self._monitor_task: asyncio.Task | None = None
         self._tasks: set[asyncio.Task] = set()
+        # Incoming stream decoding
+        self._decoder = FrameDecoder()
+        self._frames: deque[bytes] = deque()
 
     @property
     def connected(self):
@@ -239,6 +248,8 @@ class VBoxConnection:
                     asyncio.open_connection(self.ip, self.port), timeout=3
                 )
                 _LOGGER.info("Connected to VBox")
+                self._decoder.reset()
+                self._frames.clear()
                 await self.set_connected(True)
                 self.last_keep_alive = None
                 return True
@@ -315,9 +326,12 @@ class VBoxConnection:
                 _LOGGER.debug("Dropping echo frame: %s", response)
                 continue
 
-            _LOGGER.debug(
-                "Received response from VBox: %s (hex: %s)", response, response.hex()
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Received response from VBox: %s (hex: %s)",
+                    response,
+                    response.hex(),
+                )
             try:
                 await self.response_callback(response)
             except Exception as err:  # noqa: BLE001
@@ -326,32 +340,34 @@ class VBoxConnection:
         _LOGGER.debug("Reader loop finished")
 
     async def _writer_loop(self) -> None:
-        """Continuously send queued commands to the controller."""
+        """Send queued commands to the controller as they arrive."""
 
         while self.enabled and not self._stop_event.is_set():
-            try:
-                command = await asyncio.wait_for(
-                    self.command_queue.get(), timeout=self.event_beat_seconds
-                )
-            except asyncio.TimeoutError:
-                command = None
-
-            if not command:
+            commands = [await self.command_queue.get()]
+            # Coalesce commands queued meanwhile (e.g. a scene) into one write
+            while not self.command_queue.empty():
+                commands.append(self.command_queue.get_nowait())
+            commands = [command for command in commands if command]
+            if not commands:
                 continue
-            await self._send(command)
-            continue 
+            await self._send(b"".join(commands))
 
         _LOGGER.debug("Writer loop finished")
 
     async def _monitor_loop(self) -> None:
-        """Monitor connection state and trigger keep-alives/timeouts."""
+        """Send keep-alives when idle and detect a silent controller."""
 
         while self.enabled and not self._stop_event.is_set():
+            if not self.writer:
+                # Nothing to keep alive, connect() sends one once it's reopened
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), KEEP_ALIVE_INTERVAL.total_seconds()
+                    )
+                continue
+
             now = datetime.now()
-            if (
-                self.last_keep_alive_sent is None
-                or (now - self.last_keep_alive_sent) > timedelta(seconds=20)
-            ):
+            if self.last_tx is None or now - self.last_tx >= KEEP_ALIVE_INTERVAL:
                 try:
                     await self._send_keep_alive()
                 except ConnectionError as exc:
@@ -360,7 +376,7 @@ class VBoxConnection:
                     await self._handle_connection_failure()
                     return
 
-            if self.last_rx and (now - self.last_rx) > timedelta(seconds=45):
+            if self.last_rx and now - self.last_rx > RX_TIMEOUT:
                 _LOGGER.error(
                     "No keep alive response received for more than 45 seconds"
                 )
@@ -368,7 +384,12 @@ class VBoxConnection:
                 await self._handle_connection_failure()
                 return
 
-            await asyncio.sleep(max(self.event_beat_seconds, 0.5))
+            # Sleep until the next keep-alive or RX deadline
+            deadline = (self.last_tx or now) + KEEP_ALIVE_INTERVAL
+            if self.last_rx:
+                deadline = min(deadline, self.last_rx + RX_TIMEOUT)
+            delay = (deadline - datetime.now()).total_seconds()
+            await asyncio.sleep(max(delay, self.event_beat_seconds))
 
         _LOGGER.debug("Monitor loop finished")
 
@@ -390,23 +411,14 @@ class VBoxConnection:
             await self.set_connected(False)
             self.error_reason = "Connection Lost"
             return None
-        prefix = await self.reader.read(2)
-        # prefix should be b'VT' and we should remove the newline before combining with data.
-        if prefix != b"VT":
-            result = await self.reader.readuntil(b"\r\n")
-            result = prefix + result
-        else:
-            info = await self.reader.read(5)
-            # len is 2 bytes at the end of the info
-            length = int(info[-2:].hex()[1:], 16)
-            result = await self.reader.read(length)
-            result = prefix + info + result
-        if not result:
-            self.error_reason = "Connection Closed By Controller"
-            await self.set_connected(False)
-        if result:
-            _LOGGER.debug(("RECEIVED: ", result.hex()))
-        return result
+        while not self._frames:
+            data = await self.reader.read(READ_CHUNK_SIZE)
+            if not data:
+                self.error_reason = "Connection Closed By Controller"
+                await self.set_connected(False)
+                return None
+            self._frames.extend(self._decoder.feed(data))
+        return self._frames.popleft()
 
     async def __aexit__(self, exc_type, exc, tb):
         """Close the connection when exiting async context."""
@@ -469,7 +481,7 @@ class VBoxConnection:
 
         if not self.connected:
             return False
-        if self.last_rx and datetime.now() - self.last_rx > timedelta(seconds=45):
+        if self.last_rx and datetime.now() - self.last_rx > RX_TIMEOUT:
             return False
         for task in (self._reader_task, self._writer_task, self._monitor_task):
             if task and task.done():
@@ -2,10 +2,10 @@
 import asyncio
 import contextlib
 import datetime
+import ipaddress
 import logging
-import socket
-from collections.abc import Callable
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterable
 
 from .control_api.commands import (
     AuthenticateCommand,
@@ -14,11 +14,24 @@ from .control_api.commands import (
 )
 from .control_api.responses import parse_response
 from .parameter_api import VitreaDatabaseReaderV3 as VitreaDatabaseReader
-from .utils.const import SUPPORTED_VERSIONS, UPGRADEABLE_VERSIONS
-from .vbox_connection import VBoxConnection
+from .utils.const import PARAM_API_HEADER, SUPPORTED_VERSIONS, UPGRADEABLE_VERSIONS
+from .utils.frame_decoder import FrameDecoder
+from .vbox_connection import READ_CHUNK_SIZE, VBoxConnection
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_PORT = 11502
+VALIDATION_TIMEOUT = 5
+DISCOVERY_TIMEOUT = 2
+DISCOVERY_CONCURRENCY = 64
+
+# Status sub types which are events rather than states
+EVENT_SUB_TYPES = {
+    "satellite_key_short",
+    "satellite_key_long",
+    "satellite_key_release",
+}
+
 
 class VBoxController:
     """
@@ -61,14 +74,25 @@ class VBoxController:
             self._callbacks.add(status_update_callback)
         self.enabled = enabled
         self._db_initialized = False
+        self._connection_state = None
         self.database = None
         self.watchdog_task: asyncio.Task | None = None
         self.last_incoming_message: datetime.datetime | None = None
         self.response_handler_task: asyncio.Task | None = None
         self._response_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=512)
+        # Response handling statistics
+        self.dropped_frames = 0
+        self.max_queue_depth = 0
+        self.processed_frames = 0
+        self.coalesced_updates = 0
+        self._status_count = 0
 
     async def _connection_change_callback(self, connected):
         """Handle connection state changes."""
+        # The connection reports its state more than once per (re)connect
+        if connected == self._connection_state:
+            return
+        self._connection_state = connected
         await self.publish_updates({"type": "connection", "status": connected})
         if connected and self._db_initialized:
             await self.update_state()
@@ -138,6 +162,11 @@ class VBoxController:
         _LOGGER.debug("Vitrea database initialized")
         return self.database
 
+    async def use_cached_database(self):
+        """Use a database read earlier instead of reading it from the controller."""
+        self._db_initialized = True
+        await self.update_state()
+
     async def connect(self, ignore_db=False, watchdog=True):
         """Connect to the Vitrea controller and optionally load database."""
         self.enabled = True
@@ -163,7 +192,9 @@ class VBoxController:
             await self.connection.send(GetFullStatusCommand().serialize())
 
     @staticmethod
-    async def validate_controller_availability(ip: str, port: int) -> dict:
+    async def validate_controller_availability(
+        ip: str, port: int, timeout: float = VALIDATION_TIMEOUT
+    ) -> dict:
         """Check if the Vitrea Gateway is available and supported."""
         result = {
             "supported": False,
@@ -171,61 +202,116 @@ class VBoxController:
             "version": "",
             "supports_led_commands": False,
         }
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.connect((ip, port))
-                s.settimeout(5)
-                s.sendall(AuthenticateCommand().serialize())
-                data = s.recv(1024)
-                parsed_response = parse_response(data)
-                if (
-                    parsed_response.get("type") != "acknowledgment"
-                    and parsed_response.get("subtype", False)
-                    != "keep_alive_acknowledgment"
-                ):
-                    result["reason"] = "auth_failed"
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port), timeout=timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            result["reason"] = "connection_error"
+            return result
+
+        decoder = FrameDecoder()
+        frames: deque[bytes] = deque()
+
+        async def request(command: bytes):
+            writer.write(command)
+            await asyncio.wait_for(writer.drain(), timeout=timeout)
+
+        async def next_response():
+            while not frames:
+                data = await asyncio.wait_for(
+                    reader.read(READ_CHUNK_SIZE), timeout=timeout
+                )
+                if not data:
+                    raise ConnectionError("Connection closed by the controller")
+                frames.extend(decoder.feed(data))
+            return parse_response(frames.popleft())
+
+        try:
+            await request(AuthenticateCommand().serialize())
+            parsed_response = await next_response()
+            if (
+                parsed_response.get("type") != "acknowledgment"
+                and parsed_response.get("subtype", False)
+                != "keep_alive_acknowledgment"
+            ):
+                result["reason"] = "auth_failed"
+                return result
+            await request(GetControllerVersionCommand().serialize())
+            major_version = minor_version = 0
+            for _ in range(3):
+                parsed_response = await next_response()
+                if parsed_response.get("type", None) != "version":
+                    continue
+                minor_version = parsed_response.get("minor_version", 0)
+                major_version = parsed_response.get("major_version", 0)
+
+                result["version"] = str(major_version) + "." + str(minor_version)
+
+                if minor_version >= SUPPORTED_VERSIONS.get(major_version, 200):
+                    result["supported"] = True
                 else:
-                    s.sendall(GetControllerVersionCommand().serialize())
-                    for _ in range(3):
-                        data = s.recv(1024)
-                        parsed_response = parse_response(data)
-                        if parsed_response.get("type", None) != "version":
-                            continue
-                        minor_version = parsed_response.get("minor_version", 0)
-                        major_version = parsed_response.get("major_version", 0)
-                        
-                        result["version"] = (
-                            str(major_version)
-                            + "."
-                            + str(minor_version)
-                        )
-                        
-                        if minor_version >= SUPPORTED_VERSIONS.get(
-                            major_version, 200
-                        ):
-                            result["supported"] = True
+                    result["supported"] = False
+                    if major_version in UPGRADEABLE_VERSIONS:
+                        if minor_version >= UPGRADEABLE_VERSIONS.get(major_version, 200):
+                            result["reason"] = "unsupported_version_upgrade_optional"
                         else:
-                            result["supported"] = False
-                            if major_version in UPGRADEABLE_VERSIONS:
-                                if minor_version >= UPGRADEABLE_VERSIONS.get(major_version, 200):
-                                    result["reason"] = "unsupported_version_upgrade_optional"
-                                else:
-                                    result["reason"] = "unsupported_version"
-                            else:
-                                result["reason"] = "unsupported_version"
-                        break
-                    s.close()
-                    result["supports_led_commands"] = (
-                        major_version >= 9
-                        or major_version < 1
-                    )
-                    _LOGGER.debug(result)
-                    return result
-            except (ConnectionError, TimeoutError):
-                result["reason"] = "connection_error"
-                s.close()
+                            result["reason"] = "unsupported_version"
+                    else:
+                        result["reason"] = "unsupported_version"
+                break
+            result["supports_led_commands"] = (
+                major_version >= 9
+                or major_version < 1
+            )
+            _LOGGER.debug(result)
+        except (OSError, asyncio.TimeoutError, ValueError):
+            result["reason"] = "connection_error"
+        finally:
+            writer.close()
+            with contextlib.suppress(OSError, asyncio.TimeoutError):
+                await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
         return result
 
+    @staticmethod
+    async def discover_controllers(
+        hosts: str | Iterable[str],
+        port: int = DEFAULT_PORT,
+        timeout: float = DISCOVERY_TIMEOUT,
+        max_concurrency: int = DISCOVERY_CONCURRENCY,
+    ) -> dict[str, dict]:
+        """
+        Probe candidate hosts concurrently for Vitrea Gateways.
+
+        Args:
+            hosts: Host addresses, or a subnet (e.g. "192.168.1.0/24")
+            port: Port of the Vitrea Gateway
+            timeout: Timeout of each connection and response
+            max_concurrency: Maximal number of hosts probed at once
+
+        Returns:
+            The validation result of each host which answered as a VBox
+        """
+        if isinstance(hosts, str):
+            hosts = [
+                str(host)
+                for host in ipaddress.ip_network(hosts, strict=False).hosts()
+            ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def probe(host: str):
+            async with semaphore:
+                return host, await VBoxController.validate_controller_availability(
+                    host, port, timeout=timeout
+                )
+
+        results = await asyncio.gather(*(probe(host) for host in hosts))
+        return {
+            host: result
+            for host, result in results
+            if result["reason"] != "connection_error"
+        }
+
     async def close(self):
         """Close the controller."""
         self.enabled = False
@@ -244,17 +330,14 @@ class VBoxController:
 
     async def _validate_single_response(self, response: bytes):
         """Validate if response is a single message or multiple."""
-        if not response.hex().startswith("5654483c"):
-            possible_responses = response.decode("utf-8", errors="replace").split(
-                "\r\n"
-            )
-            if len(possible_responses) > 1:
-                return False
+        if not response.startswith(PARAM_API_HEADER):
+            # The connection yields a line at a time, ending with a line break
+            return b"\r\n" not in response.strip()
         return True
 
     async def _handle_multiple_messages(self, response: bytes):
         """Handle responses that contain multiple messages."""
-        if not response.hex().startswith("5654483c"):
+        if not response.startswith(PARAM_API_HEADER):
             possible_responses = response.decode("utf-8", errors="replace").split(
                 "\r\n"
             )
@@ -267,54 +350,71 @@ class VBoxController:
         return True
 
     async def on_response(self, response):
-        """Handle incoming response from the controller in a threaded manner."""
+        """Queue an incoming response from the controller."""
         try:
             self._response_queue.put_nowait(response)
         except asyncio.QueueFull:
-            _LOGGER.warning("Dropping response due to full queue")
+            self.dropped_frames += 1
+            _LOGGER.warning(
+                "Dropping response due to full queue (%d dropped)",
+                self.dropped_frames,
+            )
         return True
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of responses waiting to be handled."""
+        return self._response_queue.qsize()
+
     async def response_thread_loop(self):
-        """Loop to handle incoming responses from the controller in a threaded manner."""
-        response_tasks = set[Any]()
-        while self.enabled:
-            try:
-                response = await asyncio.wait_for(
-                    self._response_queue.get(), timeout=1
-                )
-            except asyncio.TimeoutError:
-                continue
+        """
+        Handle the incoming responses in order, a burst at a time.
 
-            task = asyncio.create_task(self._response_task(response))
+        All the responses queued since the previous burst are parsed in order,
+        and the status updates are then published once per device (the latest
+        status wins), so a full status dump doesn't update a device repeatedly.
+        """
+        while self.enabled:
+            responses = [await self._response_queue.get()]
+            while not self._response_queue.empty():
+                responses.append(self._response_queue.get_nowait())
+            self.max_queue_depth = max(self.max_queue_depth, len(responses))
+            self.processed_frames += len(responses)
 
-            def _log_done(t: asyncio.Task) -> None:
+            updates = {}
+            for response in responses:
                 try:
-                    result = t.result()
-                    _LOGGER.debug(
-                        "Response handler finished successfully: %s", result
-                    )
+                    await self._response_task(response, updates)
                 except Exception as err:  # noqa: BLE001
                     _LOGGER.warning("Response handler finished with error: %s", err)
+            self.coalesced_updates += self._status_count - len(updates)
+            self._status_count = 0
 
-            task.add_done_callback(_log_done)
-            response_tasks.add(task)
+            for item in updates.values():
+                try:
+                    await self.publish_updates(item)
+                except Exception as err:  # noqa: BLE001
+                    _LOGGER.warning("Status update failed: %s", err)
 
-            done = {t for t in response_tasks if t.done()}
-            response_tasks.difference_update(done)
+    def _status_key(self, item: dict):
+        """Return the key by which the status updates of a burst are merged."""
+        self._status_count += 1
+        match item.get("type"):
+            case "node_status" if item.get("sub_type") not in EVENT_SUB_TYPES:
+                return "node_status", item.get("node_id"), item.get("key")
+            case "ac_status":
+                return "ac_status", item.get("ac_id")
+        # Events (e.g. key presses) are published one by one
+        return "event", self._status_count
 
-    async def _response_task(self, response):
+    async def _response_task(self, response, updates: dict):
         """Handle incoming response from the controller."""
         if not await self._validate_single_response(response):
             return await self._handle_multiple_messages(response)
         try:
-            _LOGGER.debug(("Received Response: ", response))
+            _LOGGER.debug("Received Response: %s", response)
             self.last_incoming_message = datetime.datetime.now()
-            response_hex = response.hex()
-            _LOGGER.debug(
-                "Response hex starts with: %s (checking for 5654483c)",
-                response_hex[:20],
-            )
-            if response_hex.startswith("5654483c"):  # Params Received
+            if response.startswith(PARAM_API_HEADER):  # Params Received
                 _LOGGER.debug(
                     "Parameter API response detected, vitrea_db_reader exists: %s",
                     self.vitrea_db_reader is not None,
@@ -323,7 +423,7 @@ class VBoxController:
                     await self.vitrea_db_reader.feed(response)
             else:
                 result = parse_response(response)
-                if isinstance(result, dict):
+                if not isinstance(result, list):
                     result = [result]
                 for item in result:
                     _LOGGER.debug("Parsed Response: %s", item)
@@ -336,8 +436,10 @@ class VBoxController:
                             )
                     elif "status" in item.get("type", ""):
                         _LOGGER.debug("Received Status Update")
-                        await self.publish_updates(item)
-                # Status Update Received
+                        # Status Update Received, published after the burst
+                        key = self._status_key(item)
+                        updates.pop(key, None)
+                        updates[key] = item
         except (TypeError, ValueError) as e:
             _LOGGER.error("Error parsing response", stack_info=True)
             _LOGGER.error("Response: %s", response.hex())
@@ -0,0 +1,153 @@
+"""Benchmark downloading and extracting a repository zipball with HACS.
+
+A multi-MB integration archive (Python modules, binary assets and docs which
+are not extracted) is served by a local HTTP server. The benchmark measures
+the wall time of HacsRepository.download_repository_zip, and the peak memory
+allocated while it runs (traced in a separate run, as tracing slows it down).
+
+Usage (from the repository root):
+
+    python -m tests.hacs.benchmark_zip_download
+    python -m tests.hacs.benchmark_zip_download --assets-mib 64 --spool-mib 1
+
+To compare with another revision, pass the root of its checkout (e.g. a git
+worktree) with --source, its custom_components are imported instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import io
+import os
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+from aiohttp import ClientSession, web
+
+HOST = "127.0.0.1"
+MODULES = 150
+DOCS = 40
+
+
+def build_archive(assets_mib: float, seed: int = 0) -> bytes:
+    """Return a zipball of a (large) integration, like the GitHub archives."""
+    rand = random.Random(seed)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index in range(MODULES):
+            archive.writestr(
+                f"foo-1.0/custom_components/foo/module{index}.py",
+                f"# module {index}\n" + "value = 1\n" * 4000,
+            )
+        assets = max(1, round(assets_mib * 2**20 / 300_000))
+        for index in range(assets):
+            archive.writestr(
+                f"foo-1.0/custom_components/foo/assets/asset{index}.bin",
+                rand.randbytes(300_000),
+            )
+        for index in range(DOCS):
+            archive.writestr(f"foo-1.0/docs/screenshot{index}.png", rand.randbytes(250_000))
+    return buffer.getvalue()
+
+
+def digest(path: Path) -> str:
+    """Return a digest of the names and content of the files in the path."""
+    sha = hashlib.sha1()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            sha.update(name.encode())
+            sha.update((Path(root) / name).read_bytes())
+    return sha.hexdigest()[:12]
+
+
+async def async_benchmark(body: bytes, runs: int, spool_mib: float | None) -> dict:
+    """Download and extract the archive, return the measurements."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.hacs import base as hacs_base
+    from custom_components.hacs.base import HacsBase
+    from custom_components.hacs.repositories import base as repository_base
+    from custom_components.hacs.repositories.base import HacsRepository
+
+    if spool_mib is not None:
+        hacs_base.DOWNLOAD_SPOOL_MAX_SIZE = int(spool_mib * 2**20)
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(body=body)
+
+    app = web.Application()
+    app.router.add_get("/{path:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, HOST, 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    repository_base.github_archive = lambda **_: f"http://{HOST}:{port}/archive.zip"
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hacs = HacsBase()
+        hacs.hass = hass
+        hacs.session = ClientSession()
+        repository = HacsRepository(hacs)
+        repository.ref = "1.0"
+        repository.data.full_name = "owner/foo"
+        repository.repository_manifest.filename = None
+        repository.content.path.remote = "custom_components/foo"
+        repository.content.path.local = str(Path(config_dir) / "custom_components" / "foo")
+
+        times = []
+        try:
+            for run in range(runs + 1):
+                trace = run == runs
+                if trace:
+                    tracemalloc.start()
+                start = time.perf_counter()
+                await repository.download_repository_zip()
+                elapsed = time.perf_counter() - start
+                if trace:
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                else:
+                    times.append(elapsed)
+            result = {
+                "archive_mib": round(len(body) / 2**20, 1),
+                "best_ms": round(min(times) * 1000),
+                "median_ms": round(statistics.median(times) * 1000),
+                "peak_traced_mib": round(peak / 2**20, 1),
+                "digest": digest(Path(repository.content.path.local)),
+            }
+        finally:
+            await hacs.session.close()
+            await hass.async_stop(force=True)
+            await runner.cleanup()
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets-mib", type=float, default=6, help="size of the assets")
+    parser.add_argument("--runs", type=int, default=15, help="timed runs")
+    parser.add_argument("--spool-mib", type=float, help="override DOWNLOAD_SPOOL_MAX_SIZE")
+    parser.add_argument("--source", type=Path, help="root of the checkout to benchmark")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(args.source or Path(__file__).parents[2]))
+    body = build_archive(args.assets_mib)
+    result = asyncio.run(async_benchmark(body, args.runs, args.spool_mib))
+    print(" ".join(f"{key}={value}" for key, value in result.items()))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Test saving and restoring the HACS data."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.repositories import REPOSITORY_CLASSES
+from custom_components.hacs.utils.data import HacsData
+from custom_components.hacs.utils.store import DATA_STORE_FINGERPRINTS, HACSStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _hacs(hass: HomeAssistant) -> HacsBase:
+    """Return HACS with a few registered repositories."""
+    hacs = HacsBase()
+    hacs.hass = hass
+    hacs.common.categories = {"integration", "plugin"}
+    hacs.common.ignored_repositories = {"owner/ignored"}
+    for index, category in enumerate(("integration", "plugin", "integration"), start=1):
+        repository = REPOSITORY_CLASSES[category](hacs, f"owner/repository{index}")
+        repository.data.update_data(
+            {
+                "id": index,
+                "description": f"Repository {index}",
+                "topics": ["home-assistant"],
+                "installed": index == 1,
+            }
+        )
+        hacs.repositories.register(repository)
+    return hacs
+
+
+def test_restored_data_is_not_written_again(tmp_path: Path) -> None:
+    """Test the first write after a restart only saves the stores which changed."""
+
+    async def _async_test() -> list[str]:
+        hass = HomeAssistant(str(tmp_path))
+        hacs = _hacs(hass)
+        saved = []
+        save = HACSStore.async_save
+
+        async def _async_save(store: HACSStore, data: dict) -> None:
+            saved.append(store.key)
+            await save(store, data)
+
+        try:
+            await HacsData(hacs).async_write()
+            # A restart, the fingerprints are only kept in memory
+            hass.data.pop(DATA_STORE_FINGERPRINTS)
+            hacs.data = HacsData(hacs)
+            assert await hacs.data.restore()
+
+            with patch.object(HACSStore, "async_save", _async_save):
+                await hacs.data.async_write()
+                assert not saved
+                hacs.repositories.get_by_id("2").data.stargazers_count = 10
+                await hacs.data.async_write()
+        finally:
+            await hass.async_stop(force=True)
+        return sorted(saved)
+
+    assert asyncio.run(_async_test()) == ["hacs.data", "hacs.repositories"]
@@ -0,0 +1,135 @@
+"""Test the HACS scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hacs.enums import HacsTaskPriority
+from custom_components.hacs.utils.scheduler import (
+    DEFAULT_TASK_COST,
+    RATE_LIMIT_RESERVE,
+    HacsScheduler,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+WORKERS = 5
+
+
+async def _async_rate_limit_reached() -> tuple[int, int]:
+    """Return a rate limit which is used up for the next hour."""
+    return 0, int(time.time()) + 3600
+
+
+def test_rate_limit_does_not_hold_back_user_tasks(tmp_path: Path) -> None:
+    """Test user tasks run while background tasks wait for the rate limit."""
+
+    async def _async_test() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        scheduler = HacsScheduler(
+            hass, rate_limit_fetcher=_async_rate_limit_reached, workers=WORKERS
+        )
+        background_ran = []
+
+        async def _background() -> None:
+            background_ran.append(True)
+
+        async def _user() -> str:
+            return "installed"
+
+        try:
+            for _ in range(WORKERS * 2):
+                scheduler.add(_background())
+            scheduler.async_start()
+            await asyncio.sleep(0.1)
+            assert scheduler.stats["waiting_for_rate_limit"]
+            assert not scheduler.running
+
+            result = await asyncio.wait_for(
+                scheduler.async_run(_user(), priority=HacsTaskPriority.USER), 2
+            )
+            assert result == "installed"
+            assert not background_ran
+            assert scheduler.pending_tasks == WORKERS * 2
+        finally:
+            scheduler.clear()
+            await hass.async_stop(force=True)
+
+    asyncio.run(_async_test())
+
+
+def test_running_tasks_are_pending(tmp_path: Path) -> None:
+    """Test tasks count as pending until they are done."""
+
+    async def _async_test() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        scheduler = HacsScheduler(hass)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _download() -> None:
+            started.set()
+            await release.wait()
+
+        try:
+            scheduler.add(_download(), priority=HacsTaskPriority.USER, cost=0)
+            await started.wait()
+            assert scheduler.stats["running"] == 1
+            assert scheduler.pending_tasks == 1
+            assert scheduler.has_pending_tasks
+
+            release.set()
+            await scheduler.async_wait_idle()
+            assert scheduler.pending_tasks == 0
+            assert not scheduler.has_pending_tasks
+        finally:
+            scheduler.clear()
+            await hass.async_stop(force=True)
+
+    asyncio.run(_async_test())
+
+
+def test_drained_after_rate_limit_reset(tmp_path: Path) -> None:
+    """Test on_drained is called once the tasks held back by the rate limit have run."""
+
+    async def _async_test() -> None:
+        hass = HomeAssistant(str(tmp_path))
+        rate_limits = [
+            (RATE_LIMIT_RESERVE + 2 * DEFAULT_TASK_COST, int(time.time()) + 1),
+            (RATE_LIMIT_RESERVE + 100 * DEFAULT_TASK_COST, int(time.time()) + 3600),
+        ]
+
+        async def _async_rate_limit() -> tuple[int, int]:
+            return rate_limits.pop(0)
+
+        drained = asyncio.Event()
+        scheduler = HacsScheduler(
+            hass, rate_limit_fetcher=_async_rate_limit, on_drained=drained.set
+        )
+        ran = []
+
+        async def _update(index: int) -> None:
+            ran.append(index)
+
+        try:
+            for index in range(WORKERS):
+                scheduler.add(_update(index))
+            scheduler.async_start()
+            await scheduler.async_wait_idle()
+            assert len(ran) == 2
+            assert scheduler.stats["waiting_for_rate_limit"]
+            assert not drained.is_set()
+
+            await asyncio.wait_for(drained.wait(), 5)
+            assert sorted(ran) == list(range(WORKERS))
+            assert not scheduler.has_pending_tasks
+        finally:
+            scheduler.clear()
+            await hass.async_stop(force=True)
+
+    asyncio.run(_async_test())
@@ -0,0 +1,93 @@
+"""Benchmark the oref_alert area lookup of lat/lon points.
+
+Random points across Israel (a bounding box, so some points are outside of
+any area) are resolved one by one with find_area and in a single batch with
+find_areas (when the revision has it). The load of the polygons is timed too.
+The number of points which were found and a digest of the areas are printed,
+to check the revisions agree.
+
+Usage (from the repository root):
+
+    python -m tests.oref_alert.benchmark_find_area
+    python -m tests.oref_alert.benchmark_find_area --points 5000
+
+To compare with another revision, pass the root of its checkout (e.g. a git
+worktree) with --source, its custom_components are imported instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# South-west and north-east corners (lat/lon) of Israel
+BOUNDS = ((29.45, 34.25), (33.35, 35.9))
+
+
+def random_points(count: int, seed: int = 0) -> list[tuple[float, float]]:
+    """Return random lat/lon points in the bounds."""
+    rand = random.Random(seed)
+    (south, west), (north, east) = BOUNDS
+    return [
+        (rand.uniform(south, north), rand.uniform(west, east)) for _ in range(count)
+    ]
+
+
+def digest(areas: list[str | None]) -> str:
+    """Return a digest of the areas which were found."""
+    return hashlib.sha1("\n".join(map(str, areas)).encode()).hexdigest()[:12]
+
+
+async def async_benchmark(
+    points: list[tuple[float, float]], runs: int
+) -> dict[str, Any]:
+    """Time the lookups, return the measurements."""
+    # pylint: disable=import-outside-toplevel
+    from custom_components.oref_alert.metadata import area_to_polygon
+
+    start = time.perf_counter()
+    await area_to_polygon.init_area_to_polygon()
+    result: dict[str, Any] = {"init_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+    start = time.perf_counter()
+    areas = [area_to_polygon.find_area(lat, lon) for lat, lon in points]
+    elapsed = time.perf_counter() - start
+    result["find_area_ms_per_point"] = round(elapsed * 1000 / len(points), 4)
+
+    if find_areas := getattr(area_to_polygon, "find_areas", None):
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            batch = find_areas(points)
+            times.append(time.perf_counter() - start)
+        if batch != areas:
+            msg = "find_areas does not agree with find_area"
+            raise AssertionError(msg)
+        result["find_areas_ms"] = round(statistics.median(times) * 1000, 2)
+    result["found"] = sum(area is not None for area in areas)
+    result["digest"] = digest(areas)
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, default=500, help="random points")
+    parser.add_argument("--runs", type=int, default=20, help="timed batch runs")
+    parser.add_argument("--source", type=Path, help="root of the checkout to benchmark")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(args.source or Path(__file__).parents[2]))
+    result = asyncio.run(async_benchmark(random_points(args.points), args.runs))
+    print(" ".join(f"{key}={value}" for key, value in result.items()))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""Benchmark the oref_alert coordinator refresh with a large alerts history.
+
+The history (AlertsHistory.json) is served by the stubbed session of the
+replay harness and the coordinator's _async_update_data is timed directly, so
+only the processing of the alerts is measured:
+
+- first: the first refresh, the whole history is new.
+- steady: nothing changed (304), the data is built again.
+- new_alert: one more alert at the top of the history.
+
+Both modes are measured, only the active alerts (default) and all alerts
+(the all alerts attributes option).
+
+Usage (from the repository root):
+
+    python -m tests.oref_alert.benchmark_refresh
+    python -m tests.oref_alert.benchmark_refresh --alerts 3000 --spread 60
+
+To compare with another revision, pass the root of its checkout (e.g. a git
+worktree) with --source, its custom_components are imported instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def build_history(
+    areas: list[str], alerts: int, spread: float, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Return a history (newest first) of salvos in the last spread minutes."""
+    # pylint: disable=import-outside-toplevel
+    from custom_components.oref_alert.const import (
+        AREA_FIELD,
+        CATEGORY_FIELD,
+        DATE_FIELD,
+        IST,
+        TITLE_FIELD,
+    )
+
+    rand = random.Random(seed)
+    now = datetime.now(IST)
+    history = []
+    while len(history) < alerts:
+        date = (now - timedelta(seconds=rand.uniform(0, spread * 60))).strftime(
+            DATE_FORMAT
+        )
+        history.extend(
+            {
+                DATE_FIELD: date,
+                TITLE_FIELD: "ירי רקטות וטילים",
+                AREA_FIELD: area,
+                CATEGORY_FIELD: 1,
+            }
+            for area in rand.sample(areas, min(rand.randint(1, 50), len(areas)))
+        )
+    del history[alerts:]
+    history.sort(key=lambda alert: (alert[DATE_FIELD], alert[AREA_FIELD]), reverse=True)
+    return history
+
+
+async def async_benchmark(
+    alerts: int, spread: float, runs: int, *, all_alerts: bool
+) -> dict[str, float]:
+    """Time the refreshes, return the median of each (in milliseconds)."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.oref_alert import alert_store, coordinator
+    from custom_components.oref_alert.const import (
+        CONF_ALERT_ACTIVE_DURATION,
+        CONF_ALL_ALERTS_ATTRIBUTES,
+        DATE_FIELD,
+        IST,
+    )
+    from custom_components.oref_alert.metadata.areas import AREAS
+
+    from .replay import ReplaySession
+
+    areas = sorted(AREAS)
+    history = build_history(areas, alerts, spread)
+    entry = SimpleNamespace(
+        options={
+            CONF_ALERT_ACTIVE_DURATION: int(spread) + 1,
+            CONF_ALL_ALERTS_ATTRIBUTES: all_alerts,
+        }
+    )
+    times: dict[str, list[float]] = {"first": [], "steady": [], "new_alert": []}
+    session = ReplaySession()
+
+    async def _async_time(data_coordinator: Any, phase: str) -> None:
+        start = time.perf_counter()
+        data_coordinator.data = await data_coordinator._async_update_data()  # noqa: SLF001
+        times[phase].append(time.perf_counter() - start)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            with (
+                patch.object(
+                    coordinator, "async_get_clientsession", return_value=session
+                ),
+                patch.object(coordinator, "REQUEST_THROTTLING", 0),
+            ):
+                for _ in range(runs):
+                    if cache_clear := getattr(
+                        getattr(alert_store, "date_to_timestamp", None),
+                        "cache_clear",
+                        None,
+                    ):
+                        # Don't let the dates parsed by the previous run help
+                        cache_clear()
+                    session.serve(
+                        coordinator.OREF_HISTORY_URL,
+                        json.dumps(history, ensure_ascii=False).encode(),
+                    )
+                    data_coordinator = coordinator.OrefAlertDataUpdateCoordinator(
+                        hass, entry, []
+                    )
+                    await _async_time(data_coordinator, "first")
+                    await _async_time(data_coordinator, "steady")
+                    new_alert = {
+                        **history[0],
+                        DATE_FIELD: datetime.now(IST).strftime(DATE_FORMAT),
+                    }
+                    session.serve(
+                        coordinator.OREF_HISTORY_URL,
+                        json.dumps([new_alert, *history], ensure_ascii=False).encode(),
+                    )
+                    await _async_time(data_coordinator, "new_alert")
+        finally:
+            await hass.async_stop(force=True)
+    return {
+        phase: round(statistics.median(values) * 1000, 2)
+        for phase, values in times.items()
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--alerts", type=int, default=3000, help="alerts in the history"
+    )
+    parser.add_argument(
+        "--spread", type=float, default=10, help="minutes the history spans"
+    )
+    parser.add_argument("--runs", type=int, default=20, help="timed runs")
+    parser.add_argument("--source", type=Path, help="root of the checkout to benchmark")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(args.source or Path(__file__).parents[2]))
+    for all_alerts in (False, True):
+        result = asyncio.run(
+            async_benchmark(args.alerts, args.spread, args.runs, all_alerts=all_alerts)
+        )
+        print(  # noqa: T201
+            f"all_alerts={all_alerts} "
+            + " ".join(f"{phase}_ms={value}" for phase, value in result.items())
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark loading the oref_alert metadata and importing the integration.
+
+Each measurement runs in a new interpreter:
+
+- tables: import the metadata tables (area_info, segment_to_area, ...) without
+  the integration package, cold (the integration has no bytecode cache, like
+  after an install or an upgrade) and warm (from the bytecode cache).
+- integration: import the integration and its platforms, from the bytecode
+  cache, with the Home Assistant core already imported.
+
+The modules of the standard library (and Home Assistant) are imported from
+the bytecode cache before the measurement, as they are in Home Assistant.
+
+The time and the growth of the RSS during the import are reported (medians).
+
+Usage (from the repository root):
+
+    python -m tests.oref_alert.benchmark_startup
+    python -m tests.oref_alert.benchmark_startup --runs 20
+
+To compare with another revision, pass the root of its checkout (e.g. a git
+worktree) with --source, its custom_components are imported instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TABLES = [
+    "areas",
+    "areas_and_groups",
+    "area_info",
+    "area_to_district",
+    "area_to_migun_time",
+    "city_all_areas",
+    "district_to_areas",
+    "segment_to_area",
+    "tzevaadom_id_to_area",
+]
+INTEGRATION = [
+    "",
+    ".binary_sensor",
+    ".config_flow",
+    ".event",
+    ".geo_location",
+    ".sensor",
+]
+
+_CHILD = """
+import enum, functools, importlib, json, pathlib, struct, sys, time, types, typing
+
+
+def rss():
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+
+
+mode, root, names = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+sys.path.insert(0, root)
+if mode == "tables":
+    # Only the metadata, without running the integration's __init__
+    package = types.ModuleType("custom_components.oref_alert")
+    package.__path__ = [root + "/custom_components/oref_alert"]
+    sys.modules[package.__name__] = package
+    prefix = "custom_components.oref_alert.metadata."
+else:
+    import homeassistant.core
+    import homeassistant.helpers.config_validation
+    import homeassistant.helpers.entity_platform
+
+    prefix = "custom_components.oref_alert"
+before = rss()
+start = time.perf_counter()
+for name in names:
+    importlib.import_module(prefix + name)
+elapsed = time.perf_counter() - start
+print(json.dumps({"time": elapsed, "rss": rss() - before}))
+"""
+
+
+def measure(
+    root: Path, mode: str, names: list[str], cache_dir: str
+) -> dict[str, float]:
+    """Import the modules in a new interpreter, return the time and RSS growth."""
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", _CHILD, mode, str(root), json.dumps(names)],
+        capture_output=True,
+        check=True,
+        env={
+            **{
+                key: value
+                for key, value in os.environ.items()
+                if key != "PYTHONDONTWRITEBYTECODE"
+            },
+            "PYTHONPYCACHEPREFIX": cache_dir,
+        },
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def benchmark(root: Path, runs: int) -> dict[str, float]:
+    """Run the measurements, return the medians."""
+    samples: dict[str, list[dict[str, float]]] = {
+        "tables_cold": [],
+        "tables_warm": [],
+        "integration": [],
+    }
+    with tempfile.TemporaryDirectory() as cache_dir:
+        warm_cache = f"{cache_dir}/warm"
+        cold_cache = f"{cache_dir}/cold"
+        # Fill the bytecode cache
+        measure(root, "tables", TABLES, warm_cache)
+        measure(root, "integration", INTEGRATION, warm_cache)
+        for _ in range(runs):
+            # The cache has the paths of the sources under the prefix
+            shutil.copytree(warm_cache, cold_cache)
+            shutil.rmtree(f"{cold_cache}/{root.resolve()}/custom_components")
+            samples["tables_cold"].append(measure(root, "tables", TABLES, cold_cache))
+            shutil.rmtree(cold_cache)
+            samples["tables_warm"].append(measure(root, "tables", TABLES, warm_cache))
+            samples["integration"].append(
+                measure(root, "integration", INTEGRATION, warm_cache)
+            )
+    result = {}
+    for name, values in samples.items():
+        result[f"{name}_ms"] = round(
+            statistics.median(value["time"] for value in values) * 1000, 1
+        )
+        result[f"{name}_rss_mib"] = round(
+            statistics.median(value["rss"] for value in values) / 2**20, 1
+        )
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="measured imports")
+    parser.add_argument("--source", type=Path, help="root of the checkout to benchmark")
+    args = parser.parse_args(argv)
+
+    result = benchmark(args.source or Path(__file__).parents[2], args.runs)
+    print(" ".join(f"{key}={value}" for key, value in result.items()))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,702 @@
+"""Record and replay Oref alert traffic against the oref_alert integration.
+
+A trace is a JSON file with the time it was recorded ("recorded_at", epoch
+seconds) and a list of events, each with its offset in seconds ("time") and
+its source:
+
+- "alerts" / "history": the body ("body", text) served for Alerts.json and
+  AlertsHistory.json from that point on.
+- "pushy": a Pushy MQTT payload ("payload", JSON object).
+- "tzevaadom": a Tzeva Adom WS message ("message", JSON object).
+
+The replay sets up the integration in a Home Assistant instance with a stubbed
+aiohttp session. HTTP requests are served from the trace, Tzeva Adom messages
+go through the WS listener and Pushy payloads are passed to
+PushyNotifications.on_message from an executor thread (like the MQTT thread).
+Dates in the payloads are moved by the time passed since the recording, so the
+alerts are active during the replay.
+
+It reports the latency from the arrival of the 1st message of an area to the
+state change of the area's binary sensor, and the time the event loop was
+busy (total and longest callback) during each coordinator refresh.
+
+Usage (from the repository root):
+
+    python -m tests.oref_alert.replay --record trace.json --duration 600
+    python -m tests.oref_alert.replay trace.json --speed 5
+    python -m tests.oref_alert.replay --salvo 200
+
+Recording captures the Oref HTTP endpoints and the Tzeva Adom WS. Pushy
+requires a registered device, so its payloads (the "MQTT message" debug log
+of the integration) have to be added to a trace manually.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp import WSMsgType
+from aiohttp.http_websocket import WSMessage
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_state_change_event
+from paho.mqtt.client import MQTTMessage
+
+from custom_components.oref_alert import areas_checker, coordinator, event, pushy
+from custom_components.oref_alert import tzevaadom as tzevaadom_module
+from custom_components.oref_alert.categories import (
+    category_is_alert,
+    category_is_update,
+    pushy_thread_id_to_history_category,
+    real_time_to_history_category,
+    tzevaadom_threat_id_to_history_category,
+)
+from custom_components.oref_alert.const import (
+    AREA_FIELD,
+    CATEGORY_FIELD,
+    CONF_ALERT_ACTIVE_DURATION,
+    CONF_ALL_ALERTS_ATTRIBUTES,
+    CONF_AREAS,
+    CONF_SENSORS,
+    DATE_FIELD,
+    DEFAULT_ALERT_ACTIVE_DURATION,
+    DOMAIN,
+    IST,
+    TITLE,
+    TITLE_FIELD,
+)
+from custom_components.oref_alert.metadata import (
+    CITIES_MIX_URL,
+    TZEVAADOM_SPELLING_FIX,
+)
+from custom_components.oref_alert.metadata.areas import AREAS
+from custom_components.oref_alert.metadata.segment_to_area import SEGMENT_TO_AREA
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from homeassistant.core import Event, EventStateChangedData
+
+HTTP_SOURCES = {
+    "alerts": coordinator.OREF_ALERTS_URL,
+    "history": coordinator.OREF_HISTORY_URL,
+}
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+RECORDS_SCHEMA_PATH = (
+    Path(__file__).parents[2] / "custom_components" / DOMAIN / "records_schema.py"
+)
+SETTLE_TIME = 3.0
+LEAD_IN = 2.0
+SALVO_TITLE = "ירי רקטות וטילים"
+
+
+class ReplayResponse:
+    """A response of the stubbed aiohttp session."""
+
+    def __init__(
+        self, status: int, body: bytes = b"", headers: dict[str, str] | None = None
+    ) -> None:
+        """Initialize the response."""
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self) -> ReplayResponse:
+        """Enter the context."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Exit the context."""
+
+    def raise_for_status(self) -> None:
+        """Raise if the status is an error."""
+        if self.status >= 400:  # noqa: PLR2004
+            msg = f"Replay status {self.status}"
+            raise aiohttp.ClientError(msg)
+
+    async def read(self) -> bytes:
+        """Return the body."""
+        return self._body
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        return self._body.decode("utf-8")
+
+    async def json(self) -> Any:
+        """Return the body as JSON."""
+        return json.loads(self._body)
+
+
+class ReplayWebSocket:
+    """A WS connection which receives the replayed Tzeva Adom messages."""
+
+    def __init__(self) -> None:
+        """Initialize the connection."""
+        self.messages: asyncio.Queue[WSMessage] = asyncio.Queue()
+
+    async def __aenter__(self) -> ReplayWebSocket:
+        """Enter the context."""
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Exit the context."""
+
+    async def receive(self) -> WSMessage:
+        """Return the next message."""
+        return await self.messages.get()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self.messages.put_nowait(WSMessage(WSMsgType.CLOSED, None, None))
+
+
+class ReplaySession:
+    """Stubbed aiohttp session serving the trace."""
+
+    def __init__(self) -> None:
+        """Initialize the session."""
+        self.bodies: dict[str, tuple[int, bytes]] = {}
+        self.websockets: list[ReplayWebSocket] = []
+        self._records_schema = RECORDS_SCHEMA_PATH.read_bytes()
+        self._areas = json.dumps([{"label": area} for area in AREAS]).encode()
+
+    def serve(self, url: str, body: bytes) -> None:
+        """Serve a new body for the URL."""
+        version = self.bodies.get(url, (0, b""))[0] + 1
+        self.bodies[url] = (version, body)
+
+    def get(self, url: str, headers: dict[str, str] | None = None, **_: Any) -> Any:
+        """Return the response of a GET request."""
+        if url == event.RECORDS_SCHEMA_URL:
+            return ReplayResponse(200, self._records_schema)
+        if url == CITIES_MIX_URL:
+            return ReplayResponse(200, self._areas)
+        if url not in self.bodies:
+            return ReplayResponse(200, b"")
+        version, body = self.bodies[url]
+        last_modified = str(version)
+        if (headers or {}).get("If-Modified-Since") == last_modified:
+            return ReplayResponse(304)
+        return ReplayResponse(200, body, {"Last-Modified": last_modified})
+
+    def ws_connect(self, *_: Any, **__: Any) -> ReplayWebSocket:
+        """Return a new WS connection."""
+        websocket = ReplayWebSocket()
+        self.websockets.append(websocket)
+        return websocket
+
+    def send(self, message: dict[str, Any]) -> None:
+        """Send a message on the open WS connection."""
+        self.websockets[-1].messages.put_nowait(
+            WSMessage(WSMsgType.TEXT, json.dumps(message, ensure_ascii=False), None)
+        )
+
+
+class LoopMonitor:
+    """Measure how long each callback of the event loop runs."""
+
+    def __init__(self) -> None:
+        """Initialize the monitor."""
+        self.callbacks: list[tuple[float, float]] = []
+
+    @contextlib.contextmanager
+    def attach(self) -> Iterator[None]:
+        """Time the callbacks while in the context."""
+        original = asyncio.events.Handle._run  # noqa: SLF001
+        callbacks = self.callbacks
+
+        def _run(handle: asyncio.Handle) -> None:
+            start = time.perf_counter()
+            try:
+                original(handle)
+            finally:
+                callbacks.append((start, time.perf_counter() - start))
+
+        asyncio.events.Handle._run = _run  # type: ignore[method-assign] # noqa: SLF001
+        try:
+            yield
+        finally:
+            asyncio.events.Handle._run = original  # type: ignore[method-assign] # noqa: SLF001
+
+    def busy(self, start: float, end: float) -> tuple[float, float]:
+        """Return the total and the longest callback time in a time window."""
+        durations = [
+            duration
+            for callback_start, duration in self.callbacks
+            if start <= callback_start < end
+        ]
+        return sum(durations), max(durations, default=0.0)
+
+
+@dataclass
+class ReplayResult:
+    """Measurements of a replay."""
+
+    # Area to (source of the 1st message, seconds until the sensor was on)
+    latencies: dict[str, tuple[str, float]] = field(default_factory=dict)
+    # Areas with a message but without a state change
+    missed: list[str] = field(default_factory=list)
+    # (busy seconds, longest callback seconds) of each refresh
+    refreshes: list[tuple[float, float]] = field(default_factory=list)
+    longest_callback: float = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Return the statistics of the measurements (in milliseconds)."""
+
+        def _stats(values: list[float]) -> dict[str, float]:
+            if not values:
+                return {}
+            values = sorted(values)
+            return {
+                "count": len(values),
+                "median": round(statistics.median(values) * 1000, 1),
+                "p95": round(values[int(len(values) * 0.95)] * 1000, 1),
+                "max": round(values[-1] * 1000, 1),
+            }
+
+        sources = sorted({source for source, _ in self.latencies.values()})
+        return {
+            "latency": {
+                source: _stats(
+                    [
+                        latency
+                        for area_source, latency in self.latencies.values()
+                        if area_source == source
+                    ]
+                )
+                for source in sources
+            },
+            "missed": len(self.missed),
+            "refresh_busy": _stats([busy for busy, _ in self.refreshes]),
+            "refresh_longest_callback": _stats([block for _, block in self.refreshes]),
+            "longest_callback": round(self.longest_callback * 1000, 1),
+        }
+
+
+def _shift_date(date: str, shift: float) -> str:
+    """Move a date (history format) by the shift in seconds."""
+    return (
+        datetime.strptime(date, DATE_FORMAT).replace(tzinfo=IST)
+        + timedelta(seconds=shift)
+    ).strftime(DATE_FORMAT)
+
+
+def _rebase(item: dict[str, Any], shift: float) -> dict[str, Any]:
+    """Return the event with its dates moved by the shift in seconds."""
+    item = {**item}
+    match item["source"]:
+        case "history":
+            if history := json.loads(item["body"] or "[]"):
+                for alert in history:
+                    alert[DATE_FIELD] = _shift_date(alert[DATE_FIELD], shift)
+                item["body"] = json.dumps(history, ensure_ascii=False)
+        case "pushy":
+            payload = item["payload"] = {**item["payload"]}
+            payload["time"] = (
+                datetime.fromisoformat(payload["time"]) + timedelta(seconds=shift)
+            ).isoformat()
+        case "tzevaadom":
+            message = item["message"] = {**item["message"]}
+            message["data"] = {
+                **message["data"],
+                "time": int(message["data"]["time"]) + round(shift),
+            }
+    return item
+
+
+def _is_alert(category: int | None) -> bool:
+    """Check if the category turns the binary sensor on."""
+    return (
+        category is not None
+        and category_is_alert(category)
+        and not category_is_update(category)
+    )
+
+
+def _event_areas(item: dict[str, Any]) -> list[str]:
+    """Return the areas an event turns on."""
+    match item["source"]:
+        case "alerts":
+            if not (body := item["body"].strip()):
+                return []
+            current = json.loads(body)
+            if not _is_alert(real_time_to_history_category(int(current["cat"]))):
+                return []
+            return list(current[AREA_FIELD])
+        case "history":
+            return [
+                alert[AREA_FIELD]
+                for alert in json.loads(item["body"] or "[]")
+                if _is_alert(alert[CATEGORY_FIELD])
+            ]
+        case "pushy":
+            payload = item["payload"]
+            if payload.get("test") or not _is_alert(
+                pushy_thread_id_to_history_category(int(payload["threatId"]))
+            ):
+                return []
+            return [
+                SEGMENT_TO_AREA[segment]
+                for segment in map(int, payload["citiesIds"].split(","))
+                if segment in SEGMENT_TO_AREA
+            ]
+        case "tzevaadom":
+            message = item["message"]
+            if (
+                message["type"] != tzevaadom_module.MessageType.ALERT
+                or message["data"]["isDrill"]
+                or not _is_alert(
+                    tzevaadom_threat_id_to_history_category(
+                        int(message["data"]["threat"])
+                    )
+                )
+            ):
+                return []
+            return [
+                TZEVAADOM_SPELLING_FIX.get(area, area)
+                for area in message["data"]["cities"]
+            ]
+    return []
+
+
+def salvo_trace(areas_count: int, bursts: int = 5, spread: float = 10.0) -> dict:
+    """Build a trace of a salvo in the areas, reported by all the channels."""
+    segments = {area: segment for segment, area in SEGMENT_TO_AREA.items()}
+    areas = sorted(area for area in segments if area in AREAS)[:areas_count]
+    recorded_at = time.time()
+    events: list[dict[str, Any]] = []
+    history: list[dict[str, Any]] = []
+    for burst in range(bursts):
+        burst_areas = areas[burst::bursts]
+        offset = spread * burst / bursts
+        date = datetime.fromtimestamp(recorded_at + offset, IST)
+        events.append(
+            {
+                "time": offset,
+                "source": "pushy",
+                "payload": {
+                    "threatId": "0",
+                    "time": date.isoformat(),
+                    "citiesIds": ",".join(str(segments[area]) for area in burst_areas),
+                    TITLE_FIELD: SALVO_TITLE,
+                },
+            }
+        )
+        events.append(
+            {
+                "time": offset + 0.3,
+                "source": "tzevaadom",
+                "message": {
+                    "type": "ALERT",
+                    "data": {
+                        "notificationId": f"replay-{burst}",
+                        "time": int(date.timestamp()),
+                        "threat": 0,
+                        "isDrill": False,
+                        "cities": burst_areas,
+                    },
+                },
+            }
+        )
+        events.append(
+            {
+                "time": offset + 1,
+                "source": "alerts",
+                "body": json.dumps(
+                    {
+                        "id": str(burst),
+                        "cat": "1",
+                        TITLE_FIELD: SALVO_TITLE,
+                        AREA_FIELD: burst_areas,
+                        "desc": "",
+                    },
+                    ensure_ascii=False,
+                ),
+            }
+        )
+        history = [
+            {
+                DATE_FIELD: date.strftime(DATE_FORMAT),
+                TITLE_FIELD: SALVO_TITLE,
+                AREA_FIELD: area,
+                CATEGORY_FIELD: 1,
+            }
+            for area in burst_areas
+        ] + history
+        events.append(
+            {
+                "time": offset + 3,
+                "source": "history",
+                "body": json.dumps(history, ensure_ascii=False),
+            }
+        )
+    events.append({"time": spread + 1, "source": "alerts", "body": ""})
+    events.sort(key=lambda item: item["time"])
+    return {"recorded_at": recorded_at, "events": events}
+
+
+async def _async_setup_hass(config_dir: str) -> HomeAssistant:
+    """Create a Home Assistant instance."""
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    await hass.config.async_set_time_zone(str(IST))
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await hass.async_start()
+    return hass
+
+
+@contextlib.contextmanager
+def _stubbed(session: ReplaySession) -> Iterator[None]:
+    """Use the replay session and skip the Pushy registration."""
+
+    async def _start(self: pushy.PushyNotifications) -> None:
+        self.connected = True
+        self.last_message = time.monotonic()
+
+    with contextlib.ExitStack() as stack:
+        for module in (areas_checker, coordinator, event, pushy, tzevaadom_module):
+            stack.enter_context(
+                patch.object(module, "async_get_clientsession", return_value=session)
+            )
+        stack.enter_context(patch.object(pushy.PushyNotifications, "start", _start))
+        yield
+
+
+async def async_replay(
+    trace: dict[str, Any],
+    speed: float = 1.0,
+    max_sensors: int = 100,
+    config_dir: str | None = None,
+) -> ReplayResult:
+    """Replay a trace and measure the integration."""
+    events: list[dict[str, Any]] = sorted(trace["events"], key=lambda e: e["time"])
+    areas: list[str] = []
+    for item in events:
+        areas.extend(
+            area for area in _event_areas(item) if area in AREAS and area not in areas
+        )
+    areas = areas[:max_sensors]
+    sensors = {f"Replay {index}": [area] for index, area in enumerate(areas)}
+    entity_areas = {
+        f"binary_sensor.oref_alert_replay_{index}": area
+        for index, area in enumerate(areas)
+    }
+
+    result = ReplayResult()
+    monitor = LoopMonitor()
+    session = ReplaySession()
+    arrivals: dict[str, tuple[str, float]] = {}
+
+    with contextlib.ExitStack() as stack:
+        if config_dir is None:
+            config_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(_stubbed(session))
+        hass = await _async_setup_hass(config_dir)
+        entry = ConfigEntry(
+            data={},
+            discovery_keys={},  # type: ignore[arg-type]
+            domain=DOMAIN,
+            minor_version=1,
+            options={
+                CONF_AREAS: [],
+                CONF_ALERT_ACTIVE_DURATION: DEFAULT_ALERT_ACTIVE_DURATION,
+                CONF_ALL_ALERTS_ATTRIBUTES: False,
+                CONF_SENSORS: sensors,
+            },
+            source="user",
+            subentries_data=None,
+            title=TITLE,
+            unique_id=None,
+            version=1,
+        )
+        try:
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            data_coordinator = entry.runtime_data.coordinator
+            refresh = data_coordinator._async_refresh  # noqa: SLF001
+            windows: list[tuple[float, float]] = []
+
+            async def _async_refresh(*args: Any, **kwargs: Any) -> None:
+                start = time.perf_counter()
+                try:
+                    await refresh(*args, **kwargs)
+                finally:
+                    windows.append((start, time.perf_counter()))
+
+            data_coordinator._async_refresh = _async_refresh  # noqa: SLF001
+
+            def _state_changed(change: Event[EventStateChangedData]) -> None:
+                area = entity_areas[change.data["entity_id"]]
+                new_state = change.data["new_state"]
+                if (
+                    new_state is not None
+                    and new_state.state == "on"
+                    and area in arrivals
+                    and area not in result.latencies
+                ):
+                    source, arrival = arrivals[area]
+                    result.latencies[area] = (source, time.perf_counter() - arrival)
+
+            unsub = async_track_state_change_event(
+                hass, list(entity_areas), _state_changed
+            )
+
+            # The payloads are rebased (before the clock starts) to the time
+            # they are delivered at.
+            start = time.time() + LEAD_IN
+            events = [
+                _rebase(
+                    item,
+                    start + item["time"] / speed - trace["recorded_at"] - item["time"],
+                )
+                for item in events
+            ]
+            await asyncio.sleep(start - time.time())
+            clock = time.perf_counter()
+
+            with monitor.attach():
+                for item in events:
+                    if (
+                        delay := clock + item["time"] / speed - time.perf_counter()
+                    ) > 0:
+                        await asyncio.sleep(delay)
+                    arrival = time.perf_counter()
+                    for area in _event_areas(item):
+                        arrivals.setdefault(area, (item["source"], arrival))
+                    await _async_deliver(hass, session, entry, item)
+                await asyncio.sleep(SETTLE_TIME)
+
+            unsub()
+            result.refreshes = [monitor.busy(*window) for window in windows]
+            result.longest_callback = max(
+                (duration for _, duration in monitor.callbacks), default=0.0
+            )
+            result.missed = sorted(
+                area
+                for area in entity_areas.values()
+                if area in arrivals and area not in result.latencies
+            )
+            await hass.config_entries.async_unload(entry.entry_id)
+        finally:
+            await hass.async_stop(force=True)
+    return result
+
+
+async def _async_deliver(
+    hass: HomeAssistant,
+    session: ReplaySession,
+    entry: ConfigEntry,
+    item: dict[str, Any],
+) -> None:
+    """Deliver an event to the integration."""
+    match item["source"]:
+        case "alerts" | "history":
+            session.serve(HTTP_SOURCES[item["source"]], item["body"].encode("utf-8"))
+        case "pushy":
+            message = MQTTMessage(topic=b"replay")
+            message.payload = json.dumps(item["payload"], ensure_ascii=False).encode()
+            await hass.async_add_executor_job(
+                entry.runtime_data.pushy.on_message, message
+            )
+        case "tzevaadom":
+            session.send(item["message"])
+
+
+async def async_record(path: Path, duration: float, interval: float = 1.0) -> int:
+    """Record the Oref HTTP endpoints and the Tzeva Adom WS into a trace."""
+    recorded_at = time.time()
+    clock = time.monotonic()
+    events: list[dict[str, Any]] = []
+
+    def _elapsed() -> float:
+        return round(time.monotonic() - clock, 3)
+
+    async def _poll(http: aiohttp.ClientSession) -> None:
+        bodies: dict[str, str] = {}
+        while True:
+            for source, url in HTTP_SOURCES.items():
+                with contextlib.suppress(aiohttp.ClientError):
+                    async with http.get(url, headers=coordinator.OREF_HEADERS) as resp:
+                        body = (await resp.read()).decode("utf-8-sig").strip()
+                    if bodies.get(source) != body:
+                        bodies[source] = body
+                        events.append(
+                            {"time": _elapsed(), "source": source, "body": body}
+                        )
+            await asyncio.sleep(interval)
+
+    async def _listen(http: aiohttp.ClientSession) -> None:
+        while True:
+            with contextlib.suppress(aiohttp.ClientError):
+                async with http.ws_connect(
+                    tzevaadom_module.WS_URL, origin=tzevaadom_module.ORIGIN_HEADER
+                ) as websocket:
+                    async for message in websocket:
+                        if message.type == WSMsgType.TEXT:
+                            events.append(
+                                {
+                                    "time": _elapsed(),
+                                    "source": "tzevaadom",
+                                    "message": message.json(),
+                                }
+                            )
+            await asyncio.sleep(5)
+
+    async with aiohttp.ClientSession() as http:
+        tasks = [asyncio.create_task(_poll(http)), asyncio.create_task(_listen(http))]
+        await asyncio.sleep(duration)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    path.write_text(
+        json.dumps({"recorded_at": recorded_at, "events": events}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    return len(events)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Record or replay a trace and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?", type=Path, help="trace to replay")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed")
+    parser.add_argument(
+        "--salvo", type=int, metavar="AREAS", help="replay a synthetic salvo"
+    )
+    parser.add_argument("--max-sensors", type=int, default=100)
+    parser.add_argument("--record", type=Path, metavar="TRACE", help="record a trace")
+    parser.add_argument("--duration", type=float, default=300, help="record seconds")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        count = asyncio.run(async_record(args.record, args.duration))
+        print(f"Recorded {count} events to {args.record}")  # noqa: T201
+        return
+    if args.salvo:
+        trace = salvo_trace(args.salvo)
+    elif args.trace:
+        trace = json.loads(args.trace.read_text(encoding="utf-8"))
+    else:
+        parser.error("a trace or --salvo is required")
+    result = asyncio.run(async_replay(trace, args.speed, args.max_sensors))
+    print(json.dumps(result.summary(), indent=2))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Replay synthetic salvos through the oref_alert push channels."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .replay import async_replay, salvo_trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+AREAS_COUNT = 10
+
+
+@pytest.mark.parametrize("source", ["pushy", "tzevaadom"])
+def test_push_channel_turns_sensors_on(source: str, tmp_path: Path) -> None:
+    """Test the sensors of all areas are turned on by a push channel."""
+    trace = salvo_trace(AREAS_COUNT, bursts=2, spread=1)
+    trace["events"] = [item for item in trace["events"] if item["source"] == source]
+    result = asyncio.run(async_replay(trace, config_dir=str(tmp_path)))
+    assert not result.missed
+    assert len(result.latencies) == AREAS_COUNT
+    assert {source for source, _ in result.latencies.values()} == {source}
+    assert result.refreshes
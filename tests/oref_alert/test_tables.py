@@ -0,0 +1,34 @@
+"""Test the metadata tables."""
+
+from __future__ import annotations
+
+from custom_components.oref_alert.metadata import tables
+from custom_components.oref_alert.metadata.area_info import AREA_INFO
+from custom_components.oref_alert.metadata.areas import AREAS
+from custom_components.oref_alert.metadata.segment_to_area import SEGMENT_TO_AREA
+
+TABLES = [
+    "areas",
+    "areas_and_groups",
+    "area_info",
+    "area_to_district",
+    "area_to_migun_time",
+    "city_all_areas",
+    "district_to_areas",
+    "segment_to_area",
+    "tzevaadom_id_to_area",
+]
+
+
+def test_dump_round_trip() -> None:
+    """Test encoding the loaded tables gives the same file."""
+    encoded = tables.dump({name: tables.load_table(name) for name in TABLES})
+    assert encoded == tables._PATH.read_bytes()  # noqa: SLF001
+
+
+def test_tables_share_strings() -> None:
+    """Test the tables reference the same str objects."""
+    area = SEGMENT_TO_AREA[AREA_INFO["אילת"]["segment"]]
+    assert area == "אילת"
+    assert area in AREAS
+    assert next(key for key in AREA_INFO if key == area) is area
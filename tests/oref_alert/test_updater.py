@@ -0,0 +1,87 @@
+"""Test the HTTP poll interval of the coordinator updater."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+import pytest
+
+from custom_components.oref_alert.coordinator import (
+    UPDATER_FAST_WINDOW,
+    UPDATER_IDLE_INTERVAL,
+    UPDATER_PUSH_IDLE_INTERVAL,
+    UPDATER_TICK,
+    OrefAlertCoordinatorUpdater,
+)
+
+HEARTBEAT_INTERVAL = 45
+
+
+def _channel(*, connected: bool = True, silent_for: float = 0) -> Any:
+    """Return a push channel which was last heard from silent_for seconds ago."""
+    return SimpleNamespace(
+        connected=connected,
+        heartbeat_interval=HEARTBEAT_INTERVAL,
+        last_message=time.monotonic() - silent_for,
+    )
+
+
+def _updater(*channels: Any) -> OrefAlertCoordinatorUpdater:
+    """Return an updater which is not started."""
+    data = SimpleNamespace(active_alerts=[], updates=[])
+
+    async def _async_request_refresh() -> None:
+        pass
+
+    coordinator = SimpleNamespace(
+        data=data, async_request_refresh=_async_request_refresh
+    )
+    return OrefAlertCoordinatorUpdater(None, coordinator, channels)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("channels", "interval"),
+    [
+        ((_channel(), _channel()), UPDATER_PUSH_IDLE_INTERVAL),
+        ((_channel(), _channel(connected=False)), UPDATER_IDLE_INTERVAL),
+        (
+            (_channel(), _channel(silent_for=HEARTBEAT_INTERVAL * 2)),
+            UPDATER_IDLE_INTERVAL,
+        ),
+    ],
+)
+def test_idle_interval_depends_on_push_health(channels: tuple, interval: Any) -> None:
+    """Test polling backs off only while all the channels heartbeat."""
+    updater = _updater(*channels)
+    updater._push_healthy = updater._is_push_healthy()  # noqa: SLF001
+    assert updater._poll_interval(dt_util.now()) == interval  # noqa: SLF001
+
+
+def test_active_window_polls_fast_with_healthy_push() -> None:
+    """Test polling stays fast while there are active alerts."""
+    updater = _updater(_channel(), _channel())
+    updater._push_healthy = updater._is_push_healthy()  # noqa: SLF001
+    now = dt_util.now()
+    updater._active = now - timedelta(minutes=5)  # noqa: SLF001
+    assert updater._poll_interval(now) == UPDATER_TICK  # noqa: SLF001
+
+
+def test_silent_channel_polls_fast() -> None:
+    """Test a channel which stops heartbeating is handled like a disconnection."""
+    channel = _channel()
+    updater = _updater(channel, _channel())
+    updater._stop = True  # noqa: SLF001
+    asyncio.run(updater._async_update())  # noqa: SLF001
+    now = dt_util.now()
+    assert updater._poll_interval(now) == UPDATER_PUSH_IDLE_INTERVAL  # noqa: SLF001
+
+    channel.last_message -= HEARTBEAT_INTERVAL * 2
+    asyncio.run(updater._async_update())  # noqa: SLF001
+    now = dt_util.now()
+    assert updater._poll_interval(now) == UPDATER_TICK  # noqa: SLF001
+    assert updater._fast_until > now + UPDATER_FAST_WINDOW - timedelta(seconds=5)  # noqa: SLF001
@@ -0,0 +1,149 @@
+"""Benchmark decoding the VBox byte stream.
+
+A synthetic stream of node status lines, keep-alive acks and binary parameter
+frames is decoded by FrameDecoder (in chunks of the size the connection
+reads) and by the read(2)/readuntil/read sequence the connection used before
+over an asyncio.StreamReader. Both must return the original frames.
+
+The stream is also fed in random chunks (1 byte to 4KB) to check partial and
+coalesced frames, and the old sequence is run on a binary frame split across
+two reads, which it returned truncated.
+
+Usage (from the repository root):
+
+    python -m tests.vitrea.benchmark_frame_decoder
+    python -m tests.vitrea.benchmark_frame_decoder --frames 50000 --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+READ_CHUNK_SIZE = 4096
+CHUNK_SIZES = [1, 2, 3, 7, 50, 1500, 4096]
+
+
+def binary_frame(command: int, payload: bytes) -> bytes:
+    """Return a parameter API frame ("VTH<", command, length, payload)."""
+    return b"VTH<" + bytes([command]) + len(payload).to_bytes(2, "big") + payload
+
+
+def build_frames(count: int, seed: int = 1) -> list[bytes]:
+    """Return frames like the ones a busy controller sends."""
+    rand = random.Random(seed)
+    frames = []
+    for _ in range(count):
+        kind = rand.random()
+        if kind < 0.6:
+            node, key = rand.randint(1, 200), rand.randint(1, 8)
+            frames.append(f"S:N{node:03d}:{key}:O:000\r\n".encode())
+        elif kind < 0.8:
+            frames.append(b"S:PSW:OK\r\n")
+        else:
+            frames.append(
+                binary_frame(
+                    rand.randint(0x1F, 0x30), rand.randbytes(rand.randint(3, 60))
+                )
+            )
+    return frames
+
+
+async def async_read_old(reader: asyncio.StreamReader) -> bytes:
+    """Read a frame the way the connection did before the decoder."""
+    prefix = await reader.read(2)
+    if not prefix:
+        return b""
+    if prefix != b"VT":
+        return prefix + await reader.readuntil(b"\r\n")
+    info = await reader.read(5)
+    length = int(info[-2:].hex()[1:], 16)
+    return prefix + info + await reader.read(length)
+
+
+async def async_decode_old(stream: bytes) -> tuple[list[bytes], float]:
+    """Decode the stream with the old sequence, return the frames and time."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(stream)
+    reader.feed_eof()
+    frames = []
+    start = time.perf_counter()
+    while frame := await async_read_old(reader):
+        frames.append(frame)
+    return frames, time.perf_counter() - start
+
+
+async def async_split_frame_old(frame: bytes, split: int) -> bytes:
+    """Read a frame which arrives in two reads with the old sequence."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(frame[:split])
+    asyncio.get_running_loop().call_later(0.01, reader.feed_data, frame[split:])
+    return await async_read_old(reader)
+
+
+def decode(stream: bytes, sizes: list[int], rand: random.Random) -> list[bytes]:
+    """Feed the stream to a new decoder in chunks of random sizes."""
+    # pylint: disable=import-outside-toplevel
+    from custom_components.vitrea.vitrea_integration.utils.frame_decoder import (
+        FrameDecoder,
+    )
+
+    decoder = FrameDecoder()
+    frames = []
+    position = 0
+    while position < len(stream):
+        size = rand.choice(sizes)
+        frames += decoder.feed(stream[position : position + size])
+        position += size
+    return frames
+
+
+def benchmark(count: int, runs: int, fuzz: int) -> dict:
+    """Decode the stream, return the measurements."""
+    frames = build_frames(count)
+    stream = b"".join(frames)
+    rand = random.Random(0)
+
+    for _ in range(fuzz):
+        assert decode(stream, CHUNK_SIZES, rand) == frames
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        decoded = decode(stream, [READ_CHUNK_SIZE], rand)
+        times.append(time.perf_counter() - start)
+        assert decoded == frames
+    old_times = []
+    for _ in range(runs):
+        decoded, elapsed = asyncio.run(async_decode_old(stream))
+        old_times.append(elapsed)
+        assert decoded == frames
+
+    frame = next(frame for frame in frames if frame.startswith(b"VT"))
+    split = asyncio.run(async_split_frame_old(frame, 9))
+    return {
+        "frames": len(frames),
+        "stream_kib": round(len(stream) / 1024),
+        "fuzz_chunkings": fuzz,
+        "decoder_ms": round(min(times) * 1000, 1),
+        "old_reader_ms": round(min(old_times) * 1000, 1),
+        "old_split_payload": f"{len(split) - 7}/{len(frame) - 7}",
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000, help="frames")
+    parser.add_argument("--runs", type=int, default=5, help="timed runs")
+    parser.add_argument("--fuzz", type=int, default=200, help="random chunkings")
+    args = parser.parse_args(argv)
+
+    result = benchmark(args.frames, args.runs, args.fuzz)
+    print(" ".join(f"{key}={value}" for key, value in result.items()))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark parsing the VBox control API responses.
+
+A corpus of frames like the ones a busy controller sends (node status lines,
+keep-alive acks, AC statuses and action acks) plus version, error, scenario,
+unknown and invalid frames is parsed with parse_response. A digest of the
+results is reported, so another revision can be checked for the same
+results. The keep-alive acks and node status frames are timed.
+
+Usage (from the repository root):
+
+    python -m tests.vitrea.benchmark_parse_response
+    python -m tests.vitrea.benchmark_parse_response --frames 50000 --runs 10
+
+To compare with another revision, pass the root of its checkout (e.g. a git
+worktree) with --source, its custom_components are imported instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+RARE_FRAMES = [
+    b"V:0905\r\n",
+    b"E:2:bad node\r\n",
+    b"S:R012\r\n",
+    b"S:X:1\r\n",
+    b"T:1:2:3\r\n",
+]
+RESULT_KEYS = [
+    "type",
+    "subtype",
+    "node_id",
+    "key",
+    "status",
+    "sub_type",
+    "parameters",
+    "message",
+    "major_version",
+    "minor_version",
+]
+
+
+def build_frames(count: int, seed: int = 2) -> list[bytes]:
+    """Return the corpus of frames."""
+    rand = random.Random(seed)
+    frames = []
+    for _ in range(count):
+        kind = rand.random()
+        if kind < 0.75:
+            node, key = rand.randint(1, 200), rand.randint(1, 8)
+            status, value = rand.choice("OFDBSLR"), rand.randint(0, 100)
+            frames.append(f"S:N{node:03d}:{key}:{status}:{value:03d}\r\n".encode())
+        elif kind < 0.85:
+            frames.append(b"S:PSW:OK\r\n")
+        elif kind < 0.86:
+            frames.append(b"S:A001:1:2:3:4:5:6:7\r\n")
+        else:
+            frames.append(b"OK\r\n")
+    return frames + RARE_FRAMES
+
+
+def normalize(result: Any) -> Any:
+    """Return the fields of a parse result which the hub and devices read."""
+    if isinstance(result, list):
+        return [normalize(item) for item in result]
+    if hasattr(result, "get"):
+        return {key: str(result.get(key)) for key in RESULT_KEYS}
+    return str(result)
+
+
+def benchmark(count: int, runs: int) -> dict:
+    """Parse the corpus, return the measurements."""
+    # pylint: disable=import-outside-toplevel
+    from custom_components.vitrea.vitrea_integration.control_api.responses.vbox_responses import (  # noqa: E501
+        parse_response,
+    )
+
+    frames = build_frames(count)
+    results = []
+    for frame in frames:
+        try:
+            results.append(normalize(parse_response(frame)))
+        except Exception as err:  # noqa: BLE001 pylint: disable=broad-except
+            results.append(repr(err))
+    digest = hashlib.sha1(json.dumps(results).encode()).hexdigest()[:12]
+
+    timed = [frame for frame in frames if frame.startswith((b"S:N", b"S:PSW"))]
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for frame in timed:
+            parse_response(frame)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "frames": len(frames),
+        "timed_frames": len(timed),
+        "best_ms": round(best * 1000, 1),
+        "median_ms": round(statistics.median(times) * 1000, 1),
+        "kframes_per_s": round(len(timed) / best / 1000),
+        "digest": digest,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark and print the measurements."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20_000, help="frames")
+    parser.add_argument("--runs", type=int, default=20, help="timed runs")
+    parser.add_argument("--source", type=Path, help="root of the checkout to benchmark")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(args.source or Path(__file__).parents[2]))
+    # The parsers log the invalid frames of the corpus
+    logging.disable(logging.ERROR)
+    result = benchmark(args.frames, args.runs)
+    print(" ".join(f"{key}={value}" for key, value in result.items()))  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
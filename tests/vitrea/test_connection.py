@@ -0,0 +1,40 @@
+"""Test the keep-alive monitor of the VBox connection."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+
+from custom_components.vitrea.vitrea_integration.vbox_connection import (
+    KEEP_ALIVE_INTERVAL,
+    VBoxConnection,
+)
+
+
+def test_monitor_waits_without_writer() -> None:
+    """Test the monitor doesn't spin while the connection has no writer."""
+
+    async def _async_test() -> int:
+        async def _response_callback(_: bytes) -> None:
+            pass
+
+        connection = VBoxConnection(
+            "127.0.0.1", 0, _response_callback, event_beat_seconds=0.02
+        )
+        # The writer was closed after the last command was sent
+        connection.last_tx = datetime.now() - KEEP_ALIVE_INTERVAL
+        keep_alives = 0
+
+        async def _send_keep_alive() -> None:
+            nonlocal keep_alives
+            keep_alives += 1
+
+        connection._send_keep_alive = _send_keep_alive  # noqa: SLF001
+        task = asyncio.create_task(connection._monitor_loop())  # noqa: SLF001
+        await asyncio.sleep(0.5)
+        assert not task.done()
+        connection._stop_event.set()  # noqa: SLF001
+        await asyncio.wait_for(task, 1)
+        return keep_alives
+
+    assert asyncio.run(_async_test()) == 0
@@ -0,0 +1,53 @@
+"""Test the availability of the Vitrea entities."""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from custom_components.vitrea.switch import VitreaSatelliteIndicatorLed
+
+SIGNAL = "vitrea_availability_test"
+
+
+def _switch() -> Any:
+    """Return a satellite button of a hub which is offline."""
+    callbacks: set = set()
+    return SimpleNamespace(
+        hub=SimpleNamespace(hub_id="hub", online=False, availability_signal=SIGNAL),
+        name="Led",
+        node_id=1,
+        key_id=2,
+        register_callback=callbacks.add,
+        remove_callback=callbacks.discard,
+    )
+
+
+def test_availability_signal() -> None:
+    """Test an entity writes its state when the hub's availability changes."""
+
+    async def _async_test() -> list[bool]:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = HomeAssistant(config_dir)
+            entity = VitreaSatelliteIndicatorLed(_switch())
+            entity.hass = hass
+            entity.entity_id = "switch.led"
+            writes = []
+            entity.async_write_ha_state = lambda: writes.append(entity.available)
+            await entity.async_added_to_hass()
+
+            entity._hub.online = True  # noqa: SLF001
+            async_dispatcher_send(hass, SIGNAL)
+            await hass.async_block_till_done()
+            await entity.async_remove()
+            async_dispatcher_send(hass, SIGNAL)
+            await hass.async_block_till_done()
+            await hass.async_stop(force=True)
+        return writes
+
+    assert asyncio.run(_async_test()) == [True]